@@ -2,86 +2,247 @@
 # Copyright (c) 2021 Airbyte, Inc., all rights reserved.
 #
 
-from importlib import metadata
-
-from .destinations import Destination
-from .models import AirbyteConnectionStatus, AirbyteMessage, ConfiguredAirbyteCatalog, Status, Type, FailureType, AirbyteStream, AdvancedAuth, DestinationSyncMode, ConnectorSpecification, OAuthConfigSpecification, OrchestratorType, ConfiguredAirbyteStream, SyncMode, AirbyteLogMessage, Level, AirbyteRecordMessage
-
-from .sources import Source
-from .config_observation import create_connector_config_control_message, emit_configuration_as_airbyte_control_message
-from .connector import BaseConnector, Connector
-
-from .entrypoint import launch, AirbyteEntrypoint
-
-from .logger import AirbyteLogFormatter, init_logger
-from .sources import AbstractSource
-from .sources.concurrent_source.concurrent_source import ConcurrentSource
-from .sources.concurrent_source.concurrent_source_adapter import ConcurrentSourceAdapter
-from .sources.config import BaseConfig
-from .sources.types import Config, Record, StreamSlice
-from .sources.connector_state_manager import ConnectorStateManager
-from .sources.declarative.auth import DeclarativeOauth2Authenticator
-from .sources.declarative.auth.declarative_authenticator import DeclarativeAuthenticator
-from .sources.declarative.auth.declarative_authenticator import NoAuth
-from .sources.declarative.auth.oauth import DeclarativeSingleUseRefreshTokenOauth2Authenticator
-from .sources.declarative.auth.token import BasicHttpAuthenticator, BearerAuthenticator, ApiKeyAuthenticator
-from .sources.declarative.datetime.min_max_datetime import MinMaxDatetime
-from .sources.declarative.declarative_stream import DeclarativeStream
-from .sources.declarative.decoders import Decoder, JsonDecoder
-from .sources.declarative.exceptions import ReadException
-from .sources.declarative.extractors import DpathExtractor, RecordSelector
-from .sources.declarative.extractors.record_extractor import RecordExtractor
-from .sources.declarative.extractors.record_filter import RecordFilter
-from .sources.declarative.incremental import DatetimeBasedCursor
-from .sources.declarative.interpolation import InterpolatedString, InterpolatedBoolean
-from .sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
-from .sources.declarative.migrations.legacy_to_per_partition_state_migration import LegacyToPerPartitionStateMigration
-
-from .sources.declarative.partition_routers import CartesianProductStreamSlicer, SinglePartitionRouter, SubstreamPartitionRouter
-from .sources.declarative.partition_routers.substream_partition_router import ParentStreamConfig
-from .sources.declarative.requesters import Requester, HttpRequester
-
-from .sources.declarative.requesters.error_handlers import BackoffStrategy
-from .sources.declarative.requesters.paginators import DefaultPaginator, PaginationStrategy
-from .sources.declarative.requesters.paginators.strategies import OffsetIncrement, CursorPaginationStrategy, PageIncrement, StopConditionPaginationStrategyDecorator
-
-from .sources.declarative.requesters.request_option import RequestOption, RequestOptionType
-
-from .sources.declarative.requesters.request_options.default_request_options_provider import DefaultRequestOptionsProvider
-from .sources.declarative.requesters.request_options.interpolated_request_input_provider import InterpolatedRequestInputProvider
-from .sources.declarative.requesters.requester import HttpMethod
-from .sources.declarative.retrievers import SimpleRetriever
-from .sources.declarative.schema import JsonFileSchemaLoader
-from .sources.declarative.transformations.add_fields import AddFields, AddedFieldDefinition
-from .sources.declarative.transformations.transformation import RecordTransformation
-from .sources.declarative.types import FieldPointer
-from .sources.declarative.yaml_declarative_source import YamlDeclarativeSource
-from .sources.message import InMemoryMessageRepository, MessageRepository
-from .sources.source import TState
-from .sources.streams.availability_strategy import AvailabilityStrategy
-from .sources.streams.call_rate import AbstractAPIBudget, HttpAPIBudget, HttpRequestMatcher, MovingWindowCallRatePolicy, Rate, CachedLimiterSession, LimiterSession
-from .sources.streams.checkpoint import Cursor as LegacyCursor
-from .sources.streams.checkpoint import ResumableFullRefreshCursor
-from .sources.streams.concurrent.adapters import StreamFacade
-from .sources.streams.concurrent.cursor import ConcurrentCursor, CursorField, FinalStateCursor
-from .sources.streams.concurrent.cursor import Cursor
-from .sources.streams.concurrent.state_converters.datetime_stream_state_converter import EpochValueConcurrentStreamStateConverter, IsoMillisConcurrentStreamStateConverter
-from .sources.streams.core import Stream, IncrementalMixin, package_name_from_class
-from .sources.streams.http import HttpStream, HttpSubStream
-from .sources.streams.http.availability_strategy import HttpAvailabilityStrategy
-from .sources.streams.http.exceptions import BaseBackoffException, DefaultBackoffException, UserDefinedBackoffException
-from .sources.streams.http.rate_limiting import default_backoff_handler
-from .sources.streams.http.requests_native_auth import Oauth2Authenticator, TokenAuthenticator, SingleUseRefreshTokenOauth2Authenticator
-from .sources.streams.http.requests_native_auth.abstract_token import AbstractHeaderAuthenticator
-from .sources.utils import casing
-from .sources.utils.schema_helpers import InternalConfig, ResourceSchemaLoader, check_config_against_spec_or_exit, split_config, expand_refs
-from .sources.utils.transform import TransformConfig, TypeTransformer
-from .utils import AirbyteTracedException, is_cloud_environment
-from .utils.constants import ENV_REQUEST_CACHE_PATH
-from .utils.event_timing import create_timer
-from .utils.oneof_option_config import OneOfOptionConfig
-from .utils.spec_schema_transformations import resolve_refs
-from .utils.stream_status_utils import as_airbyte_message
+from importlib import import_module, metadata
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, List, Mapping, Tuple
+
+if TYPE_CHECKING:
+    from .destinations import Destination
+    from .models import AirbyteConnectionStatus, AirbyteMessage, ConfiguredAirbyteCatalog, Status, Type, FailureType, AirbyteStream, AdvancedAuth, DestinationSyncMode, ConnectorSpecification, OAuthConfigSpecification, OrchestratorType, ConfiguredAirbyteStream, SyncMode, AirbyteLogMessage, Level, AirbyteRecordMessage
+
+    from .sources import Source
+    from .config_observation import create_connector_config_control_message, emit_configuration_as_airbyte_control_message
+    from .connector import BaseConnector, Connector
+
+    from .entrypoint import launch, AirbyteEntrypoint
+
+    from .logger import AirbyteLogFormatter, init_logger
+    from .sources import AbstractSource
+    from .sources.concurrent_source.concurrent_source import ConcurrentSource
+    from .sources.concurrent_source.concurrent_source_adapter import ConcurrentSourceAdapter
+    from .sources.config import BaseConfig
+    from .sources.types import Config, Record, StreamSlice
+    from .sources.connector_state_manager import ConnectorStateManager
+    from .sources.declarative.auth import DeclarativeOauth2Authenticator
+    from .sources.declarative.auth.declarative_authenticator import DeclarativeAuthenticator
+    from .sources.declarative.auth.declarative_authenticator import NoAuth
+    from .sources.declarative.auth.oauth import DeclarativeSingleUseRefreshTokenOauth2Authenticator
+    from .sources.declarative.auth.token import BasicHttpAuthenticator, BearerAuthenticator, ApiKeyAuthenticator
+    from .sources.declarative.datetime.min_max_datetime import MinMaxDatetime
+    from .sources.declarative.declarative_stream import DeclarativeStream
+    from .sources.declarative.decoders import Decoder, JsonDecoder
+    from .sources.declarative.exceptions import ReadException
+    from .sources.declarative.extractors import DpathExtractor, RecordSelector
+    from .sources.declarative.extractors.record_extractor import RecordExtractor
+    from .sources.declarative.extractors.record_filter import RecordFilter
+    from .sources.declarative.incremental import DatetimeBasedCursor
+    from .sources.declarative.interpolation import InterpolatedString, InterpolatedBoolean
+    from .sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
+    from .sources.declarative.migrations.legacy_to_per_partition_state_migration import LegacyToPerPartitionStateMigration
+
+    from .sources.declarative.partition_routers import CartesianProductStreamSlicer, SinglePartitionRouter, SubstreamPartitionRouter
+    from .sources.declarative.partition_routers.substream_partition_router import ParentStreamConfig
+    from .sources.declarative.requesters import Requester, HttpRequester
+
+    from .sources.declarative.requesters.error_handlers import BackoffStrategy
+    from .sources.declarative.requesters.paginators import DefaultPaginator, PaginationStrategy
+    from .sources.declarative.requesters.paginators.strategies import OffsetIncrement, CursorPaginationStrategy, PageIncrement, StopConditionPaginationStrategyDecorator
+
+    from .sources.declarative.requesters.request_option import RequestOption, RequestOptionType
+
+    from .sources.declarative.requesters.request_options.default_request_options_provider import DefaultRequestOptionsProvider
+    from .sources.declarative.requesters.request_options.interpolated_request_input_provider import InterpolatedRequestInputProvider
+    from .sources.declarative.requesters.requester import HttpMethod
+    from .sources.declarative.retrievers import SimpleRetriever
+    from .sources.declarative.schema import JsonFileSchemaLoader
+    from .sources.declarative.transformations.add_fields import AddFields, AddedFieldDefinition
+    from .sources.declarative.transformations.transformation import RecordTransformation
+    from .sources.declarative.types import FieldPointer
+    from .sources.declarative.yaml_declarative_source import YamlDeclarativeSource
+    from .sources.message import InMemoryMessageRepository, MessageRepository
+    from .sources.source import TState
+    from .sources.streams.availability_strategy import AvailabilityStrategy
+    from .sources.streams.call_rate import AbstractAPIBudget, HttpAPIBudget, HttpRequestMatcher, MovingWindowCallRatePolicy, Rate, CachedLimiterSession, LimiterSession
+    from .sources.streams.checkpoint import Cursor as LegacyCursor
+    from .sources.streams.checkpoint import ResumableFullRefreshCursor
+    from .sources.streams.concurrent.adapters import StreamFacade
+    from .sources.streams.concurrent.cursor import ConcurrentCursor, CursorField, FinalStateCursor
+    from .sources.streams.concurrent.cursor import Cursor
+    from .sources.streams.concurrent.state_converters.datetime_stream_state_converter import EpochValueConcurrentStreamStateConverter, IsoMillisConcurrentStreamStateConverter
+    from .sources.streams.core import Stream, IncrementalMixin, package_name_from_class
+    from .sources.streams.http import HttpStream, HttpSubStream
+    from .sources.streams.http.availability_strategy import HttpAvailabilityStrategy
+    from .sources.streams.http.exceptions import BaseBackoffException, DefaultBackoffException, UserDefinedBackoffException
+    from .sources.streams.http.rate_limiting import default_backoff_handler
+    from .sources.streams.http.requests_native_auth import Oauth2Authenticator, TokenAuthenticator, SingleUseRefreshTokenOauth2Authenticator
+    from .sources.streams.http.requests_native_auth.abstract_token import AbstractHeaderAuthenticator
+    from .sources.utils import casing
+    from .sources.utils.schema_helpers import InternalConfig, ResourceSchemaLoader, check_config_against_spec_or_exit, split_config, expand_refs
+    from .sources.utils.transform import TransformConfig, TypeTransformer
+    from .utils import AirbyteTracedException, is_cloud_environment
+    from .utils.constants import ENV_REQUEST_CACHE_PATH
+    from .utils.event_timing import create_timer
+    from .utils.oneof_option_config import OneOfOptionConfig
+    from .utils.spec_schema_transformations import resolve_refs
+    from .utils.stream_status_utils import as_airbyte_message
+
+# Importing the whole CDK takes seconds while most connectors only use a few of these names. The names are therefore only imported when
+# they are first accessed. Each name maps to the module it is defined in, relative to this package, and its name in that module.
+_LAZY_EXPORTS: Mapping[str, Tuple[str, str]] = {
+    "Destination": (".destinations", "Destination"),
+    "AirbyteConnectionStatus": (".models", "AirbyteConnectionStatus"),
+    "AirbyteMessage": (".models", "AirbyteMessage"),
+    "ConfiguredAirbyteCatalog": (".models", "ConfiguredAirbyteCatalog"),
+    "Status": (".models", "Status"),
+    "Type": (".models", "Type"),
+    "FailureType": (".models", "FailureType"),
+    "AirbyteStream": (".models", "AirbyteStream"),
+    "AdvancedAuth": (".models", "AdvancedAuth"),
+    "DestinationSyncMode": (".models", "DestinationSyncMode"),
+    "ConnectorSpecification": (".models", "ConnectorSpecification"),
+    "OAuthConfigSpecification": (".models", "OAuthConfigSpecification"),
+    "OrchestratorType": (".models", "OrchestratorType"),
+    "ConfiguredAirbyteStream": (".models", "ConfiguredAirbyteStream"),
+    "SyncMode": (".models", "SyncMode"),
+    "AirbyteLogMessage": (".models", "AirbyteLogMessage"),
+    "Level": (".models", "Level"),
+    "AirbyteRecordMessage": (".models", "AirbyteRecordMessage"),
+    "Source": (".sources", "Source"),
+    "create_connector_config_control_message": (".config_observation", "create_connector_config_control_message"),
+    "emit_configuration_as_airbyte_control_message": (".config_observation", "emit_configuration_as_airbyte_control_message"),
+    "BaseConnector": (".connector", "BaseConnector"),
+    "Connector": (".connector", "Connector"),
+    "launch": (".entrypoint", "launch"),
+    "AirbyteEntrypoint": (".entrypoint", "AirbyteEntrypoint"),
+    "AirbyteLogFormatter": (".logger", "AirbyteLogFormatter"),
+    "init_logger": (".logger", "init_logger"),
+    "AbstractSource": (".sources", "AbstractSource"),
+    "ConcurrentSource": (".sources.concurrent_source.concurrent_source", "ConcurrentSource"),
+    "ConcurrentSourceAdapter": (".sources.concurrent_source.concurrent_source_adapter", "ConcurrentSourceAdapter"),
+    "BaseConfig": (".sources.config", "BaseConfig"),
+    "Config": (".sources.types", "Config"),
+    "Record": (".sources.types", "Record"),
+    "StreamSlice": (".sources.types", "StreamSlice"),
+    "ConnectorStateManager": (".sources.connector_state_manager", "ConnectorStateManager"),
+    "DeclarativeOauth2Authenticator": (".sources.declarative.auth", "DeclarativeOauth2Authenticator"),
+    "DeclarativeAuthenticator": (".sources.declarative.auth.declarative_authenticator", "DeclarativeAuthenticator"),
+    "NoAuth": (".sources.declarative.auth.declarative_authenticator", "NoAuth"),
+    "DeclarativeSingleUseRefreshTokenOauth2Authenticator": (".sources.declarative.auth.oauth", "DeclarativeSingleUseRefreshTokenOauth2Authenticator"),
+    "BasicHttpAuthenticator": (".sources.declarative.auth.token", "BasicHttpAuthenticator"),
+    "BearerAuthenticator": (".sources.declarative.auth.token", "BearerAuthenticator"),
+    "ApiKeyAuthenticator": (".sources.declarative.auth.token", "ApiKeyAuthenticator"),
+    "MinMaxDatetime": (".sources.declarative.datetime.min_max_datetime", "MinMaxDatetime"),
+    "DeclarativeStream": (".sources.declarative.declarative_stream", "DeclarativeStream"),
+    "Decoder": (".sources.declarative.decoders", "Decoder"),
+    "JsonDecoder": (".sources.declarative.decoders", "JsonDecoder"),
+    "ReadException": (".sources.declarative.exceptions", "ReadException"),
+    "DpathExtractor": (".sources.declarative.extractors", "DpathExtractor"),
+    "RecordSelector": (".sources.declarative.extractors", "RecordSelector"),
+    "RecordExtractor": (".sources.declarative.extractors.record_extractor", "RecordExtractor"),
+    "RecordFilter": (".sources.declarative.extractors.record_filter", "RecordFilter"),
+    "DatetimeBasedCursor": (".sources.declarative.incremental", "DatetimeBasedCursor"),
+    "InterpolatedString": (".sources.declarative.interpolation", "InterpolatedString"),
+    "InterpolatedBoolean": (".sources.declarative.interpolation", "InterpolatedBoolean"),
+    "ManifestDeclarativeSource": (".sources.declarative.manifest_declarative_source", "ManifestDeclarativeSource"),
+    "LegacyToPerPartitionStateMigration": (".sources.declarative.migrations.legacy_to_per_partition_state_migration", "LegacyToPerPartitionStateMigration"),
+    "CartesianProductStreamSlicer": (".sources.declarative.partition_routers", "CartesianProductStreamSlicer"),
+    "SinglePartitionRouter": (".sources.declarative.partition_routers", "SinglePartitionRouter"),
+    "SubstreamPartitionRouter": (".sources.declarative.partition_routers", "SubstreamPartitionRouter"),
+    "ParentStreamConfig": (".sources.declarative.partition_routers.substream_partition_router", "ParentStreamConfig"),
+    "Requester": (".sources.declarative.requesters", "Requester"),
+    "HttpRequester": (".sources.declarative.requesters", "HttpRequester"),
+    "BackoffStrategy": (".sources.declarative.requesters.error_handlers", "BackoffStrategy"),
+    "DefaultPaginator": (".sources.declarative.requesters.paginators", "DefaultPaginator"),
+    "PaginationStrategy": (".sources.declarative.requesters.paginators", "PaginationStrategy"),
+    "OffsetIncrement": (".sources.declarative.requesters.paginators.strategies", "OffsetIncrement"),
+    "CursorPaginationStrategy": (".sources.declarative.requesters.paginators.strategies", "CursorPaginationStrategy"),
+    "PageIncrement": (".sources.declarative.requesters.paginators.strategies", "PageIncrement"),
+    "StopConditionPaginationStrategyDecorator": (".sources.declarative.requesters.paginators.strategies", "StopConditionPaginationStrategyDecorator"),
+    "RequestOption": (".sources.declarative.requesters.request_option", "RequestOption"),
+    "RequestOptionType": (".sources.declarative.requesters.request_option", "RequestOptionType"),
+    "DefaultRequestOptionsProvider": (".sources.declarative.requesters.request_options.default_request_options_provider", "DefaultRequestOptionsProvider"),
+    "InterpolatedRequestInputProvider": (".sources.declarative.requesters.request_options.interpolated_request_input_provider", "InterpolatedRequestInputProvider"),
+    "HttpMethod": (".sources.declarative.requesters.requester", "HttpMethod"),
+    "SimpleRetriever": (".sources.declarative.retrievers", "SimpleRetriever"),
+    "JsonFileSchemaLoader": (".sources.declarative.schema", "JsonFileSchemaLoader"),
+    "AddFields": (".sources.declarative.transformations.add_fields", "AddFields"),
+    "AddedFieldDefinition": (".sources.declarative.transformations.add_fields", "AddedFieldDefinition"),
+    "RecordTransformation": (".sources.declarative.transformations.transformation", "RecordTransformation"),
+    "FieldPointer": (".sources.declarative.types", "FieldPointer"),
+    "YamlDeclarativeSource": (".sources.declarative.yaml_declarative_source", "YamlDeclarativeSource"),
+    "InMemoryMessageRepository": (".sources.message", "InMemoryMessageRepository"),
+    "MessageRepository": (".sources.message", "MessageRepository"),
+    "TState": (".sources.source", "TState"),
+    "AvailabilityStrategy": (".sources.streams.availability_strategy", "AvailabilityStrategy"),
+    "AbstractAPIBudget": (".sources.streams.call_rate", "AbstractAPIBudget"),
+    "HttpAPIBudget": (".sources.streams.call_rate", "HttpAPIBudget"),
+    "HttpRequestMatcher": (".sources.streams.call_rate", "HttpRequestMatcher"),
+    "MovingWindowCallRatePolicy": (".sources.streams.call_rate", "MovingWindowCallRatePolicy"),
+    "Rate": (".sources.streams.call_rate", "Rate"),
+    "CachedLimiterSession": (".sources.streams.call_rate", "CachedLimiterSession"),
+    "LimiterSession": (".sources.streams.call_rate", "LimiterSession"),
+    "LegacyCursor": (".sources.streams.checkpoint", "Cursor"),
+    "ResumableFullRefreshCursor": (".sources.streams.checkpoint", "ResumableFullRefreshCursor"),
+    "StreamFacade": (".sources.streams.concurrent.adapters", "StreamFacade"),
+    "ConcurrentCursor": (".sources.streams.concurrent.cursor", "ConcurrentCursor"),
+    "CursorField": (".sources.streams.concurrent.cursor", "CursorField"),
+    "FinalStateCursor": (".sources.streams.concurrent.cursor", "FinalStateCursor"),
+    "Cursor": (".sources.streams.concurrent.cursor", "Cursor"),
+    "EpochValueConcurrentStreamStateConverter": (".sources.streams.concurrent.state_converters.datetime_stream_state_converter", "EpochValueConcurrentStreamStateConverter"),
+    "IsoMillisConcurrentStreamStateConverter": (".sources.streams.concurrent.state_converters.datetime_stream_state_converter", "IsoMillisConcurrentStreamStateConverter"),
+    "Stream": (".sources.streams.core", "Stream"),
+    "IncrementalMixin": (".sources.streams.core", "IncrementalMixin"),
+    "package_name_from_class": (".sources.streams.core", "package_name_from_class"),
+    "HttpStream": (".sources.streams.http", "HttpStream"),
+    "HttpSubStream": (".sources.streams.http", "HttpSubStream"),
+    "HttpAvailabilityStrategy": (".sources.streams.http.availability_strategy", "HttpAvailabilityStrategy"),
+    "BaseBackoffException": (".sources.streams.http.exceptions", "BaseBackoffException"),
+    "DefaultBackoffException": (".sources.streams.http.exceptions", "DefaultBackoffException"),
+    "UserDefinedBackoffException": (".sources.streams.http.exceptions", "UserDefinedBackoffException"),
+    "default_backoff_handler": (".sources.streams.http.rate_limiting", "default_backoff_handler"),
+    "Oauth2Authenticator": (".sources.streams.http.requests_native_auth", "Oauth2Authenticator"),
+    "TokenAuthenticator": (".sources.streams.http.requests_native_auth", "TokenAuthenticator"),
+    "SingleUseRefreshTokenOauth2Authenticator": (".sources.streams.http.requests_native_auth", "SingleUseRefreshTokenOauth2Authenticator"),
+    "AbstractHeaderAuthenticator": (".sources.streams.http.requests_native_auth.abstract_token", "AbstractHeaderAuthenticator"),
+    "casing": (".sources.utils", "casing"),
+    "InternalConfig": (".sources.utils.schema_helpers", "InternalConfig"),
+    "ResourceSchemaLoader": (".sources.utils.schema_helpers", "ResourceSchemaLoader"),
+    "check_config_against_spec_or_exit": (".sources.utils.schema_helpers", "check_config_against_spec_or_exit"),
+    "split_config": (".sources.utils.schema_helpers", "split_config"),
+    "expand_refs": (".sources.utils.schema_helpers", "expand_refs"),
+    "TransformConfig": (".sources.utils.transform", "TransformConfig"),
+    "TypeTransformer": (".sources.utils.transform", "TypeTransformer"),
+    "AirbyteTracedException": (".utils", "AirbyteTracedException"),
+    "is_cloud_environment": (".utils", "is_cloud_environment"),
+    "ENV_REQUEST_CACHE_PATH": (".utils.constants", "ENV_REQUEST_CACHE_PATH"),
+    "create_timer": (".utils.event_timing", "create_timer"),
+    "OneOfOptionConfig": (".utils.oneof_option_config", "OneOfOptionConfig"),
+    "resolve_refs": (".utils.spec_schema_transformations", "resolve_refs"),
+    "as_airbyte_message": (".utils.stream_status_utils", "as_airbyte_message"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_EXPORTS:
+        # Submodules used to be available as attributes once the package was imported as the package imported them
+        if find_spec(f"{__name__}.{name}") is not None:
+            return import_module(f".{name}", __name__)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attribute_name = _LAZY_EXPORTS[name]
+    module = import_module(module_name, __name__)
+    try:
+        value = getattr(module, attribute_name)
+    except AttributeError:
+        # The name is a submodule that is not imported by its package
+        value = import_module(f"{module_name}.{attribute_name}", __name__)
+    # Caching the value in the module namespace means __getattr__ is not called for this name anymore
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
 
 __all__ = [
@@ -0,0 +1,94 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+from typing import IO, Any, Iterator, List, Mapping, Optional, Union
+
+from airbyte_cdk.models import AirbyteMessage, AirbyteMessageSerializer, Type
+from airbyte_cdk.models.airbyte_protocol import AirbyteRecordMessageMeta
+from orjson import orjson
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+_RECORD_TYPE = Type.RECORD.value
+
+
+class AirbyteRecordView:
+    """
+    Lightweight representation of a record message read by a destination. The record data is the dict parsed from the input and the
+    AirbyteMessage is only built if `to_airbyte_message` is called.
+
+    The view exposes the same attributes as an AirbyteMessage of type RECORD (`view.type` and `view.record.data` for example) so that
+    destinations iterating over AirbyteMessages can consume it as is.
+    """
+
+    __slots__ = ("stream", "namespace", "data", "emitted_at", "_message")
+
+    type = Type.RECORD
+
+    def __init__(self, message: Mapping[str, Any]) -> None:
+        record = message["record"]
+        self.stream: str = record["stream"]
+        self.namespace: Optional[str] = record.get("namespace")
+        self.data: Mapping[str, Any] = record["data"]
+        self.emitted_at: int = record["emitted_at"]
+        self._message = message
+
+    @property
+    def record(self) -> "AirbyteRecordView":
+        return self
+
+    @property
+    def meta(self) -> Optional[AirbyteRecordMessageMeta]:
+        return self.to_airbyte_message().record.meta  # type: ignore[union-attr]  # the message is a record
+
+    def to_airbyte_message(self) -> AirbyteMessage:
+        return AirbyteMessageSerializer.load(self._message)  # type: ignore[no-any-return]  # serpyco has no typing
+
+    def __repr__(self) -> str:
+        return (
+            f"AirbyteRecordView(stream={self.stream!r}, namespace={self.namespace!r}, data={self.data!r}, emitted_at={self.emitted_at!r})"
+        )
+
+
+def iterate_lines(stream: IO[bytes], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yield the lines of a binary stream without their line separator. The stream is read by chunks of `chunk_size` bytes which are split
+    on newlines without being decoded.
+    """
+    remainder = b""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        lines: List[bytes] = chunk.split(b"\n")
+        # Only the line overlapping two chunks is copied
+        lines[0] = remainder + lines[0]
+        remainder = lines.pop()
+        yield from lines
+    if remainder:
+        yield remainder
+
+
+def parse_input_messages(
+    stream: IO[bytes], logger: logging.Logger, use_record_views: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Union[AirbyteMessage, AirbyteRecordView]]:
+    """
+    Parse the Airbyte messages of a binary stream, one message per line. Lines that can't be deserialized as JSON are logged and ignored.
+
+    :param stream: The stream to read the messages from
+    :param logger: The logger used to report the lines that are ignored
+    :param use_record_views: If True, record messages are returned as AirbyteRecordViews instead of AirbyteMessages
+    :param chunk_size: The number of bytes read from the stream at once
+    """
+    for line in iterate_lines(stream, chunk_size):
+        try:
+            message = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            if line.strip():
+                logger.info(f"ignoring input which can't be deserialized as Airbyte Message: {line.decode('utf-8', errors='replace')}")
+            continue
+        if use_record_views and isinstance(message, dict) and message.get("type") == _RECORD_TYPE:
+            yield AirbyteRecordView(message)
+        else:
+            yield AirbyteMessageSerializer.load(message)
@@ -10,6 +10,7 @@ from abc import ABC, abstractmethod
 from typing import Any, Iterable, List, Mapping
 
 from airbyte_cdk.connector import Connector
+from airbyte_cdk.destinations.binary_input import parse_input_messages
 from airbyte_cdk.exception_handler import init_uncaught_exception_handler
 from airbyte_cdk.models import AirbyteMessage, AirbyteMessageSerializer, ConfiguredAirbyteCatalog, ConfiguredAirbyteCatalogSerializer, Type
 from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_or_exit
@@ -22,6 +23,10 @@ logger = logging.getLogger("airbyte")
 class Destination(Connector, ABC):
     VALID_CMDS = {"spec", "check", "write"}
 
+    # If True, `write` receives record messages as AirbyteRecordViews which expose the stream, namespace, data and emitted_at of the
+    # record without building the AirbyteMessage. Other messages are still AirbyteMessages
+    use_record_views = False
+
     @abstractmethod
     def write(
         self, config: Mapping[str, Any], configured_catalog: ConfiguredAirbyteCatalog, input_messages: Iterable[AirbyteMessage]
@@ -34,6 +39,12 @@ class Destination(Connector, ABC):
 
     def _parse_input_stream(self, input_stream: io.TextIOWrapper) -> Iterable[AirbyteMessage]:
         """Reads from stdin, converting to Airbyte messages"""
+        binary_stream = getattr(input_stream, "buffer", None)
+        if binary_stream is not None:
+            # Reading the underlying bytes avoids decoding the input as orjson parses bytes directly
+            yield from parse_input_messages(binary_stream, logger, self.use_record_views)  # type: ignore[misc]  # views are opted in
+            return
+
         for line in input_stream:
             try:
                 yield AirbyteMessageSerializer.load(orjson.loads(line))
@@ -0,0 +1,132 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+import logging
+import time
+from typing import Optional
+
+from airbyte_cdk.sources.streams.http.rate_limiting import RateLimitedResponsesCounter, rate_limited_responses_counter
+
+
+class AdaptiveConcurrencyController:
+    """
+    Limits the number of partitions being read concurrently and adjusts this limit while the sync is running.
+
+    The thread pool is sized for the maximum number of partition readers but only `limit` partitions are submitted at the same time: the
+    other ones are held back by the ConcurrentReadProcessor until a slot is released, so that no worker thread waits for a slot. Every
+    `evaluation_interval_in_seconds`, the limit is re-evaluated from the signals collected since the last evaluation:
+    * If requests were rate limited (HTTP 429), the limit is halved as adding readers would only make the API reject more requests
+    * If the queue is almost full, the main thread can't keep up with the readers and the limit is decreased by one
+    * If the main thread is busy most of the time, adding readers would only fill the queue so the limit is kept as is
+    * If partitions are waiting for a slot, the limit is increased by one
+
+    Decisions are logged using the logger provided. All the methods are meant to be called from the main thread.
+    """
+
+    DEFAULT_EVALUATION_INTERVAL_IN_SECONDS = 5.0
+    DEFAULT_QUEUE_HIGH_WATERMARK = 0.8
+    DEFAULT_CONSUMER_BUSY_THRESHOLD = 0.9
+
+    def __init__(
+        self,
+        min_readers: int,
+        max_readers: int,
+        logger: logging.Logger,
+        initial_readers: Optional[int] = None,
+        evaluation_interval_in_seconds: float = DEFAULT_EVALUATION_INTERVAL_IN_SECONDS,
+        queue_high_watermark: float = DEFAULT_QUEUE_HIGH_WATERMARK,
+        consumer_busy_threshold: float = DEFAULT_CONSUMER_BUSY_THRESHOLD,
+        rate_limit_counter: RateLimitedResponsesCounter = rate_limited_responses_counter,
+    ) -> None:
+        """
+        :param min_readers: The minimum number of partitions that can be read concurrently
+        :param max_readers: The maximum number of partitions that can be read concurrently. This should not be more than the number of
+          threads available to read partitions
+        :param logger: The logger used to report the decisions
+        :param initial_readers: The number of partitions that can be read concurrently when the sync starts. Defaults to `max_readers`
+        :param evaluation_interval_in_seconds: The minimum time between two evaluations of the limit
+        :param queue_high_watermark: The ratio of the queue capacity above which the main thread is considered to be lagging behind
+        :param consumer_busy_threshold: The ratio of time the main thread spends handling items above which it is considered busy
+        :param rate_limit_counter: The counter of rate limited responses
+        """
+        if min_readers < 1 or max_readers < min_readers:
+            raise ValueError(f"Expected 1 <= min_readers <= max_readers but got min_readers={min_readers} and max_readers={max_readers}")
+        self._min_readers = min_readers
+        self._max_readers = max_readers
+        self._logger = logger
+        self._limit = max(min_readers, min(max_readers, initial_readers if initial_readers is not None else max_readers))
+        self._evaluation_interval_in_seconds = evaluation_interval_in_seconds
+        self._queue_high_watermark = queue_high_watermark
+        self._consumer_busy_threshold = consumer_busy_threshold
+        self._rate_limit_counter = rate_limit_counter
+
+        self._active_readers = 0
+
+        self._last_evaluation_time = time.monotonic()
+        self._last_rate_limited_responses_count = rate_limit_counter.value
+        self._consumer_waiting_time = 0.0
+        self._consumer_handling_time = 0.0
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def try_acquire_reading_slot(self) -> bool:
+        """
+        Take a reading slot if the number of partitions being read is below the limit.
+        :return: True if the partition can be submitted, False if it has to wait for a slot
+        """
+        if self._active_readers >= self._limit:
+            return False
+        self._active_readers += 1
+        return True
+
+    def release_reading_slot(self) -> None:
+        """
+        Release the slot of a partition once it is read.
+        """
+        self._active_readers -= 1
+
+    def on_item_consumed(self, waiting_time_in_seconds: float, handling_time_in_seconds: float) -> None:
+        """
+        Record how long the main thread waited for a queue item and how long it took to handle it.
+        """
+        self._consumer_waiting_time += waiting_time_in_seconds
+        self._consumer_handling_time += handling_time_in_seconds
+
+    def maybe_adjust(self, queue_size: int, queue_max_size: int, waiting_readers: int = 0) -> None:
+        """
+        Re-evaluate the limit if the evaluation interval has elapsed.
+        :param queue_size: The number of items in the queue shared between the workers and the main thread
+        :param queue_max_size: The capacity of the queue
+        :param waiting_readers: The number of partitions waiting for a reading slot
+        """
+        now = time.monotonic()
+        if now - self._last_evaluation_time < self._evaluation_interval_in_seconds:
+            return
+        self._last_evaluation_time = now
+
+        rate_limited_responses_count = self._rate_limit_counter.value
+        new_rate_limited_responses = rate_limited_responses_count - self._last_rate_limited_responses_count
+        self._last_rate_limited_responses_count = rate_limited_responses_count
+        consumer_total_time = self._consumer_waiting_time + self._consumer_handling_time
+        consumer_busy_ratio = self._consumer_handling_time / consumer_total_time if consumer_total_time else 0.0
+        self._consumer_waiting_time = 0.0
+        self._consumer_handling_time = 0.0
+        queue_fill_ratio = queue_size / queue_max_size if queue_max_size > 0 else 0.0
+
+        if new_rate_limited_responses > 0:
+            self._set_limit(self._limit // 2, f"{new_rate_limited_responses} requests were rate limited")
+        elif queue_fill_ratio >= self._queue_high_watermark:
+            self._set_limit(self._limit - 1, f"the queue is {queue_fill_ratio:.0%} full")
+        elif consumer_busy_ratio >= self._consumer_busy_threshold:
+            self._logger.debug(f"Keeping {self._limit} concurrent partition readers as the main thread is {consumer_busy_ratio:.0%} busy")
+        elif waiting_readers > 0:
+            self._set_limit(self._limit + 1, "partitions were waiting to be read")
+
+    def _set_limit(self, limit: int, reason: str) -> None:
+        limit = max(self._min_readers, min(self._max_readers, limit))
+        if limit == self._limit:
+            return
+        self._logger.info(f"Adjusting the number of concurrent partition readers from {self._limit} to {limit} because {reason}")
+        self._limit = limit
@@ -2,11 +2,13 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 import logging
-from typing import Dict, Iterable, List, Optional, Set
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Set
 
 from airbyte_cdk.exception_handler import generate_failed_streams_error_message
 from airbyte_cdk.models import AirbyteMessage, AirbyteStreamStatus, FailureType, StreamDescriptor
 from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources.concurrent_source.adaptive_concurrency import AdaptiveConcurrencyController
 from airbyte_cdk.sources.concurrent_source.partition_generation_completed_sentinel import PartitionGenerationCompletedSentinel
 from airbyte_cdk.sources.concurrent_source.stream_thread_exception import StreamThreadException
 from airbyte_cdk.sources.concurrent_source.thread_pool_manager import ThreadPoolManager
@@ -15,7 +17,7 @@ from airbyte_cdk.sources.streams.concurrent.abstract_stream import AbstractStrea
 from airbyte_cdk.sources.streams.concurrent.partition_enqueuer import PartitionEnqueuer
 from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
-from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record, RecordBatch
 from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel
 from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
 from airbyte_cdk.sources.utils.slice_logger import SliceLogger
@@ -33,6 +35,7 @@ class ConcurrentReadProcessor:
         slice_logger: SliceLogger,
         message_repository: MessageRepository,
         partition_reader: PartitionReader,
+        concurrency_controller: Optional[AdaptiveConcurrencyController] = None,
     ):
         """
         This class is responsible for handling items from a concurrent stream read process.
@@ -43,6 +46,7 @@ class ConcurrentReadProcessor:
         :param slice_logger: SliceLogger instance
         :param message_repository: MessageRepository instance
         :param partition_reader: PartitionReader instance
+        :param concurrency_controller: If provided, partitions are only submitted once the controller grants them a reading slot
         """
         self._stream_name_to_instance = {s.name: s for s in stream_instances_to_read_from}
         self._record_counter = {}
@@ -60,6 +64,9 @@ class ConcurrentReadProcessor:
         self._partition_reader = partition_reader
         self._streams_done: Set[str] = set()
         self._exceptions_per_stream_name: dict[str, List[Exception]] = {}
+        self._concurrency_controller = concurrency_controller
+        # Partitions are held back here rather than in the worker threads so that waiting for a reading slot does not occupy a thread
+        self._partitions_waiting_for_reading_slot: Deque[Partition] = deque()
 
     def on_partition_generation_completed(self, sentinel: PartitionGenerationCompletedSentinel) -> Iterable[AirbyteMessage]:
         """
@@ -82,22 +89,48 @@ class ConcurrentReadProcessor:
         This method is called when a partition is generated.
         1. Add the partition to the set of partitions for the stream
         2. Log the slice if necessary
-        3. Submit the partition to the thread pool manager
+        3. Submit the partition to the thread pool manager, or hold it back until the concurrency controller grants it a reading slot
         """
         stream_name = partition.stream_name()
         self._streams_to_running_partitions[stream_name].add(partition)
         if self._slice_logger.should_log_slice_message(self._logger):
             self._message_repository.emit_message(self._slice_logger.create_slice_log_message(partition.to_slice()))
+        if self._concurrency_controller and not self._concurrency_controller.try_acquire_reading_slot():
+            self._partitions_waiting_for_reading_slot.append(partition)
+            return
         self._thread_pool_manager.submit(self._partition_reader.process_partition, partition)
 
+    @property
+    def waiting_partitions_count(self) -> int:
+        """
+        The number of partitions held back until the concurrency controller grants them a reading slot
+        """
+        return len(self._partitions_waiting_for_reading_slot)
+
+    def submit_waiting_partitions(self) -> None:
+        """
+        Submit the partitions held back for as long as the concurrency controller grants reading slots. This is meant to be called when a
+        slot is released or when the limit of the controller may have increased.
+        """
+        while (
+            self._concurrency_controller
+            and self._partitions_waiting_for_reading_slot
+            and self._concurrency_controller.try_acquire_reading_slot()
+        ):
+            self._thread_pool_manager.submit(self._partition_reader.process_partition, self._partitions_waiting_for_reading_slot.popleft())
+
     def on_partition_complete_sentinel(self, sentinel: PartitionCompleteSentinel) -> Iterable[AirbyteMessage]:
         """
         This method is called when a partition is completed.
-        1. Close the partition
-        2. If the stream is done, mark it as such and return a stream status message
-        3. Emit messages that were added to the message repository
+        1. Release the reading slot of the partition and submit the next partition waiting for one
+        2. Close the partition
+        3. If the stream is done, mark it as such and return a stream status message
+        4. Emit messages that were added to the message repository
         """
         partition = sentinel.partition
+        if self._concurrency_controller:
+            self._concurrency_controller.release_reading_slot()
+            self.submit_waiting_partitions()
 
         try:
             if sentinel.is_successful:
@@ -141,6 +174,30 @@ class ConcurrentReadProcessor:
         yield message
         yield from self._message_repository.consume_queue()
 
+    def on_record_batch(self, record_batch: RecordBatch) -> Iterable[AirbyteMessage]:
+        """
+        Same as `on_record` for all the records of the batch. The record counter and the cursor are updated once for the whole batch and the
+        messages from the message repository are emitted after the records.
+        """
+        stream_name = record_batch.partition.stream_name()
+        stream = self._stream_name_to_instance[stream_name]
+        messages = [stream_data_to_airbyte_message(stream_name, record.data) for record in record_batch.records]
+        number_of_records = sum(1 for message in messages if message.type == MessageType.RECORD)
+
+        if number_of_records:
+            if self._record_counter[stream.name] == 0:
+                self._logger.info(f"Marking stream {stream.name} as RUNNING")
+                yield stream_status_as_airbyte_message(stream.as_airbyte_stream(), AirbyteStreamStatus.RUNNING)
+            self._record_counter[stream.name] += number_of_records
+            if number_of_records < len(messages):
+                record_batch = RecordBatch(
+                    [record for record, message in zip(record_batch.records, messages) if message.type == MessageType.RECORD],
+                    record_batch.partition,
+                )
+            stream.cursor.observe_batch(record_batch)
+        yield from messages
+        yield from self._message_repository.consume_queue()
+
     def on_exception(self, exception: StreamThreadException) -> Iterable[AirbyteMessage]:
         """
         This method is called when an exception is raised.
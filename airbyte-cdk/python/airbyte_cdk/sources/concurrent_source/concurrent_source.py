@@ -3,12 +3,15 @@
 #
 import concurrent
 import logging
+import time
 from queue import Queue
-from typing import Iterable, Iterator, List
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional
 
 from airbyte_cdk.models import AirbyteMessage
+from airbyte_cdk.sources.concurrent_source.adaptive_concurrency import AdaptiveConcurrencyController
 from airbyte_cdk.sources.concurrent_source.concurrent_read_processor import ConcurrentReadProcessor
 from airbyte_cdk.sources.concurrent_source.partition_generation_completed_sentinel import PartitionGenerationCompletedSentinel
+from airbyte_cdk.sources.concurrent_source.partition_reader_process_pool import PartitionReaderProcessPool
 from airbyte_cdk.sources.concurrent_source.stream_thread_exception import StreamThreadException
 from airbyte_cdk.sources.concurrent_source.thread_pool_manager import ThreadPoolManager
 from airbyte_cdk.sources.message import InMemoryMessageRepository, MessageRepository
@@ -16,10 +19,14 @@ from airbyte_cdk.sources.streams.concurrent.abstract_stream import AbstractStrea
 from airbyte_cdk.sources.streams.concurrent.partition_enqueuer import PartitionEnqueuer
 from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
-from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record, RecordBatch
 from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel, QueueItem
 from airbyte_cdk.sources.utils.slice_logger import DebugSliceLogger, SliceLogger
 
+if TYPE_CHECKING:
+    # aiohttp is an optional dependency
+    from airbyte_cdk.sources.streams.http.async_http_client import AsyncHttpEngine
+
 
 class ConcurrentSource:
     """
@@ -30,6 +37,11 @@ class ConcurrentSource:
     """
 
     DEFAULT_TIMEOUT_SECONDS = 900
+    # We set a maxsize to for the main thread to process record items when the queue size grows. This assumes that there are less
+    # threads generating partitions that than are max number of workers. If it weren't the case, we could have threads only generating
+    # partitions which would fill the queue. This number is arbitrarily set to 10_000 but will probably need to be changed given more
+    # information and might even need to be configurable depending on the source
+    DEFAULT_QUEUE_MAX_SIZE = 10_000
 
     @staticmethod
     def create(
@@ -39,16 +51,61 @@ class ConcurrentSource:
         slice_logger: SliceLogger,
         message_repository: MessageRepository,
         timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+        adaptive_concurrency: bool = False,
+        queue_max_size: int = DEFAULT_QUEUE_MAX_SIZE,
+        max_concurrent_tasks: int = ThreadPoolManager.DEFAULT_MAX_QUEUE_SIZE,
+        num_partition_reader_processes: int = 0,
+        record_batch_size: int = 1,
+        record_batch_timeout_in_seconds: float = PartitionReader.DEFAULT_RECORD_BATCH_TIMEOUT_IN_SECONDS,
+        use_async_http: bool = False,
     ) -> "ConcurrentSource":
+        """
+        :param adaptive_concurrency: If True, the number of partitions read concurrently is adjusted during the sync between 1 and the
+          number of workers not reserved for partition generation. See AdaptiveConcurrencyController
+        :param queue_max_size: The maximum number of items in the queue shared between the workers and the main thread
+        :param max_concurrent_tasks: The maximum number of tasks that can be pending in the thread pool at the same time
+        :param num_partition_reader_processes: If greater than 0, partitions that can be serialized are read in this number of worker
+          processes instead of the threads. This is meant for streams where reading a partition is CPU-bound. See PartitionReaderProcessPool
+        :param record_batch_size: If greater than 1, records are moved from the workers to the main thread in batches of up to this number
+          of records in order to reduce the synchronization overhead of the queue
+        :param record_batch_timeout_in_seconds: The maximum time a record waits in a batch before the batch is moved to the main thread
+        :param use_async_http: If True, partitions of the HttpStreams using the AsyncHttpClient are read on the event loop of the shared
+          AsyncHttpEngine instead of blocking a worker thread each. This requires the `async-http` extra
+        """
         is_single_threaded = initial_number_of_partitions_to_generate == 1 and num_workers == 1
         too_many_generator = not is_single_threaded and initial_number_of_partitions_to_generate >= num_workers
         assert not too_many_generator, "It is required to have more workers than threads generating partitions"
         threadpool = ThreadPoolManager(
             concurrent.futures.ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="workerpool"),
             logger,
+            max_concurrent_tasks,
+        )
+        concurrency_controller = (
+            AdaptiveConcurrencyController(1, max(1, num_workers - initial_number_of_partitions_to_generate), logger)
+            if adaptive_concurrency
+            else None
         )
+        partition_reader_process_pool = (
+            PartitionReaderProcessPool(num_partition_reader_processes, logger) if num_partition_reader_processes > 0 else None
+        )
+        async_http_engine = None
+        if use_async_http:
+            from airbyte_cdk.sources.streams.http.async_http_client import AsyncHttpEngine
+
+            async_http_engine = AsyncHttpEngine.shared()
         return ConcurrentSource(
-            threadpool, logger, slice_logger, message_repository, initial_number_of_partitions_to_generate, timeout_seconds
+            threadpool,
+            logger,
+            slice_logger,
+            message_repository,
+            initial_number_of_partitions_to_generate,
+            timeout_seconds,
+            queue_max_size,
+            concurrency_controller,
+            partition_reader_process_pool,
+            record_batch_size,
+            record_batch_timeout_in_seconds,
+            async_http_engine,
         )
 
     def __init__(
@@ -59,6 +116,12 @@ class ConcurrentSource:
         message_repository: MessageRepository = InMemoryMessageRepository(),
         initial_number_partitions_to_generate: int = 1,
         timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+        queue_max_size: int = DEFAULT_QUEUE_MAX_SIZE,
+        concurrency_controller: Optional[AdaptiveConcurrencyController] = None,
+        partition_reader_process_pool: Optional[PartitionReaderProcessPool] = None,
+        record_batch_size: int = 1,
+        record_batch_timeout_in_seconds: float = PartitionReader.DEFAULT_RECORD_BATCH_TIMEOUT_IN_SECONDS,
+        async_http_engine: Optional["AsyncHttpEngine"] = None,
     ) -> None:
         """
         :param threadpool: The threadpool to submit tasks to
@@ -67,6 +130,12 @@ class ConcurrentSource:
         :param message_repository: The repository to emit messages to
         :param initial_number_partitions_to_generate: The initial number of concurrent partition generation tasks. Limiting this number ensures will limit the latency of the first records emitted. While the latency is not critical, emitting the records early allows the platform and the destination to process them as early as possible.
         :param timeout_seconds: The maximum number of seconds to wait for a record to be read from the queue. If no record is read within this time, the source will stop reading and return.
+        :param queue_max_size: The maximum number of items in the queue shared between the workers and the main thread
+        :param concurrency_controller: If provided, limits the number of partitions read concurrently based on how the sync is going
+        :param partition_reader_process_pool: If provided, partitions that can be serialized are read in worker processes
+        :param record_batch_size: If greater than 1, records are put in the queue in batches of up to this number of records
+        :param record_batch_timeout_in_seconds: The maximum time a record waits in a batch before the batch is put in the queue
+        :param async_http_engine: If provided, partitions that can be read asynchronously are read on the event loop of this engine
         """
         self._threadpool = threadpool
         self._logger = logger
@@ -74,6 +143,12 @@ class ConcurrentSource:
         self._message_repository = message_repository
         self._initial_number_partitions_to_generate = initial_number_partitions_to_generate
         self._timeout_seconds = timeout_seconds
+        self._queue_max_size = queue_max_size
+        self._concurrency_controller = concurrency_controller
+        self._partition_reader_process_pool = partition_reader_process_pool
+        self._record_batch_size = record_batch_size
+        self._record_batch_timeout_in_seconds = record_batch_timeout_in_seconds
+        self._async_http_engine = async_http_engine
 
     def read(
         self,
@@ -81,11 +156,7 @@ class ConcurrentSource:
     ) -> Iterator[AirbyteMessage]:
         self._logger.info("Starting syncing")
 
-        # We set a maxsize to for the main thread to process record items when the queue size grows. This assumes that there are less
-        # threads generating partitions that than are max number of workers. If it weren't the case, we could have threads only generating
-        # partitions which would fill the queue. This number is arbitrarily set to 10_000 but will probably need to be changed given more
-        # information and might even need to be configurable depending on the source
-        queue: Queue[QueueItem] = Queue(maxsize=10_000)
+        queue: Queue[QueueItem] = Queue(maxsize=self._queue_max_size)
         concurrent_stream_processor = ConcurrentReadProcessor(
             streams,
             PartitionEnqueuer(queue, self._threadpool),
@@ -93,18 +164,29 @@ class ConcurrentSource:
             self._logger,
             self._slice_logger,
             self._message_repository,
-            PartitionReader(queue),
+            PartitionReader(
+                queue,
+                self._partition_reader_process_pool,
+                self._record_batch_size,
+                self._record_batch_timeout_in_seconds,
+                self._async_http_engine,
+            ),
+            self._concurrency_controller,
         )
 
-        # Enqueue initial partition generation tasks
-        yield from self._submit_initial_partition_generators(concurrent_stream_processor)
+        try:
+            # Enqueue initial partition generation tasks
+            yield from self._submit_initial_partition_generators(concurrent_stream_processor)
 
-        # Read from the queue until all partitions were generated and read
-        yield from self._consume_from_queue(
-            queue,
-            concurrent_stream_processor,
-        )
-        self._threadpool.check_for_errors_and_shutdown()
+            # Read from the queue until all partitions were generated and read
+            yield from self._consume_from_queue(
+                queue,
+                concurrent_stream_processor,
+            )
+            self._threadpool.check_for_errors_and_shutdown()
+        finally:
+            if self._partition_reader_process_pool:
+                self._partition_reader_process_pool.shutdown()
         self._logger.info("Finished syncing")
 
     def _submit_initial_partition_generators(self, concurrent_stream_processor: ConcurrentReadProcessor) -> Iterable[AirbyteMessage]:
@@ -118,14 +200,44 @@ class ConcurrentSource:
         queue: Queue[QueueItem],
         concurrent_stream_processor: ConcurrentReadProcessor,
     ) -> Iterable[AirbyteMessage]:
+        if self._concurrency_controller:
+            yield from self._consume_from_queue_with_concurrency_controller(queue, concurrent_stream_processor, self._concurrency_controller)
+            return
+
+        while airbyte_message_or_record_or_exception := queue.get():
+            yield from self._handle_item(
+                airbyte_message_or_record_or_exception,
+                concurrent_stream_processor,
+            )
+            if concurrent_stream_processor.is_done() and queue.empty():
+                # all partitions were generated and processed. we're done here
+                break
+
+    def _consume_from_queue_with_concurrency_controller(
+        self,
+        queue: Queue[QueueItem],
+        concurrent_stream_processor: ConcurrentReadProcessor,
+        concurrency_controller: AdaptiveConcurrencyController,
+    ) -> Iterable[AirbyteMessage]:
+        """
+        Same as `_consume_from_queue` but measures how long the main thread waits for items and how long it takes to handle them in order
+        for the concurrency controller to adjust the number of partitions read concurrently.
+        """
+        waiting_start_time = time.monotonic()
         while airbyte_message_or_record_or_exception := queue.get():
+            handling_start_time = time.monotonic()
             yield from self._handle_item(
                 airbyte_message_or_record_or_exception,
                 concurrent_stream_processor,
             )
+            handling_end_time = time.monotonic()
+            concurrency_controller.on_item_consumed(handling_start_time - waiting_start_time, handling_end_time - handling_start_time)
+            concurrency_controller.maybe_adjust(queue.qsize(), queue.maxsize, concurrent_stream_processor.waiting_partitions_count)
+            concurrent_stream_processor.submit_waiting_partitions()
             if concurrent_stream_processor.is_done() and queue.empty():
                 # all partitions were generated and processed. we're done here
                 break
+            waiting_start_time = handling_end_time
 
     def _handle_item(
         self,
@@ -143,5 +255,7 @@ class ConcurrentSource:
             yield from concurrent_stream_processor.on_partition_complete_sentinel(queue_item)
         elif isinstance(queue_item, Record):
             yield from concurrent_stream_processor.on_record(queue_item)
+        elif isinstance(queue_item, RecordBatch):
+            yield from concurrent_stream_processor.on_record_batch(queue_item)
         else:
             raise ValueError(f"Unknown queue item type: {type(queue_item)}")
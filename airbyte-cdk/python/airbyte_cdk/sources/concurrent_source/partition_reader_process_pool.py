@@ -0,0 +1,277 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+import functools
+import io
+import logging
+import multiprocessing
+import pickle
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from logging.handlers import QueueHandler
+from multiprocessing.context import BaseContext
+from multiprocessing.managers import SyncManager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+from airbyte_cdk.models import AirbyteMessage, Level
+from airbyte_cdk.sources.message import LogMessage, MessageRepository
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.http.requests_native_auth import SingleUseRefreshTokenOauth2Authenticator
+
+# Time to wait for a batch before checking if the worker process is still alive
+_POLLING_INTERVAL_IN_SECONDS = 1.0
+_MESSAGE_REPOSITORY_ID = "message_repository"
+
+
+class _NotReadableInWorkerProcess(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class _EmittedMessage:
+    repository_index: int
+    message: AirbyteMessage
+
+
+@dataclass(frozen=True)
+class _LoggedMessage:
+    repository_index: int
+    level: Level
+    message: LogMessage
+
+
+class _PartitionPickler(pickle.Pickler):
+    """
+    Pickles a partition, replacing the message repositories it references by their index in `message_repositories` so that the messages
+    emitted in the worker process can be forwarded to them.
+    """
+
+    def __init__(self, file: io.BytesIO) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.message_repositories: List[MessageRepository] = []
+        self._index_by_repository_id: Dict[int, int] = {}
+
+    def persistent_id(self, obj: Any) -> Optional[Tuple[str, int]]:
+        if isinstance(obj, MessageRepository):
+            index = self._index_by_repository_id.get(id(obj))
+            if index is None:
+                index = len(self.message_repositories)
+                self._index_by_repository_id[id(obj)] = index
+                self.message_repositories.append(obj)
+            return _MESSAGE_REPOSITORY_ID, index
+        if isinstance(obj, SingleUseRefreshTokenOauth2Authenticator):
+            # The refresh token can only be used once so the token refreshed by a worker process would be unknown to the other processes
+            raise _NotReadableInWorkerProcess("single use refresh tokens can't be refreshed in worker processes")
+        return None
+
+
+class _WorkerChannel:
+    """
+    Sends the record data in batches and the messages of a partition read in a worker process to the main process. Pending records are
+    sent before any message in order to preserve the order in which they were produced.
+    """
+
+    def __init__(self, items: "queue.Queue[Any]", batch_size: int) -> None:
+        self._items = items
+        self._batch_size = batch_size
+        self._batch: List[Mapping[str, Any]] = []
+
+    def add_record(self, data: Mapping[str, Any]) -> None:
+        self._batch.append(data)
+        if len(self._batch) >= self._batch_size:
+            self.flush()
+
+    def put(self, item: Any) -> None:
+        self.flush()
+        self._items.put(item)
+
+    def flush(self) -> None:
+        if self._batch:
+            self._items.put(self._batch)
+            self._batch = []
+
+
+class _ForwardingMessageRepository(MessageRepository):
+    """
+    Stands for a message repository of the main process in a worker process.
+    """
+
+    def __init__(self, repository_index: int, channel: _WorkerChannel) -> None:
+        self._repository_index = repository_index
+        self._channel = channel
+
+    def emit_message(self, message: AirbyteMessage) -> None:
+        self._channel.put(_EmittedMessage(self._repository_index, message))
+
+    def log_message(self, level: Level, message_provider: Callable[[], LogMessage]) -> None:
+        self._channel.put(_LoggedMessage(self._repository_index, level, message_provider()))
+
+    def consume_queue(self) -> Iterable[AirbyteMessage]:
+        # The messages are consumed from the message repository of the main process
+        return []
+
+
+class _ForwardingLogHandler(QueueHandler):
+    def __init__(self, channel: _WorkerChannel) -> None:
+        super().__init__(channel)  # type: ignore[arg-type]  # only `enqueue` uses the queue
+        self._channel = channel
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self._channel.put(record)
+
+
+class _PartitionUnpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, channel: _WorkerChannel) -> None:
+        super().__init__(file)
+        self._channel = channel
+        self._repositories: Dict[int, _ForwardingMessageRepository] = {}
+
+    def persistent_load(self, pid: Any) -> Any:
+        kind, index = pid
+        if kind != _MESSAGE_REPOSITORY_ID:
+            raise pickle.UnpicklingError(f"Unsupported persistent id {pid}")
+        if index not in self._repositories:
+            self._repositories[index] = _ForwardingMessageRepository(index, self._channel)
+        return self._repositories[index]
+
+
+def _identity(message: LogMessage) -> LogMessage:
+    return message
+
+
+def _read_partition(serialized_partition: bytes, items: "queue.Queue[Any]", batch_size: int, log_level: int) -> None:
+    """
+    Entrypoint of the worker processes. Reads the partition and puts the record data in the queue as batches along with the messages emitted
+    to the message repositories and the logs. `None` is always put in the queue once the partition is read, even on failure, for the main
+    process to stop waiting for batches.
+    """
+    channel = _WorkerChannel(items, batch_size)
+    root_logger = logging.getLogger()
+    handlers, level = root_logger.handlers, root_logger.level
+    root_logger.handlers = [_ForwardingLogHandler(channel)]
+    root_logger.setLevel(log_level)
+    try:
+        partition: Partition = _PartitionUnpickler(io.BytesIO(serialized_partition), channel).load()
+        for record in partition.read():
+            channel.add_record(record.data)
+        channel.flush()
+    finally:
+        root_logger.handlers = handlers
+        root_logger.setLevel(level)
+        items.put(None)
+
+
+class PartitionReaderProcessPool:
+    """
+    Reads partitions in worker processes in order for CPU-bound streams not to be limited by the GIL.
+
+    Only partitions that can be pickled are read in worker processes. The records are pickled back to the main process in batches, so that
+    their values are the same as if they were read in a thread, and are associated with the partition from the main process so that cursors
+    and state are only updated by the main process. The messages emitted to the message repositories referenced by the partition and the
+    logs are forwarded to the main process in the order they were produced. Partitions refreshing single use refresh tokens are read in
+    threads as the new token would only be known by the worker process.
+    """
+
+    DEFAULT_BATCH_SIZE = 1000
+    DEFAULT_MAX_BATCHES_IN_FLIGHT = 8
+
+    def __init__(
+        self,
+        num_processes: int,
+        logger: logging.Logger,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_batches_in_flight: int = DEFAULT_MAX_BATCHES_IN_FLIGHT,
+        mp_context: Optional[BaseContext] = None,
+    ) -> None:
+        """
+        :param num_processes: The number of worker processes
+        :param logger: The logger to log to
+        :param batch_size: The maximum number of records sent back to the main process at once
+        :param max_batches_in_flight: The maximum number of batches per partition waiting to be consumed by the main process. Once reached,
+          the worker process waits for the main process to catch up
+        :param mp_context: The multiprocessing context used to start the processes. Defaults to "spawn" as forking a process running
+          threads is not safe
+        """
+        if num_processes < 1:
+            raise ValueError(f"Expected at least one worker process but got {num_processes}")
+        self._num_processes = num_processes
+        self._logger = logger
+        self._batch_size = batch_size
+        self._max_batches_in_flight = max_batches_in_flight
+        self._mp_context = mp_context or multiprocessing.get_context("spawn")
+
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._manager: Optional[SyncManager] = None
+        self._non_serializable_streams: Set[str] = set()
+
+    def read(self, partition: Partition) -> Optional[Iterator[Record]]:
+        """
+        Return the records of the partition read in a worker process or None if the partition can't be sent to a worker process, in which
+        case the caller is expected to read the partition itself. This is meant to be called from a thread.
+        """
+        stream_name = partition.stream_name()
+        if stream_name in self._non_serializable_streams:
+            return None
+
+        serialized_partition = io.BytesIO()
+        pickler = _PartitionPickler(serialized_partition)
+        try:
+            pickler.dump(partition)
+        except Exception as exception:
+            # Depending on the object that can't be pickled, pickle raises PicklingError, TypeError or AttributeError
+            with self._lock:
+                if stream_name not in self._non_serializable_streams:
+                    self._non_serializable_streams.add(stream_name)
+                    self._logger.info(f"Partitions of stream {stream_name} can't be serialized and will be read in threads: {exception}")
+            return None
+        return self._read_in_worker_process(serialized_partition.getvalue(), partition, pickler.message_repositories)
+
+    def _read_in_worker_process(
+        self, serialized_partition: bytes, partition: Partition, message_repositories: List[MessageRepository]
+    ) -> Iterator[Record]:
+        executor, manager = self._start()
+        items = manager.Queue(maxsize=self._max_batches_in_flight)
+        future = executor.submit(_read_partition, serialized_partition, items, self._batch_size, logging.getLogger().getEffectiveLevel())
+        while True:
+            try:
+                item = items.get(timeout=_POLLING_INTERVAL_IN_SECONDS)
+            except queue.Empty:
+                if future.done():
+                    # If the worker process died without putting the end of partition marker in the queue, this raises. Else, the marker is
+                    # in the queue and will be consumed by the next iteration
+                    future.result()
+                continue
+            if item is None:
+                break
+            if isinstance(item, list):
+                for data in item:
+                    yield Record(data, partition)
+            elif isinstance(item, _EmittedMessage):
+                message_repositories[item.repository_index].emit_message(item.message)
+            elif isinstance(item, _LoggedMessage):
+                message_repositories[item.repository_index].log_message(item.level, functools.partial(_identity, item.message))
+            else:
+                logging.getLogger(item.name).handle(item)
+        # Raise the exception from the worker process if any
+        future.result()
+
+    def _start(self) -> Tuple[ProcessPoolExecutor, SyncManager]:
+        with self._lock:
+            if self._executor is None or self._manager is None:
+                self._manager = self._mp_context.Manager()  # type: ignore[attr-defined]  # Manager is defined on all concrete contexts
+                self._executor = ProcessPoolExecutor(max_workers=self._num_processes, mp_context=self._mp_context)
+            return self._executor, self._manager
+
+    def shutdown(self) -> None:
+        with self._lock:
+            # The manager is shut down first so that worker processes blocked on a full queue fail instead of hanging
+            if self._manager is not None:
+                self._manager.shutdown()
+                self._manager = None
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
@@ -4,12 +4,15 @@
 import logging
 import threading
 from concurrent.futures import Future, ThreadPoolExecutor
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Optional, Set
 
 
 class ThreadPoolManager:
     """
     Wrapper to abstract away the threadpool and the logic to wait for pending tasks to be completed.
+
+    Futures are tracked using done-callbacks: each future removes itself from the pending futures when it completes and the first exception
+    raised by a future is captured. This way, the number of pending tasks is known without having to iterate over the futures.
     """
 
     DEFAULT_MAX_QUEUE_SIZE = 10_000
@@ -28,48 +31,51 @@ class ThreadPoolManager:
         self._threadpool = threadpool
         self._logger = logger
         self._max_concurrent_tasks = max_concurrent_tasks
-        self._futures: List[Future[Any]] = []
+        self._pending_futures: Set[Future[Any]] = set()
         self._lock = threading.Lock()
         self._most_recently_seen_exception: Optional[Exception] = None
 
         self._logging_threshold = max_concurrent_tasks * 2
 
+    @property
+    def in_flight_count(self) -> int:
+        """
+        The number of submitted tasks that are not completed yet
+        """
+        return len(self._pending_futures)
+
     def prune_to_validate_has_reached_futures_limit(self) -> bool:
-        self._prune_futures(self._futures)
-        if len(self._futures) > self._logging_threshold:
-            self._logger.warning(f"ThreadPoolManager: The list of futures is getting bigger than expected ({len(self._futures)})")
-        return len(self._futures) >= self._max_concurrent_tasks
+        # Completed futures are removed by `_on_future_done` so there is nothing to prune anymore. The name is kept for backward
+        # compatibility.
+        in_flight_count = self.in_flight_count
+        if in_flight_count > self._logging_threshold:
+            self._logger.warning(f"ThreadPoolManager: The list of futures is getting bigger than expected ({in_flight_count})")
+        return in_flight_count >= self._max_concurrent_tasks
 
     def submit(self, function: Callable[..., Any], *args: Any) -> None:
-        self._futures.append(self._threadpool.submit(function, *args))
+        future = self._threadpool.submit(function, *args)
+        with self._lock:
+            self._pending_futures.add(future)
+        # If the future is already done, the callback is called immediately in the current thread. Hence, it needs to be registered after
+        # the future is added to the pending futures.
+        future.add_done_callback(self._on_future_done)
 
-    def _prune_futures(self, futures: List[Future[Any]]) -> None:
+    def _on_future_done(self, future: Future[Any]) -> None:
         """
-        Take a list in input and remove the futures that are completed. If a future has an exception, it'll raise and kill the stream
-        operation.
-
-        We are using a lock here as without it, the algorithm would not be thread safe
+        Called once the future is completed, either from the thread that ran the task or from the thread that registered the callback.
+        If the future has an exception, it'll be raised by `check_for_errors_and_shutdown` and kill the stream operation.
         """
+        optional_exception = None if future.cancelled() else future.exception()
         with self._lock:
-            if len(futures) < self._max_concurrent_tasks:
-                return
-
-            for index in reversed(range(len(futures))):
-                future = futures[index]
-
-                if future.done():
-                    # Only call future.exception() if the future is known to be done because it will block until the future is done.
-                    # See https://docs.python.org/3/library/concurrent.futures.html#concurrent.futures.Future.exception
-                    optional_exception = future.exception()
-                    if optional_exception:
-                        # Exception handling should be done in the main thread. Hence, we only store the exception and expect the main
-                        # thread to call raise_if_exception
-                        # We do not expect this error to happen. The futures created during concurrent syncs should catch the exception and
-                        # push it to the queue. If this exception occurs, please review the futures and how they handle exceptions.
-                        self._most_recently_seen_exception = RuntimeError(
-                            f"Failed processing a future: {optional_exception}. Please contact the Airbyte team."
-                        )
-                    futures.pop(index)
+            self._pending_futures.discard(future)
+            if optional_exception and self._most_recently_seen_exception is None:
+                # Exception handling should be done in the main thread. Hence, we only store the exception and expect the main thread to
+                # call check_for_errors_and_shutdown
+                # We do not expect this error to happen. The futures created during concurrent syncs should catch the exception and push it
+                # to the queue. If this exception occurs, please review the futures and how they handle exceptions.
+                self._most_recently_seen_exception = RuntimeError(
+                    f"Failed processing a future: {optional_exception}. Please contact the Airbyte team."
+                )
 
     def _shutdown(self) -> None:
         # Without a way to stop the threads that have already started, this will not stop the Python application. We are fine today with
@@ -77,7 +83,7 @@ class ThreadPoolManager:
         self._threadpool.shutdown(wait=False, cancel_futures=True)
 
     def is_done(self) -> bool:
-        return all([f.done() for f in self._futures])
+        return not self._pending_futures
 
     def check_for_errors_and_shutdown(self) -> None:
         """
@@ -92,17 +98,23 @@ class ThreadPoolManager:
             )
             self._stop_and_raise_exception(self._most_recently_seen_exception)
 
-        exceptions_from_futures = [f for f in [future.exception() for future in self._futures] if f is not None]
+        with self._lock:
+            pending_futures = list(self._pending_futures)
+        # A future is marked as done before its callbacks are called so the pending futures might contain completed futures
+        futures_not_done = [future for future in pending_futures if not future.done()]
+        exceptions_from_futures = [
+            exception
+            for exception in [future.exception() for future in pending_futures if future.done() and not future.cancelled()]
+            if exception is not None
+        ]
         if exceptions_from_futures:
             exception = RuntimeError(f"Failed reading with errors: {exceptions_from_futures}")
             self._stop_and_raise_exception(exception)
+        elif futures_not_done:
+            exception = RuntimeError(f"Failed reading with futures not done: {futures_not_done}")
+            self._stop_and_raise_exception(exception)
         else:
-            futures_not_done = [f for f in self._futures if not f.done()]
-            if futures_not_done:
-                exception = RuntimeError(f"Failed reading with futures not done: {futures_not_done}")
-                self._stop_and_raise_exception(exception)
-            else:
-                self._shutdown()
+            self._shutdown()
 
     def _stop_and_raise_exception(self, exception: BaseException) -> None:
         self._shutdown()
@@ -8,6 +8,7 @@ from typing import Any, Generator, MutableMapping
 
 import requests
 from airbyte_cdk.sources.declarative.decoders import Decoder
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
 
 logger = logging.getLogger("airbyte")
 
@@ -16,6 +17,8 @@ logger = logging.getLogger("airbyte")
 class PaginationDecoderDecorator(Decoder):
     """
     Decoder to wrap other decoders when instantiating a DefaultPaginator in order to bypass decoding if the response is streamed.
+
+    As StreamingJsonDecoder keeps the part of the response that is not records, this part is returned instead.
     """
 
     def __init__(self, decoder: Decoder):
@@ -29,7 +32,9 @@ class PaginationDecoderDecorator(Decoder):
         return self._decoder.is_stream_response()
 
     def decode(self, response: requests.Response) -> Generator[MutableMapping[str, Any], None, None]:
-        if self._decoder.is_stream_response():
+        if isinstance(self._decoder, StreamingJsonDecoder):
+            yield self._decoder.decode_remainder(response)
+        elif self._decoder.is_stream_response():
             logger.warning("Response is streamed and therefore will not be decoded for pagination.")
             yield {}
         else:
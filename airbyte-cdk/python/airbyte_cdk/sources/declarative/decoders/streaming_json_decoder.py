@@ -0,0 +1,288 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import codecs
+import json
+import logging
+import re
+import threading
+import weakref
+from dataclasses import InitVar, dataclass, field
+from typing import Any, Generator, Iterator, List, Mapping, MutableMapping, Sequence, Union, overload
+
+import requests
+from airbyte_cdk.sources.declarative.decoders.decoder import Decoder
+
+logger = logging.getLogger("airbyte")
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _IncrementalJsonReader:
+    """
+    Reads JSON values from a stream of text chunks while only keeping the part of the text that has not been parsed yet in memory.
+
+    Values are parsed using `json.JSONDecoder.raw_decode` which parses a single value from a position in the buffer. If the value is
+    truncated, more chunks are read and the value is parsed again.
+    """
+
+    def __init__(self, chunks: Iterator[str]) -> None:
+        self._chunks = chunks
+        self._buffer = ""
+        self._position = 0
+        self._is_exhausted = False
+        self._json_decoder = json.JSONDecoder()
+
+    def peek(self) -> str:
+        """
+        Return the next non-whitespace character without consuming it or an empty string if the stream is exhausted
+        """
+        while True:
+            self._position = _WHITESPACE.match(self._buffer, self._position).end()  # type: ignore  # the regex matches empty strings
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read_more():
+                return ""
+
+    def consume(self, expected_characters: str) -> str:
+        """
+        Consume the next non-whitespace character and return it. Raise if it is not one of the expected characters
+        """
+        character = self.peek()
+        if not character or character not in expected_characters:
+            raise ValueError(f"Expected one of '{expected_characters}' but got '{character}' while parsing JSON")
+        self._position += 1
+        return character
+
+    def read_value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                # The value might be truncated. Reading as much data as the unparsed data avoids re-parsing large values too many times
+                if self._read_more(len(self._buffer) - self._position):
+                    continue
+                raise
+            # A number at the end of the buffer might be truncated
+            if end == len(self._buffer) and self._read_more():
+                continue
+            self._position = end
+            return value
+
+    def _read_more(self, minimum_number_of_characters: int = 1) -> bool:
+        if self._is_exhausted:
+            return False
+        new_chunks = []
+        number_of_characters_read = 0
+        while number_of_characters_read < minimum_number_of_characters:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._is_exhausted = True
+                break
+            new_chunks.append(chunk)
+            number_of_characters_read += len(chunk)
+        if not new_chunks:
+            return False
+        # Discard the part of the buffer that has already been parsed
+        self._buffer = self._buffer[self._position :] + "".join(new_chunks)
+        self._position = 0
+        return True
+
+
+class StreamedArray(Sequence[Any]):
+    """
+    Stands for the array at `field_path` in the remainder of a response decoded by StreamingJsonDecoder. The items were yielded as records
+    and are not kept in memory except for the first and the last one. The length of the array is kept so that paginators can use
+    conditions like `{{ not response.data }}`, `{{ response.data | length < 100 }}` or `{{ response.data[-1].id }}`.
+
+    Accessing any other item, or iterating beyond the first item, raises a ValueError rather than silently returning a wrong value.
+    """
+
+    def __init__(self, length: int, first: Any, last: Any) -> None:
+        self._length = length
+        self._first = first
+        self._last = last
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[Any]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            raise ValueError("Slicing the records streamed by StreamingJsonDecoder is not supported")
+        if index < 0:
+            index += self._length
+        if index < 0 or index >= self._length:
+            raise IndexError("StreamedArray index out of range")
+        if index == 0:
+            return self._first
+        if index == self._length - 1:
+            return self._last
+        raise ValueError("Only the first and the last records streamed by StreamingJsonDecoder can be accessed")
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(self._length):
+            yield self[index]
+
+    def __reversed__(self) -> Iterator[Any]:
+        for index in reversed(range(self._length)):
+            yield self[index]
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, StreamedArray):
+            return NotImplemented
+        return (self._length, self._first, self._last) == (other._length, other._first, other._last)
+
+    def __repr__(self) -> str:
+        return f"StreamedArray(length={self._length}, first={self._first!r}, last={self._last!r})"
+
+
+class _StreamingJsonParser:
+    """
+    Yields the items of the array located at `field_path` and keeps the rest of the document, where the array is replaced by a
+    StreamedArray. If the value at `field_path` is not an array, it is yielded as is and kept in the remainder.
+    """
+
+    def __init__(self, reader: _IncrementalJsonReader, field_path: List[str]) -> None:
+        self._reader = reader
+        self._field_path = field_path
+        self.remainder: Any = {}
+
+    def items(self) -> Generator[Any, None, None]:
+        if not self._reader.peek():
+            # Empty body
+            return
+        self.remainder = yield from self._parse_value(self._field_path)
+        if self._reader.peek():
+            raise ValueError("Unexpected data after the JSON document")
+
+    def _parse_value(self, remaining_path: List[str]) -> Generator[Any, None, Any]:
+        character = self._reader.peek()
+        if not remaining_path:
+            if character == "[":
+                return (yield from self._parse_items())
+            value = self._reader.read_value()
+            yield value
+            return value
+        if character == "{":
+            return (yield from self._parse_object(remaining_path))
+        if character == "[" and remaining_path[0].isdigit():
+            return (yield from self._parse_array(remaining_path))
+        return self._reader.read_value()
+
+    def _parse_object(self, remaining_path: List[str]) -> Generator[Any, None, MutableMapping[str, Any]]:
+        self._reader.consume("{")
+        parsed: MutableMapping[str, Any] = {}
+        if self._reader.peek() == "}":
+            self._reader.consume("}")
+            return parsed
+        while True:
+            key = self._reader.read_value()
+            self._reader.consume(":")
+            if key == remaining_path[0]:
+                parsed[key] = yield from self._parse_value(remaining_path[1:])
+            else:
+                parsed[key] = self._reader.read_value()
+            if self._reader.consume(",}") == "}":
+                return parsed
+
+    def _parse_array(self, remaining_path: List[str]) -> Generator[Any, None, List[Any]]:
+        self._reader.consume("[")
+        parsed: List[Any] = []
+        if self._reader.peek() == "]":
+            self._reader.consume("]")
+            return parsed
+        index_in_path = int(remaining_path[0])
+        while True:
+            if len(parsed) == index_in_path:
+                parsed.append((yield from self._parse_value(remaining_path[1:])))
+            else:
+                parsed.append(self._reader.read_value())
+            if self._reader.consume(",]") == "]":
+                return parsed
+
+    def _parse_items(self) -> Generator[Any, None, Union[StreamedArray, List[Any]]]:
+        self._reader.consume("[")
+        if self._reader.peek() == "]":
+            self._reader.consume("]")
+            return []
+        first = last = self._reader.read_value()
+        length = 1
+        yield first
+        while self._reader.consume(",]") == ",":
+            last = self._reader.read_value()
+            length += 1
+            yield last
+        return StreamedArray(length, first, last)
+
+
+@dataclass
+class StreamingJsonDecoder(Decoder):
+    """
+    Decoder strategy that streams the response and yields the items of the array located at `field_path` as they are parsed. This allows to
+    read large responses without loading the whole body in memory. If the value at `field_path` is not an array, it is yielded as is.
+
+    The rest of the body, with the array replaced by a StreamedArray which only keeps its length and its first and last items, is kept until
+    the response is garbage collected and can be retrieved using `decode_remainder` in order to read pagination tokens.
+    PaginationDecoderDecorator does so automatically.
+
+    As the decoder already yields the records, the record extractor should use an empty `field_path`.
+    """
+
+    parameters: InitVar[Mapping[str, Any]]
+    field_path: List[str] = field(default_factory=list)
+    chunk_size: int = 64 * 1024
+
+    def __post_init__(self, parameters: Mapping[str, Any]) -> None:
+        self._remainders: MutableMapping[requests.Response, Any] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def is_stream_response(self) -> bool:
+        return True
+
+    def decode(self, response: requests.Response) -> Generator[MutableMapping[str, Any], None, None]:
+        parser = _StreamingJsonParser(_IncrementalJsonReader(self._iterate_text_chunks(response)), self.field_path)
+        has_yielded_items = False
+        try:
+            for item in parser.items():
+                has_yielded_items = True
+                yield item
+        except ValueError:
+            # json.JSONDecodeError is a subclass of ValueError
+            if has_yielded_items:
+                # Records were already emitted so failing silently would mean losing the end of the page
+                raise
+            logger.warning(f"Response cannot be parsed into json: {response.status_code=}")
+            parser.remainder = {}
+        with self._lock:
+            self._remainders[response] = parser.remainder
+
+    def decode_remainder(self, response: requests.Response) -> Any:
+        """
+        Return the body of the response where the array at `field_path` is replaced by a StreamedArray. If the response has not been
+        decoded yet, it is decoded and the items are discarded.
+        """
+        with self._lock:
+            if response in self._remainders:
+                return self._remainders[response]
+        for _ in self.decode(response):
+            pass
+        with self._lock:
+            return self._remainders.get(response, {})
+
+    def _iterate_text_chunks(self, response: requests.Response) -> Iterator[str]:
+        text_decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+        for chunk in response.iter_content(chunk_size=self.chunk_size):
+            text = text_decoder.decode(chunk)
+            if text:
+                yield text
+        text = text_decoder.decode(b"", final=True)
+        if text:
+            yield text
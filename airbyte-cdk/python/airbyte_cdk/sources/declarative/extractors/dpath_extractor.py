@@ -3,7 +3,7 @@
 #
 
 from dataclasses import InitVar, dataclass, field
-from typing import Any, Iterable, List, Mapping, MutableMapping, Union
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Sequence, Tuple, Union
 
 import dpath
 import requests
@@ -12,6 +12,121 @@ from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordEx
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 from airbyte_cdk.sources.types import Config
 
+_WILDCARD = "*"
+# Characters interpreted by dpath as glob patterns (see fnmatch)
+_GLOB_CHARACTERS = frozenset("*?[")
+_NOT_FOUND = object()
+
+# A segment is kept as the key used to look into objects and the index used to look into arrays as dpath matches the segment "0" against
+# both the key "0" and the index 0. A wildcard segment is None.
+_PathSegment = Optional[Tuple[Optional[str], Optional[int]]]
+
+
+def _requires_dpath(segment: Any) -> bool:
+    if segment == _WILDCARD:
+        return False
+    if isinstance(segment, str):
+        return bool(_GLOB_CHARACTERS.intersection(segment))
+    return not isinstance(segment, int)
+
+
+def _to_path_segment(segment: Union[str, int]) -> _PathSegment:
+    if segment == _WILDCARD:
+        return None
+    if isinstance(segment, int):
+        # dpath does not match integers against object keys
+        return None, int(segment)
+    try:
+        return segment, int(segment)
+    except ValueError:
+        return segment, None
+
+
+def _is_object(node: Any) -> bool:
+    # Checking for dict first avoids the cost of checking against the abstract class for decoded JSON
+    return isinstance(node, dict) or isinstance(node, Mapping)
+
+
+def _is_array(node: Any) -> bool:
+    return isinstance(node, list) or (isinstance(node, Sequence) and not isinstance(node, (str, bytes)))
+
+
+def _get_child(node: Any, key: Optional[str], index: Optional[int]) -> Any:
+    if _is_object(node):
+        return node.get(key, _NOT_FOUND) if key is not None else _NOT_FOUND
+    if index is not None and _is_array(node):
+        # dpath supports negative indexes
+        return node[index] if -len(node) <= index < len(node) else _NOT_FOUND
+    return _NOT_FOUND
+
+
+def _get_children(node: Any) -> Iterable[Any]:
+    if _is_object(node):
+        return node.values()  # type: ignore[no-any-return]
+    if _is_array(node):
+        return node  # type: ignore[no-any-return]
+    return []
+
+
+def _iterate_values(node: Any, segments: List[_PathSegment], position: int = 0) -> Iterator[Any]:
+    """
+    Yield the values matching `segments[position:]` in the same order as `dpath.values`
+    """
+    segment = segments[position]
+    is_last_segment = position == len(segments) - 1
+    if segment is None:
+        if is_last_segment:
+            yield from _get_children(node)
+        else:
+            for child in _get_children(node):
+                yield from _iterate_values(child, segments, position + 1)
+        return
+
+    child = _get_child(node, *segment)
+    if child is _NOT_FOUND:
+        return
+    if is_last_segment:
+        yield child
+    else:
+        yield from _iterate_values(child, segments, position + 1)
+
+
+def _as_records(extracted: Any) -> Iterable[Any]:
+    if isinstance(extracted, list):
+        return extracted
+    elif extracted:
+        return [extracted]
+    else:
+        return []
+
+
+def _compile_path(path: List[Any]) -> Callable[[Any], Iterable[Any]]:
+    """
+    Return a function extracting the records at `path` from a body. The records are the same as when using `dpath.get`, or
+    `dpath.values` if the path contains wildcards, but dpath walks the whole body and matches every key against the path. Instead, the
+    values are accessed directly and only the children of the nodes matching a wildcard are iterated over.
+
+    Paths relying on globbing features other than the `*` wildcard are evaluated using dpath.
+    """
+    if any(_requires_dpath(segment) for segment in path):
+        if _WILDCARD in path:
+            return lambda body: dpath.values(body, path)  # type: ignore  # dpath's Glob type does not allow integers
+        return lambda body: _as_records(dpath.get(body, path, default=[]))  # type: ignore  # same as above
+
+    segments = [_to_path_segment(segment) for segment in path]
+    if _WILDCARD in path:
+        return lambda body: _iterate_values(body, segments)
+
+    def _get(body: Any) -> Iterable[Any]:
+        node = body
+        for key, index in segments:  # type: ignore  # there are no wildcards
+            node = _get_child(node, key, index)
+            if node is _NOT_FOUND:
+                return []
+        return _as_records(node)
+
+    return _get
+
 
 @dataclass
 class DpathExtractor(RecordExtractor):
@@ -62,20 +177,17 @@ class DpathExtractor(RecordExtractor):
         for path_index in range(len(self.field_path)):
             if isinstance(self.field_path[path_index], str):
                 self._field_path[path_index] = InterpolatedString.create(self.field_path[path_index], parameters=parameters)
+        self._compiled_path: Optional[Callable[[Any], Iterable[Any]]] = None
 
     def extract_records(self, response: requests.Response) -> Iterable[MutableMapping[Any, Any]]:
         for body in self.decoder.decode(response):
             if len(self._field_path) == 0:
-                extracted = body
-            else:
-                path = [path.eval(self.config) for path in self._field_path]
-                if "*" in path:
-                    extracted = dpath.values(body, path)
-                else:
-                    extracted = dpath.get(body, path, default=[])  # type: ignore # extracted will be a MutableMapping, given input data structure
-            if isinstance(extracted, list):
-                yield from extracted
-            elif extracted:
-                yield extracted
+                yield from _as_records(body)
             else:
-                yield from []
+                yield from self._get_compiled_path()(body)
+
+    def _get_compiled_path(self) -> Callable[[Any], Iterable[Any]]:
+        # The path only depends on the config and the parameters so it is resolved once instead of once per response
+        if self._compiled_path is None:
+            self._compiled_path = _compile_path([path.eval(self.config) for path in self._field_path])
+        return self._compiled_path
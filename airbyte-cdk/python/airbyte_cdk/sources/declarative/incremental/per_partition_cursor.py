@@ -2,9 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import copy
 import logging
-from collections import OrderedDict
-from typing import Any, Callable, Iterable, Mapping, Optional, Union
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 from airbyte_cdk.sources.declarative.incremental.declarative_cursor import DeclarativeCursor
 from airbyte_cdk.sources.declarative.partition_routers.partition_router import PartitionRouter
@@ -39,6 +41,16 @@ class PerPartitionCursor(DeclarativeCursor):
     Between record #3 and #4 | Duplication | #1, #2
 
     Therefore, we need to manage state per partition.
+
+    As the state of every partition is emitted after each slice, the state is only rebuilt when a slice has been closed since it was last
+    built. Streams with many partitions can also:
+    * Use a compact state by setting `use_compact_state`. The most common partition state is emitted once as a global `state` and the
+      partitions having this state are listed in `states` without their `cursor`. Partitions that are not listed, for example because
+      they were not read yet when the state was emitted, start from the beginning. The compact state is always accepted as an initial
+      state.
+    * Throttle how often the state is emitted using `checkpoint_every_n_slices` and/or `checkpoint_interval_seconds`. The state is then
+      emitted once either budget is exhausted and at the end of the sync. If the sync fails, the slices closed since the last emitted
+      state are read again on the next sync.
     """
 
     DEFAULT_MAX_PARTITIONS_NUMBER = 10000
@@ -48,13 +60,37 @@ class PerPartitionCursor(DeclarativeCursor):
     _VALUE = 1
     _state_to_migrate_from: Mapping[str, Any] = {}
 
-    def __init__(self, cursor_factory: CursorFactory, partition_router: PartitionRouter):
+    def __init__(
+        self,
+        cursor_factory: CursorFactory,
+        partition_router: PartitionRouter,
+        use_compact_state: bool = False,
+        checkpoint_every_n_slices: Optional[int] = None,
+        checkpoint_interval_seconds: Optional[float] = None,
+    ):
+        """
+        :param cursor_factory: The factory creating the cursor of each partition
+        :param partition_router: The router generating the partitions
+        :param use_compact_state: If True, the most common partition state is emitted once as a global state instead of per partition
+        :param checkpoint_every_n_slices: If set, the state is emitted at most once every `checkpoint_every_n_slices` closed slices
+        :param checkpoint_interval_seconds: If set, the state is emitted at most once every `checkpoint_interval_seconds` seconds
+        """
         self._cursor_factory = cursor_factory
         self._partition_router = partition_router
         # The dict is ordered to ensure that once the maximum number of partitions is reached,
         # the oldest partitions can be efficiently removed, maintaining the most recent partitions.
         self._cursor_per_partition: OrderedDict[str, DeclarativeCursor] = OrderedDict()
         self._partition_serializer = PerPartitionKeySerializer()
+        self._use_compact_state = use_compact_state
+        self._checkpoint_every_n_slices = checkpoint_every_n_slices
+        self._checkpoint_interval_seconds = checkpoint_interval_seconds
+        # Partitions are serialized for every record so the key is cached for the partition objects that are being read
+        self._partition_key_by_partition_id: Dict[int, Tuple[Mapping[str, Any], str]] = {}
+        self._partition_by_key: Dict[str, Mapping[str, Any]] = {}
+        self._partitions_state: Optional[Dict[str, Any]] = None
+        self._closed_slices_since_checkpoint = 0
+        self._last_checkpoint_time = time.monotonic()
+        self._is_checkpoint_due = True
 
     def stream_slices(self) -> Iterable[StreamSlice]:
         slices = self._partition_router.stream_slices()
@@ -62,11 +98,13 @@ class PerPartitionCursor(DeclarativeCursor):
             # Ensure the maximum number of partitions is not exceeded
             self._ensure_partition_limit()
 
-            cursor = self._cursor_per_partition.get(self._to_partition_key(partition.partition))
+            partition_key = self._to_partition_key(partition.partition)
+            cursor = self._cursor_per_partition.get(partition_key)
             if not cursor:
                 partition_state = self._state_to_migrate_from if self._state_to_migrate_from else self._NO_CURSOR_STATE
                 cursor = self._create_cursor(partition_state)
-                self._cursor_per_partition[self._to_partition_key(partition.partition)] = cursor
+                self._cursor_per_partition[partition_key] = cursor
+                self._partitions_state = None
 
             for cursor_slice in cursor.stream_slices():
                 yield StreamSlice(partition=partition, cursor_slice=cursor_slice)
@@ -77,6 +115,8 @@ class PerPartitionCursor(DeclarativeCursor):
         """
         while len(self._cursor_per_partition) > self.DEFAULT_MAX_PARTITIONS_NUMBER - 1:
             oldest_partition = self._cursor_per_partition.popitem(last=False)[0]  # Remove the oldest partition
+            self._partition_by_key.pop(oldest_partition, None)
+            self._partitions_state = None
             logging.warning(f"The maximum number of partitions has been reached. Dropping the oldest partition: {oldest_partition}.")
 
     def set_initial_state(self, stream_state: StreamState) -> None:
@@ -90,7 +130,8 @@ class PerPartitionCursor(DeclarativeCursor):
         does not have parent streams, this step will be skipped due to the default PartitionRouter implementation.
 
         Args:
-            stream_state (StreamState): The state of the streams to be set. The format of the stream state should be:
+            stream_state (StreamState): The state of the streams to be set. The format of the stream state should be as follows, with an
+            optional global `state` applied to the partitions that are listed in `states` without a `cursor` if the state is compact:
                 {
                     "states": [
                         {
@@ -119,7 +160,9 @@ class PerPartitionCursor(DeclarativeCursor):
 
         else:
             for state in stream_state["states"]:
-                self._cursor_per_partition[self._to_partition_key(state["partition"])] = self._create_cursor(state["cursor"])
+                cursor_state = state["cursor"] if "cursor" in state else stream_state["state"]
+                self._cursor_per_partition[self._to_partition_key(state["partition"])] = self._create_cursor(cursor_state)
+        self._partitions_state = None
 
         # Set parent state for partition routers based on parent streams
         self._partition_router.set_initial_state(stream_state)
@@ -139,25 +182,67 @@ class PerPartitionCursor(DeclarativeCursor):
                 f"Partition {str(exception)} could not be found in current state based on the record. This is unexpected because "
                 f"we should only update state for partitions that were emitted during `stream_slices`"
             )
+        self._partitions_state = None
+        self._closed_slices_since_checkpoint += 1
+        self._is_checkpoint_due = self._evaluate_checkpoint_budget()
+
+    def _evaluate_checkpoint_budget(self) -> bool:
+        if self._checkpoint_every_n_slices is None and self._checkpoint_interval_seconds is None:
+            return True
+
+        now = time.monotonic()
+        is_slice_budget_exhausted = (
+            self._checkpoint_every_n_slices is not None and self._closed_slices_since_checkpoint >= self._checkpoint_every_n_slices
+        )
+        is_time_budget_exhausted = (
+            self._checkpoint_interval_seconds is not None and now - self._last_checkpoint_time >= self._checkpoint_interval_seconds
+        )
+        is_due = is_slice_budget_exhausted or is_time_budget_exhausted
+        if is_due:
+            self._closed_slices_since_checkpoint = 0
+            self._last_checkpoint_time = now
+        return is_due
+
+    def is_checkpoint_due(self) -> bool:
+        return self._is_checkpoint_due
 
     def get_stream_state(self) -> StreamState:
-        states = []
-        for partition_tuple, cursor in self._cursor_per_partition.items():
-            cursor_state = cursor.get_stream_state()
-            if cursor_state:
-                states.append(
-                    {
-                        "partition": self._to_dict(partition_tuple),
-                        "cursor": cursor_state,
-                    }
-                )
-        state: dict[str, Any] = {"states": states}
+        # The cursors of the partitions are only updated when slices are closed which allows to reuse the state of the partitions
+        if self._partitions_state is None:
+            self._partitions_state = self._build_partitions_state()
+        state: dict[str, Any] = copy.deepcopy(self._partitions_state)
 
         parent_state = self._partition_router.get_stream_state()
         if parent_state:
             state["parent_state"] = parent_state
         return state
 
+    def _build_partitions_state(self) -> Dict[str, Any]:
+        partition_states: List[Tuple[str, StreamState]] = []
+        for partition_key, cursor in self._cursor_per_partition.items():
+            cursor_state = cursor.get_stream_state()
+            if cursor_state:
+                partition_states.append((partition_key, cursor_state))
+
+        if not self._use_compact_state or not partition_states:
+            return {"states": [self._to_partition_state(partition_key, cursor_state) for partition_key, cursor_state in partition_states]}
+
+        serialized_states = [self._partition_serializer.to_partition_key(cursor_state) for _, cursor_state in partition_states]
+        global_serialized_state = Counter(serialized_states).most_common(1)[0][0]
+        global_state = partition_states[serialized_states.index(global_serialized_state)][self._VALUE]
+        return {
+            "state": global_state,
+            "states": [
+                {"partition": self._to_dict(partition_key)}
+                if serialized_state == global_serialized_state
+                else self._to_partition_state(partition_key, cursor_state)
+                for (partition_key, cursor_state), serialized_state in zip(partition_states, serialized_states)
+            ],
+        }
+
+    def _to_partition_state(self, partition_key: str, cursor_state: StreamState) -> Mapping[str, Any]:
+        return {"partition": self._to_dict(partition_key), "cursor": cursor_state}
+
     def _get_state_for_partition(self, partition: Mapping[str, Any]) -> Optional[StreamState]:
         cursor = self._cursor_per_partition.get(self._to_partition_key(partition))
         if cursor:
@@ -170,10 +255,23 @@ class PerPartitionCursor(DeclarativeCursor):
         return not bool(stream_state)
 
     def _to_partition_key(self, partition: Mapping[str, Any]) -> str:
-        return self._partition_serializer.to_partition_key(partition)
+        cached = self._partition_key_by_partition_id.get(id(partition))
+        # The partition is kept along with its key so that its id can't be reused by another object
+        if cached and cached[0] is partition:
+            return cached[1]
+
+        partition_key = self._partition_serializer.to_partition_key(partition)
+        if len(self._partition_key_by_partition_id) >= self.DEFAULT_MAX_PARTITIONS_NUMBER:
+            self._partition_key_by_partition_id.clear()
+        self._partition_key_by_partition_id[id(partition)] = (partition, partition_key)
+        return partition_key
 
     def _to_dict(self, partition_key: str) -> Mapping[str, Any]:
-        return self._partition_serializer.to_partition(partition_key)
+        partition = self._partition_by_key.get(partition_key)
+        if partition is None:
+            partition = self._partition_serializer.to_partition(partition_key)
+            self._partition_by_key[partition_key] = partition
+        return partition
 
     def select_state(self, stream_slice: Optional[StreamSlice] = None) -> Optional[StreamState]:
         if not stream_slice:
@@ -4,15 +4,15 @@
 
 import ast
 from functools import cache
-from typing import Any, Mapping, Optional, Tuple, Type
+from typing import Any, Callable, List, Mapping, Optional, Tuple, Type, Union
 
 from airbyte_cdk.sources.declarative.interpolation.filters import filters
 from airbyte_cdk.sources.declarative.interpolation.interpolation import Interpolation
 from airbyte_cdk.sources.declarative.interpolation.macros import macros
 from airbyte_cdk.sources.types import Config
-from jinja2 import meta
+from jinja2 import meta, nodes
 from jinja2.environment import Template
-from jinja2.exceptions import UndefinedError
+from jinja2.exceptions import TemplateSyntaxError, UndefinedError
 from jinja2.sandbox import SandboxedEnvironment
 
 
@@ -29,6 +29,104 @@ class StreamPartitionAccessEnvironment(SandboxedEnvironment):
         return super().is_safe_attribute(obj, attr, value)  # type: ignore  # for some reason, mypy says 'Returning Any from function declared to return "bool"'
 
 
+# A Python literal can only start with an identifier character if it is True, False, None or a prefixed string like r'...' or b'...'. Any
+# other string starting with an identifier character is not a literal and does not need to be parsed by ast.literal_eval
+_LITERAL_IDENTIFIER_START_CHARACTERS = frozenset("TFNrRbBuU")
+_IDENTIFIER_START_CHARACTERS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_")
+
+# Returned by a fast path accessor when the value can't be resolved without the Jinja engine
+_NOT_RESOLVED = object()
+
+_Accessor = Callable[[Mapping[str, Any]], Any]
+_FastPath = Callable[[Mapping[str, Any]], Optional[str]]
+
+
+def _create_accessor(node: nodes.Node) -> Optional[_Accessor]:
+    """
+    Return a function resolving the value of the expression from the context if the expression is a simple lookup like `config['x']`,
+    `record.id` or `stream_slice['start_time']['date']`, else None.
+
+    The function returns _NOT_RESOLVED whenever the sandboxed environment would not simply resolve the value with `obj[key]` (missing key,
+    attribute access, etc.) so that the template is rendered by Jinja instead.
+    """
+    steps: List[Tuple[bool, Any]] = []
+    while isinstance(node, (nodes.Getitem, nodes.Getattr)):
+        if isinstance(node, nodes.Getattr):
+            steps.append((True, node.attr))
+        elif isinstance(node.arg, nodes.Const) and isinstance(node.arg.value, (str, int)):
+            steps.append((False, node.arg.value))
+        else:
+            return None
+        node = node.node
+    if not isinstance(node, nodes.Name) or node.ctx != "load":
+        return None
+    name = node.name
+    steps.reverse()
+
+    def accessor(context: Mapping[str, Any]) -> Any:
+        value = context.get(name, _NOT_RESOLVED)
+        if value is _NOT_RESOLVED:
+            return _NOT_RESOLVED
+        for is_attribute, key in steps:
+            # For `obj.key`, Jinja first tries to access the attribute and only falls back on `obj[key]` if there is no such attribute
+            if is_attribute and hasattr(value, key):
+                return _NOT_RESOLVED
+            try:
+                value = value[key]
+            except (TypeError, LookupError):
+                return _NOT_RESOLVED
+        return value
+
+    return accessor
+
+
+def _create_fast_path(template_ast: nodes.Template) -> Optional[_FastPath]:
+    """
+    Return a function rendering the template without the Jinja engine if the template only contains raw text and simple lookups, else
+    None. Like Jinja, values are rendered using `str`.
+    """
+    if not template_ast.body:
+        return lambda context: ""
+    if len(template_ast.body) != 1 or not isinstance(template_ast.body[0], nodes.Output):
+        return None
+
+    parts: List[Union[str, _Accessor]] = []
+    for node in template_ast.body[0].nodes:
+        if isinstance(node, nodes.TemplateData):
+            parts.append(node.data)
+            continue
+        accessor = _create_accessor(node)
+        if accessor is None:
+            return None
+        parts.append(accessor)
+
+    if all(isinstance(part, str) for part in parts):
+        constant = "".join(parts)  # type: ignore  # all parts are strings
+        return lambda context: constant
+    if len(parts) == 1:
+        single_accessor: _Accessor = parts[0]  # type: ignore  # the only part is an accessor
+
+        def render_single_value(context: Mapping[str, Any]) -> Optional[str]:
+            value = single_accessor(context)
+            return None if value is _NOT_RESOLVED else str(value)
+
+        return render_single_value
+
+    def render(context: Mapping[str, Any]) -> Optional[str]:
+        rendered = []
+        for part in parts:
+            if isinstance(part, str):
+                rendered.append(part)
+                continue
+            value = part(context)
+            if value is _NOT_RESOLVED:
+                return None
+            rendered.append(str(value))
+        return "".join(rendered)
+
+    return render
+
+
 class JinjaInterpolation(Interpolation):
     """
     Interpolation strategy using the Jinja2 template engine.
@@ -106,6 +204,10 @@ class JinjaInterpolation(Interpolation):
         return self._literal_eval(self._eval(default, context), valid_types)
 
     def _literal_eval(self, result: Optional[str], valid_types: Optional[Tuple[Type[Any]]]) -> Any:
+        if isinstance(result, str) and result:
+            first_character = result.lstrip(" \t")[:1]
+            if first_character in _IDENTIFIER_START_CHARACTERS and first_character not in _LITERAL_IDENTIFIER_START_CHARACTERS:
+                return result
         try:
             evaluated = ast.literal_eval(result)  # type: ignore # literal_eval is able to handle None
         except (ValueError, SyntaxError):
@@ -115,6 +217,12 @@ class JinjaInterpolation(Interpolation):
         return result
 
     def _eval(self, s: Optional[str], context: Mapping[str, Any]) -> Optional[str]:
+        fast_path = self.compile_fast_path(s)
+        if fast_path:
+            rendered = fast_path(context)
+            if rendered is not None:
+                return rendered
+
         try:
             undeclared = self._find_undeclared_variables(s)
             undeclared_not_in_context = {var for var in undeclared if var not in context}
@@ -134,6 +242,23 @@ class JinjaInterpolation(Interpolation):
         ast = self._environment.parse(s)  # type: ignore # parse is able to handle None
         return meta.find_undeclared_variables(ast)
 
+    @cache
+    def compile_fast_path(self, s: Optional[str]) -> Optional[_FastPath]:
+        """
+        Analyze the template and return a function rendering it without the Jinja engine if the template is a constant or only contains
+        simple lookups like `{{ config['x'] }}` or `{{ record['id'] }}`. Return None if the template needs to be rendered by Jinja.
+
+        The result is cached so calling this method when the template is loaded avoids analyzing the template during the sync.
+        """
+        if not isinstance(s, str):
+            return None
+        try:
+            template_ast = self._environment.parse(s)
+        except TemplateSyntaxError:
+            # Let Jinja raise the error when the template is rendered
+            return None
+        return _create_fast_path(template_ast)
+
     @cache
     def _compile(self, s: Optional[str]) -> Template:
         """
@@ -4,6 +4,7 @@
 
 import json
 import logging
+import os
 import pkgutil
 import re
 from copy import deepcopy
@@ -23,6 +24,7 @@ from airbyte_cdk.sources.declarative.declarative_source import DeclarativeSource
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import CheckStream as CheckStreamModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import DeclarativeStream as DeclarativeStreamModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import Spec as SpecModel
+from airbyte_cdk.sources.declarative.parsers.compiled_manifest_cache import CompiledManifestCache
 from airbyte_cdk.sources.declarative.parsers.manifest_component_transformer import ManifestComponentTransformer
 from airbyte_cdk.sources.declarative.parsers.manifest_reference_resolver import ManifestReferenceResolver
 from airbyte_cdk.sources.declarative.parsers.model_to_component_factory import ModelToComponentFactory
@@ -30,6 +32,7 @@ from airbyte_cdk.sources.message import MessageRepository
 from airbyte_cdk.sources.streams.core import Stream
 from airbyte_cdk.sources.types import ConnectionDefinition
 from airbyte_cdk.sources.utils.slice_logger import AlwaysLogSliceLogger, DebugSliceLogger, SliceLogger
+from airbyte_cdk.utils.constants import ENV_COMPILED_MANIFEST_CACHE_PATH
 from jsonschema.exceptions import ValidationError
 from jsonschema.validators import validate
 
@@ -43,11 +46,14 @@ class ManifestDeclarativeSource(DeclarativeSource):
         debug: bool = False,
         emit_connector_builder_messages: bool = False,
         component_factory: Optional[ModelToComponentFactory] = None,
+        compiled_manifest_cache: Optional[CompiledManifestCache] = None,
     ):
         """
         :param source_config(Mapping[str, Any]): The manifest of low-code components that describe the source connector
         :param debug(bool): True if debug mode is enabled
         :param component_factory(ModelToComponentFactory): optional factory if ModelToComponentFactory's default behaviour needs to be tweaked
+        :param compiled_manifest_cache(CompiledManifestCache): optional cache of manifests that were already resolved and validated. If not
+            provided, a cache is created in the directory defined by the COMPILED_MANIFEST_CACHE_PATH environment variable if it is set
         """
         self.logger = logging.getLogger(f"airbyte.{self.name}")
 
@@ -56,16 +62,27 @@ class ManifestDeclarativeSource(DeclarativeSource):
         if "type" not in manifest:
             manifest["type"] = "DeclarativeSource"
 
-        resolved_source_config = ManifestReferenceResolver().preprocess_manifest(manifest)
-        propagated_source_config = ManifestComponentTransformer().propagate_types_and_parameters("", resolved_source_config, {})
-        self._source_config = propagated_source_config
         self._debug = debug
         self._emit_connector_builder_messages = emit_connector_builder_messages
         self._constructor = component_factory if component_factory else ModelToComponentFactory(emit_connector_builder_messages)
         self._message_repository = self._constructor.get_message_repository()
         self._slice_logger: SliceLogger = AlwaysLogSliceLogger() if emit_connector_builder_messages else DebugSliceLogger()
-
-        self._validate_source()
+        # Set while reading so that only the streams of the configured catalog are created
+        self._configured_catalog: Optional[ConfiguredAirbyteCatalog] = None
+
+        if compiled_manifest_cache is None and os.getenv(ENV_COMPILED_MANIFEST_CACHE_PATH):
+            compiled_manifest_cache = CompiledManifestCache(os.environ[ENV_COMPILED_MANIFEST_CACHE_PATH])
+        cache_key = compiled_manifest_cache.get_key(manifest) if compiled_manifest_cache else None
+        compiled_manifest = compiled_manifest_cache.get(cache_key) if compiled_manifest_cache and cache_key else None
+        if compiled_manifest is not None:
+            # The manifest was already resolved and validated by a previous launch using the same version of the CDK
+            self._source_config = compiled_manifest
+        else:
+            resolved_source_config = ManifestReferenceResolver().preprocess_manifest(manifest)
+            self._source_config = ManifestComponentTransformer().propagate_types_and_parameters("", resolved_source_config, {})
+            self._validate_source()
+            if compiled_manifest_cache and cache_key:
+                compiled_manifest_cache.set(cache_key, self._source_config)
 
     @property
     def resolved_manifest(self) -> Mapping[str, Any]:
@@ -91,6 +108,10 @@ class ManifestDeclarativeSource(DeclarativeSource):
     def streams(self, config: Mapping[str, Any]) -> List[Stream]:
         self._emit_manifest_debug_message(extra_args={"source_name": self.name, "parsed_config": json.dumps(self._source_config)})
         stream_configs = self._stream_configs(self._source_config)
+        if self._configured_catalog is not None:
+            # Parent streams are defined within the configs of their substreams so they don't need to be selected
+            selected_stream_names = {configured_stream.stream.name for configured_stream in self._configured_catalog.streams}
+            stream_configs = [stream_config for stream_config in stream_configs if stream_config.get("name") in selected_stream_names]
 
         source_streams = [
             self._constructor.create_component(
@@ -104,9 +125,14 @@ class ManifestDeclarativeSource(DeclarativeSource):
     @staticmethod
     def _initialize_cache_for_parent_streams(stream_configs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         parent_streams = set()
+        top_level_stream_names = {stream_config.get("name") for stream_config in stream_configs}
 
         def update_with_cache_parent_configs(parent_configs: list[dict[str, Any]]) -> None:
             for parent_config in parent_configs:
+                if not parent_config.get("incremental_dependency") and parent_config["stream"]["name"] not in top_level_stream_names:
+                    # The partitions of parents read without state are kept in the ParentRecordCache of the partition routers. A parent
+                    # that is also read as a top-level stream still shares the HTTP cache with it so that it is only fetched once
+                    continue
                 parent_streams.add(parent_config["stream"]["name"])
                 parent_config["stream"]["retriever"]["requester"]["use_cache"] = True
 
@@ -162,7 +188,13 @@ class ManifestDeclarativeSource(DeclarativeSource):
         state: Optional[Union[List[AirbyteStateMessage], MutableMapping[str, Any]]] = None,
     ) -> Iterator[AirbyteMessage]:
         self._configure_logger_level(logger)
-        yield from super().read(logger, config, catalog, state)
+        self._configured_catalog = catalog
+        try:
+            yield from super().read(logger, config, catalog, state)
+        finally:
+            self._configured_catalog = None
+            # Parent records are only cached for the duration of a read so that a later read fetches the new parent records
+            self._constructor.clear_parent_record_cache()
 
     def _configure_logger_level(self, logger: logging.Logger) -> None:
         """
@@ -676,6 +676,17 @@ class JsonlDecoder(BaseModel):
     type: Literal['JsonlDecoder']
 
 
+class StreamingJsonDecoder(BaseModel):
+    type: Literal['StreamingJsonDecoder']
+    field_path: Optional[List[str]] = Field(
+        [],
+        description='Path to the array of records in the response. Wildcards are not supported.',
+        examples=[['data'], ['data', 'records']],
+        title='Field Path',
+    )
+    parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
+
+
 class KeysToLower(BaseModel):
     type: Literal['KeysToLower']
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
@@ -1157,6 +1168,21 @@ class DatetimeBasedCursor(BaseModel):
         description='This setting optimizes performance when the parent stream has thousands of partitions by storing the cursor as a single value rather than per partition. Notably, the substream state is updated only at the end of the sync, which helps prevent data loss in case of a sync failure. See more info in the [docs](https://docs.airbyte.com/connector-development/config-based/understanding-the-yaml-file/incremental-syncs).',
         title='Whether to store cursor as one value instead of per partition',
     )
+    use_compact_state: Optional[bool] = Field(
+        False,
+        description='Only applies to streams with partitions. The most common partition state is stored once as a global state instead of being repeated for every partition having it, which reduces the size of the state of streams with thousands of partitions.',
+        title='Whether to store the most common partition state once',
+    )
+    checkpoint_every_n_slices: Optional[int] = Field(
+        None,
+        description='Only applies to streams with partitions. If set, the state is emitted at most once every given number of closed slices instead of after each slice. The state is always emitted at the end of the sync.',
+        title='Number of Slices Between Checkpoints',
+    )
+    checkpoint_interval_seconds: Optional[float] = Field(
+        None,
+        description='Only applies to streams with partitions. If set, the state is emitted at most once every given number of seconds instead of after each slice. The state is always emitted at the end of the sync.',
+        title='Seconds Between Checkpoints',
+    )
     lookback_window: Optional[str] = Field(
         None,
         description='Time interval before the start_datetime to read data for, e.g. P1M for looking back one month.',
@@ -1629,12 +1655,12 @@ class SimpleRetriever(BaseModel):
         description='PartitionRouter component that describes how to partition the stream, enabling incremental syncs and checkpointing.',
         title='Partition Router',
     )
-    decoder: Optional[Union[JsonDecoder, JsonlDecoder, IterableDecoder, XmlDecoder]] = (
-        Field(
-            None,
-            description='Component decoding the response so records can be extracted.',
-            title='Decoder',
-        )
+    decoder: Optional[
+        Union[JsonDecoder, JsonlDecoder, StreamingJsonDecoder, IterableDecoder, XmlDecoder]
+    ] = Field(
+        None,
+        description='Component decoding the response so records can be extracted.',
+        title='Decoder',
     )
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
 
@@ -1695,12 +1721,12 @@ class AsyncRetriever(BaseModel):
         description='PartitionRouter component that describes how to partition the stream, enabling incremental syncs and checkpointing.',
         title='Partition Router',
     )
-    decoder: Optional[Union[JsonDecoder, JsonlDecoder, IterableDecoder, XmlDecoder]] = (
-        Field(
-            None,
-            description='Component decoding the response so records can be extracted.',
-            title='Decoder',
-        )
+    decoder: Optional[
+        Union[JsonDecoder, JsonlDecoder, StreamingJsonDecoder, IterableDecoder, XmlDecoder]
+    ] = Field(
+        None,
+        description='Component decoding the response so records can be extracted.',
+        title='Decoder',
     )
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
 
@@ -1712,6 +1738,11 @@ class SubstreamPartitionRouter(BaseModel):
         description='Specifies which parent streams are being iterated over and how parent records should be used to partition the child stream data set.',
         title='Parent Stream Configs',
     )
+    max_prefetched_partitions: Optional[int] = Field(
+        0,
+        description='If greater than 0, the parent records are read in a background thread and the partitions are created as soon as the parent records are read, up to this number of partitions ahead of the child stream.',
+        title='Maximum Prefetched Partitions',
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
 
 
@@ -0,0 +1,86 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import logging
+import os
+import tempfile
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Union
+
+from orjson import orjson
+
+logger = logging.getLogger("airbyte")
+
+# Dates parsed by the YAML loader are not passed through so that manifests that can't be represented as JSON are not cached
+_DUMPS_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+class CompiledManifestCache:
+    """
+    Persists manifests that were resolved, propagated and validated by ManifestDeclarativeSource in a directory so that later launches of
+    the same connector can skip these steps.
+
+    Entries are keyed by a fingerprint of the manifest as provided by the connector and of the airbyte-cdk version. Upgrading the CDK or
+    changing the manifest therefore results in a different key. Each entry is written to its own file which is replaced atomically so that
+    processes sharing the directory never read a partially written artifact.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        """
+        :param directory: The directory where the compiled manifests are stored. The directory is created if it does not exist
+        """
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def get_key(manifest: Mapping[str, Any]) -> Optional[str]:
+        """
+        Return the key of the manifest or None if the manifest can't be serialized to JSON and therefore can't be cached
+        """
+        try:
+            serialized_manifest = orjson.dumps(manifest, option=_DUMPS_OPTIONS)
+        except orjson.JSONEncodeError:
+            return None
+        fingerprint = hashlib.sha256(metadata.version("airbyte_cdk").encode("utf-8"))
+        fingerprint.update(b"\n")
+        fingerprint.update(serialized_manifest)
+        return fingerprint.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the compiled manifest stored for the key or None if there is none or if the artifact can't be read
+        """
+        try:
+            compiled_manifest = orjson.loads(self._path(key).read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, orjson.JSONDecodeError) as exception:
+            logger.warning(f"Ignoring compiled manifest {key} that can't be read: {exception}")
+            return None
+        return compiled_manifest if isinstance(compiled_manifest, dict) else None
+
+    def set(self, key: str, compiled_manifest: Mapping[str, Any]) -> None:
+        """
+        Store the compiled manifest. Failing to write the artifact is logged and does not fail the sync
+        """
+        try:
+            content = orjson.dumps(compiled_manifest, option=_DUMPS_OPTIONS)
+        except orjson.JSONEncodeError:
+            return
+        try:
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=self._directory, prefix=f".{key}", suffix=".tmp")
+            try:
+                with os.fdopen(file_descriptor, "wb") as temporary_file:
+                    temporary_file.write(content)
+                os.replace(temporary_path, self._path(key))
+            except BaseException:
+                os.unlink(temporary_path)
+                raise
+        except OSError as exception:
+            logger.warning(f"Failed to store compiled manifest {key}: {exception}")
+
+    def _path(self, key: str) -> Path:
+        return self._directory / f"{key}.json"
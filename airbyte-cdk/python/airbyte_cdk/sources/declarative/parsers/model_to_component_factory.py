@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import importlib
 import inspect
 import re
@@ -37,6 +38,7 @@ from airbyte_cdk.sources.declarative.decoders import (
     JsonDecoder,
     JsonlDecoder,
     PaginationDecoderDecorator,
+    StreamingJsonDecoder,
     XmlDecoder,
 )
 from airbyte_cdk.sources.declarative.extractors import DpathExtractor, RecordFilter, RecordSelector, ResponseToFileExtractor
@@ -121,6 +123,7 @@ from airbyte_cdk.sources.declarative.models.declarative_component_schema import
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import SessionTokenAuthenticator as SessionTokenAuthenticatorModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import SimpleRetriever as SimpleRetrieverModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import Spec as SpecModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import StreamingJsonDecoder as StreamingJsonDecoderModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import SubstreamPartitionRouter as SubstreamPartitionRouterModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import ValueType
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import WaitTimeFromHeader as WaitTimeFromHeaderModel
@@ -132,6 +135,7 @@ from airbyte_cdk.sources.declarative.partition_routers import (
     SinglePartitionRouter,
     SubstreamPartitionRouter,
 )
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import ParentRecordCache
 from airbyte_cdk.sources.declarative.partition_routers.substream_partition_router import ParentStreamConfig
 from airbyte_cdk.sources.declarative.requesters import HttpRequester, RequestOption
 from airbyte_cdk.sources.declarative.requesters.error_handlers import CompositeErrorHandler, DefaultErrorHandler, HttpResponseFilter
@@ -171,6 +175,7 @@ from airbyte_cdk.sources.streams.http.error_handlers.response_models import Resp
 from airbyte_cdk.sources.types import Config
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 from isodate import parse_duration
+from orjson import orjson
 from pydantic.v1 import BaseModel
 
 ComponentDefinition = Mapping[str, Any]
@@ -185,6 +190,7 @@ class ModelToComponentFactory:
         disable_retries: bool = False,
         disable_cache: bool = False,
         message_repository: Optional[MessageRepository] = None,
+        parent_record_cache: Optional[ParentRecordCache] = None,
     ):
         self._init_mappings()
         self._limit_pages_fetched_per_slice = limit_pages_fetched_per_slice
@@ -195,6 +201,11 @@ class ModelToComponentFactory:
         self._message_repository = message_repository or InMemoryMessageRepository(  # type: ignore
             self._evaluate_log_level(emit_connector_builder_messages)
         )
+        # Shared by all the substream partition routers created by this factory so that parents are only read once per sync. The
+        # cache is cleared at the end of each read by `clear_parent_record_cache`
+        if parent_record_cache is None and not disable_cache:
+            parent_record_cache = ParentRecordCache()
+        self._parent_record_cache = parent_record_cache
 
     def _init_mappings(self) -> None:
         self.PYDANTIC_MODEL_TO_CONSTRUCTOR: Mapping[Type[BaseModel], Callable[..., Any]] = {
@@ -233,6 +244,7 @@ class ModelToComponentFactory:
             InlineSchemaLoaderModel: self.create_inline_schema_loader,
             JsonDecoderModel: self.create_json_decoder,
             JsonlDecoderModel: self.create_jsonl_decoder,
+            StreamingJsonDecoderModel: self.create_streaming_json_decoder,
             KeysToLowerModel: self.create_keys_to_lower_transformation,
             IterableDecoderModel: self.create_iterable_decoder,
             XmlDecoderModel: self.create_xml_decoder,
@@ -469,14 +481,14 @@ class ModelToComponentFactory:
         self, model: CursorPaginationModel, config: Config, decoder: Decoder, **kwargs: Any
     ) -> CursorPaginationStrategy:
         if isinstance(decoder, PaginationDecoderDecorator):
-            if not isinstance(decoder.decoder, (JsonDecoder, XmlDecoder)):
+            if not isinstance(decoder.decoder, (JsonDecoder, StreamingJsonDecoder, XmlDecoder)):
                 raise ValueError(
-                    f"Provided decoder of {type(decoder.decoder)=} is not supported. Please set JsonDecoder or XmlDecoder instead."
+                    f"Provided decoder of {type(decoder.decoder)=} is not supported. Please set JsonDecoder, StreamingJsonDecoder or XmlDecoder instead."
                 )
             decoder_to_use = decoder
         else:
-            if not isinstance(decoder, (JsonDecoder, XmlDecoder)):
-                raise ValueError(f"Provided decoder of {type(decoder)=} is not supported. Please set JsonDecoder or XmlDecoder instead.")
+            if not isinstance(decoder, (JsonDecoder, StreamingJsonDecoder, XmlDecoder)):
+                raise ValueError(f"Provided decoder of {type(decoder)=} is not supported. Please set JsonDecoder, StreamingJsonDecoder or XmlDecoder instead.")
             decoder_to_use = PaginationDecoderDecorator(decoder=decoder)
 
         return CursorPaginationStrategy(
@@ -796,6 +808,9 @@ class ModelToComponentFactory:
                         lambda: self._create_component_from_model(model=incremental_sync_model, config=config),
                     ),
                     partition_router=stream_slicer,
+                    use_compact_state=getattr(incremental_sync_model, "use_compact_state", None) or False,
+                    checkpoint_every_n_slices=getattr(incremental_sync_model, "checkpoint_every_n_slices", None),
+                    checkpoint_interval_seconds=getattr(incremental_sync_model, "checkpoint_interval_seconds", None),
                 )
         elif model.incremental_sync:
             return self._create_component_from_model(model=model.incremental_sync, config=config) if model.incremental_sync else None
@@ -841,8 +856,8 @@ class ModelToComponentFactory:
         cursor_used_for_stop_condition: Optional[DeclarativeCursor] = None,
     ) -> Union[DefaultPaginator, PaginatorTestReadDecorator]:
         if decoder:
-            if not isinstance(decoder, (JsonDecoder, XmlDecoder)):
-                raise ValueError(f"Provided decoder of {type(decoder)=} is not supported. Please set JsonDecoder or XmlDecoder instead.")
+            if not isinstance(decoder, (JsonDecoder, StreamingJsonDecoder, XmlDecoder)):
+                raise ValueError(f"Provided decoder of {type(decoder)=} is not supported. Please set JsonDecoder, StreamingJsonDecoder or XmlDecoder instead.")
             decoder_to_use = PaginationDecoderDecorator(decoder=decoder)
         else:
             decoder_to_use = PaginationDecoderDecorator(decoder=JsonDecoder(parameters={}))
@@ -963,6 +978,10 @@ class ModelToComponentFactory:
     def create_jsonl_decoder(model: JsonlDecoderModel, config: Config, **kwargs: Any) -> JsonlDecoder:
         return JsonlDecoder(parameters={})
 
+    @staticmethod
+    def create_streaming_json_decoder(model: StreamingJsonDecoderModel, config: Config, **kwargs: Any) -> StreamingJsonDecoder:
+        return StreamingJsonDecoder(field_path=model.field_path or [], parameters=model.parameters or {})
+
     @staticmethod
     def create_iterable_decoder(model: IterableDecoderModel, config: Config, **kwargs: Any) -> IterableDecoder:
         return IterableDecoder(parameters={})
@@ -1083,14 +1102,14 @@ class ModelToComponentFactory:
     @staticmethod
     def create_offset_increment(model: OffsetIncrementModel, config: Config, decoder: Decoder, **kwargs: Any) -> OffsetIncrement:
         if isinstance(decoder, PaginationDecoderDecorator):
-            if not isinstance(decoder.decoder, (JsonDecoder, XmlDecoder)):
+            if not isinstance(decoder.decoder, (JsonDecoder, StreamingJsonDecoder, XmlDecoder)):
                 raise ValueError(
-                    f"Provided decoder of {type(decoder.decoder)=} is not supported. Please set JsonDecoder or XmlDecoder instead."
+                    f"Provided decoder of {type(decoder.decoder)=} is not supported. Please set JsonDecoder, StreamingJsonDecoder or XmlDecoder instead."
                 )
             decoder_to_use = decoder
         else:
-            if not isinstance(decoder, (JsonDecoder, XmlDecoder)):
-                raise ValueError(f"Provided decoder of {type(decoder)=} is not supported. Please set JsonDecoder or XmlDecoder instead.")
+            if not isinstance(decoder, (JsonDecoder, StreamingJsonDecoder, XmlDecoder)):
+                raise ValueError(f"Provided decoder of {type(decoder)=} is not supported. Please set JsonDecoder, StreamingJsonDecoder or XmlDecoder instead.")
             decoder_to_use = PaginationDecoderDecorator(decoder=decoder)
         return OffsetIncrement(
             page_size=model.page_size,
@@ -1120,9 +1139,29 @@ class ModelToComponentFactory:
             partition_field=model.partition_field,
             config=config,
             incremental_dependency=model.incremental_dependency or False,
+            record_cache_key=self._get_parent_record_cache_key(model, config),
             parameters=model.parameters or {},
         )
 
+    @staticmethod
+    def _get_parent_record_cache_key(model: ParentStreamConfigModel, config: Config) -> Optional[str]:
+        """
+        Parents are identified by the definition of the parent stream, the parent key and the config so that the partitions of parent
+        streams that are inlined in many substreams are shared
+        """
+        try:
+            serialized_stream = model.stream.json(sort_keys=True)
+            serialized_config = orjson.dumps(config, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            # orjson.JSONEncodeError is a subclass of TypeError
+            return None
+        fingerprint = hashlib.sha256(serialized_stream.encode("utf-8"))
+        fingerprint.update(b"\n")
+        fingerprint.update(str(model.parent_key).encode("utf-8"))
+        fingerprint.update(b"\n")
+        fingerprint.update(serialized_config)
+        return fingerprint.hexdigest()
+
     @staticmethod
     def create_record_filter(model: RecordFilterModel, config: Config, **kwargs: Any) -> RecordFilter:
         return RecordFilter(condition=model.condition or "", config=config, parameters=model.parameters or {})
@@ -1418,7 +1457,13 @@ class ModelToComponentFactory:
                 ]
             )
 
-        return SubstreamPartitionRouter(parent_stream_configs=parent_stream_configs, parameters=model.parameters or {}, config=config)
+        return SubstreamPartitionRouter(
+            parent_stream_configs=parent_stream_configs,
+            parameters=model.parameters or {},
+            config=config,
+            max_prefetched_partitions=model.max_prefetched_partitions or 0,
+            parent_record_cache=self._parent_record_cache,
+        )
 
     def _create_message_repository_substream_wrapper(self, model: ParentStreamConfigModel, config: Config) -> Any:
         substream_factory = ModelToComponentFactory(
@@ -1432,6 +1477,7 @@ class ModelToComponentFactory:
                 self._message_repository,
                 self._evaluate_log_level(self._emit_connector_builder_messages),
             ),
+            parent_record_cache=self._parent_record_cache,
         )
         return substream_factory._create_component_from_model(model=model, config=config)
 
@@ -1456,5 +1502,12 @@ class ModelToComponentFactory:
     def get_message_repository(self) -> MessageRepository:
         return self._message_repository
 
+    def clear_parent_record_cache(self) -> None:
+        """
+        Discard the parent partitions cached by the substream partition routers so that the next read fetches the parents again
+        """
+        if self._parent_record_cache is not None:
+            self._parent_record_cache.close()
+
     def _evaluate_log_level(self, emit_connector_builder_messages: bool) -> Level:
         return Level.DEBUG if emit_connector_builder_messages else Level.INFO
@@ -0,0 +1,166 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+import mmap
+import tempfile
+import threading
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from orjson import orjson
+
+logger = logging.getLogger("airbyte")
+
+# A parent partition is the value of the parent key of a parent record and the partition of the parent slice the record was read from
+ParentPartition = Tuple[Any, Mapping[str, Any]]
+_Span = Tuple[int, int]
+
+_CHUNK_SIZE = 64 * 1024
+
+
+class ParentRecordCache:
+    """
+    Keeps the parent partitions extracted by SubstreamPartitionRouters so that a parent stream is only read once per sync even if many
+    child streams depend on it. Only the fields the partition router needs are kept, not the parent records or HTTP responses.
+
+    The partitions are serialized as JSON lines and appended to an anonymous temporary file which is memory-mapped to be read. The
+    partitions of a parent are only available once the parent has been read entirely. Once the file reaches `max_size_bytes`, the
+    partitions of the parents that are still being read are discarded and those parents are read again by every child stream.
+
+    Each read maps the file on its own so that closing the cache does not interrupt the reads in progress. The partitions written
+    before the cache was closed are discarded.
+    """
+
+    DEFAULT_MAX_SIZE_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES, directory: Optional[str] = None):
+        """
+        :param max_size_bytes: The maximum size of the file holding the parent partitions
+        :param directory: The directory of the temporary file. Uses the default temporary directory if not provided
+        """
+        if max_size_bytes < 1:
+            raise ValueError(f"Expected the cache to hold at least one byte but got {max_size_bytes}")
+        self._max_size_bytes = max_size_bytes
+        self._directory = directory
+        self._lock = threading.Lock()
+        self._file: Optional[Any] = None
+        self._size = 0
+        # Incremented when the cache is closed so that the writers started before do not commit spans of the closed file
+        self._generation = 0
+        self._spans_by_key: Dict[str, List[_Span]] = {}
+
+    def get(self, key: str) -> Optional[Iterator[ParentPartition]]:
+        """
+        Return the parent partitions stored for the key or None if the parent has not been read entirely yet
+        """
+        with self._lock:
+            spans = self._spans_by_key.get(key)
+            if spans is None:
+                return None
+            if not spans or self._file is None:
+                return iter([])
+            # The mapping is owned by the read so that it stays valid if the cache is closed while it is being read
+            mapping = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._read(mapping, spans)
+
+    def writer(self, key: str) -> "ParentRecordCacheWriter":
+        with self._lock:
+            return ParentRecordCacheWriter(self, key, self._generation)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._spans_by_key)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._spans_by_key.clear()
+            self._size = 0
+            self._generation += 1
+
+    def _append(self, chunk: bytes, generation: int) -> Optional[_Span]:
+        """
+        Append the chunk to the file and return its offset and length or None if the file would exceed the maximum size, can't be
+        written or if the cache was closed since the writer was created
+        """
+        with self._lock:
+            if generation != self._generation or self._size + len(chunk) > self._max_size_bytes:
+                return None
+            try:
+                if self._file is None:
+                    self._file = tempfile.TemporaryFile(dir=self._directory)
+                self._file.seek(self._size)
+                self._file.write(chunk)
+                self._file.flush()
+            except OSError as exception:
+                logger.warning(f"Failed to write to the parent record cache: {exception}")
+                return None
+            span = (self._size, len(chunk))
+            self._size += len(chunk)
+            return span
+
+    def _commit(self, key: str, spans: List[_Span], generation: int) -> None:
+        with self._lock:
+            if generation == self._generation:
+                self._spans_by_key[key] = spans
+
+    @staticmethod
+    def _read(mapping: mmap.mmap, spans: List[_Span]) -> Iterator[ParentPartition]:
+        try:
+            for offset, length in spans:
+                for line in mapping[offset : offset + length].splitlines():
+                    partition_value, parent_partition = orjson.loads(line)
+                    yield partition_value, parent_partition
+        finally:
+            mapping.close()
+
+
+class ParentRecordCacheWriter:
+    """
+    Buffers the parent partitions of a parent being read and makes them available in the cache once `commit` is called
+    """
+
+    def __init__(self, cache: ParentRecordCache, key: str, generation: int) -> None:
+        self._cache = cache
+        self._key = key
+        self._generation = generation
+        self._buffer = bytearray()
+        self._spans: List[_Span] = []
+        self._is_discarded = False
+
+    def append(self, partition_value: Any, parent_partition: Mapping[str, Any]) -> None:
+        if self._is_discarded:
+            return
+        try:
+            self._buffer += orjson.dumps((partition_value, parent_partition), option=orjson.OPT_PASSTHROUGH_DATETIME)
+        except orjson.JSONEncodeError:
+            logger.debug(f"Parent partition {parent_partition} can't be serialized so the parent records are not cached")
+            self._discard()
+            return
+        self._buffer += b"\n"
+        if len(self._buffer) >= _CHUNK_SIZE:
+            self._flush()
+
+    def commit(self) -> None:
+        self._flush()
+        if not self._is_discarded:
+            self._cache._commit(self._key, self._spans, self._generation)
+
+    def _flush(self) -> None:
+        if self._is_discarded or not self._buffer:
+            return
+        span = self._cache._append(bytes(self._buffer), self._generation)
+        if span is None:
+            logger.info("The parent record cache is full or closed so parent records that are being read will not be cached")
+            self._discard()
+            return
+        self._spans.append(span)
+        self._buffer.clear()
+
+    def _discard(self) -> None:
+        self._is_discarded = True
+        self._buffer.clear()
+        self._spans.clear()
@@ -1,14 +1,18 @@
 #
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
+import copy
 import logging
-from dataclasses import InitVar, dataclass
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Optional, Union
+import threading
+from dataclasses import InitVar, dataclass, field
+from queue import Full, Queue
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 
 import dpath
 from airbyte_cdk.models import AirbyteMessage
 from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import ParentRecordCache
 from airbyte_cdk.sources.declarative.partition_routers.partition_router import PartitionRouter
 from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
 from airbyte_cdk.sources.types import Config, Record, StreamSlice, StreamState
@@ -17,6 +21,15 @@ from airbyte_cdk.utils import AirbyteTracedException
 if TYPE_CHECKING:
     from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
 
+_NO_PARENT_STATE_UPDATE = object()
+_END_OF_PREFETCH = object()
+_PREFETCH_POLL_INTERVAL_SECONDS = 0.1
+
+
+class _PrefetchError:
+    def __init__(self, exception: Exception) -> None:
+        self.exception = exception
+
 
 @dataclass
 class ParentStreamConfig:
@@ -28,6 +41,8 @@ class ParentStreamConfig:
     partition_field: The partition key
     request_option: How to inject the slice value on an outgoing HTTP request
     incremental_dependency (bool): Indicates if the parent stream should be read incrementally.
+    record_cache_key (Optional[str]): Identifies the parent stream and parent key in the ParentRecordCache of the partition router.
+        Parents with the same key produce the same partitions.
     """
 
     stream: "DeclarativeStream"  # Parent streams must be DeclarativeStream because we can't know which part of the stream slice is a partition for regular Stream
@@ -37,6 +52,7 @@ class ParentStreamConfig:
     parameters: InitVar[Mapping[str, Any]]
     request_option: Optional[RequestOption] = None
     incremental_dependency: bool = False
+    record_cache_key: Optional[str] = None
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         self.parent_key = InterpolatedString.create(self.parent_key, parameters=parameters)
@@ -51,15 +67,24 @@ class SubstreamPartitionRouter(PartitionRouter):
 
     Attributes:
         parent_stream_configs (List[ParentStreamConfig]): parent streams to iterate over and their config
+        max_prefetched_partitions (int): if greater than 0, the parent records are read in a background thread up to this number of
+            partitions ahead of the consumer
+        parent_record_cache (Optional[ParentRecordCache]): if set, the partitions of the parents that are not read incrementally are
+            cached so that the parent is only read once for all the routers sharing the cache
     """
 
     parent_stream_configs: List[ParentStreamConfig]
     config: Config
     parameters: InitVar[Mapping[str, Any]]
+    # Keyword only so that subclasses can still declare fields without default values
+    max_prefetched_partitions: int = field(default=0, kw_only=True)
+    parent_record_cache: Optional[ParentRecordCache] = field(default=None, kw_only=True)
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         if not self.parent_stream_configs:
             raise ValueError("SubstreamPartitionRouter needs at least 1 parent stream")
+        if self.max_prefetched_partitions < 0:
+            raise ValueError(f"max_prefetched_partitions should not be negative but got {self.max_prefetched_partitions}")
         self._parameters = parameters
         self._parent_state: Dict[str, Any] = {}
 
@@ -120,6 +145,10 @@ class SubstreamPartitionRouter(PartitionRouter):
 
         If a parent slice contains no record, emit a slice with parent_record=None.
 
+        If `max_prefetched_partitions` is greater than 0, the parent records are read in a background thread and the slices are yielded as
+        soon as the parent record is read instead of once all the records of the parent slice (or of the parent stream if the parent is
+        not read incrementally) are read. Up to `max_prefetched_partitions` slices are read ahead of the consumer.
+
         The template string can interpolate the following values:
         - parent_stream_slice: mapping representing the parent's stream slice
         - parent_record: mapping representing the parent record
@@ -129,74 +158,164 @@ class SubstreamPartitionRouter(PartitionRouter):
             yield from []
         else:
             for parent_stream_config in self.parent_stream_configs:
-                parent_stream = parent_stream_config.stream
-                parent_field = parent_stream_config.parent_key.eval(self.config)  # type: ignore # parent_key is always casted to an interpolated string
-                partition_field = parent_stream_config.partition_field.eval(self.config)  # type: ignore # partition_field is always casted to an interpolated string
-                incremental_dependency = parent_stream_config.incremental_dependency
-
-                stream_slices_for_parent = []
-                previous_associated_slice = None
-
-                # read_stateless() assumes the parent is not concurrent. This is currently okay since the concurrent CDK does
-                # not support either substreams or RFR, but something that needs to be considered once we do
-                for parent_record in parent_stream.read_only_records():
-                    parent_partition = None
-                    parent_associated_slice = None
-                    # Skip non-records (eg AirbyteLogMessage)
-                    if isinstance(parent_record, AirbyteMessage):
-                        self.logger.warning(
-                            f"Parent stream {parent_stream.name} returns records of type AirbyteMessage. This SubstreamPartitionRouter is not able to checkpoint incremental parent state."
-                        )
-                        if parent_record.type == MessageType.RECORD:
-                            parent_record = parent_record.record.data
-                        else:
-                            continue
-                    elif isinstance(parent_record, Record):
-                        parent_partition = parent_record.associated_slice.partition if parent_record.associated_slice else {}
-                        parent_associated_slice = parent_record.associated_slice
-                        parent_record = parent_record.data
-                    elif not isinstance(parent_record, Mapping):
-                        # The parent_record should only take the form of a Record, AirbyteMessage, or Mapping. Anything else is invalid
-                        raise AirbyteTracedException(message=f"Parent stream returned records as invalid type {type(parent_record)}")
-                    try:
-                        partition_value = dpath.get(parent_record, parent_field)
-                    except KeyError:
-                        pass
-                    else:
-                        if incremental_dependency:
-                            if previous_associated_slice is None:
-                                previous_associated_slice = parent_associated_slice
-                            elif previous_associated_slice != parent_associated_slice:
-                                # Update the parent state, as parent stream read all record for current slice and state
-                                # is already updated.
-                                #
-                                # When the associated slice of the current record of the parent stream changes, this
-                                # indicates the parent stream has finished processing the current slice and has moved onto
-                                # the next. When this happens, we should update the partition router's current state and
-                                # flush the previous set of collected records and start a new set
-                                #
-                                # Note: One tricky aspect to take note of here is that parent_stream.state will actually
-                                # fetch state of the stream of the previous record's slice NOT the current record's slice.
-                                # This is because in the retriever, we only update stream state after yielding all the
-                                # records. And since we are in the middle of the current slice, parent_stream.state is
-                                # still set to the previous state.
-                                self._parent_state[parent_stream.name] = parent_stream.state
-                                yield from stream_slices_for_parent
-
-                                # Reset stream_slices_for_parent after we've flushed parent records for the previous parent slice
-                                stream_slices_for_parent = []
-                                previous_associated_slice = parent_associated_slice
-                        stream_slices_for_parent.append(
-                            StreamSlice(
-                                partition={partition_field: partition_value, "parent_slice": parent_partition or {}}, cursor_slice={}
-                            )
-                        )
-
-                # A final parent state update and yield of records is needed, so we don't skip records for the final parent slice
+                if self.max_prefetched_partitions > 0:
+                    batches = self._prefetch(self._read_parent_slice_batches(parent_stream_config, is_pipelined=True))
+                else:
+                    batches = self._read_parent_slice_batches(parent_stream_config, is_pipelined=False)
+
+                for parent_state, stream_slices in batches:
+                    if parent_state is not _NO_PARENT_STATE_UPDATE:
+                        self._parent_state[parent_stream_config.stream.name] = parent_state
+                    yield from stream_slices
+
+    def _read_parent_slice_batches(
+        self, parent_stream_config: ParentStreamConfig, is_pipelined: bool
+    ) -> Iterator[Tuple[Any, List[StreamSlice]]]:
+        """
+        Read the records of the parent stream and yield batches of slices along with the parent state to set before yielding the slices,
+        or _NO_PARENT_STATE_UPDATE.
+
+        When `is_pipelined` is False, the slices are batched until the parent state is updated. Otherwise, every slice is yielded as soon
+        as the parent record is read and the parent state is yielded on its own once all the slices of the previous parent slice have been
+        yielded. As the batches are then read ahead in another thread, the parent state is copied when it is read.
+        """
+        parent_stream = parent_stream_config.stream
+        parent_field = parent_stream_config.parent_key.eval(self.config)  # type: ignore # parent_key is always casted to an interpolated string
+        partition_field = parent_stream_config.partition_field.eval(self.config)  # type: ignore # partition_field is always casted to an interpolated string
+        incremental_dependency = parent_stream_config.incremental_dependency
+
+        record_cache_key = parent_stream_config.record_cache_key
+        if self.parent_record_cache is not None and record_cache_key and not incremental_dependency:
+            cached_partitions = self.parent_record_cache.get(record_cache_key)
+            if cached_partitions is not None:
+                yield from self._read_cached_slice_batches(cached_partitions, partition_field, is_pipelined)
+                return
+            cache_writer = self.parent_record_cache.writer(record_cache_key)
+        else:
+            cache_writer = None
+
+        stream_slices_for_parent = []
+        previous_associated_slice = None
+
+        # read_stateless() assumes the parent is not concurrent. This is currently okay since the concurrent CDK does
+        # not support either substreams or RFR, but something that needs to be considered once we do
+        for parent_record in parent_stream.read_only_records():
+            parent_partition = None
+            parent_associated_slice = None
+            # Skip non-records (eg AirbyteLogMessage)
+            if isinstance(parent_record, AirbyteMessage):
+                self.logger.warning(
+                    f"Parent stream {parent_stream.name} returns records of type AirbyteMessage. This SubstreamPartitionRouter is not able to checkpoint incremental parent state."
+                )
+                if parent_record.type == MessageType.RECORD:
+                    parent_record = parent_record.record.data
+                else:
+                    continue
+            elif isinstance(parent_record, Record):
+                parent_partition = parent_record.associated_slice.partition if parent_record.associated_slice else {}
+                parent_associated_slice = parent_record.associated_slice
+                parent_record = parent_record.data
+            elif not isinstance(parent_record, Mapping):
+                # The parent_record should only take the form of a Record, AirbyteMessage, or Mapping. Anything else is invalid
+                raise AirbyteTracedException(message=f"Parent stream returned records as invalid type {type(parent_record)}")
+            try:
+                partition_value = dpath.get(parent_record, parent_field)
+            except KeyError:
+                pass
+            else:
                 if incremental_dependency:
-                    self._parent_state[parent_stream.name] = parent_stream.state
+                    if previous_associated_slice is None:
+                        previous_associated_slice = parent_associated_slice
+                    elif previous_associated_slice != parent_associated_slice:
+                        # Update the parent state, as parent stream read all record for current slice and state
+                        # is already updated.
+                        #
+                        # When the associated slice of the current record of the parent stream changes, this
+                        # indicates the parent stream has finished processing the current slice and has moved onto
+                        # the next. When this happens, we should update the partition router's current state and
+                        # flush the previous set of collected records and start a new set
+                        #
+                        # Note: One tricky aspect to take note of here is that parent_stream.state will actually
+                        # fetch state of the stream of the previous record's slice NOT the current record's slice.
+                        # This is because in the retriever, we only update stream state after yielding all the
+                        # records. And since we are in the middle of the current slice, parent_stream.state is
+                        # still set to the previous state.
+                        yield self._read_parent_state(parent_stream, is_pipelined), stream_slices_for_parent
+
+                        # Reset stream_slices_for_parent after we've flushed parent records for the previous parent slice
+                        stream_slices_for_parent = []
+                        previous_associated_slice = parent_associated_slice
+                if cache_writer is not None:
+                    cache_writer.append(partition_value, parent_partition or {})
+                stream_slices_for_parent.append(
+                    StreamSlice(partition={partition_field: partition_value, "parent_slice": parent_partition or {}}, cursor_slice={})
+                )
+                if is_pipelined:
+                    # The parent state is only updated once the slices of the whole parent slice have been yielded which keeps the state
+                    # behind the slices that have been yielded
+                    yield _NO_PARENT_STATE_UPDATE, stream_slices_for_parent
+                    stream_slices_for_parent = []
+
+        if cache_writer is not None:
+            cache_writer.commit()
+        # A final parent state update and yield of records is needed, so we don't skip records for the final parent slice
+        final_parent_state = self._read_parent_state(parent_stream, is_pipelined) if incremental_dependency else _NO_PARENT_STATE_UPDATE
+        yield final_parent_state, stream_slices_for_parent
+
+    @staticmethod
+    def _read_cached_slice_batches(
+        cached_partitions: Iterable[Tuple[Any, Mapping[str, Any]]], partition_field: str, is_pipelined: bool
+    ) -> Iterator[Tuple[Any, List[StreamSlice]]]:
+        stream_slices = (
+            StreamSlice(partition={partition_field: partition_value, "parent_slice": parent_partition}, cursor_slice={})
+            for partition_value, parent_partition in cached_partitions
+        )
+        if is_pipelined:
+            for stream_slice in stream_slices:
+                yield _NO_PARENT_STATE_UPDATE, [stream_slice]
+        else:
+            yield _NO_PARENT_STATE_UPDATE, list(stream_slices)
 
-                yield from stream_slices_for_parent
+    @staticmethod
+    def _read_parent_state(parent_stream: "DeclarativeStream", is_pipelined: bool) -> StreamState:
+        return copy.deepcopy(parent_stream.state) if is_pipelined else parent_stream.state
+
+    def _prefetch(self, batches: Iterator[Tuple[Any, List[StreamSlice]]]) -> Iterator[Tuple[Any, List[StreamSlice]]]:
+        """
+        Read the batches in a background thread, up to `max_prefetched_partitions` batches ahead of the consumer. Errors raised while
+        reading are raised to the consumer. If the consumer stops iterating, the background thread stops reading.
+        """
+        prefetched: Queue[Any] = Queue(maxsize=self.max_prefetched_partitions)
+        is_consumer_done = threading.Event()
+
+        def _put(item: Any) -> bool:
+            while not is_consumer_done.is_set():
+                try:
+                    prefetched.put(item, timeout=_PREFETCH_POLL_INTERVAL_SECONDS)
+                    return True
+                except Full:
+                    continue
+            return False
+
+        def _read_batches() -> None:
+            try:
+                for batch in batches:
+                    if not _put(batch):
+                        return
+            except Exception as exception:
+                _put(_PrefetchError(exception))
+                return
+            _put(_END_OF_PREFETCH)
+
+        reader = threading.Thread(target=_read_batches, name="substream-parent-prefetch", daemon=True)
+        reader.start()
+        try:
+            while (item := prefetched.get()) is not _END_OF_PREFETCH:
+                if isinstance(item, _PrefetchError):
+                    raise item.exception
+                yield item
+        finally:
+            is_consumer_done.set()
 
     def set_initial_state(self, stream_state: StreamState) -> None:
         """
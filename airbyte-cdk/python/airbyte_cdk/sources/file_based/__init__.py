@@ -6,6 +6,7 @@ from .exceptions import CustomFileBasedException, ErrorListingFiles, FileBasedSo
 from .file_based_source import DEFAULT_CONCURRENCY, FileBasedSource
 from .file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
 from .remote_file import RemoteFile
+from .schema_cache import FileSchemaCache
 from .stream.cursor import DefaultFileBasedCursor
 
 __all__ = [
@@ -19,6 +20,7 @@ __all__ = [
     "FileBasedSourceError",
     "FileBasedStreamConfig",
     "FileReadMode",
+    "FileSchemaCache",
     "JsonlFormat",
     "RemoteFile",
 ]
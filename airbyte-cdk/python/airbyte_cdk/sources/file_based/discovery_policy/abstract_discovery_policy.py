@@ -3,8 +3,10 @@
 #
 
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
+from airbyte_cdk.sources.file_based.schema_cache import FileSchemaCache
 
 
 class AbstractDiscoveryPolicy(ABC):
@@ -21,3 +23,18 @@ class AbstractDiscoveryPolicy(ABC):
     @abstractmethod
     def get_max_n_files_for_schema_inference(self, parser: FileTypeParser) -> int:
         ...
+
+    @property
+    def n_schema_inference_processes(self) -> int:
+        """
+        The number of worker processes used to infer the schema of the files. If 0, the schema of the files is inferred in the main
+        process.
+        """
+        return 0
+
+    @property
+    def schema_cache(self) -> Optional[FileSchemaCache]:
+        """
+        The cache of the schemas inferred for each file. If None, the schema of every file is inferred on each discover.
+        """
+        return None
@@ -2,8 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+from typing import Optional
+
 from airbyte_cdk.sources.file_based.discovery_policy.abstract_discovery_policy import AbstractDiscoveryPolicy
 from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
+from airbyte_cdk.sources.file_based.schema_cache import FileSchemaCache
 
 DEFAULT_N_CONCURRENT_REQUESTS = 10
 DEFAULT_MAX_N_FILES_FOR_STREAM_SCHEMA_INFERENCE = 10
@@ -15,6 +18,18 @@ class DefaultDiscoveryPolicy(AbstractDiscoveryPolicy):
     of files to use for schema inference.
     """
 
+    def __init__(self, n_schema_inference_processes: int = 0, schema_cache: Optional[FileSchemaCache] = None):
+        """
+        :param n_schema_inference_processes: The number of worker processes used to infer the schema of the files. As parsers infer
+          schemas synchronously, this allows CPU-bound inference, like type inference of CSV values, to use more than one core
+        :param schema_cache: If provided, the schema inferred for each file is persisted and only the schema of new or modified files is
+          inferred
+        """
+        if n_schema_inference_processes < 0:
+            raise ValueError(f"Expected a positive number of schema inference processes but got {n_schema_inference_processes}")
+        self._n_schema_inference_processes = n_schema_inference_processes
+        self._schema_cache = schema_cache
+
     @property
     def n_concurrent_requests(self) -> int:
         return DEFAULT_N_CONCURRENT_REQUESTS
@@ -26,3 +41,11 @@ class DefaultDiscoveryPolicy(AbstractDiscoveryPolicy):
                 (DEFAULT_MAX_N_FILES_FOR_STREAM_SCHEMA_INFERENCE, parser.parser_max_n_files_for_schema_inference),
             )
         )
+
+    @property
+    def n_schema_inference_processes(self) -> int:
+        return self._n_schema_inference_processes
+
+    @property
+    def schema_cache(self) -> Optional[FileSchemaCache]:
+        return self._schema_cache
@@ -3,6 +3,7 @@
 #
 
 import csv
+import io
 import json
 import logging
 from abc import ABC, abstractmethod
@@ -12,6 +13,8 @@ from io import IOBase
 from typing import Any, Callable, Dict, Generator, Iterable, List, Mapping, Optional, Set, Tuple
 from uuid import uuid4
 
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from airbyte_cdk.models import FailureType
 from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat, CsvHeaderAutogenerated, CsvHeaderUserProvided, InferenceType
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
@@ -96,6 +99,82 @@ class _CsvReader:
                 # due to RecordParseError or GeneratorExit
                 csv.unregister_dialect(dialect_name)
 
+    def read_data_in_batches(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+    ) -> Generator[Tuple[List[str], List[List[str]]], None, None]:
+        """
+        Read the file using pyarrow's CSV reader and yield the headers along with the values of each batch of rows, column by column.
+        Values are not converted by pyarrow: they are the same strings as the ones returned by `read_data`.
+        """
+        config_format = _extract_format(config)
+        dialect_name = f"{config.name}_{str(uuid4())}_{DIALECT_NAME}"
+        csv.register_dialect(
+            dialect_name,
+            delimiter=config_format.delimiter,
+            quotechar=config_format.quote_char,
+            escapechar=config_format.escape_char,
+            doublequote=config_format.double_quote,
+            quoting=csv.QUOTE_MINIMAL,
+        )
+        invalid_rows: List[pa_csv.InvalidRow] = []
+
+        def _handle_invalid_row(row: pa_csv.InvalidRow) -> str:
+            invalid_rows.append(row)
+            return "error"
+
+        try:
+            with stream_reader.open_file(file, FileReadMode.READ_BINARY, None, logger) as fp:
+                # The headers are read using the csv module in order to be the same as the ones returned by `read_data`
+                text_fp = io.TextIOWrapper(fp, encoding=config_format.encoding, newline="")  # type: ignore  # fp is a binary file
+                try:
+                    headers = self._get_headers(text_fp, config_format, dialect_name)  # type: ignore  # TextIOWrapper is an IOBase
+                except UnicodeError:
+                    raise AirbyteTracedException(
+                        message=f"{FileBasedSourceError.ENCODING_ERROR.value} Expected encoding: {config_format.encoding}",
+                    )
+                # The text wrapper reads ahead so the file is read again from the start, skipping the rows up to the first record
+                text_fp.detach()
+                fp.seek(0)
+
+                try:
+                    reader = pa_csv.open_csv(
+                        fp,
+                        read_options=pa_csv.ReadOptions(
+                            skip_rows=config_format.skip_rows_before_header
+                            + (1 if config_format.header_definition.has_header_row() else 0)
+                            + config_format.skip_rows_after_header,
+                            column_names=headers,
+                            encoding=config_format.encoding or "utf8",
+                        ),
+                        parse_options=_get_pyarrow_parse_options(config_format, _handle_invalid_row),
+                        convert_options=pa_csv.ConvertOptions(
+                            column_types={header: pa.string() for header in headers},
+                            null_values=[],
+                            strings_can_be_null=False,
+                            quoted_strings_can_be_null=False,
+                        ),
+                    )
+                    for batch in reader:
+                        # Converting through numpy is an order of magnitude faster than `to_pylist` for string arrays
+                        yield headers, [column.to_numpy(zero_copy_only=False).tolist() for column in batch.columns]
+                except pa.ArrowInvalid:
+                    if invalid_rows:
+                        # Those errors are the same as the ones raised by `read_data`
+                        raise RecordParseError(
+                            FileBasedSourceError.ERROR_PARSING_RECORD_MISMATCHED_COLUMNS
+                            if invalid_rows[0].actual_columns > invalid_rows[0].expected_columns
+                            else FileBasedSourceError.ERROR_PARSING_RECORD_MISMATCHED_ROWS,
+                            filename=file.uri,
+                            lineno=invalid_rows[0].number,
+                        )
+                    raise
+        finally:
+            csv.unregister_dialect(dialect_name)
+
     def _get_headers(self, fp: IOBase, config_format: CsvFormat, dialect_name: str) -> List[str]:
         """
         Assumes the fp is pointing to the beginning of the files and will reset it as such
@@ -137,12 +216,36 @@ class _CsvReader:
 class CsvParser(FileTypeParser):
     _MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE = 1_000_000
 
-    def __init__(self, csv_reader: Optional[_CsvReader] = None, csv_field_max_bytes: int = 2**31):
+    def __init__(
+        self,
+        csv_reader: Optional[_CsvReader] = None,
+        csv_field_max_bytes: int = 2**31,
+        read_in_batches: bool = False,
+        max_bytes_per_file_for_schema_inference: Optional[int] = None,
+        max_records_per_file_for_schema_inference: Optional[int] = None,
+    ):
+        """
+        :param csv_reader: The reader used to read the rows of the files
+        :param csv_field_max_bytes: The maximum size of a field
+        :param read_in_batches: Whether records should be read in batches using pyarrow's CSV reader when the format allows it. This is
+          faster than reading the file row by row using the csv module but pyarrow does not allow values larger than `block_size`
+        :param max_bytes_per_file_for_schema_inference: The number of bytes of each file sampled to infer the schema. Defaults to
+          `_MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE`
+        :param max_records_per_file_for_schema_inference: The number of records of each file sampled to infer the schema. If None, only
+          the number of bytes is limited
+        """
         # Increase the maximum length of data that can be parsed in a single CSV field. The default is 128k, which is typically sufficient
         # but given the use of Airbyte in loading a large variety of data it is best to allow for a larger maximum field size to avoid
         # skipping data on load. https://stackoverflow.com/questions/15063936/csv-error-field-larger-than-field-limit-131072
         csv.field_size_limit(csv_field_max_bytes)
         self._csv_reader = csv_reader if csv_reader else _CsvReader()
+        self._read_in_batches = read_in_batches
+        self._max_bytes_per_file_for_schema_inference = (
+            max_bytes_per_file_for_schema_inference
+            if max_bytes_per_file_for_schema_inference is not None
+            else self._MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE
+        )
+        self._max_records_per_file_for_schema_inference = max_records_per_file_for_schema_inference
 
     def check_config(self, config: FileBasedStreamConfig) -> Tuple[bool, Optional[str]]:
         """
@@ -171,6 +274,7 @@ class CsvParser(FileTypeParser):
         )
         data_generator = self._csv_reader.read_data(config, file, stream_reader, logger, self.file_read_mode)
         read_bytes = 0
+        read_records = 0
         for row in data_generator:
             for header, value in row.items():
                 type_inferrer_by_field[header].add_value(value)
@@ -178,7 +282,10 @@ class CsvParser(FileTypeParser):
                 # before returning. Given we would like to be more accurate, we could wrap the IO file using a decorator
                 read_bytes += len(value)
             read_bytes += len(row) - 1  # for separators
-            if read_bytes >= self._MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE:
+            read_records += 1
+            if read_bytes >= self._max_bytes_per_file_for_schema_inference:
+                break
+            if read_records == self._max_records_per_file_for_schema_inference:
                 break
 
         if not type_inferrer_by_field:
@@ -207,13 +314,24 @@ class CsvParser(FileTypeParser):
                 deduped_property_types = CsvParser._pre_propcess_property_types(property_types)
             else:
                 deduped_property_types = {}
-            cast_fn = CsvParser._get_cast_function(deduped_property_types, config_format, logger, config.schemaless)
-            data_generator = self._csv_reader.read_data(config, file, stream_reader, logger, self.file_read_mode)
-            for row in data_generator:
-                line_no += 1
-                yield CsvParser._to_nullable(
-                    cast_fn(row), deduped_property_types, config_format.null_values, config_format.strings_can_be_null
-                )
+            # Only cast values if the schema is provided
+            row_caster = _RowCaster(
+                deduped_property_types,
+                config_format,
+                logger,
+                cast_values=bool(deduped_property_types) and not config.schemaless,
+            )
+            if self._read_in_batches and _can_read_in_batches(config_format):
+                data_generator = self._csv_reader.read_data_in_batches(config, file, stream_reader, logger)
+                for headers, columns in data_generator:
+                    for record in row_caster.cast_columns(headers, columns):
+                        line_no += 1
+                        yield record
+            else:
+                data_generator = self._csv_reader.read_data(config, file, stream_reader, logger, self.file_read_mode)
+                for row in data_generator:
+                    line_no += 1
+                    yield row_caster.cast_row(row)
         except RecordParseError as parse_err:
             raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=line_no) from parse_err
         finally:
@@ -223,30 +341,12 @@ class CsvParser(FileTypeParser):
     def file_read_mode(self) -> FileReadMode:
         return FileReadMode.READ
 
-    @staticmethod
-    def _get_cast_function(
-        deduped_property_types: Mapping[str, str], config_format: CsvFormat, logger: logging.Logger, schemaless: bool
-    ) -> Callable[[Mapping[str, str]], Mapping[str, str]]:
-        # Only cast values if the schema is provided
-        if deduped_property_types and not schemaless:
-            return partial(CsvParser._cast_types, deduped_property_types=deduped_property_types, config_format=config_format, logger=logger)
-        else:
-            # If no schema is provided, yield the rows as they are
-            return _no_cast
-
     @staticmethod
     def _to_nullable(
         row: Mapping[str, str], deduped_property_types: Mapping[str, str], null_values: Set[str], strings_can_be_null: bool
     ) -> Dict[str, Optional[str]]:
-        nullable = {
-            k: None if CsvParser._value_is_none(v, deduped_property_types.get(k), null_values, strings_can_be_null) else v
-            for k, v in row.items()
-        }
-        return nullable
-
-    @staticmethod
-    def _value_is_none(value: Any, deduped_property_type: Optional[str], null_values: Set[str], strings_can_be_null: bool) -> bool:
-        return value in null_values and (strings_can_be_null or deduped_property_type != "string")
+        config_format = CsvFormat(null_values=null_values, strings_can_be_null=strings_can_be_null)
+        return _RowCaster(deduped_property_types, config_format, logging.getLogger("airbyte"), cast_values=False).cast_row(row)
 
     @staticmethod
     def _pre_propcess_property_types(property_types: Dict[str, Any]) -> Mapping[str, str]:
@@ -289,54 +389,147 @@ class CsvParser(FileTypeParser):
 
         If any errors are encountered, the value will be emitted as a string.
         """
-        warnings = []
-        result = {}
+        return _RowCaster(deduped_property_types, config_format, logger, cast_values=True, apply_null_values=False).cast_row(row)
+
 
+class _RowCaster:
+    """
+    Casts the values of the rows according to the types defined in the JSON schema and replaces the null values by None.
+
+    The converter of each column is selected once, when the column is first seen, instead of looking up the type of every value. Columns
+    that are not in the schema are dropped when values are cast.
+
+    Array and object types are only handled if they can be deserialized as JSON. If a value can't be cast, a warning is logged and the
+    value is emitted as a string.
+    """
+
+    def __init__(
+        self,
+        deduped_property_types: Mapping[str, str],
+        config_format: CsvFormat,
+        logger: logging.Logger,
+        cast_values: bool,
+        apply_null_values: bool = True,
+    ) -> None:
+        self._deduped_property_types = deduped_property_types
+        self._true_values = config_format.true_values
+        self._false_values = config_format.false_values
+        self._null_values = config_format.null_values if apply_null_values else set()
+        self._strings_can_be_null = config_format.strings_can_be_null
+        self._logger = logger
+        self._cast_values = cast_values
+        self._columns: Dict[str, Optional[_ColumnCaster]] = {}
+
+    def cast_row(self, row: Mapping[str, str]) -> Dict[str, Any]:
+        result = {}
+        warnings: List[str] = []
         for key, value in row.items():
-            prop_type = deduped_property_types.get(key)
+            column = self._columns[key] if key in self._columns else self._create_column_caster(key)
+            if column is None:
+                continue
             cast_value: Any = value
+            if column.converter:
+                try:
+                    cast_value = column.converter(value)
+                except ValueError:
+                    warnings.append(_format_warning(key, value, column.property_type))
+            if column.can_be_null and cast_value.__class__ is str and cast_value in self._null_values:
+                cast_value = None
+            result[key] = cast_value
 
-            if prop_type in TYPE_PYTHON_MAPPING and prop_type is not None:
-                _, python_type = TYPE_PYTHON_MAPPING[prop_type]
-
-                if python_type is None:
-                    if value == "":
-                        cast_value = None
-                    else:
-                        warnings.append(_format_warning(key, value, prop_type))
+        if warnings:
+            self._log_warnings(warnings)
+        return result
 
-                elif python_type == bool:
+    def cast_columns(self, headers: List[str], columns: List[List[str]]) -> Iterable[Dict[str, Any]]:
+        """
+        Cast the values of a batch of rows given column by column and return the rows
+        """
+        warnings_by_row: Dict[int, List[str]] = defaultdict(list)
+        cast_headers = []
+        cast_columns = []
+        for header, values in zip(headers, columns):
+            column = self._columns[header] if header in self._columns else self._create_column_caster(header)
+            if column is not None:
+                cast_headers.append(header)
+                cast_columns.append(self._cast_column(header, column, values, warnings_by_row))
+
+        for row_index, values in enumerate(zip(*cast_columns)):
+            if row_index in warnings_by_row:
+                self._log_warnings(warnings_by_row[row_index])
+            yield dict(zip(cast_headers, values))
+        if not cast_columns:
+            # The rows have no values to cast but they are still emitted
+            for _ in range(len(columns[0]) if columns else 0):
+                yield {}
+
+    def _cast_column(self, header: str, column: "_ColumnCaster", values: List[str], warnings_by_row: Dict[int, List[str]]) -> List[Any]:
+        cast_values: List[Any] = values
+        if column.converter:
+            try:
+                cast_values = list(map(column.converter, values))
+            except ValueError:
+                # Values are cast one by one only if some of them can't be cast in order to keep track of the rows to warn about
+                cast_values = []
+                for row_index, value in enumerate(values):
                     try:
-                        cast_value = _value_to_bool(value, config_format.true_values, config_format.false_values)
+                        cast_values.append(column.converter(value))
                     except ValueError:
-                        warnings.append(_format_warning(key, value, prop_type))
+                        warnings_by_row[row_index].append(_format_warning(header, value, column.property_type))
+                        cast_values.append(value)
+
+        if column.can_be_null and self._null_values:
+            null_values = self._null_values
+            cast_values = [None if value.__class__ is str and value in null_values else value for value in cast_values]
+        return cast_values
+
+    def _create_column_caster(self, key: str) -> Optional["_ColumnCaster"]:
+        property_type = self._deduped_property_types.get(key)
+        # Values are only nulled if they are still strings once cast
+        can_be_null = self._strings_can_be_null or property_type != "string"
+        if not self._cast_values:
+            column: Optional[_ColumnCaster] = _ColumnCaster(property_type, None, can_be_null)
+        elif property_type in TYPE_PYTHON_MAPPING and property_type is not None:
+            column = _ColumnCaster(property_type, self._get_converter(property_type), can_be_null)
+        else:
+            column = None
+        self._columns[key] = column
+        return column
 
-                elif python_type == dict:
-                    try:
-                        # we don't re-use _value_to_object here because we type the column as object as long as there is only one object
-                        cast_value = orjson.loads(value)
-                    except orjson.JSONDecodeError:
-                        warnings.append(_format_warning(key, value, prop_type))
+    def _get_converter(self, property_type: str) -> Optional[Callable[[str], Any]]:
+        """
+        Return the function casting a value to the property type. The function raises a ValueError if the value can't be cast.
+        """
+        _, python_type = TYPE_PYTHON_MAPPING[property_type]
+        if python_type is None:
+            return _value_to_none
+        elif python_type == bool:
+            return partial(_value_to_bool, true_values=self._true_values, false_values=self._false_values)
+        elif python_type == dict:
+            # we don't re-use _value_to_object here because we type the column as object as long as there is only one object
+            # orjson.JSONDecodeError is a subclass of ValueError
+            return orjson.loads
+        elif python_type == list:
+            return _value_to_list
+        elif python_type == str:
+            # Values are already strings
+            return None
+        else:
+            return python_type
 
-                elif python_type == list:
-                    try:
-                        cast_value = _value_to_list(value)
-                    except (ValueError, json.JSONDecodeError):
-                        warnings.append(_format_warning(key, value, prop_type))
+    def _log_warnings(self, warnings: List[str]) -> None:
+        self._logger.warning(
+            f"{FileBasedSourceError.ERROR_CASTING_VALUE.value}: {','.join([w for w in warnings])}",
+        )
 
-                elif python_type:
-                    try:
-                        cast_value = _value_to_python_type(value, python_type)
-                    except ValueError:
-                        warnings.append(_format_warning(key, value, prop_type))
 
-                result[key] = cast_value
+class _ColumnCaster:
+    __slots__ = ("property_type", "converter", "can_be_null")
 
-        if warnings:
-            logger.warning(
-                f"{FileBasedSourceError.ERROR_CASTING_VALUE.value}: {','.join([w for w in warnings])}",
-            )
-        return result
+    def __init__(self, property_type: Optional[str], converter: Optional[Callable[[str], Any]], can_be_null: bool) -> None:
+        self.property_type = property_type
+        self.converter = converter
+        self.can_be_null = can_be_null
 
 
 class _TypeInferrer(ABC):
@@ -437,6 +630,12 @@ def _value_to_bool(value: str, true_values: Set[str], false_values: Set[str]) ->
     raise ValueError(f"Value {value} is not a valid boolean value")
 
 
+def _value_to_none(value: str) -> None:
+    if value == "":
+        return None
+    raise ValueError(f"Value {value} is not a valid null value")
+
+
 def _value_to_list(value: str) -> List[Any]:
     parsed_value = json.loads(value)
     if isinstance(parsed_value, list):
@@ -452,8 +651,31 @@ def _format_warning(key: str, value: str, expected_type: Optional[Any]) -> str:
     return f"{key}: value={value},expected_type={expected_type}"
 
 
-def _no_cast(row: Mapping[str, str]) -> Mapping[str, str]:
-    return row
+def _get_pyarrow_parse_options(
+    config_format: CsvFormat, invalid_row_handler: Optional[Callable[[pa_csv.InvalidRow], str]] = None
+) -> pa_csv.ParseOptions:
+    return pa_csv.ParseOptions(
+        delimiter=config_format.delimiter,
+        quote_char=config_format.quote_char,
+        double_quote=config_format.double_quote,
+        escape_char=config_format.escape_char or False,
+        newlines_in_values=True,
+        invalid_row_handler=invalid_row_handler,
+    )
+
+
+def _can_read_in_batches(config_format: CsvFormat) -> bool:
+    """
+    Return whether pyarrow's CSV reader supports the format options. Rows with a number of values that does not match the headers are
+    emitted by `read_data` when `ignore_errors_on_fields_mismatch` is enabled which pyarrow does not support.
+    """
+    if config_format.ignore_errors_on_fields_mismatch:
+        return False
+    try:
+        _get_pyarrow_parse_options(config_format).validate()
+    except (ValueError, pa.ArrowInvalid):
+        return False
+    return True
 
 
 def _extract_format(config: FileBasedStreamConfig) -> CsvFormat:
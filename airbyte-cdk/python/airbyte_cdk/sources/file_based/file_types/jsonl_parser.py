@@ -20,6 +20,22 @@ class JsonlParser(FileTypeParser):
     MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE = 1_000_000
     ENCODING = "utf8"
 
+    def __init__(
+        self, max_bytes_per_file_for_schema_inference: Optional[int] = None, max_records_per_file_for_schema_inference: Optional[int] = None
+    ):
+        """
+        :param max_bytes_per_file_for_schema_inference: The number of bytes of each file sampled to infer the schema. Defaults to
+          `MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE`
+        :param max_records_per_file_for_schema_inference: The number of records of each file sampled to infer the schema. If None, only
+          the number of bytes is limited
+        """
+        self._max_bytes_per_file_for_schema_inference = (
+            max_bytes_per_file_for_schema_inference
+            if max_bytes_per_file_for_schema_inference is not None
+            else self.MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE
+        )
+        self._max_records_per_file_for_schema_inference = max_records_per_file_for_schema_inference
+
     def check_config(self, config: FileBasedStreamConfig) -> Tuple[bool, Optional[str]]:
         """
         JsonlParser does not require config checks, implicit pydantic validation is enough.
@@ -93,6 +109,7 @@ class JsonlParser(FileTypeParser):
             had_json_parsing_error = False
             has_warned_for_multiline_json_object = False
             yielded_at_least_once = False
+            yielded_records = 0
 
             accumulator = None
             for line in fp:
@@ -108,16 +125,20 @@ class JsonlParser(FileTypeParser):
 
                     yield record
                     yielded_at_least_once = True
+                    yielded_records += 1
                     accumulator = self._instantiate_accumulator(line)
                 except orjson.JSONDecodeError:
                     had_json_parsing_error = True
 
-                if read_limit and yielded_at_least_once and read_bytes >= self.MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE:
+                if read_limit and yielded_at_least_once and read_bytes >= self._max_bytes_per_file_for_schema_inference:
                     logger.warning(
-                        f"Exceeded the maximum number of bytes per file for schema inference ({self.MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE}). "
+                        "Exceeded the maximum number of bytes per file for schema inference "
+                        f"({self._max_bytes_per_file_for_schema_inference}). "
                         f"Inferring schema from an incomplete set of records."
                     )
                     break
+                if read_limit and yielded_records == self._max_records_per_file_for_schema_inference:
+                    break
 
             if had_json_parsing_error and not yielded_at_least_once:
                 raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=line)
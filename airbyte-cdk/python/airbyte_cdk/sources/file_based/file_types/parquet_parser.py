@@ -5,12 +5,12 @@
 import json
 import logging
 import os
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 from urllib.parse import unquote
 
 import pyarrow as pa
 import pyarrow.parquet as pq
-from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig, ParquetFormat
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig, ParquetFormat, ValidationPolicy
 from airbyte_cdk.sources.file_based.exceptions import ConfigValidationError, FileBasedSourceError, RecordParseError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
 from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
@@ -22,6 +22,8 @@ from pyarrow import DictionaryArray, Scalar
 class ParquetParser(FileTypeParser):
 
     ENCODING = None
+    # Maximum number of rows converted to python values at once
+    MAX_ROWS_PER_BATCH = 10_000
 
     def check_config(self, config: FileBasedStreamConfig) -> Tuple[bool, Optional[str]]:
         """
@@ -70,22 +72,64 @@ class ParquetParser(FileTypeParser):
             with stream_reader.open_file(file, self.file_read_mode, self.ENCODING, logger) as fp:
                 reader = pq.ParquetFile(fp)
                 partition_columns = {x.split("=")[0]: x.split("=")[1] for x in self._extract_partitions(file.uri)}
+                columns = self._get_columns_to_read(config, reader.schema_arrow, discovered_schema)
                 for row_group in range(reader.num_row_groups):
-                    batch = reader.read_row_group(row_group)
-                    for row in range(batch.num_rows):
-                        line_no += 1
-                        yield {
-                            **{
-                                column: ParquetParser._to_output_value(batch.column(column)[row], parquet_format)
-                                for column in batch.column_names
-                            },
-                            **partition_columns,
-                        }
+                    table = reader.read_row_group(row_group, columns=columns)
+                    for batch in table.to_batches(max_chunksize=self.MAX_ROWS_PER_BATCH):
+                        for record in ParquetParser._batch_to_records(batch, parquet_format, partition_columns):
+                            line_no += 1
+                            yield record
         except Exception as exc:
             raise RecordParseError(
                 FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=f"{row_group=}, {line_no=}"
             ) from exc
 
+    @staticmethod
+    def _get_columns_to_read(
+        config: FileBasedStreamConfig, parquet_schema: pa.Schema, discovered_schema: Optional[Mapping[str, SchemaType]]
+    ) -> Optional[List[str]]:
+        """
+        Return the columns of the file that are in the stream schema or None if all the columns should be read.
+
+        Columns are only pruned when records are emitted regardless of the schema. With the other validation policies, columns that are not
+        in the schema make the record fail the validation so they need to be read.
+        """
+        if config.schemaless or config.validation_policy != ValidationPolicy.emit_record or not discovered_schema:
+            return None
+        properties = discovered_schema.get("properties")
+        if not isinstance(properties, Mapping):
+            return None
+        return [name for name in parquet_schema.names if name in properties]
+
+    @staticmethod
+    def _batch_to_records(
+        batch: pa.RecordBatch, parquet_format: ParquetFormat, partition_columns: Mapping[str, str]
+    ) -> Iterable[Dict[str, Any]]:
+        """
+        Convert a record batch to records column by column. This avoids creating a pyarrow scalar for every value and the converter of each
+        column is only selected once.
+        """
+        column_names = batch.schema.names
+        if not column_names:
+            for _ in range(batch.num_rows):
+                yield dict(partition_columns)
+            return
+
+        column_values = [ParquetParser._column_to_python_values(column, parquet_format) for column in batch.columns]
+        for row_values in zip(*column_values):
+            record = dict(zip(column_names, row_values))
+            if partition_columns:
+                record.update(partition_columns)
+            yield record
+
+    @staticmethod
+    def _column_to_python_values(column: pa.Array, parquet_format: ParquetFormat) -> List[Any]:
+        values = column.to_pylist()
+        converter = ParquetParser._get_value_converter(column.type, parquet_format)
+        if converter is None:
+            return values  # type: ignore[no-any-return]
+        return [None if value is None else converter(value) for value in values]
+
     @staticmethod
     def _extract_partitions(filepath: str) -> List[str]:
         return [unquote(partition) for partition in filepath.split(os.sep) if "=" in partition]
@@ -109,49 +153,64 @@ class ParquetParser(FileTypeParser):
         """
         Convert a pyarrow scalar to a value that can be output by the source.
         """
-        if parquet_value.as_py() is None:
+        value = parquet_value.as_py()
+        if value is None:
             return None
+        converter = ParquetParser._get_value_converter(parquet_value.type, parquet_format)
+        return converter(value) if converter else value
 
+    @staticmethod
+    def _get_value_converter(parquet_type: pa.DataType, parquet_format: ParquetFormat) -> Optional[Callable[[Any], Any]]:
+        """
+        Return the function converting the non-null python values of a pyarrow type to values that can be output by the source or None if
+        the values can be output as is.
+        """
         # Convert date and datetime objects to isoformat strings
-        if pa.types.is_time(parquet_value.type) or pa.types.is_timestamp(parquet_value.type) or pa.types.is_date(parquet_value.type):
-            return parquet_value.as_py().isoformat()
+        if pa.types.is_time(parquet_type) or pa.types.is_timestamp(parquet_type) or pa.types.is_date(parquet_type):
+            return lambda value: value.isoformat()
 
         # Convert month_day_nano_interval to array
-        if parquet_value.type == pa.month_day_nano_interval():
-            return json.loads(json.dumps(parquet_value.as_py()))
+        if parquet_type == pa.month_day_nano_interval():
+            return lambda value: json.loads(json.dumps(value))
 
         # Decode binary strings to utf-8
-        if ParquetParser._is_binary(parquet_value.type):
-            return parquet_value.as_py().decode("utf-8")
+        if ParquetParser._is_binary(parquet_type):
+            return lambda value: value.decode("utf-8")
 
-        if pa.types.is_decimal(parquet_value.type):
+        if pa.types.is_decimal(parquet_type):
             if parquet_format.decimal_as_float:
-                return float(parquet_value.as_py())
+                return float
             else:
-                return str(parquet_value.as_py())
+                return str
 
-        if pa.types.is_map(parquet_value.type):
-            return {k: v for k, v in parquet_value.as_py()}
+        if pa.types.is_map(parquet_type):
+            return lambda value: {k: v for k, v in value}
 
-        if pa.types.is_null(parquet_value.type):
-            return None
+        if pa.types.is_null(parquet_type):
+            return lambda value: None
 
         # Convert duration to seconds, then convert to the appropriate unit
-        if pa.types.is_duration(parquet_value.type):
-            duration = parquet_value.as_py()
-            duration_seconds = duration.total_seconds()
-            if parquet_value.type.unit == "s":
-                return duration_seconds
-            elif parquet_value.type.unit == "ms":
-                return duration_seconds * 1000
-            elif parquet_value.type.unit == "us":
-                return duration_seconds * 1_000_000
-            elif parquet_value.type.unit == "ns":
-                return duration_seconds * 1_000_000_000 + duration.nanoseconds
-            else:
-                raise ValueError(f"Unknown duration unit: {parquet_value.type.unit}")
+        if pa.types.is_duration(parquet_type):
+            return ParquetParser._get_duration_converter(parquet_type.unit)
         else:
-            return parquet_value.as_py()
+            return None
+
+    @staticmethod
+    def _get_duration_converter(unit: str) -> Callable[[Any], Any]:
+        if unit == "s":
+            return lambda duration: duration.total_seconds()
+        elif unit == "ms":
+            return lambda duration: duration.total_seconds() * 1000
+        elif unit == "us":
+            return lambda duration: duration.total_seconds() * 1_000_000
+        elif unit == "ns":
+            return lambda duration: duration.total_seconds() * 1_000_000_000 + duration.nanoseconds
+        else:
+
+            def _raise_unknown_unit(duration: Any) -> Any:
+                raise ValueError(f"Unknown duration unit: {unit}")
+
+            return _raise_unknown_unit
 
     @staticmethod
     def _dictionary_array_to_python_value(parquet_value: DictionaryArray) -> Dict[str, Any]:
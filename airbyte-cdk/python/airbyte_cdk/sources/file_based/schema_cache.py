@@ -0,0 +1,103 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Mapping, Union
+
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
+from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.schema_helpers import SchemaType
+from orjson import orjson
+
+
+class FileSchemaCache:
+    """
+    Persists the schema inferred for each file in a SQLite database so that discover only needs to infer the schema of new or modified
+    files.
+
+    Entries are keyed by a fingerprint of the parser class, the stream config (which includes the globs and the format options) and the
+    file (uri, last modified date and any other attribute the stream reader sets on the RemoteFile). Changing the config or the file
+    therefore results in a different key and the stale entry is eventually evicted. Parser options that are not part of the stream config,
+    like the sampling budget of the parser, are not part of the fingerprint.
+
+    Once the cache holds more than `max_entries` entries, the least recently used ones are evicted.
+    """
+
+    DEFAULT_MAX_ENTRIES = 100_000
+
+    def __init__(self, path: Union[str, Path], max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        :param path: The path of the SQLite database. The database is created if it does not exist
+        :param max_entries: The maximum number of file schemas kept in the cache
+        """
+        if max_entries < 1:
+            raise ValueError(f"Expected the cache to hold at least one entry but got {max_entries}")
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        # The connection is guarded by the lock as the schema of streams can be requested from different threads
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS file_schemas (key TEXT PRIMARY KEY, schema BLOB NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS file_schemas_last_used ON file_schemas (last_used)")
+
+    @staticmethod
+    def get_key(parser: FileTypeParser, config: FileBasedStreamConfig, file: RemoteFile) -> str:
+        fingerprint = "\n".join(
+            [
+                f"{type(parser).__module__}.{type(parser).__qualname__}",
+                config.json(sort_keys=True),
+                file.json(sort_keys=True),
+            ]
+        )
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: Iterable[str]) -> Mapping[str, SchemaType]:
+        """
+        Return the cached schemas of the keys that are in the cache and mark them as recently used
+        """
+        keys = list(keys)
+        schemas = {}
+        with self._lock, self._connection:
+            # SQLite limits the number of parameters of a query so keys are queried by chunks
+            for chunk_start in range(0, len(keys), 500):
+                chunk = keys[chunk_start : chunk_start + 500]
+                rows = self._connection.execute(
+                    f"SELECT key, schema FROM file_schemas WHERE key IN ({','.join('?' * len(chunk))})", chunk
+                ).fetchall()
+                schemas.update({key: orjson.loads(schema) for key, schema in rows})
+            now = time.time()
+            self._connection.executemany("UPDATE file_schemas SET last_used = ? WHERE key = ?", [(now, key) for key in schemas])
+        return schemas
+
+    def set_many(self, schemas: Mapping[str, SchemaType]) -> None:
+        """
+        Store the schemas and evict the least recently used entries if the cache holds more than `max_entries` entries
+        """
+        if not schemas:
+            return
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO file_schemas (key, schema, last_used) VALUES (?, ?, ?)",
+                [(key, orjson.dumps(schema), now) for key, schema in schemas.items()],
+            )
+            self._connection.execute(
+                "DELETE FROM file_schemas WHERE key IN (SELECT key FROM file_schemas ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self._max_entries,),
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM file_schemas").fetchone()[0]  # type: ignore[no-any-return]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -2,10 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import heapq
 import logging
 from datetime import datetime, timedelta
 from threading import RLock
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, MutableMapping, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level, Type
 from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
@@ -23,6 +24,82 @@ if TYPE_CHECKING:
     from airbyte_cdk.sources.file_based.stream.concurrent.adapters import FileBasedStreamPartition
 
 _NULL_FILE = ""
+# Heaps are not compacted below this size as rebuilding them would cost more than keeping the stale entries
+_MIN_SIZE_TO_COMPACT = 1_000
+
+
+class _ReversedOrder:
+    """
+    Wraps a value so that a min-heap of wrapped values is a max-heap of the values
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Tuple[datetime, str]) -> None:
+        self.value = value
+
+    def __lt__(self, other: "_ReversedOrder") -> bool:
+        return other.value < self.value
+
+
+class _FileIndex:
+    """
+    Last modified dates of files by uri, indexed by (last modified date, uri) so that the earliest and the latest files are found in
+    O(log n) instead of iterating over all the files.
+
+    The heap entries are not removed when a file is removed or updated. Instead, they are discarded once they reach the top of the heap and
+    the heaps are rebuilt once most of their entries are outdated.
+    """
+
+    def __init__(self, last_modified_by_uri: Mapping[str, datetime]) -> None:
+        self._last_modified_by_uri = dict(last_modified_by_uri)
+        self._earliest_heap: List[Tuple[datetime, str]] = []
+        # The max-heap is only built when the latest file is requested as it is not needed for pending files
+        self._latest_heap: Optional[List[_ReversedOrder]] = None
+        self._rebuild()
+
+    def __len__(self) -> int:
+        return len(self._last_modified_by_uri)
+
+    def get(self, uri: str) -> Optional[datetime]:
+        return self._last_modified_by_uri.get(uri)
+
+    def add(self, uri: str, last_modified: datetime) -> None:
+        self._last_modified_by_uri[uri] = last_modified
+        heapq.heappush(self._earliest_heap, (last_modified, uri))
+        if self._latest_heap is not None:
+            heapq.heappush(self._latest_heap, _ReversedOrder((last_modified, uri)))
+        self._compact_if_needed()
+
+    def remove(self, uri: str) -> None:
+        del self._last_modified_by_uri[uri]
+        self._compact_if_needed()
+
+    def earliest(self) -> Optional[Tuple[datetime, str]]:
+        while self._earliest_heap and not self._is_up_to_date(self._earliest_heap[0]):
+            heapq.heappop(self._earliest_heap)
+        return self._earliest_heap[0] if self._earliest_heap else None
+
+    def latest(self) -> Optional[Tuple[datetime, str]]:
+        if self._latest_heap is None:
+            self._latest_heap = [_ReversedOrder((last_modified, uri)) for uri, last_modified in self._last_modified_by_uri.items()]
+            heapq.heapify(self._latest_heap)
+        while self._latest_heap and not self._is_up_to_date(self._latest_heap[0].value):
+            heapq.heappop(self._latest_heap)
+        return self._latest_heap[0].value if self._latest_heap else None
+
+    def _is_up_to_date(self, entry: Tuple[datetime, str]) -> bool:
+        last_modified, uri = entry
+        return self._last_modified_by_uri.get(uri) == last_modified
+
+    def _compact_if_needed(self) -> None:
+        if len(self._earliest_heap) > max(2 * len(self._last_modified_by_uri), _MIN_SIZE_TO_COMPACT):
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._earliest_heap = [(last_modified, uri) for uri, last_modified in self._last_modified_by_uri.items()]
+        heapq.heapify(self._earliest_heap)
+        self._latest_heap = None
 
 
 class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
@@ -55,7 +132,7 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
         )
         self._state_lock = RLock()
         self._pending_files_lock = RLock()
-        self._pending_files: Optional[Dict[str, RemoteFile]] = None
+        self._pending_files = None
         self._file_to_datetime_history = stream_state.get("history", {}) if stream_state else {}
         self._prev_cursor_value = self._compute_prev_sync_cursor(stream_state)
         self._sync_start = self._compute_start_time()
@@ -64,6 +141,32 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
     def state(self) -> MutableMapping[str, Any]:
         return self._state
 
+    @property
+    def _file_to_datetime_history(self) -> MutableMapping[str, str]:
+        """
+        The history as persisted in the state. It should only be modified using `_add_to_history` and `_remove_from_history` in order
+        to keep the history index up to date.
+        """
+        return self._history
+
+    @_file_to_datetime_history.setter
+    def _file_to_datetime_history(self, history: MutableMapping[str, str]) -> None:
+        with self._state_lock:
+            self._history = history
+            self._history_index = _FileIndex(
+                {uri: datetime.strptime(last_modified, self.DATE_TIME_FORMAT) for uri, last_modified in history.items()}
+            )
+
+    @property
+    def _pending_files(self) -> Optional[Dict[str, RemoteFile]]:
+        return self._pending_files_by_uri
+
+    @_pending_files.setter
+    def _pending_files(self, pending_files: Optional[Dict[str, RemoteFile]]) -> None:
+        with self._pending_files_lock:
+            self._pending_files_by_uri = pending_files
+            self._pending_files_index = _FileIndex({uri: file.last_modified for uri, file in (pending_files or {}).items()})
+
     def observe(self, record: Record) -> None:
         pass
 
@@ -74,15 +177,16 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
 
     def set_pending_partitions(self, partitions: List["FileBasedStreamPartition"]) -> None:
         with self._pending_files_lock:
-            self._pending_files = {}
+            pending_files: Dict[str, RemoteFile] = {}
             for partition in partitions:
                 _slice = partition.to_slice()
                 if _slice is None:
                     continue
                 for file in _slice["files"]:
-                    if file.uri in self._pending_files.keys():
+                    if file.uri in pending_files.keys():
                         raise RuntimeError(f"Already found file {_slice} in pending files. This is unexpected. Please contact Support.")
-                self._pending_files.update({file.uri: file})
+                pending_files.update({file.uri: file})
+            self._pending_files = pending_files
 
     def _compute_prev_sync_cursor(self, value: Optional[StreamState]) -> Tuple[datetime, str]:
         if not value:
@@ -108,12 +212,24 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
 
     def _compute_earliest_file_in_history(self) -> Optional[RemoteFile]:
         with self._state_lock:
-            if self._file_to_datetime_history:
-                filename, last_modified = min(self._file_to_datetime_history.items(), key=lambda f: (f[1], f[0]))
-                return RemoteFile(uri=filename, last_modified=datetime.strptime(last_modified, self.DATE_TIME_FORMAT))
+            earliest = self._history_index.earliest()
+            if earliest:
+                last_modified, filename = earliest
+                return RemoteFile(uri=filename, last_modified=last_modified)
             else:
                 return None
 
+    def _add_to_history(self, file: RemoteFile) -> None:
+        with self._state_lock:
+            self._file_to_datetime_history[file.uri] = file.last_modified.strftime(self.DATE_TIME_FORMAT)
+            # The time zone is not persisted in the state so it is not kept in the index either
+            self._history_index.add(file.uri, file.last_modified.replace(tzinfo=None))
+
+    def _remove_from_history(self, uri: str) -> None:
+        with self._state_lock:
+            del self._file_to_datetime_history[uri]
+            self._history_index.remove(uri)
+
     def add_file(self, file: RemoteFile) -> None:
         """
         Add a file to the cursor. This method is called when a file is processed by the stream.
@@ -135,12 +251,13 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
                     )
                 else:
                     self._pending_files.pop(file.uri)
-                self._file_to_datetime_history[file.uri] = file.last_modified.strftime(self.DATE_TIME_FORMAT)
+                    self._pending_files_index.remove(file.uri)
+                self._add_to_history(file)
                 if len(self._file_to_datetime_history) > self.DEFAULT_MAX_HISTORY_SIZE:
                     # Get the earliest file based on its last modified date and its uri
                     oldest_file = self._compute_earliest_file_in_history()
                     if oldest_file:
-                        del self._file_to_datetime_history[oldest_file.uri]
+                        self._remove_from_history(oldest_file.uri)
                     else:
                         raise Exception(
                             "The history is full but there is no files in the history. This should never happen and might be indicative of a bug in the CDK."
@@ -175,16 +292,20 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
                     return f"{self.zero_value.strftime(self.DATE_TIME_FORMAT)}_"
 
     def _compute_earliest_pending_file(self) -> Optional[RemoteFile]:
-        if self._pending_files:
-            return min(self._pending_files.values(), key=lambda x: x.last_modified)
-        else:
-            return None
+        with self._pending_files_lock:
+            earliest = self._pending_files_index.earliest()
+            if self._pending_files and earliest:
+                _, uri = earliest
+                return self._pending_files[uri]
+            else:
+                return None
 
     def _compute_latest_file_in_history(self) -> Optional[RemoteFile]:
         with self._state_lock:
-            if self._file_to_datetime_history:
-                filename, last_modified = max(self._file_to_datetime_history.items(), key=lambda f: (f[1], f[0]))
-                return RemoteFile(uri=filename, last_modified=datetime.strptime(last_modified, self.DATE_TIME_FORMAT))
+            latest = self._history_index.latest()
+            if latest:
+                last_modified, filename = latest
+                return RemoteFile(uri=filename, last_modified=last_modified)
             else:
                 return None
 
@@ -208,9 +329,9 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
 
     def _should_sync_file(self, file: RemoteFile, logger: logging.Logger) -> bool:
         with self._state_lock:
-            if file.uri in self._file_to_datetime_history:
+            updated_at_from_history = self._history_index.get(file.uri)
+            if updated_at_from_history is not None:
                 # If the file's uri is in the history, we should sync the file if it has been modified since it was synced
-                updated_at_from_history = datetime.strptime(self._file_to_datetime_history[file.uri], self.DATE_TIME_FORMAT)
                 if file.last_modified < updated_at_from_history:
                     self._message_repository.emit_message(
                         AirbyteMessage(
@@ -250,11 +371,11 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
             return len(self._file_to_datetime_history) >= self.DEFAULT_MAX_HISTORY_SIZE
 
     def _compute_start_time(self) -> datetime:
-        if not self._file_to_datetime_history:
+        earliest = self._history_index.earliest()
+        if not earliest:
             return datetime.min
         else:
-            earliest = min(self._file_to_datetime_history.values())
-            earliest_dt = datetime.strptime(earliest, self.DATE_TIME_FORMAT)
+            earliest_dt, _ = earliest
             if self._is_history_full():
                 time_window = datetime.now() - self._time_window_if_history_is_full
                 earliest_dt = min(earliest_dt, time_window)
@@ -4,14 +4,18 @@
 
 import asyncio
 import itertools
+import logging
+import multiprocessing
+import pickle
 import traceback
+from concurrent.futures import Executor, ProcessPoolExecutor
 from copy import deepcopy
 from functools import cache
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Set, Union
+from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Set, Tuple, Union
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, FailureType, Level
 from airbyte_cdk.models import Type as MessageType
-from airbyte_cdk.sources.file_based.config.file_based_stream_config import PrimaryKeyType
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig, PrimaryKeyType
 from airbyte_cdk.sources.file_based.exceptions import (
     FileBasedSourceError,
     InvalidSchemaError,
@@ -20,6 +24,8 @@ from airbyte_cdk.sources.file_based.exceptions import (
     SchemaInferenceError,
     StopSyncPerValidationPolicy,
 )
+from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader
+from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import SchemaType, merge_schemas, schemaless_schema
 from airbyte_cdk.sources.file_based.stream import AbstractFileBasedStream
@@ -31,6 +37,29 @@ from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_messa
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
 
+# The parser, the stream config, the stream reader and the logger of the stream whose schema is inferred by the worker process
+_schema_inference_context: Optional[Tuple[FileTypeParser, FileBasedStreamConfig, AbstractFileBasedStreamReader, logging.Logger]] = None
+
+
+def _init_schema_inference_process(serialized_inference_context: bytes) -> None:
+    """
+    Initializer of the schema inference worker processes. The context serialized by the main process is deserialized once per process
+    so that only the file is sent with each task.
+    """
+    global _schema_inference_context
+    _schema_inference_context = pickle.loads(serialized_inference_context)
+
+
+def _infer_file_schema_in_process(file: RemoteFile) -> SchemaType:
+    """
+    Entrypoint of the schema inference tasks run by the worker processes.
+    """
+    if _schema_inference_context is None:
+        raise RuntimeError("The schema inference process was not initialized with `_init_schema_inference_process`")
+    parser, config, stream_reader, logger = _schema_inference_context
+    return asyncio.run(parser.infer_schema(config, file, stream_reader, logger))
+
+
 class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
 
     """
@@ -269,31 +298,87 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
 
         Each file type has a corresponding `infer_schema` handler.
         Dispatch on file type.
+
+        If the discovery policy provides a schema cache, the cached schemas of the files are used and only the schema of the other files
+        is inferred.
         """
         base_schema: SchemaType = {}
         pending_tasks: Set[asyncio.tasks.Task[SchemaType]] = set()
 
-        n_started, n_files = 0, len(files)
-        files_iterator = iter(files)
-        while pending_tasks or n_started < n_files:
-            while len(pending_tasks) <= self._discovery_policy.n_concurrent_requests and (file := next(files_iterator, None)):
-                pending_tasks.add(asyncio.create_task(self._infer_file_schema(file)))
-                n_started += 1
-            # Return when the first task is completed so that we can enqueue a new task as soon as the
-            # number of concurrent tasks drops below the number allowed.
-            done, pending_tasks = await asyncio.wait(pending_tasks, return_when=asyncio.FIRST_COMPLETED)
-            for task in done:
-                try:
-                    base_schema = merge_schemas(base_schema, task.result())
-                except AirbyteTracedException as ate:
-                    raise ate
-                except Exception as exc:
-                    self.logger.error(f"An error occurred inferring the schema. \n {traceback.format_exc()}", exc_info=exc)
+        schema_cache = self._discovery_policy.schema_cache
+        inferred_schemas: MutableMapping[str, SchemaType] = {}
+        if schema_cache is not None:
+            keys_by_file = {file.uri: schema_cache.get_key(self.get_parser(), self.config, file) for file in files}
+            cached_schemas = schema_cache.get_many(keys_by_file.values())
+            for schema in cached_schemas.values():
+                base_schema = merge_schemas(base_schema, schema)
+            files = [file for file in files if keys_by_file[file.uri] not in cached_schemas]
+            self.logger.info(f"Using the cached schema of {len(cached_schemas)} files for stream {self.name}")
+
+        executor = self._create_schema_inference_executor(len(files))
+        try:
+            n_started, n_files = 0, len(files)
+            files_iterator = iter(files)
+            file_by_task: MutableMapping[asyncio.tasks.Task[SchemaType], RemoteFile] = {}
+            while pending_tasks or n_started < n_files:
+                while len(pending_tasks) <= self._discovery_policy.n_concurrent_requests and (file := next(files_iterator, None)):
+                    task = asyncio.create_task(self._infer_file_schema(file, executor))
+                    file_by_task[task] = file
+                    pending_tasks.add(task)
+                    n_started += 1
+                # Return when the first task is completed so that we can enqueue a new task as soon as the
+                # number of concurrent tasks drops below the number allowed.
+                done, pending_tasks = await asyncio.wait(pending_tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    try:
+                        file_schema = task.result()
+                        base_schema = merge_schemas(base_schema, file_schema)
+                        if schema_cache is not None:
+                            inferred_schemas[keys_by_file[file_by_task[task].uri]] = file_schema
+                    except AirbyteTracedException as ate:
+                        raise ate
+                    except Exception as exc:
+                        self.logger.error(f"An error occurred inferring the schema. \n {traceback.format_exc()}", exc_info=exc)
+        finally:
+            for task in pending_tasks:
+                task.cancel()
+            if executor:
+                executor.shutdown(wait=True, cancel_futures=True)
+            if schema_cache is not None:
+                # Schemas that were inferred before a failure are still valid
+                schema_cache.set_many(inferred_schemas)
 
         return base_schema
 
-    async def _infer_file_schema(self, file: RemoteFile) -> SchemaType:
+    def _create_schema_inference_executor(self, n_files: int) -> Optional[Executor]:
+        """
+        Return a process pool to infer the schema of the files if the discovery policy enables worker processes and the context needed by
+        the worker processes can be serialized. Else, return None and the schemas are inferred by the event loop.
+
+        The context is serialized here, rather than by the pool, so that a stream that can't be serialized falls back on the event loop.
+        """
+        n_processes = min(self._discovery_policy.n_schema_inference_processes, n_files)
+        if n_processes <= 0:
+            return None
+
+        try:
+            serialized_inference_context = pickle.dumps((self.get_parser(), self.config, self.stream_reader, self.logger))
+        except Exception as exception:
+            # Depending on the object that can't be pickled, pickle raises PicklingError, TypeError or AttributeError
+            self.logger.info(f"Schema of stream {self.name} will be inferred in the main process as it can't be serialized: {exception}")
+            return None
+        # "spawn" is used as forking a process running threads is not safe
+        return ProcessPoolExecutor(
+            max_workers=n_processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_schema_inference_process,
+            initargs=(serialized_inference_context,),
+        )
+
+    async def _infer_file_schema(self, file: RemoteFile, executor: Optional[Executor] = None) -> SchemaType:
         try:
+            if executor:
+                return await asyncio.get_running_loop().run_in_executor(executor, _infer_file_schema_in_process, file)
             return await self.get_parser().infer_schema(self.config, file, self.stream_reader, self.logger)
         except AirbyteTracedException as ate:
             raise ate
@@ -3,11 +3,21 @@
 #
 
 from .repository import (
+    ConcurrentMessageRepository,
     InMemoryMessageRepository,
     LogAppenderMessageRepositoryDecorator,
     LogMessage,
     MessageRepository,
+    MessageRepositoryMetrics,
     NoopMessageRepository,
 )
 
-__all__ = ["InMemoryMessageRepository", "LogAppenderMessageRepositoryDecorator", "LogMessage", "MessageRepository", "NoopMessageRepository"]
+__all__ = [
+    "ConcurrentMessageRepository",
+    "InMemoryMessageRepository",
+    "LogAppenderMessageRepositoryDecorator",
+    "LogMessage",
+    "MessageRepository",
+    "MessageRepositoryMetrics",
+    "NoopMessageRepository",
+]
@@ -4,8 +4,11 @@
 
 import json
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
 from collections import deque
+from dataclasses import dataclass
 from typing import Callable, Deque, Iterable, List, Optional
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level, Type
@@ -14,6 +17,7 @@ from airbyte_cdk.utils.airbyte_secrets_utils import filter_secrets
 
 _LOGGER = logging.getLogger("MessageRepository")
 _SUPPORTED_MESSAGE_TYPES = {Type.CONTROL, Type.LOG}
+_PRIORITY_MESSAGE_TYPES = {Type.STATE, Type.CONTROL}
 LogMessage = dict[str, JsonType]
 
 _SEVERITY_BY_LOG_LEVEL = {
@@ -88,6 +92,118 @@ class InMemoryMessageRepository(MessageRepository):
             yield self._message_queue.popleft()
 
 
+@dataclass(frozen=True)
+class MessageRepositoryMetrics:
+    queued: int
+    emitted: int
+    dropped: int
+
+
+class ConcurrentMessageRepository(MessageRepository):
+    """
+    Message repository meant to be fed by many worker threads and drained by a single consumer thread.
+
+    Messages are kept in a deque which appends and pops atomically so that emitting and consuming messages do not take any lock. Once
+    `max_queue_size` messages are queued, threads other than the consumer wait up to `max_wait_seconds` for the consumer to drain the
+    queue. State and control messages never wait as delaying them would delay checkpointing. If the queue is still full after waiting, log
+    messages are dropped, before being built if they are logged through `log_message`, while other messages are queued regardless of the
+    capacity. The number of dropped log messages is reported in a single warning once the queue has been drained. The order in which
+    messages are emitted is always preserved.
+    """
+
+    DEFAULT_MAX_QUEUE_SIZE = 10_000
+    DEFAULT_MAX_WAIT_SECONDS = 1.0
+
+    def __init__(
+        self,
+        log_level: Level = Level.INFO,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        max_wait_seconds: float = DEFAULT_MAX_WAIT_SECONDS,
+    ) -> None:
+        """
+        :param log_level: The minimum level of the log messages that are emitted
+        :param max_queue_size: The number of queued messages above which producers wait for the queue to be drained
+        :param max_wait_seconds: The maximum number of seconds a producer waits for the queue to be drained
+        """
+        if max_queue_size < 1:
+            raise ValueError(f"Expected the queue to hold at least one message but got {max_queue_size}")
+        self._message_queue: Deque[AirbyteMessage] = deque()
+        self._log_level = log_level
+        self._max_queue_size = max_queue_size
+        self._max_wait_seconds = max_wait_seconds
+        self._queue_drained = threading.Event()
+        self._consumer_thread_id: Optional[int] = None
+        self._emitted = 0
+        self._dropped = 0
+        self._reported_dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    @property
+    def metrics(self) -> MessageRepositoryMetrics:
+        return MessageRepositoryMetrics(queued=len(self._message_queue), emitted=self._emitted, dropped=self._dropped)
+
+    def emit_message(self, message: AirbyteMessage) -> None:
+        if message.type in _PRIORITY_MESSAGE_TYPES or self._wait_for_capacity() or message.type != Type.LOG:
+            self._message_queue.append(message)
+        else:
+            self._drop_log_message()
+
+    def log_message(self, level: Level, message_provider: Callable[[], LogMessage]) -> None:
+        if not _is_severe_enough(self._log_level, level):
+            return
+        if not self._wait_for_capacity():
+            self._drop_log_message()
+            return
+        self._message_queue.append(
+            AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=level, message=filter_secrets(json.dumps(message_provider()))))
+        )
+
+    def consume_queue(self) -> Iterable[AirbyteMessage]:
+        self._consumer_thread_id = threading.get_ident()
+        while self._message_queue:
+            message = self._message_queue.popleft()
+            self._emitted += 1
+            yield message
+        self._queue_drained.set()
+
+        dropped = self._dropped
+        if dropped > self._reported_dropped:
+            self._emitted += 1
+            yield AirbyteMessage(
+                type=Type.LOG,
+                log=AirbyteLogMessage(
+                    level=Level.WARN,
+                    message=f"{dropped - self._reported_dropped} log messages were dropped because the message queue was full",
+                ),
+            )
+            self._reported_dropped = dropped
+
+    def _wait_for_capacity(self) -> bool:
+        """
+        Return True if there is room in the queue, waiting for the consumer to drain the queue if needed. The consumer thread never waits as
+        it would wait for itself and no thread waits until a consumer has started to drain the queue.
+        """
+        if len(self._message_queue) < self._max_queue_size:
+            return True
+        if self._consumer_thread_id is None or self._consumer_thread_id == threading.get_ident():
+            return False
+
+        deadline = time.monotonic() + self._max_wait_seconds
+        while len(self._message_queue) >= self._max_queue_size:
+            self._queue_drained.clear()
+            # The queue might have been drained before the event was cleared
+            if len(self._message_queue) < self._max_queue_size:
+                break
+            remaining_seconds = deadline - time.monotonic()
+            if remaining_seconds <= 0 or not self._queue_drained.wait(remaining_seconds):
+                return False
+        return True
+
+    def _drop_log_message(self) -> None:
+        with self._dropped_lock:
+            self._dropped += 1
+
+
 class LogAppenderMessageRepositoryDecorator(MessageRepository):
     def __init__(self, dict_to_append: LogMessage, decorated: MessageRepository, log_level: Level = Level.INFO):
         self._dict_to_append = dict_to_append
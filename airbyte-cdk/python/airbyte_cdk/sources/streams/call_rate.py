@@ -3,13 +3,15 @@
 #
 
 import abc
+import asyncio
 import dataclasses
 import datetime
 import logging
 import time
+from collections import deque
 from datetime import timedelta
-from threading import RLock
-from typing import TYPE_CHECKING, Any, Mapping, Optional
+from threading import Condition, Lock, RLock
+from typing import TYPE_CHECKING, Any, Deque, Dict, Mapping, Optional, Tuple, Union
 from urllib import parse
 
 import requests
@@ -18,6 +20,7 @@ from pyrate_limiter import InMemoryBucket, Limiter
 from pyrate_limiter import Rate as PyRateRate
 from pyrate_limiter import RateItem, TimeClock
 from pyrate_limiter.exceptions import BucketFullException
+from pyrate_limiter.utils import binary_search
 
 # prevents mypy from complaining about missing session attributes in LimiterMixin
 if TYPE_CHECKING:
@@ -27,6 +30,9 @@ else:
 
 logger = logging.getLogger("airbyte")
 
+# Shortest time a call waits for call credits so that calls do not spin when a credit is about to be available
+_MINIMUM_TIME_TO_WAIT = 0.001
+
 
 @dataclasses.dataclass
 class Rate:
@@ -83,6 +89,10 @@ class AbstractCallRatePolicy(abc.ABC):
         :param call_reset_ts:
         """
 
+    def utilization(self) -> Optional[float]:
+        """Share of the call credits currently used, from 0 to 1, or None if the policy does not limit calls"""
+        return None
+
 
 class RequestMatcher(abc.ABC):
     """Callable that help to match a request object with call rate policies."""
@@ -268,6 +278,11 @@ class FixedWindowCallRatePolicy(BaseCallRatePolicy):
                 logger.debug("got rate limit update from api, adjusting reset time from %s to %s", self._next_reset_ts, call_reset_ts)
                 self._next_reset_ts = call_reset_ts
 
+    def utilization(self) -> float:
+        with self._lock:
+            self._update_current_window()
+            return min(1.0, self._calls_num / self._call_limit)
+
     def _update_current_window(self) -> None:
         now = datetime.datetime.now()
         if now > self._next_reset_ts:
@@ -338,6 +353,85 @@ class MovingWindowCallRatePolicy(BaseCallRatePolicy):
         # if available_calls is not None and call_reset_ts is not None:
         #     ts = call_reset_ts.timestamp()
 
+    def utilization(self) -> float:
+        """Utilization of the most used rate"""
+        with self._limiter.lock:
+            now: int = TimeClock().now()  # type: ignore[no-untyped-call]
+            items = self._bucket.items
+            utilization = 0.0
+            for rate in self._bucket.rates:
+                lower_bound_idx = binary_search(items, now - rate.interval)
+                calls_in_window = len(items) - lower_bound_idx if lower_bound_idx >= 0 else 0
+                utilization = max(utilization, calls_in_window / rate.limit)
+            return min(1.0, utilization)
+
+
+@dataclasses.dataclass(frozen=True)
+class APIBudgetMetrics:
+    """Snapshot of the calls acquired from an APIBudget since its creation
+
+    :param acquired_calls: number of calls that were allowed
+    :param delayed_calls: number of the allowed calls that had to wait for call credits
+    :param rejected_calls: number of times CallRateLimitHit was raised, i.e. non-blocking calls without call credits and blocking calls
+     that reached their timeout
+    :param waiting_calls: number of calls currently waiting for call credits
+    :param total_wait_time: time spent waiting by the allowed calls
+    :param max_wait_time: longest time an allowed call waited
+    :param utilization: utilization of each policy of the budget, in the order of the policies
+    """
+
+    acquired_calls: int
+    delayed_calls: int
+    rejected_calls: int
+    waiting_calls: int
+    total_wait_time: timedelta
+    max_wait_time: timedelta
+    utilization: list[Optional[float]]
+
+    @property
+    def average_wait_time(self) -> timedelta:
+        return self.total_wait_time / self.acquired_calls if self.acquired_calls else timedelta(0)
+
+
+class _AsyncCallWaiter:
+    """Counterpart of the condition a blocking call parks on for the calls awaited on an event loop. It can be notified from any thread"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._event = asyncio.Event()
+
+    def notify(self) -> None:
+        self._loop.call_soon_threadsafe(self._event.set)
+
+    def clear(self) -> None:
+        self._event.clear()
+
+    async def wait(self, timeout: Optional[float]) -> None:
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+@dataclasses.dataclass
+class _QueuedCall:
+    """Progress of a call waiting in a _CallQueue"""
+
+    waiter: Union[Condition, _AsyncCallWaiter]
+    start: float
+    deadline: Optional[float]
+    attempt: int = 0
+    delayed: bool = False
+
+
+class _CallQueue:
+    """Calls waiting for the credits of a policy in their order of arrival. Each call parks on its own waiter so that a single call
+    is woken up when credits may be available"""
+
+    def __init__(self) -> None:
+        self.waiters: Deque[Union[Condition, _AsyncCallWaiter]] = deque()
+        self.last_hit: Optional[CallRateLimitHit] = None
+
 
 class AbstractAPIBudget(abc.ABC):
     """Interface to some API where a client allowed to have N calls per T interval.
@@ -359,6 +453,16 @@ class AbstractAPIBudget(abc.ABC):
         :raises: CallRateLimitHit - when no credits left and if timeout was set the waiting time exceed the timeout
         """
 
+    async def acquire_call_async(self, request: Any, timeout: Optional[float] = None) -> None:
+        """Wait for a call from budget without blocking the running event loop. By default, the blocking `acquire_call` runs in the
+        default executor of the loop
+
+        :param request:
+        :param timeout: if set will limit maximum time to wait, otherwise will wait until credit is available
+        :raises: CallRateLimitHit - when no credits left and if timeout was set the waiting time exceed the timeout
+        """
+        await asyncio.get_running_loop().run_in_executor(None, lambda: self.acquire_call(request, block=True, timeout=timeout))
+
     @abc.abstractmethod
     def get_matching_policy(self, request: Any) -> Optional[AbstractCallRatePolicy]:
         """Find matching call rate policy for specific request"""
@@ -385,6 +489,13 @@ class APIBudget(AbstractAPIBudget):
 
         self._policies = policies
         self._maximum_attempts_to_acquire = maximum_attempts_to_acquire
+        self._lock = Lock()
+        self._queues: Dict[int, _CallQueue] = {}
+        self._acquired_calls = 0
+        self._delayed_calls = 0
+        self._rejected_calls = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
 
     def get_matching_policy(self, request: Any) -> Optional[AbstractCallRatePolicy]:
         for policy in self._policies:
@@ -409,6 +520,21 @@ class APIBudget(AbstractAPIBudget):
         elif self._policies:
             logger.info("no policies matched with requests, allow call by default")
 
+    async def acquire_call_async(self, request: Any, timeout: Optional[float] = None) -> None:
+        """Wait for a call from budget without blocking the running event loop. The call waits in the same queue as the blocking calls
+        so that calls get credits in their order of arrival whether they are awaited or not
+
+        :param request:
+        :param timeout: if provided will limit maximum time to wait, otherwise will wait until credit is available
+        :raises: CallRateLimitHit - when no calls left and if timeout was set the waiting time exceed the timeout
+        """
+
+        policy = self.get_matching_policy(request)
+        if policy:
+            await self._do_acquire_async(request=request, policy=policy, timeout=timeout)
+        elif self._policies:
+            logger.info("no policies matched with requests, allow call by default")
+
     def update_from_response(self, request: Any, response: Any) -> None:
         """Update budget information based on response from API
 
@@ -417,37 +543,158 @@ class APIBudget(AbstractAPIBudget):
         """
         pass
 
+    @property
+    def metrics(self) -> APIBudgetMetrics:
+        """Wait time and utilization of the budget"""
+        with self._lock:
+            acquired_calls = self._acquired_calls
+            delayed_calls = self._delayed_calls
+            rejected_calls = self._rejected_calls
+            waiting_calls = sum(len(queue.waiters) for queue in self._queues.values())
+            total_wait_time = self._total_wait_time
+            max_wait_time = self._max_wait_time
+        return APIBudgetMetrics(
+            acquired_calls=acquired_calls,
+            delayed_calls=delayed_calls,
+            rejected_calls=rejected_calls,
+            waiting_calls=waiting_calls,
+            total_wait_time=timedelta(seconds=total_wait_time),
+            max_wait_time=timedelta(seconds=max_wait_time),
+            utilization=[policy.utilization() for policy in self._policies],
+        )
+
     def _do_acquire(self, request: Any, policy: AbstractCallRatePolicy, block: bool, timeout: Optional[float]) -> None:
         """Internal method to try to acquire a call credit
 
+        Blocking calls wait in a FIFO queue per policy so that no caller is starved by the others. Only the call at the head of the queue
+        tries to acquire a credit: it sleeps until the policy expects a credit to be available while the other calls sleep until they reach
+        the head of the queue. Non-blocking calls are not queued.
+
         :param request:
         :param policy:
         :param block:
         :param timeout:
         """
-        last_exception = None
-        # sometimes we spend all budget before a second attempt, so we have few more here
-        for attempt in range(1, self._maximum_attempts_to_acquire):
+        if not block:
+            try:
+                policy.try_acquire(request, weight=1)
+            except CallRateLimitHit:
+                with self._lock:
+                    self._rejected_calls += 1
+                raise
+            with self._lock:
+                self._record_acquired_call(wait_time=0.0, delayed=False)
+            return
+
+        start = time.monotonic()
+        with self._lock:
+            queue = self._queues.setdefault(id(policy), _CallQueue())
+            waiter = Condition(self._lock)
+            call = _QueuedCall(waiter=waiter, start=start, deadline=None if timeout is None else start + timeout)
+            queue.waiters.append(waiter)
+            try:
+                while True:
+                    acquired, time_to_wait = self._try_acquire_queued(request, policy, queue, call, timeout)
+                    if acquired:
+                        return
+                    call.delayed = True
+                    waiter.wait(time_to_wait)
+            finally:
+                self._leave_queue(queue, waiter)
+
+    async def _do_acquire_async(self, request: Any, policy: AbstractCallRatePolicy, timeout: Optional[float]) -> None:
+        """Internal method to wait for a call credit on an event loop. The lock is only held while trying to acquire so that the loop is
+        not blocked while the call waits
+
+        :param request:
+        :param policy:
+        :param timeout:
+        """
+        start = time.monotonic()
+        waiter = _AsyncCallWaiter(asyncio.get_running_loop())
+        call = _QueuedCall(waiter=waiter, start=start, deadline=None if timeout is None else start + timeout)
+        with self._lock:
+            queue = self._queues.setdefault(id(policy), _CallQueue())
+            queue.waiters.append(waiter)
+        try:
+            while True:
+                with self._lock:
+                    # notifications received from now on are for this attempt
+                    waiter.clear()
+                    acquired, time_to_wait = self._try_acquire_queued(request, policy, queue, call, timeout)
+                if acquired:
+                    return
+                call.delayed = True
+                await waiter.wait(time_to_wait)
+        finally:
+            with self._lock:
+                self._leave_queue(queue, waiter)
+
+    def _try_acquire_queued(
+        self, request: Any, policy: AbstractCallRatePolicy, queue: _CallQueue, call: _QueuedCall, timeout: Optional[float]
+    ) -> Tuple[bool, Optional[float]]:
+        """Try to acquire a credit for a queued call. Must be called with the lock held
+
+        :return: whether the credit was acquired and, if not, how long the call should wait before trying again (None to wait until
+         notified)
+        :raises: CallRateLimitHit - when all attempts were used or the timeout expired
+        """
+        # calls behind the head of the queue wait until they are notified
+        time_to_wait: Optional[float] = None
+        if queue.waiters[0] is call.waiter:
+            call.attempt += 1
             try:
                 policy.try_acquire(request, weight=1)
-                return
+                self._record_acquired_call(wait_time=time.monotonic() - call.start, delayed=call.delayed)
+                return True, None
             except CallRateLimitHit as exc:
-                last_exception = exc
-                if block:
-                    if timeout is not None:
-                        time_to_wait = min(timedelta(seconds=timeout), exc.time_to_wait)
-                    else:
-                        time_to_wait = exc.time_to_wait
-
-                    time_to_wait = max(timedelta(0), time_to_wait)  # sometimes we get negative duration
-                    logger.info("reached call limit %s. going to sleep for %s", exc.rate, time_to_wait)
-                    time.sleep(time_to_wait.total_seconds())
-                else:
+                queue.last_hit = exc
+                if call.attempt >= self._maximum_attempts_to_acquire:
+                    logger.info("we used all %s attempts to acquire and failed", self._maximum_attempts_to_acquire)
+                    self._rejected_calls += 1
                     raise
+                # sometimes we get a negative or zero duration as policies count time in milliseconds
+                time_to_wait = max(_MINIMUM_TIME_TO_WAIT, exc.time_to_wait.total_seconds())
+                logger.info("reached call limit %s. going to sleep for %s", exc.rate, timedelta(seconds=time_to_wait))
+        if call.deadline is not None:
+            remaining_time = call.deadline - time.monotonic()
+            if remaining_time <= 0:
+                self._rejected_calls += 1
+                raise self._timeout_exception(request, queue, timeout)
+            time_to_wait = remaining_time if time_to_wait is None else min(time_to_wait, remaining_time)
+        return False, time_to_wait
 
-        if last_exception:
-            logger.info("we used all %s attempts to acquire and failed", self._maximum_attempts_to_acquire)
-            raise last_exception
+    @staticmethod
+    def _leave_queue(queue: _CallQueue, waiter: Union[Condition, _AsyncCallWaiter]) -> None:
+        """Remove the call from the queue and wake up the next one. Must be called with the lock held"""
+        queue.waiters.remove(waiter)
+        if queue.waiters:
+            queue.waiters[0].notify()
+
+    def _notify_next_call(self, policy: AbstractCallRatePolicy) -> None:
+        """Wake up the call at the head of the queue of the policy so that it tries again after the policy was updated"""
+        with self._lock:
+            queue = self._queues.get(id(policy))
+            if queue and queue.waiters:
+                queue.waiters[0].notify()
+
+    def _record_acquired_call(self, wait_time: float, delayed: bool) -> None:
+        self._acquired_calls += 1
+        if delayed:
+            self._delayed_calls += 1
+            self._total_wait_time += wait_time
+            self._max_wait_time = max(self._max_wait_time, wait_time)
+
+    @staticmethod
+    def _timeout_exception(request: Any, queue: _CallQueue, timeout: Optional[float]) -> CallRateLimitHit:
+        last_hit = queue.last_hit
+        return CallRateLimitHit(
+            error=f"no call credit was available within {timeout} seconds" + (f": {last_hit}" if last_hit else ""),
+            item=request,
+            weight=1,
+            rate=last_hit.rate if last_hit else "",
+            time_to_wait=last_hit.time_to_wait if last_hit else timedelta(0),
+        )
 
 
 class HttpAPIBudget(APIBudget):
@@ -480,6 +727,7 @@ class HttpAPIBudget(APIBudget):
             available_calls = self.get_calls_left_from_response(response)
             reset_ts = self.get_reset_ts_from_response(response)
             policy.update(available_calls=available_calls, call_reset_ts=reset_ts)
+            self._notify_next_call(policy)
 
     def get_reset_ts_from_response(self, response: requests.Response) -> Optional[datetime.datetime]:
         if response.headers.get(self._ratelimit_reset_header):
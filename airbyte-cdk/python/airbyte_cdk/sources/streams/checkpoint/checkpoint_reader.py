@@ -95,6 +95,7 @@ class CursorBasedCheckpointReader(CheckpointReader):
         self._read_state_from_cursor = read_state_from_cursor
         self._current_slice: Optional[StreamSlice] = None
         self._finished_sync = False
+        self._has_pending_checkpoint = False
 
     def next(self) -> Optional[Mapping[str, Any]]:
         try:
@@ -114,6 +115,14 @@ class CursorBasedCheckpointReader(CheckpointReader):
         # emitted state at the end of each slice. We only emit state if _current_slice is None which indicates we had no
         # slices and emitted no record or are currently in the process of emitting records.
         if self.current_slice is None or not self._finished_sync:
+            if self.current_slice is not None and not self._cursor.is_checkpoint_due():
+                # The cursor throttles its checkpoints so the state will be emitted later or at the end of the sync
+                self._has_pending_checkpoint = True
+                return None
+            self._has_pending_checkpoint = False
+            return self._cursor.get_stream_state()
+        elif self._has_pending_checkpoint:
+            self._has_pending_checkpoint = False
             return self._cursor.get_stream_state()
         else:
             return None
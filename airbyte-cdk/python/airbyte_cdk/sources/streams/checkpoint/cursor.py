@@ -56,6 +56,13 @@ class Cursor(ABC):
         allows for emitting the state to the platform.
         """
 
+    def is_checkpoint_due(self) -> bool:
+        """
+        Evaluating if the state should be emitted after the last closed slice. Cursors with large states can return False in order to
+        throttle how often the state is emitted. If the state was not emitted after the last slice, it is emitted at the end of the sync.
+        """
+        return True
+
     @abstractmethod
     def should_be_synced(self, record: Record) -> bool:
         """
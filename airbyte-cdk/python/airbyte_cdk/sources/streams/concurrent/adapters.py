@@ -6,7 +6,7 @@ import copy
 import json
 import logging
 from functools import lru_cache
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
+from typing import Any, AsyncIterator, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, AirbyteStream, ConfiguredAirbyteStream, Level, SyncMode, Type
 from airbyte_cdk.sources import AbstractSource, Source
@@ -25,6 +25,7 @@ from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partitio
 from airbyte_cdk.sources.streams.concurrent.partitions.partition_generator import PartitionGenerator
 from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
 from airbyte_cdk.sources.streams.core import StreamData
+from airbyte_cdk.sources.streams.http.http import HttpStream
 from airbyte_cdk.sources.types import StreamSlice
 from airbyte_cdk.sources.utils.schema_helpers import InternalConfig
 from airbyte_cdk.sources.utils.slice_logger import SliceLogger
@@ -260,12 +261,9 @@ class StreamPartition(Partition):
                 stream_slice=copy.deepcopy(self._slice),
                 stream_state=self._state,
             ):
-                if isinstance(record_data, Mapping):
-                    data_to_return = dict(record_data)
-                    self._stream.transformer.transform(data_to_return, self._stream.get_json_schema())
-                    yield Record(data_to_return, self)
-                else:
-                    self._message_repository.emit_message(record_data)
+                record = self._to_record(record_data)
+                if record is not None:
+                    yield record
         except Exception as e:
             display_message = self._stream.get_error_display_message(e)
             if display_message:
@@ -273,6 +271,43 @@ class StreamPartition(Partition):
             else:
                 raise e
 
+    def read_async(self) -> Optional[AsyncIterator[Record]]:
+        """
+        Read messages from the stream on an event loop if the stream is an HttpStream using the AsyncHttpClient.
+        """
+        if not isinstance(self._stream, HttpStream) or not self._stream.reads_records_async:
+            return None
+        return self._read_records_async(self._stream)
+
+    async def _read_records_async(self, stream: HttpStream) -> AsyncIterator[Record]:
+        try:
+            async for record_data in stream.read_records_async(
+                cursor_field=self._cursor_field,
+                sync_mode=SyncMode.full_refresh,
+                stream_slice=copy.deepcopy(self._slice),
+                stream_state=self._state,
+            ):
+                record = self._to_record(record_data)
+                if record is not None:
+                    yield record
+        except Exception as e:
+            display_message = self._stream.get_error_display_message(e)
+            if display_message:
+                raise ExceptionWithDisplayMessage(display_message) from e
+            else:
+                raise e
+
+    def _to_record(self, record_data: StreamData) -> Optional[Record]:
+        """
+        If the StreamData is a Mapping, it is converted to a Record. Otherwise, the message is emitted on the message repository.
+        """
+        if isinstance(record_data, Mapping):
+            data_to_return = dict(record_data)
+            self._stream.transformer.transform(data_to_return, self._stream.get_json_schema())
+            return Record(data_to_return, self)
+        self._message_repository.emit_message(record_data)
+        return None
+
     def to_slice(self) -> Optional[Mapping[str, Any]]:
         return self._slice
 
@@ -10,7 +10,7 @@ from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
 from airbyte_cdk.sources.message import MessageRepository
 from airbyte_cdk.sources.streams import NO_CURSOR_STATE_KEY
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
-from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record, RecordBatch
 from airbyte_cdk.sources.streams.concurrent.state_converters.abstract_stream_state_converter import AbstractStreamStateConverter
 
 
@@ -72,6 +72,14 @@ class Cursor(ABC):
         """
         raise NotImplementedError()
 
+    def observe_batch(self, record_batch: RecordBatch) -> None:
+        """
+        Indicate to the cursor that all the records of the batch have been emitted. Cursors can override this method to process the batch
+        at once
+        """
+        for record in record_batch.records:
+            self.observe(record)
+
     @abstractmethod
     def close_partition(self, partition: Partition) -> None:
         """
@@ -120,6 +128,9 @@ class FinalStateCursor(Cursor):
     def observe(self, record: Record) -> None:
         pass
 
+    def observe_batch(self, record_batch: RecordBatch) -> None:
+        pass
+
     def close_partition(self, partition: Partition) -> None:
         pass
 
@@ -186,6 +197,15 @@ class ConcurrentCursor(Cursor):
         if most_recent_cursor_value is None or most_recent_cursor_value < cursor_value:
             self._most_recent_cursor_value_per_partition[record.partition] = cursor_value
 
+    def observe_batch(self, record_batch: RecordBatch) -> None:
+        if not record_batch.records:
+            return
+        most_recent_cursor_value = self._most_recent_cursor_value_per_partition.get(record_batch.partition)
+        batch_cursor_value = max(self._extract_cursor_value(record) for record in record_batch.records)
+
+        if most_recent_cursor_value is None or most_recent_cursor_value < batch_cursor_value:
+            self._most_recent_cursor_value_per_partition[record_batch.partition] = batch_cursor_value
+
     def _extract_cursor_value(self, record: Record) -> Any:
         return self._connector_state_converter.parse_value(self._cursor_field.extract_value(record))
 
@@ -1,12 +1,21 @@
 #
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
-from queue import Queue
+import asyncio
+import time
+from queue import Full, Queue
+from typing import TYPE_CHECKING, AsyncIterator, Iterable, List, Optional
 
+from airbyte_cdk.sources.concurrent_source.partition_reader_process_pool import PartitionReaderProcessPool
 from airbyte_cdk.sources.concurrent_source.stream_thread_exception import StreamThreadException
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record, RecordBatch
 from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel, QueueItem
 
+if TYPE_CHECKING:
+    # aiohttp is an optional dependency
+    from airbyte_cdk.sources.streams.http.async_http_client import AsyncHttpEngine
+
 
 class PartitionReader:
     """
@@ -14,12 +23,37 @@ class PartitionReader:
     """
 
     _IS_SUCCESSFUL = True
+    DEFAULT_RECORD_BATCH_TIMEOUT_IN_SECONDS = 0.5
+    DEFAULT_MAX_CONCURRENT_ASYNC_PARTITIONS = 100
 
-    def __init__(self, queue: Queue[QueueItem]) -> None:
+    def __init__(
+        self,
+        queue: Queue[QueueItem],
+        process_pool: Optional[PartitionReaderProcessPool] = None,
+        record_batch_size: int = 1,
+        record_batch_timeout_in_seconds: float = DEFAULT_RECORD_BATCH_TIMEOUT_IN_SECONDS,
+        async_http_engine: Optional["AsyncHttpEngine"] = None,
+        max_concurrent_async_partitions: int = DEFAULT_MAX_CONCURRENT_ASYNC_PARTITIONS,
+    ) -> None:
         """
         :param queue: The queue to put the records in.
+        :param process_pool: If provided, partitions that can be serialized are read in worker processes
+        :param record_batch_size: If greater than 1, records are put in the queue as RecordBatch of up to this number of records instead
+          of one by one
+        :param record_batch_timeout_in_seconds: The maximum time a record can wait in a batch. As the time is only checked when a record is
+          read, a partition that stops producing records keeps the pending batch until the partition is fully read
+        :param async_http_engine: If provided, partitions that can be read asynchronously (see `Partition.read_async`) are read on the
+          event loop of the engine so that the worker thread does not wait for the responses
+        :param max_concurrent_async_partitions: The maximum number of partitions read at the same time on the event loop of the engine
         """
         self._queue = queue
+        self._process_pool = process_pool
+        self._record_batch_size = record_batch_size
+        self._record_batch_timeout_in_seconds = record_batch_timeout_in_seconds
+        self._async_http_engine = async_http_engine
+        self._max_concurrent_async_partitions = max_concurrent_async_partitions
+        # created on the event loop of the engine as asyncio primitives are bound to the loop they are used on
+        self._async_partitions_semaphore: Optional[asyncio.Semaphore] = None
 
     def process_partition(self, partition: Partition) -> None:
         """
@@ -33,10 +67,75 @@ class PartitionReader:
         :param partition: The partition to read data from
         :return: None
         """
+        records_async = partition.read_async() if self._async_http_engine else None
+        if self._async_http_engine and records_async is not None:
+            # the partition is read on the event loop of the engine, which frees the worker thread for the next task
+            self._async_http_engine.submit(self._process_partition_async(partition, records_async))
+            return
+
         try:
-            for record in partition.read():
-                self._queue.put(record)
+            records = self._process_pool.read(partition) if self._process_pool else None
+            self._put_records(partition, records if records is not None else partition.read())
             self._queue.put(PartitionCompleteSentinel(partition, self._IS_SUCCESSFUL))
         except Exception as e:
             self._queue.put(StreamThreadException(e, partition.stream_name()))
             self._queue.put(PartitionCompleteSentinel(partition, not self._IS_SUCCESSFUL))
+
+    def _put_records(self, partition: Partition, records: Iterable[Record]) -> None:
+        if self._record_batch_size <= 1:
+            for record in records:
+                self._queue.put(record)
+            return
+
+        batch: List[Record] = []
+        batch_start_time = 0.0
+        try:
+            for record in records:
+                if not batch:
+                    batch_start_time = time.monotonic()
+                batch.append(record)
+                if len(batch) >= self._record_batch_size or time.monotonic() - batch_start_time >= self._record_batch_timeout_in_seconds:
+                    self._queue.put(RecordBatch(batch, partition))
+                    batch = []
+        finally:
+            # Records read before an exception are still put in the queue as they would be without batching
+            if batch:
+                self._queue.put(RecordBatch(batch, partition))
+
+    async def _process_partition_async(self, partition: Partition, records: AsyncIterator[Record]) -> None:
+        if self._async_partitions_semaphore is None:
+            self._async_partitions_semaphore = asyncio.Semaphore(self._max_concurrent_async_partitions)
+        async with self._async_partitions_semaphore:
+            try:
+                await self._put_records_async(partition, records)
+                await self._put_async(PartitionCompleteSentinel(partition, self._IS_SUCCESSFUL))
+            except Exception as e:
+                await self._put_async(StreamThreadException(e, partition.stream_name()))
+                await self._put_async(PartitionCompleteSentinel(partition, not self._IS_SUCCESSFUL))
+
+    async def _put_records_async(self, partition: Partition, records: AsyncIterator[Record]) -> None:
+        if self._record_batch_size <= 1:
+            async for record in records:
+                await self._put_async(record)
+            return
+
+        batch: List[Record] = []
+        batch_start_time = 0.0
+        try:
+            async for record in records:
+                if not batch:
+                    batch_start_time = time.monotonic()
+                batch.append(record)
+                if len(batch) >= self._record_batch_size or time.monotonic() - batch_start_time >= self._record_batch_timeout_in_seconds:
+                    await self._put_async(RecordBatch(batch, partition))
+                    batch = []
+        finally:
+            if batch:
+                await self._put_async(RecordBatch(batch, partition))
+
+    async def _put_async(self, item: QueueItem) -> None:
+        try:
+            self._queue.put_nowait(item)
+        except Full:
+            # the main thread is lagging behind so the item waits for room in the queue in another thread not to block the event loop
+            await asyncio.to_thread(self._queue.put, item)
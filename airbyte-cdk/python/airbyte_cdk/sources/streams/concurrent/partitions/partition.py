@@ -3,7 +3,7 @@
 #
 
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, Mapping, Optional
+from typing import Any, AsyncIterator, Iterable, Mapping, Optional
 
 from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
 
@@ -21,6 +21,14 @@ class Partition(ABC):
         """
         pass
 
+    def read_async(self) -> Optional[AsyncIterator[Record]]:
+        """
+        Reads the data from the partition without blocking the event loop iterating over the records. Partitions that don't support it
+        return None and are read with `read`.
+        :return: An async iterator of records or None.
+        """
+        return None
+
     @abstractmethod
     def to_slice(self) -> Optional[Mapping[str, Any]]:
         """
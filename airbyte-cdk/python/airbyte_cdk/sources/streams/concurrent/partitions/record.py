@@ -2,7 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import TYPE_CHECKING, Any, Mapping
+from typing import TYPE_CHECKING, Any, List, Mapping
 
 if TYPE_CHECKING:
     from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
@@ -24,3 +24,21 @@ class Record:
 
     def __repr__(self) -> str:
         return f"Record(data={self.data}, stream_name={self.partition.stream_name()})"
+
+
+class RecordBatch:
+    """
+    Represents records read from the same partition that are moved through the queue at once.
+    """
+
+    def __init__(self, records: List[Record], partition: "Partition"):
+        self.records = records
+        self.partition = partition
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, RecordBatch):
+            return False
+        return self.records == other.records and self.partition.stream_name() == other.partition.stream_name()
+
+    def __repr__(self) -> str:
+        return f"RecordBatch(records={self.records}, stream_name={self.partition.stream_name()})"
@@ -0,0 +1,349 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import asyncio
+import atexit
+import concurrent.futures
+import datetime
+import logging
+import ssl
+import threading
+import time
+from typing import Any, Callable, Coroutine, Dict, List, Mapping, Optional, Tuple, TypeVar, Union
+
+import aiohttp
+import requests
+from airbyte_cdk.sources.message import MessageRepository
+from airbyte_cdk.sources.streams.call_rate import APIBudget
+from airbyte_cdk.sources.streams.http.error_handlers import BackoffStrategy, ErrorHandler, ErrorMessageParser
+from airbyte_cdk.sources.streams.http.http_client import HttpClient
+from airbyte_cdk.sources.streams.http.rate_limiting import (
+    async_user_defined_backoff_handler,
+    http_client_default_backoff_handler,
+    rate_limit_default_backoff_handler,
+)
+from requests.auth import AuthBase
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from yarl import URL
+
+T = TypeVar("T")
+
+# Unlike the requests pools which hold one connection per thread, a connection of the asyncio pool is only held while a request is in
+# flight so the pool is sized for the number of concurrent requests
+MAX_ASYNC_CONNECTION_POOL_SIZE = 100
+
+
+class AsyncHttpEngine:
+    """
+    Holds the aiohttp sessions, and therefore the connection pools, shared by the AsyncHttpClients using this engine. One session is
+    created per event loop as aiohttp sessions can't be shared across loops.
+
+    The engine also runs an event loop in a background thread so that requests sent from synchronous code, whatever the thread, are
+    multiplexed on a single loop and a single connection pool.
+    """
+
+    _shared: Optional["AsyncHttpEngine"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_connections: int = MAX_ASYNC_CONNECTION_POOL_SIZE):
+        """
+        :param max_connections: The maximum number of connections opened by each session, i.e. the maximum number of requests in flight
+        """
+        if max_connections < 1:
+            raise ValueError(f"Expected at least one connection but got {max_connections}")
+        self._max_connections = max_connections
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+    @classmethod
+    def shared(cls) -> "AsyncHttpEngine":
+        """
+        Return the engine used by the AsyncHttpClients that are not given one. The engine is closed when the process exits
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+                atexit.register(cls._shared.close)
+            return cls._shared
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the session of the running event loop
+        """
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._max_connections, limit_per_host=0),
+                # Cookies are handled by the requests session preparing the requests
+                cookie_jar=aiohttp.DummyCookieJar(),
+                # The timeouts are the ones of the request kwargs like with requests
+                timeout=aiohttp.ClientTimeout(total=None),
+            )
+            self._sessions[loop] = session
+        return session
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """
+        Run the coroutine on the loop of the engine and wait for its result
+        """
+        return self.submit(coroutine).result()
+
+    def submit(self, coroutine: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+        """
+        Schedule the coroutine on the loop of the engine
+        """
+        loop = self._get_loop()
+        if threading.current_thread() is self._thread:
+            coroutine.close()
+            raise RuntimeError("Coroutines submitted from the event loop of the AsyncHttpEngine would never complete, await them instead")
+        return asyncio.run_coroutine_threadsafe(coroutine, loop)
+
+    async def aclose(self) -> None:
+        """
+        Close the session of the running event loop
+        """
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+
+    def close(self) -> None:
+        """
+        Close the session and stop the loop of the engine. Sessions of other loops are closed with `aclose`
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop, self._thread = None, None
+        if loop is None or thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="airbyte-async-http", daemon=True)
+                self._thread.start()
+            return self._loop
+
+
+class AsyncHttpClient(HttpClient):
+    """
+    HttpClient sending requests with aiohttp so that many requests can be in flight on a single event loop. Requests are prepared by the
+    requests session so that authenticators apply, and responses are converted to requests.Responses so that the ErrorHandler,
+    BackoffStrategy, APIBudget and MessageRepository behave as they do with the HttpClient.
+
+    `send_request_async` can be awaited from any event loop. `send_request` runs the request on the loop of the engine and blocks the
+    calling thread until the response is received. Responses are not cached.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        logger: logging.Logger,
+        error_handler: Optional[ErrorHandler] = None,
+        api_budget: Optional[APIBudget] = None,
+        authenticator: Optional[AuthBase] = None,
+        backoff_strategy: Optional[Union[BackoffStrategy, List[BackoffStrategy]]] = None,
+        error_message_parser: Optional[ErrorMessageParser] = None,
+        disable_retries: bool = False,
+        message_repository: Optional[MessageRepository] = None,
+        engine: Optional[AsyncHttpEngine] = None,
+    ):
+        """
+        :param engine: The engine holding the connection pools. Defaults to the engine shared by all AsyncHttpClients
+        """
+        super().__init__(
+            name=name,
+            logger=logger,
+            error_handler=error_handler,
+            api_budget=api_budget,
+            authenticator=authenticator,
+            backoff_strategy=backoff_strategy,
+            error_message_parser=error_message_parser,
+            disable_retries=disable_retries,
+            message_repository=message_repository,
+        )
+        self._engine = engine or AsyncHttpEngine.shared()
+
+    def send_request(
+        self,
+        http_method: str,
+        url: str,
+        request_kwargs: Mapping[str, Any],
+        headers: Optional[Mapping[str, str]] = None,
+        params: Optional[Mapping[str, str]] = None,
+        json: Optional[Mapping[str, Any]] = None,
+        data: Optional[Union[str, Mapping[str, Any]]] = None,
+        dedupe_query_params: bool = False,
+        log_formatter: Optional[Callable[[requests.Response], Any]] = None,
+        exit_on_rate_limit: Optional[bool] = False,
+    ) -> Tuple[requests.PreparedRequest, requests.Response]:
+        # The request is prepared in the calling thread so that authenticators refreshing their token do not block the event loop
+        request: requests.PreparedRequest = self._create_prepared_request(
+            http_method=http_method, url=url, dedupe_query_params=dedupe_query_params, headers=headers, params=params, json=json, data=data
+        )
+        response = self._engine.run(
+            self._send_with_retry_async(
+                request=request, request_kwargs=request_kwargs, log_formatter=log_formatter, exit_on_rate_limit=exit_on_rate_limit
+            )
+        )
+        return request, response
+
+    async def send_request_async(
+        self,
+        http_method: str,
+        url: str,
+        request_kwargs: Mapping[str, Any],
+        headers: Optional[Mapping[str, str]] = None,
+        params: Optional[Mapping[str, str]] = None,
+        json: Optional[Mapping[str, Any]] = None,
+        data: Optional[Union[str, Mapping[str, Any]]] = None,
+        dedupe_query_params: bool = False,
+        log_formatter: Optional[Callable[[requests.Response], Any]] = None,
+        exit_on_rate_limit: Optional[bool] = False,
+    ) -> Tuple[requests.PreparedRequest, requests.Response]:
+        """
+        Prepares and sends request and return request and response objects.
+        """
+        request: requests.PreparedRequest = self._create_prepared_request(
+            http_method=http_method, url=url, dedupe_query_params=dedupe_query_params, headers=headers, params=params, json=json, data=data
+        )
+        response = await self._send_with_retry_async(
+            request=request, request_kwargs=request_kwargs, log_formatter=log_formatter, exit_on_rate_limit=exit_on_rate_limit
+        )
+        return request, response
+
+    async def _send_with_retry_async(
+        self,
+        request: requests.PreparedRequest,
+        request_kwargs: Mapping[str, Any],
+        log_formatter: Optional[Callable[[requests.Response], Any]] = None,
+        exit_on_rate_limit: Optional[bool] = False,
+    ) -> requests.Response:
+        max_tries = max(0, self._max_retries) + 1
+        max_time = self._max_time
+
+        user_backoff_handler = async_user_defined_backoff_handler(max_tries=max_tries, max_time=max_time)(self._send_async)
+        rate_limit_backoff_handler = rate_limit_default_backoff_handler()
+        backoff_handler = http_client_default_backoff_handler(max_tries=max_tries, max_time=max_time)
+        # backoff handlers wrap _send_async, so it will always return a response
+        response: requests.Response = await backoff_handler(rate_limit_backoff_handler(user_backoff_handler))(
+            request, request_kwargs, log_formatter=log_formatter, exit_on_rate_limit=exit_on_rate_limit
+        )
+        return response
+
+    async def _send_async(
+        self,
+        request: requests.PreparedRequest,
+        request_kwargs: Mapping[str, Any],
+        log_formatter: Optional[Callable[[requests.Response], Any]] = None,
+        exit_on_rate_limit: Optional[bool] = False,
+    ) -> requests.Response:
+        if request not in self._request_attempt_count:
+            self._request_attempt_count[request] = 1
+        else:
+            self._request_attempt_count[request] += 1
+
+        self._logger.debug(
+            "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
+        )
+
+        response: Optional[requests.Response] = None
+        exc: Optional[requests.RequestException] = None
+
+        # the call waits in the queue of the budget policy, in its order of arrival, without blocking the event loop
+        await self._api_budget.acquire_call_async(request)
+        try:
+            response = await self._send_with_aiohttp(request, request_kwargs)
+        except requests.RequestException as e:
+            exc = e
+        else:
+            self._api_budget.update_from_response(request, response)
+
+        return self._evaluate_response(request, request_kwargs, response, exc, log_formatter, exit_on_rate_limit)
+
+    async def _send_with_aiohttp(self, request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> requests.Response:
+        session = self._engine.get_session()
+        start = time.perf_counter()
+        try:
+            async with session.request(
+                request.method or "GET",
+                # The URL was already encoded when the request was prepared
+                URL(request.url, encoded=True),
+                headers=request.headers,
+                data=request.body,
+                **_to_aiohttp_kwargs(request, request_kwargs),
+            ) as aiohttp_response:
+                content = await aiohttp_response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exception:
+            raise _to_requests_exception(exception, request) from exception
+
+        response = requests.Response()
+        response.status_code = aiohttp_response.status
+        response.reason = aiohttp_response.reason or ""
+        response.headers = CaseInsensitiveDict()
+        for key, value in aiohttp_response.headers.items():
+            # requests joins the values of repeated headers
+            response.headers[key] = f"{response.headers[key]}, {value}" if key in response.headers else value
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = str(aiohttp_response.url)
+        response._content = content
+        response._content_consumed = True  # type: ignore[attr-defined]  # private attribute set by requests when reading the content
+        response.request = request
+        response.elapsed = datetime.timedelta(seconds=time.perf_counter() - start)
+        return response
+
+
+def _to_aiohttp_kwargs(request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> Mapping[str, Any]:
+    """
+    Translate the keyword arguments of requests.Session.send to the ones of aiohttp.ClientSession.request
+    """
+    kwargs: Dict[str, Any] = {"allow_redirects": request_kwargs.get("allow_redirects", True)}
+    timeout = request_kwargs.get("timeout")
+    if isinstance(timeout, tuple):
+        connect_timeout, read_timeout = timeout
+        kwargs["timeout"] = aiohttp.ClientTimeout(total=None, sock_connect=connect_timeout, sock_read=read_timeout)
+    elif timeout is not None:
+        kwargs["timeout"] = aiohttp.ClientTimeout(total=None, sock_connect=timeout, sock_read=timeout)
+
+    verify = request_kwargs.get("verify", True)
+    cert = request_kwargs.get("cert")
+    if verify is False:
+        kwargs["ssl"] = False
+    elif isinstance(verify, str) or cert:
+        ssl_context = ssl.create_default_context(cafile=verify if isinstance(verify, str) else None)
+        if isinstance(cert, tuple):
+            ssl_context.load_cert_chain(*cert)
+        elif cert:
+            ssl_context.load_cert_chain(cert)
+        kwargs["ssl"] = ssl_context
+
+    proxies = request_kwargs.get("proxies")
+    if proxies:
+        kwargs["proxy"] = proxies.get(URL(request.url or "", encoded=True).scheme) or proxies.get("all")
+    return kwargs
+
+
+def _to_requests_exception(exception: Exception, request: requests.PreparedRequest) -> requests.RequestException:
+    """
+    Map the aiohttp exceptions to the requests ones the error handlers and backoff handlers expect
+    """
+    if isinstance(exception, aiohttp.ConnectionTimeoutError):
+        return requests.exceptions.ConnectTimeout(exception, request=request)
+    if isinstance(exception, asyncio.TimeoutError):
+        return requests.exceptions.ReadTimeout(exception, request=request)
+    if isinstance(exception, aiohttp.InvalidURL):
+        return requests.exceptions.InvalidURL(exception, request=request)
+    if isinstance(exception, aiohttp.ClientPayloadError):
+        return requests.exceptions.ChunkedEncodingError(exception, request=request)
+    if isinstance(exception, aiohttp.ClientConnectionError):
+        return requests.exceptions.ConnectionError(exception, request=request)
+    return requests.RequestException(exception, request=request)
@@ -5,7 +5,7 @@
 import logging
 from abc import ABC, abstractmethod
 from datetime import timedelta
-from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
+from typing import Any, AsyncIterator, Callable, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 from urllib.parse import urljoin
 
 import requests
@@ -39,16 +39,32 @@ class HttpStream(Stream, CheckpointMixin, ABC):
 
     def __init__(self, authenticator: Optional[AuthBase] = None, api_budget: Optional[APIBudget] = None):
         self._exit_on_rate_limit: bool = False
-        self._http_client = HttpClient(
-            name=self.name,
-            logger=self.logger,
-            error_handler=self.get_error_handler(),
-            api_budget=api_budget or APIBudget(policies=[]),
-            authenticator=authenticator,
-            use_cache=self.use_cache,
-            backoff_strategy=self.get_backoff_strategy(),
-            message_repository=InMemoryMessageRepository(),
-        )
+        self._http_client: HttpClient
+        self._sends_requests_async = self.use_async_http_client and not self.use_cache
+        if self._sends_requests_async:
+            # aiohttp is an optional dependency so the async client is only imported by the streams using it
+            from airbyte_cdk.sources.streams.http.async_http_client import AsyncHttpClient
+
+            self._http_client = AsyncHttpClient(
+                name=self.name,
+                logger=self.logger,
+                error_handler=self.get_error_handler(),
+                api_budget=api_budget or APIBudget(policies=[]),
+                authenticator=authenticator,
+                backoff_strategy=self.get_backoff_strategy(),
+                message_repository=InMemoryMessageRepository(),
+            )
+        else:
+            self._http_client = HttpClient(
+                name=self.name,
+                logger=self.logger,
+                error_handler=self.get_error_handler(),
+                api_budget=api_budget or APIBudget(policies=[]),
+                authenticator=authenticator,
+                use_cache=self.use_cache,
+                backoff_strategy=self.get_backoff_strategy(),
+                message_repository=InMemoryMessageRepository(),
+            )
 
         # There are three conditions that dictate if RFR should automatically be applied to a stream
         # 1. Streams that explicitly initialize their own cursor should defer to it and not automatically apply RFR
@@ -85,6 +101,22 @@ class HttpStream(Stream, CheckpointMixin, ABC):
         """
         return False
 
+    @property
+    def use_async_http_client(self) -> bool:
+        """
+        Override if needed. If True, requests are sent with aiohttp and the concurrent framework reads the partitions of the stream on
+        the event loop of the AsyncHttpEngine instead of blocking a worker thread per partition. This requires the `async-http` extra.
+        Responses are not cached so this is ignored if `use_cache` is True.
+        """
+        return False
+
+    @property
+    def reads_records_async(self) -> bool:
+        """
+        :return: True if `read_records_async` can be used instead of `read_records`. Streams overriding `read_records` are read with it
+        """
+        return self._sends_requests_async and type(self).read_records is HttpStream.read_records
+
     @property
     @abstractmethod
     def url_base(self) -> str:
@@ -344,6 +376,34 @@ class HttpStream(Stream, CheckpointMixin, ABC):
                 stream_state,
             )
 
+    async def read_records_async(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: Optional[List[str]] = None,
+        stream_slice: Optional[Mapping[str, Any]] = None,
+        stream_state: Optional[Mapping[str, Any]] = None,
+    ) -> AsyncIterator[StreamData]:
+        """
+        Same as `read_records` but the requests are awaited so that many slices can be read on a single event loop. Only available if
+        `reads_records_async` is True
+        """
+        if not self.reads_records_async:
+            raise ValueError(f"Stream {self.name} can't be read asynchronously, see `HttpStream.reads_records_async`")
+        if self.cursor_field or not isinstance(self.get_cursor(), ResumableFullRefreshCursor):
+            records = self._read_pages_async(
+                lambda req, res, state, _slice: self.parse_response(res, stream_slice=_slice, stream_state=state),
+                stream_slice,
+                stream_state,
+            )
+        else:
+            records = self._read_single_page_async(
+                lambda req, res, state, _slice: self.parse_response(res, stream_slice=_slice, stream_state=state),
+                stream_slice,
+                stream_state,
+            )
+        async for record in records:
+            yield record
+
     @property
     def state(self) -> MutableMapping[str, Any]:
         cursor = self.get_cursor()
@@ -424,6 +484,54 @@ class HttpStream(Stream, CheckpointMixin, ABC):
         # Always return an empty generator just in case no records were ever yielded
         yield from []
 
+    async def _read_pages_async(
+        self,
+        records_generator_fn: Callable[
+            [requests.PreparedRequest, requests.Response, Mapping[str, Any], Optional[Mapping[str, Any]]], Iterable[StreamData]
+        ],
+        stream_slice: Optional[Mapping[str, Any]] = None,
+        stream_state: Optional[Mapping[str, Any]] = None,
+    ) -> AsyncIterator[StreamData]:
+        partition, _, _ = self._extract_slice_fields(stream_slice=stream_slice)
+
+        stream_state = stream_state or {}
+        pagination_complete = False
+        next_page_token = None
+        while not pagination_complete:
+            request, response = await self._fetch_next_page_async(stream_slice, stream_state, next_page_token)
+            for record in records_generator_fn(request, response, stream_state, stream_slice):
+                yield record
+
+            next_page_token = self.next_page_token(response)
+            if not next_page_token:
+                pagination_complete = True
+
+        cursor = self.get_cursor()
+        if cursor and isinstance(cursor, SubstreamResumableFullRefreshCursor):
+            cursor.close_slice(StreamSlice(cursor_slice={}, partition=partition))
+
+    async def _read_single_page_async(
+        self,
+        records_generator_fn: Callable[
+            [requests.PreparedRequest, requests.Response, Mapping[str, Any], Optional[Mapping[str, Any]]], Iterable[StreamData]
+        ],
+        stream_slice: Optional[Mapping[str, Any]] = None,
+        stream_state: Optional[Mapping[str, Any]] = None,
+    ) -> AsyncIterator[StreamData]:
+        partition, cursor_slice, remaining_slice = self._extract_slice_fields(stream_slice=stream_slice)
+        stream_state = stream_state or {}
+        next_page_token = cursor_slice or None
+
+        request, response = await self._fetch_next_page_async(remaining_slice, stream_state, next_page_token)
+        for record in records_generator_fn(request, response, stream_state, remaining_slice):
+            yield record
+
+        next_page_token = self.next_page_token(response) or {"__ab_full_refresh_sync_complete": True}
+
+        cursor = self.get_cursor()
+        if cursor:
+            cursor.close_slice(StreamSlice(cursor_slice=next_page_token, partition=partition))
+
     @staticmethod
     def _extract_slice_fields(stream_slice: Optional[Mapping[str, Any]]) -> tuple[Mapping[str, Any], Mapping[str, Any], Mapping[str, Any]]:
         if not stream_slice:
@@ -450,23 +558,46 @@ class HttpStream(Stream, CheckpointMixin, ABC):
     ) -> Tuple[requests.PreparedRequest, requests.Response]:
 
         request, response = self._http_client.send_request(
-            http_method=self.http_method,
-            url=self._join_url(
-                self.url_base,
-                self.path(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
-            ),
-            request_kwargs=self.request_kwargs(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
-            headers=self.request_headers(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
-            params=self.request_params(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
-            json=self.request_body_json(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
-            data=self.request_body_data(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
-            dedupe_query_params=True,
-            log_formatter=self.get_log_formatter(),
-            exit_on_rate_limit=self.exit_on_rate_limit,
+            **self._next_page_request_arguments(stream_slice, stream_state, next_page_token)
         )
 
         return request, response
 
+    async def _fetch_next_page_async(
+        self,
+        stream_slice: Optional[Mapping[str, Any]] = None,
+        stream_state: Optional[Mapping[str, Any]] = None,
+        next_page_token: Optional[Mapping[str, Any]] = None,
+    ) -> Tuple[requests.PreparedRequest, requests.Response]:
+        # only called when reads_records_async is True, i.e. when the client is an AsyncHttpClient
+        request, response = await self._http_client.send_request_async(  # type: ignore[attr-defined]
+            **self._next_page_request_arguments(stream_slice, stream_state, next_page_token)
+        )
+
+        return request, response  # type: ignore[no-any-return]
+
+    def _next_page_request_arguments(
+        self,
+        stream_slice: Optional[Mapping[str, Any]],
+        stream_state: Optional[Mapping[str, Any]],
+        next_page_token: Optional[Mapping[str, Any]],
+    ) -> Mapping[str, Any]:
+        return {
+            "http_method": self.http_method,
+            "url": self._join_url(
+                self.url_base,
+                self.path(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+            ),
+            "request_kwargs": self.request_kwargs(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+            "headers": self.request_headers(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+            "params": self.request_params(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+            "json": self.request_body_json(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+            "data": self.request_body_data(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+            "dedupe_query_params": True,
+            "log_formatter": self.get_log_formatter(),
+            "exit_on_rate_limit": self.exit_on_rate_limit,
+        }
+
     def get_log_formatter(self) -> Optional[Callable[[requests.Response], Any]]:
         """
 
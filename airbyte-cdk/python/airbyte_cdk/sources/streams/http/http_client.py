@@ -40,6 +40,7 @@ from airbyte_cdk.sources.streams.http.exceptions import (
 from airbyte_cdk.sources.streams.http.rate_limiting import (
     http_client_default_backoff_handler,
     rate_limit_default_backoff_handler,
+    rate_limited_responses_counter,
     user_defined_backoff_handler,
 )
 from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
@@ -262,6 +263,21 @@ class HttpClient:
         except requests.RequestException as e:
             exc = e
 
+        return self._evaluate_response(request, request_kwargs, response, exc, log_formatter, exit_on_rate_limit)
+
+    def _evaluate_response(
+        self,
+        request: requests.PreparedRequest,
+        request_kwargs: Mapping[str, Any],
+        response: Optional[requests.Response],
+        exc: Optional[requests.RequestException],
+        log_formatter: Optional[Callable[[requests.Response], Any]] = None,
+        exit_on_rate_limit: Optional[bool] = False,
+    ) -> requests.Response:
+        """
+        Interpret the response or the exception raised while sending the request and raise the exception the retry handlers expect if
+        the request needs to be retried
+        """
         error_resolution: ErrorResolution = self._error_handler.interpret_response(response if response is not None else exc)
 
         # Evaluation of response.text can be heavy, for example, if streaming a large response
@@ -287,6 +303,7 @@ class HttpClient:
 
         # Emit stream status RUNNING with the reason RATE_LIMITED to log that the rate limit has been reached
         if error_resolution.response_action == ResponseAction.RATE_LIMITED:
+            rate_limited_responses_counter.increment()
             # TODO: Update to handle with message repository when concurrent message repository is ready
             reasons = [AirbyteStreamStatusReason(type=AirbyteStreamStatusReasonType.RATE_LIMITED)]
             message = orjson.dumps(
@@ -2,10 +2,12 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import asyncio
 import logging
 import sys
+import threading
 import time
-from typing import Any, Callable, Mapping, Optional
+from typing import Any, Awaitable, Callable, Mapping, Optional
 
 import backoff
 from requests import PreparedRequest, RequestException, Response, codes, exceptions
@@ -24,6 +26,29 @@ logger = logging.getLogger("airbyte")
 
 
 SendRequestCallableType = Callable[[PreparedRequest, Mapping[str, Any]], Response]
+AsyncSendRequestCallableType = Callable[[PreparedRequest, Mapping[str, Any]], Awaitable[Response]]
+
+
+class RateLimitedResponsesCounter:
+    """
+    Thread-safe count of the responses that were rate limited since the start of the process. Consumers are expected to keep track of the
+    last value they have seen in order to compute the number of new rate limited responses.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._value = 0
+
+    def increment(self) -> None:
+        with self._lock:
+            self._value += 1
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+
+rate_limited_responses_counter = RateLimitedResponsesCounter()
 
 
 def default_backoff_handler(
@@ -124,6 +149,42 @@ def user_defined_backoff_handler(
     )
 
 
+def async_user_defined_backoff_handler(
+    max_tries: Optional[int], max_time: Optional[int] = None, **kwargs: Any
+) -> Callable[[AsyncSendRequestCallableType], AsyncSendRequestCallableType]:
+    """
+    Same as `user_defined_backoff_handler` for coroutines: the event loop is not blocked while waiting for the backoff to expire
+    """
+
+    async def sleep_on_ratelimit(details: Mapping[str, Any]) -> None:
+        exc = details.get("exception")
+        if isinstance(exc, UserDefinedBackoffException):
+            if exc.response:
+                logger.info(f"Status code: {exc.response.status_code!r}, Response Content: {exc.response.content!r}")
+            retry_after = exc.backoff
+            logger.info(f"Retrying. Sleeping for {retry_after} seconds")
+            await asyncio.sleep(retry_after + 1)  # extra second to cover any fractions of second
+
+    def log_give_up(details: Mapping[str, Any]) -> None:
+        exc = details.get("exception")
+        if isinstance(exc, RequestException):
+            logger.error(f"Max retry limit reached in {details['elapsed']}s. Request: {exc.request}, Response: {exc.response}")
+        else:
+            logger.error("Max retry limit reached for unknown request and response")
+
+    return backoff.on_exception(  # type: ignore # Decorator function returns a function with a different signature than the input function, so mypy can't infer the type of the returned function
+        backoff.constant,
+        UserDefinedBackoffException,
+        interval=0,  # skip waiting, we'll wait in on_backoff handler
+        on_backoff=sleep_on_ratelimit,
+        on_giveup=log_give_up,
+        jitter=None,
+        max_tries=max_tries,
+        max_time=max_time,
+        **kwargs,
+    )
+
+
 def rate_limit_default_backoff_handler(**kwargs: Any) -> Callable[[SendRequestCallableType], SendRequestCallableType]:
     def log_retry_attempt(details: Mapping[str, Any]) -> None:
         _, exc, _ = sys.exc_info()
@@ -0,0 +1,54 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from airbyte_cdk.models import AirbyteMessage
+from airbyte_cdk.models import Type as MessageType
+from orjson import orjson
+
+
+class RecordMessageSerializer:
+    """
+    Serializes record messages of a single stream without going through the generic AirbyteMessageSerializer.
+
+    The envelope surrounding the record data is computed once per stream so serializing a record only requires dumping the record data.
+    The output is byte-for-byte the same as `orjson.dumps(AirbyteMessageSerializer.dump(message))`, including the fact that top-level
+    record fields with a `None` value are omitted by the serializer.
+    """
+
+    def __init__(self, stream: str, namespace: Optional[str] = None):
+        self._prefix = b'{"type":"RECORD","record":{"stream":' + orjson.dumps(stream) + b',"data":'
+        self._suffix = (b',"namespace":' + orjson.dumps(namespace) if namespace is not None else b"") + b"}}"
+
+    def serialize(self, data: Dict[str, Any], emitted_at: int) -> bytes:
+        for value in data.values():
+            if value is None:
+                data = {key: value for key, value in data.items() if value is not None}
+                break
+        return b'%b%b,"emitted_at":%d%b' % (self._prefix, orjson.dumps(data), emitted_at, self._suffix)
+
+
+@lru_cache(maxsize=None)
+def get_record_message_serializer(stream: str, namespace: Optional[str] = None) -> RecordMessageSerializer:
+    return RecordMessageSerializer(stream, namespace)
+
+
+def serialize_record_message(message: AirbyteMessage) -> Optional[bytes]:
+    """
+    Return the serialized message if it is a record message that can be serialized using the fast path, else None. Callers are expected to
+    fallback on the generic AirbyteMessageSerializer when None is returned.
+    """
+    record = message.record
+    if record is None or message.type is not MessageType.RECORD or record.meta is not None:
+        return None
+    if type(record.data) is not dict or type(record.emitted_at) is not int:
+        return None
+
+    try:
+        return get_record_message_serializer(record.stream, record.namespace).serialize(record.data, record.emitted_at)
+    except TypeError:
+        # Let the generic path handle (or fail on) the values orjson does not support natively
+        return None
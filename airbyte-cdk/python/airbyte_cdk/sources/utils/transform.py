@@ -3,11 +3,14 @@
 #
 
 import logging
+import numbers
+from collections import OrderedDict
 from distutils.util import strtobool
 from enum import Flag, auto
-from typing import Any, Callable, Dict, Mapping, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
-from jsonschema import Draft7Validator, ValidationError, validators
+from jsonschema import Draft7Validator, RefResolutionError, RefResolver, ValidationError, validators
+from orjson import orjson
 
 json_to_python_simple = {"string": str, "number": float, "integer": int, "boolean": bool, "null": type(None)}
 json_to_python = {**json_to_python_simple, **{"object": dict, "array": list}}
@@ -15,6 +18,26 @@ python_to_json = {v: k for k, v in json_to_python.items()}
 
 logger = logging.getLogger("airbyte")
 
+# Mirrors the type checks of the validator class created by TypeTransformer which relies on the jsonschema legacy default types
+_JSON_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "array": lambda instance: isinstance(instance, list),
+    "boolean": lambda instance: isinstance(instance, bool),
+    "integer": lambda instance: isinstance(instance, int) and not isinstance(instance, bool),
+    "null": lambda instance: instance is None,
+    "number": lambda instance: isinstance(instance, numbers.Number) and not isinstance(instance, bool),
+    "object": lambda instance: isinstance(instance, dict),
+    "string": lambda instance: isinstance(instance, str),
+}
+_DEFAULT_CASTS: Dict[str, Callable[[Any], Any]] = {
+    "string": str,
+    "number": float,
+    "integer": int,
+    "boolean": lambda value: strtobool(value) == 1 if isinstance(value, str) else bool(value),
+}
+MAX_COMPILED_SCHEMAS = 128
+
+CompiledNormalizer = Callable[[Any, Tuple[Any, ...]], None]
+
 
 class TransformConfig(Flag):
     """
@@ -35,6 +58,28 @@ class TransformConfig(Flag):
     CustomSchemaNormalization = auto()
 
 
+class UnsupportedSchemaError(Exception):
+    """
+    Raised when a schema relies on features the compiled normalizer does not support. In that case, the jsonschema validator is used.
+    """
+
+
+class _CompiledSchemaNode:
+    """
+    Normalizer for one location of a schema. Nodes are created before their steps are compiled so that recursive schemas can reference
+    a node which is still being compiled.
+    """
+
+    __slots__ = ("steps",)
+
+    def __init__(self) -> None:
+        self.steps: List[CompiledNormalizer] = []
+
+    def __call__(self, instance: Any, path: Tuple[Any, ...]) -> None:
+        for step in self.steps:
+            step(instance, path)
+
+
 class TypeTransformer:
     """
     Class for transforming object before output.
@@ -42,14 +87,20 @@ class TypeTransformer:
 
     _custom_normalizer: Optional[Callable[[Any, Dict[str, Any]], Any]] = None
 
-    def __init__(self, config: TransformConfig):
+    def __init__(self, config: TransformConfig, compile_schema: bool = False):
         """
         Initialize TypeTransformer instance.
         :param config Transform config that would be applied to object
+        :param compile_schema If True, schemas are compiled once into a tree of plain python callables instead of building a jsonschema
+            validator for every record. Casting and warnings are the same as when traversing the record with the validator. Compiled
+            schemas are cached by content so schemas are expected not to be mutated once they have been used to transform a record.
         """
         if TransformConfig.NoTransform in config and config != TransformConfig.NoTransform:
             raise Exception("NoTransform option cannot be combined with other flags.")
         self._config = config
+        self._compile_schema = compile_schema
+        self._last_compiled_schema: Optional[Tuple[Mapping[str, Any], Optional[CompiledNormalizer]]] = None
+        self._compiled_schemas: "OrderedDict[bytes, Optional[CompiledNormalizer]]" = OrderedDict()
         all_validators = {
             key: self.__get_normalizer(key, orig_validator)
             for key, orig_validator in Draft7Validator.VALIDATORS.items()
@@ -180,6 +231,11 @@ class TypeTransformer:
         """
         if TransformConfig.NoTransform in self._config:
             return
+        if self._compile_schema:
+            compiled_normalizer = self._get_compiled_normalizer(schema)
+            if compiled_normalizer is not None:
+                compiled_normalizer(record, ())
+                return
         normalizer = self._normalizer(schema)
         for e in normalizer.iter_errors(record):
             """
@@ -194,3 +250,191 @@ class TypeTransformer:
         return (
             f"Failed to transform value {repr(e.instance)} of type '{instance_json_type}' to '{e.validator_value}', key path: '{key_path}'"
         )
+
+    def _get_compiled_normalizer(self, schema: Mapping[str, Any]) -> Optional[CompiledNormalizer]:
+        """
+        Return the compiled normalizer for the schema or None if the schema can't be compiled. Streams usually provide the same schema
+        object for every record but some rebuild it every time so the cache is keyed by the serialized schema.
+        """
+        last_compiled_schema = self._last_compiled_schema
+        if last_compiled_schema is not None and last_compiled_schema[0] is schema:
+            return last_compiled_schema[1]
+
+        try:
+            key = orjson.dumps(schema)
+        except TypeError:
+            return None
+        if key in self._compiled_schemas:
+            compiled_normalizer = self._compiled_schemas[key]
+        else:
+            try:
+                compiled_normalizer = self._compile_node(schema, RefResolver.from_schema(schema), {})
+            except UnsupportedSchemaError:
+                compiled_normalizer = None
+            self._compiled_schemas[key] = compiled_normalizer
+            while len(self._compiled_schemas) > MAX_COMPILED_SCHEMAS:
+                self._compiled_schemas.popitem(last=False)
+        self._last_compiled_schema = (schema, compiled_normalizer)
+        return compiled_normalizer
+
+    def _compile_node(self, schema: Any, resolver: RefResolver, compiled_nodes: Dict[int, _CompiledSchemaNode]) -> _CompiledSchemaNode:
+        """
+        Compile the schema following the same traversal as the jsonschema validator: a `$ref` replaces its sibling keywords and the
+        keywords are applied in the order they are defined in the schema.
+        """
+        if schema is True:
+            return _CompiledSchemaNode()
+        if not isinstance(schema, dict) or "$id" in schema:
+            raise UnsupportedSchemaError(f"Unsupported schema {schema}")
+        if id(schema) in compiled_nodes:
+            return compiled_nodes[id(schema)]
+
+        node = _CompiledSchemaNode()
+        compiled_nodes[id(schema)] = node
+        if "$ref" in schema:
+            node.steps.append(self._compile_node(self._resolve_reference(schema, resolver), resolver, compiled_nodes))
+            return node
+        for keyword, value in schema.items():
+            if keyword == "type":
+                node.steps.append(self._compile_type_check(value))
+            elif keyword == "properties":
+                node.steps.append(self._compile_properties(value, resolver, compiled_nodes))
+            elif keyword == "items":
+                node.steps.append(self._compile_items(value, resolver, compiled_nodes))
+        return node
+
+    @staticmethod
+    def _resolve_reference(schema: Dict[str, Any], resolver: RefResolver) -> Any:
+        reference = schema["$ref"]
+        if not isinstance(reference, str) or not reference.startswith("#"):
+            raise UnsupportedSchemaError(f"Only local references are supported but got {reference}")
+        try:
+            _, resolved = resolver.resolve(reference)
+        except RefResolutionError as exception:
+            # The validator only fails on unresolvable references if a record has a value for them
+            raise UnsupportedSchemaError(f"Unable to resolve reference {reference}") from exception
+        return resolved
+
+    def _compile_type_check(self, types: Any) -> CompiledNormalizer:
+        type_names = [types] if isinstance(types, str) else types
+        if not isinstance(type_names, list) or not all(isinstance(name, str) and name in _JSON_TYPE_CHECKS for name in type_names):
+            raise UnsupportedSchemaError(f"Unsupported type {types}")
+        type_checks = [_JSON_TYPE_CHECKS[name] for name in type_names]
+
+        def check_type(instance: Any, path: Tuple[Any, ...]) -> None:
+            for type_check in type_checks:
+                if type_check(instance):
+                    return
+            error = ValidationError(
+                f"{instance!r} is not of type {', '.join(map(repr, type_names))}",
+                validator="type",
+                path=path,
+                validator_value=types,
+                instance=instance,
+            )
+            logger.warning(self.get_error_message(error))
+
+        return check_type
+
+    def _compile_properties(
+        self, properties: Any, resolver: RefResolver, compiled_nodes: Dict[int, _CompiledSchemaNode]
+    ) -> CompiledNormalizer:
+        if not isinstance(properties, dict):
+            raise UnsupportedSchemaError(f"Unsupported properties {properties}")
+        normalizers = []
+        nodes = []
+        for key, subschema in properties.items():
+            normalizers.append((key, self._compile_value_normalizer(subschema, resolver)))
+            nodes.append((key, self._compile_node(subschema, resolver, compiled_nodes)))
+
+        def normalize_properties(instance: Any, path: Tuple[Any, ...]) -> None:
+            if not isinstance(instance, dict):
+                return
+            # Like with the validator, every property is normalized before recursing into the properties
+            for key, normalize in normalizers:
+                if key in instance:
+                    instance[key] = normalize(instance[key])
+            for key, node in nodes:
+                if key in instance:
+                    node(instance[key], path + (key,))
+
+        return normalize_properties
+
+    def _compile_items(self, items: Any, resolver: RefResolver, compiled_nodes: Dict[int, _CompiledSchemaNode]) -> CompiledNormalizer:
+        normalize = self._compile_value_normalizer(items, resolver)
+        node = self._compile_node(items, resolver, compiled_nodes)
+
+        def normalize_items(instance: Any, path: Tuple[Any, ...]) -> None:
+            if not isinstance(instance, list):
+                return
+            for index, item in enumerate(instance):
+                instance[index] = normalize(item)
+            for index, item in enumerate(instance):
+                node(item, path + (index,))
+
+        return normalize_items
+
+    def _compile_value_normalizer(self, subschema: Any, resolver: RefResolver) -> Callable[[Any], Any]:
+        """
+        Compiled equivalent of `__normalize` for a given subschema. As with the validator, only one level of reference is resolved.
+        """
+        if not isinstance(subschema, dict):
+            raise UnsupportedSchemaError(f"Unsupported schema {subschema}")
+        if "$ref" in subschema:
+            subschema = self._resolve_reference(subschema, resolver)
+            if not isinstance(subschema, dict):
+                raise UnsupportedSchemaError(f"Unsupported schema {subschema}")
+
+        convert = self._compile_default_convert(subschema) if TransformConfig.DefaultSchemaNormalization in self._config else None
+        if TransformConfig.CustomSchemaNormalization not in self._config and not self._custom_normalizer:
+            return convert or (lambda value: value)
+
+        def normalize(value: Any) -> Any:
+            if convert:
+                value = convert(value)
+            if self._custom_normalizer:
+                value = self._custom_normalizer(value, subschema)
+            return value
+
+        return normalize
+
+    def _compile_default_convert(self, subschema: Dict[str, Any]) -> Callable[[Any], Any]:
+        """
+        Compiled equivalent of `default_convert` for a given subschema: the target type is resolved once instead of for every value.
+        """
+        default_convert = self.default_convert
+        target_type = subschema.get("type", [])
+        if type(self).default_convert is not TypeTransformer.default_convert or not isinstance(target_type, (str, list)):
+            return lambda value: default_convert(value, subschema)
+
+        nullable = "null" in target_type
+        if isinstance(target_type, list):
+            target_type = [t for t in target_type if t != "null"]
+            if len(target_type) != 1:
+                return lambda value: value
+            target_type = target_type[0]
+
+        if target_type == "array":
+            try:
+                item_types = set(subschema.get("items", {}).get("type", set()))
+            except Exception:
+                # let default_convert fail the same way for every value
+                return lambda value: default_convert(value, subschema)
+            if not item_types.issubset(json_to_python_simple):
+                return lambda value: value
+            simple_types = set(json_to_python_simple.values())
+            return lambda value: None if value is None and nullable else ([value] if type(value) in simple_types else value)
+
+        cast = _DEFAULT_CASTS.get(target_type) if isinstance(target_type, str) else None
+        if cast is None:
+            return lambda value: value
+
+        def convert(value: Any) -> Any:
+            if value is None and nullable:
+                return None
+            try:
+                return cast(value)
+            except (ValueError, TypeError):
+                return value
+
+        return convert
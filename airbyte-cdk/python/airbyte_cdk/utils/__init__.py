@@ -6,5 +6,6 @@ from .is_cloud_environment import is_cloud_environment
 from .schema_inferrer import SchemaInferrer
 from .traced_exception import AirbyteTracedException
 from .print_buffer import PrintBuffer
+from .buffered_message_writer import BufferedMessageWriter
 
-__all__ = ["AirbyteTracedException", "SchemaInferrer", "is_cloud_environment", "PrintBuffer"]
+__all__ = ["AirbyteTracedException", "BufferedMessageWriter", "SchemaInferrer", "is_cloud_environment", "PrintBuffer"]
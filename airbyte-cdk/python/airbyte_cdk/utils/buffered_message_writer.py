@@ -0,0 +1,112 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+import sys
+import time
+from threading import Event, Lock, Thread
+from types import TracebackType
+from typing import IO, List, Optional, Type, Union
+
+DEFAULT_MAX_BUFFER_SIZE_IN_BYTES = 64 * 1024
+DEFAULT_FLUSH_INTERVAL_IN_SECONDS = 0.1
+
+
+class BufferedMessageWriter:
+    """
+    Thread-safe output stage batching serialized Airbyte messages before they are written to stdout.
+
+    Each message is buffered as a complete line (the message followed by a line break) so a line is never split between two writes.
+    All callers share a single buffer which means messages are written in the same order they were submitted: a state message is never
+    written before the records that were submitted before it.
+
+    The buffer is flushed when:
+    * it holds at least `max_buffer_size` bytes
+    * the oldest buffered message has been waiting for more than `flush_interval` seconds. When used as a context manager, a background
+      thread enforces this even if no new message is submitted
+    * `flush` is called explicitly or the context manager exits
+
+    Note that only messages submitted through `write` are buffered: anything printed directly to stdout (for example by the logging
+    handler) can be written before messages that are still waiting in the buffer.
+    """
+
+    def __init__(
+        self,
+        max_buffer_size: int = DEFAULT_MAX_BUFFER_SIZE_IN_BYTES,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_IN_SECONDS,
+        stream: Optional[IO[str]] = None,
+    ):
+        """
+        :param max_buffer_size: number of bytes after which the buffer is flushed
+        :param flush_interval: maximum time in seconds a message can wait in the buffer
+        :param stream: text stream to write to. If not provided, `sys.stdout` is resolved every time the buffer is flushed
+        """
+        self._max_buffer_size = max_buffer_size
+        self._flush_interval = flush_interval
+        self._stream = stream
+        self._buffer: List[bytes] = []
+        self._buffer_size = 0
+        self._oldest_message_time: Optional[float] = None
+        self._lock = Lock()
+        self._stop_event = Event()
+        self._flusher: Optional[Thread] = None
+
+    def write(self, message: Union[str, bytes]) -> None:
+        """
+        Buffer a serialized message without its trailing line break.
+        """
+        line = (message.encode() if isinstance(message, str) else message) + b"\n"
+        with self._lock:
+            now = time.monotonic()
+            if self._oldest_message_time is None:
+                self._oldest_message_time = now
+            self._buffer.append(line)
+            self._buffer_size += len(line)
+            if self._buffer_size >= self._max_buffer_size or now - self._oldest_message_time >= self._flush_interval:
+                self._flush_buffer()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_buffer()
+
+    def _flush_if_stale(self) -> None:
+        with self._lock:
+            if self._oldest_message_time is not None and time.monotonic() - self._oldest_message_time >= self._flush_interval:
+                self._flush_buffer()
+
+    def _flush_buffer(self) -> None:
+        """
+        Must be called while holding the lock
+        """
+        if not self._buffer:
+            return
+        data = b"".join(self._buffer)
+        self._buffer = []
+        self._buffer_size = 0
+        self._oldest_message_time = None
+
+        stream = self._stream or sys.stdout
+        binary_stream = getattr(stream, "buffer", None)
+        if binary_stream is not None:
+            # Anything written through the text layer (e.g. logs) needs to reach the binary layer first in order to preserve ordering
+            stream.flush()
+            binary_stream.write(data)
+            binary_stream.flush()
+        else:
+            stream.write(data.decode())
+            stream.flush()
+
+    def _run_flusher(self) -> None:
+        while not self._stop_event.wait(self._flush_interval):
+            self._flush_if_stale()
+
+    def __enter__(self) -> "BufferedMessageWriter":
+        self._stop_event.clear()
+        self._flusher = Thread(target=self._run_flusher, name="airbyte-message-writer", daemon=True)
+        self._flusher.start()
+        return self
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]], exc_val: Optional[BaseException], exc_tb: Optional[TracebackType]) -> None:
+        self._stop_event.set()
+        if self._flusher:
+            self._flusher.join()
+            self._flusher = None
+        self.flush()
@@ -2,8 +2,9 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import random
 from collections import defaultdict
-from typing import Any, Dict, List, Mapping, Optional
+from typing import Any, Dict, Hashable, List, Mapping, MutableMapping, Optional, Set
 
 from airbyte_cdk.models import AirbyteRecordMessage
 from genson import SchemaBuilder, SchemaNode
@@ -49,6 +50,37 @@ class NoRequiredSchemaBuilder(SchemaBuilder):
     EXTRA_STRATEGIES = (NoRequiredObj, IntegerToNumber)
 
 
+_SCALAR_TYPES = frozenset([str, int, float, bool, type(None)])
+
+
+class _UnknownShape(Exception):
+    pass
+
+
+def _get_shape(value: Any) -> Hashable:
+    """
+    Return a hashable signature of the structure of a JSON value: the type of every value and the keys of every object. Two values with
+    the same signature contribute exactly the same to the schema built by genson, hence only the first one needs to be added.
+
+    The items of arrays are represented as a set as genson merges them regardless of their order and number.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        types: Hashable = tuple(map(type, value.values()))
+        if not _SCALAR_TYPES.issuperset(types):  # type: ignore[arg-type]  # types is a tuple of types
+            types = tuple([_get_shape(item) for item in value.values()])
+        return dict, tuple(value), types
+    if value_type is list:
+        types = frozenset(map(type, value))
+        if not _SCALAR_TYPES.issuperset(types):
+            types = frozenset([_get_shape(item) for item in value])
+        return list, types
+    if value_type in _SCALAR_TYPES:
+        return value_type
+    # Values of other types (subclasses of dict for example) are always added to the schema builder
+    raise _UnknownShape()
+
+
 # This type is inferred from the genson lib, but there is no alias provided for it - creating it here for type safety
 InferredSchema = Dict[str, Any]
 
@@ -80,18 +112,85 @@ class SchemaInferrer:
     Instances of this class are stateful, meaning they build their inferred schemas
     from every record passed into the accumulate method.
 
+    Adding a record to a genson schema builder is expensive while most records of a stream share the same structure. The shape of each
+    record (see `_get_shape`) is therefore computed and only records with a shape that has not been seen yet are added to the builder. Up
+    to `max_shapes_per_stream` shapes are remembered per stream so that the memory used does not grow with the number of records.
+
+    If `max_records_per_stream` is set, the schema is inferred from a uniform sample of that many records per stream selected using
+    reservoir sampling instead of from every record. Fields or types that only appear in records outside of the sample are then missing
+    from the schema.
     """
 
+    DEFAULT_MAX_SHAPES_PER_STREAM = 10_000
+
     stream_to_builder: Dict[str, SchemaBuilder]
 
-    def __init__(self, pk: Optional[List[List[str]]] = None, cursor_field: Optional[List[List[str]]] = None) -> None:
+    def __init__(
+        self,
+        pk: Optional[List[List[str]]] = None,
+        cursor_field: Optional[List[List[str]]] = None,
+        max_records_per_stream: Optional[int] = None,
+        max_shapes_per_stream: int = DEFAULT_MAX_SHAPES_PER_STREAM,
+    ) -> None:
+        """
+        :param pk: The nested fields of the primary key which are marked as required
+        :param cursor_field: The nested fields of the cursor which are marked as required
+        :param max_records_per_stream: If set, the number of records per stream sampled to infer the schema
+        :param max_shapes_per_stream: The number of record shapes remembered per stream to skip records with an already seen structure
+        """
+        if max_records_per_stream is not None and max_records_per_stream < 1:
+            raise ValueError(f"Expected to sample at least one record per stream but got {max_records_per_stream}")
         self.stream_to_builder = defaultdict(NoRequiredSchemaBuilder)
         self._pk = [] if pk is None else pk
         self._cursor_field = [] if cursor_field is None else cursor_field
+        self._max_records_per_stream = max_records_per_stream
+        self._max_shapes_per_stream = max_shapes_per_stream
+        self._stream_to_shapes: MutableMapping[str, Set[Hashable]] = defaultdict(set)
+        self._stream_to_sample: MutableMapping[str, List[Mapping[str, Any]]] = defaultdict(list)
+        self._stream_to_record_count: MutableMapping[str, int] = defaultdict(int)
+        self._random = random.Random(0)
 
     def accumulate(self, record: AirbyteRecordMessage) -> None:
         """Uses the input record to add to the inferred schemas maintained by this object"""
-        self.stream_to_builder[record.stream].add_object(record.data)
+        if self._max_records_per_stream is None:
+            self._add_to_builder(record.stream, record.data)
+            return
+
+        self._stream_to_record_count[record.stream] += 1
+        record_count = self._stream_to_record_count[record.stream]
+        sample = self._stream_to_sample[record.stream]
+        if record_count <= self._max_records_per_stream:
+            sample.append(record.data)
+        else:
+            index = self._random.randrange(record_count)
+            if index < self._max_records_per_stream:
+                sample[index] = record.data
+
+    def _add_to_builder(self, stream_name: str, data: Mapping[str, Any]) -> None:
+        builder = self.stream_to_builder[stream_name]
+        try:
+            shape = _get_shape(data)
+        except _UnknownShape:
+            builder.add_object(data)
+            return
+
+        shapes = self._stream_to_shapes[stream_name]
+        if shape in shapes:
+            return
+        builder.add_object(data)
+        if len(shapes) < self._max_shapes_per_stream:
+            shapes.add(shape)
+
+    def _build_from_sample(self, stream_name: str) -> None:
+        """
+        Build the schema of the stream from the records sampled so far. The builder is rebuilt as sampled records can be replaced.
+        """
+        if stream_name not in self._stream_to_sample:
+            return
+        self.stream_to_builder.pop(stream_name, None)
+        self._stream_to_shapes.pop(stream_name, None)
+        for data in self._stream_to_sample[stream_name]:
+            self._add_to_builder(stream_name, data)
 
     def _null_type_in_any_of(self, node: InferredSchema) -> bool:
         if _ANY_OF in node:
@@ -241,6 +340,8 @@ class SchemaInferrer:
         """
         Returns the inferred JSON schema for the specified stream. Might be `None` if there were no records for the given stream name.
         """
+        if self._max_records_per_stream is not None:
+            self._build_from_sample(stream_name)
         return (
             self._add_required_properties(self._clean(self.stream_to_builder[stream_name].to_schema()))
             if stream_name in self.stream_to_builder
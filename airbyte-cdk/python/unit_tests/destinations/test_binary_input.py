@@ -0,0 +1,133 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import io
+import logging
+from typing import Iterator, List
+from unittest.mock import Mock
+
+import pytest
+from airbyte_cdk.destinations.binary_input import AirbyteRecordView, iterate_lines, parse_input_messages
+from airbyte_cdk.models import (
+    AirbyteMessage,
+    AirbyteMessageSerializer,
+    AirbyteRecordMessage,
+    AirbyteStateBlob,
+    AirbyteStateMessage,
+    AirbyteStateType,
+    AirbyteStreamState,
+    StreamDescriptor,
+    Type,
+)
+from airbyte_cdk.models.airbyte_protocol import AirbyteRecordMessageMeta
+from orjson import orjson
+
+
+def _record(stream: str, data, namespace=None, meta=None) -> AirbyteMessage:
+    return AirbyteMessage(
+        type=Type.RECORD, record=AirbyteRecordMessage(stream=stream, namespace=namespace, data=data, emitted_at=1, meta=meta)
+    )
+
+
+def _state(stream: str) -> AirbyteMessage:
+    return AirbyteMessage(
+        type=Type.STATE,
+        state=AirbyteStateMessage(
+            type=AirbyteStateType.STREAM,
+            stream=AirbyteStreamState(stream_descriptor=StreamDescriptor(name=stream), stream_state=AirbyteStateBlob(cursor=1)),
+        ),
+    )
+
+
+def _serialize(messages: List[AirbyteMessage]) -> bytes:
+    return b"".join(orjson.dumps(AirbyteMessageSerializer.dump(message)) + b"\n" for message in messages)
+
+
+_MESSAGES = [
+    _record("stream", {"id": 1, "name": "é😀"}),
+    _record("stream", {"id": 2, "nested": {"values": [1, 2]}}, namespace="namespace"),
+    _state("stream"),
+    _record("another_stream", {"id": 3}, meta=AirbyteRecordMessageMeta(changes=[])),
+]
+
+
+@pytest.mark.parametrize(
+    "content, chunk_size, expected_lines",
+    [
+        pytest.param(b"a\nbc\ndef\n", 1024, [b"a", b"bc", b"def"], id="test_lines_in_one_chunk"),
+        pytest.param(b"a\nbc\ndef\n", 2, [b"a", b"bc", b"def"], id="test_lines_across_chunks"),
+        pytest.param(b"a\nbc\ndef", 3, [b"a", b"bc", b"def"], id="test_no_trailing_newline"),
+        pytest.param(b"a\n\nb\n", 1, [b"a", b"", b"b"], id="test_empty_line"),
+        pytest.param(b"", 3, [], id="test_empty_stream"),
+    ],
+)
+def test_iterate_lines(content, chunk_size, expected_lines) -> None:
+    assert list(iterate_lines(io.BytesIO(content), chunk_size)) == expected_lines
+
+
+@pytest.mark.parametrize("chunk_size", [7, 1024])
+def test_given_messages_when_parse_input_messages_then_return_airbyte_messages(chunk_size) -> None:
+    assert list(parse_input_messages(io.BytesIO(_serialize(_MESSAGES)), Mock(), chunk_size=chunk_size)) == _MESSAGES
+
+
+def test_given_use_record_views_when_parse_input_messages_then_only_records_are_views() -> None:
+    messages = list(parse_input_messages(io.BytesIO(_serialize(_MESSAGES)), Mock(), use_record_views=True))
+
+    assert [type(message) for message in messages] == [AirbyteRecordView, AirbyteRecordView, AirbyteMessage, AirbyteRecordView]
+    assert messages[2] == _MESSAGES[2]
+    for view, expected_message in zip([messages[0], messages[1], messages[3]], [_MESSAGES[0], _MESSAGES[1], _MESSAGES[3]]):
+        assert view.type == Type.RECORD
+        assert view.record.stream == expected_message.record.stream
+        assert view.record.namespace == expected_message.record.namespace
+        assert view.record.data == expected_message.record.data
+        assert view.record.emitted_at == expected_message.record.emitted_at
+        assert view.record.meta == expected_message.record.meta
+        assert view.to_airbyte_message() == expected_message
+
+
+def test_given_malformed_line_when_parse_input_messages_then_log_and_ignore_line() -> None:
+    logger = Mock(spec=logging.Logger)
+    content = _serialize(_MESSAGES[:1]) + b"not a message\n\n" + _serialize(_MESSAGES[1:2])
+
+    messages = list(parse_input_messages(io.BytesIO(content), logger))
+
+    assert messages == _MESSAGES[:2]
+    logger.info.assert_called_once_with("ignoring input which can't be deserialized as Airbyte Message: not a message")
+
+
+@pytest.mark.slow
+def test_parse_input_messages_benchmark() -> None:
+    """
+    Compares parsing the input as text lines deserialized into AirbyteMessages with parsing the binary input into AirbyteMessages and into
+    record views. Messages are compared as they are parsed so that they are not kept in memory.
+    """
+    lines = [
+        orjson.dumps(
+            {
+                "type": "RECORD",
+                "record": {
+                    "stream": "stream",
+                    "data": {"id": i, "name": f"name {i}", "amount": i * 1.5, "tags": ["a", "b"], "nested": {"key": "value"}},
+                    "emitted_at": 1,
+                },
+            }
+        )
+        for i in range(200_000)
+    ]
+    content = b"\n".join(lines) + b"\n"
+
+    def _parse_text_lines(text_content: bytes) -> Iterator[AirbyteMessage]:
+        for line in io.TextIOWrapper(io.BytesIO(text_content), encoding="utf-8"):
+            yield AirbyteMessageSerializer.load(orjson.loads(line))
+
+    number_of_messages = 0
+    for text_message, binary_message, view in zip(
+        _parse_text_lines(content),
+        parse_input_messages(io.BytesIO(content), Mock()),
+        parse_input_messages(io.BytesIO(content), Mock(), use_record_views=True),
+    ):
+        assert binary_message == text_message
+        assert view.record.data == text_message.record.data
+        number_of_messages += 1
+    assert number_of_messages == len(lines)
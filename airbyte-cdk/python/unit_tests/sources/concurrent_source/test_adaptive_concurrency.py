@@ -0,0 +1,133 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+import logging
+from unittest import TestCase
+from unittest.mock import Mock
+
+import pytest
+from airbyte_cdk.models import AirbyteStream, SyncMode
+from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources.concurrent_source.adaptive_concurrency import AdaptiveConcurrencyController
+from airbyte_cdk.sources.concurrent_source.concurrent_source import ConcurrentSource
+from airbyte_cdk.sources.message import InMemoryMessageRepository
+from airbyte_cdk.sources.streams.concurrent.abstract_stream import AbstractStream
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.http.rate_limiting import RateLimitedResponsesCounter
+from airbyte_cdk.sources.utils.slice_logger import DebugSliceLogger
+
+_QUEUE_MAX_SIZE = 100
+
+
+class AdaptiveConcurrencyControllerTest(TestCase):
+    def setUp(self) -> None:
+        self._logger = Mock()
+        self._rate_limit_counter = RateLimitedResponsesCounter()
+        self._controller = self._create_controller(initial_readers=4)
+
+    def _create_controller(self, initial_readers: int) -> AdaptiveConcurrencyController:
+        return AdaptiveConcurrencyController(
+            1,
+            8,
+            self._logger,
+            initial_readers=initial_readers,
+            evaluation_interval_in_seconds=0,
+            rate_limit_counter=self._rate_limit_counter,
+        )
+
+    def test_given_invalid_bounds_when_create_then_raise(self):
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyController(2, 1, self._logger)
+
+    def test_given_rate_limited_responses_when_maybe_adjust_then_halve_limit(self):
+        self._rate_limit_counter.increment()
+
+        self._controller.maybe_adjust(0, _QUEUE_MAX_SIZE)
+
+        assert self._controller.limit == 2
+        self._logger.info.assert_called_once()
+
+    def test_given_rate_limited_responses_already_seen_when_maybe_adjust_then_do_not_decrease_again(self):
+        self._rate_limit_counter.increment()
+        self._controller.maybe_adjust(0, _QUEUE_MAX_SIZE)
+
+        self._controller.maybe_adjust(0, _QUEUE_MAX_SIZE)
+
+        assert self._controller.limit == 2
+
+    def test_given_queue_almost_full_when_maybe_adjust_then_decrease_limit(self):
+        self._controller.maybe_adjust(90, _QUEUE_MAX_SIZE)
+        assert self._controller.limit == 3
+
+    def test_given_limit_at_minimum_when_maybe_adjust_then_limit_is_not_decreased(self):
+        controller = self._create_controller(initial_readers=1)
+        self._rate_limit_counter.increment()
+
+        controller.maybe_adjust(0, _QUEUE_MAX_SIZE)
+
+        assert controller.limit == 1
+        self._logger.info.assert_not_called()
+
+    def test_given_readers_waiting_and_consumer_busy_when_maybe_adjust_then_keep_limit(self):
+        self._controller.on_item_consumed(waiting_time_in_seconds=0.01, handling_time_in_seconds=1)
+
+        self._controller.maybe_adjust(0, _QUEUE_MAX_SIZE, waiting_readers=1)
+
+        assert self._controller.limit == 4
+
+    def test_given_readers_waiting_when_maybe_adjust_then_increase_limit(self):
+        self._controller.on_item_consumed(waiting_time_in_seconds=1, handling_time_in_seconds=0.01)
+
+        self._controller.maybe_adjust(0, _QUEUE_MAX_SIZE, waiting_readers=1)
+
+        assert self._controller.limit == 5
+
+    def test_given_no_reader_waiting_when_maybe_adjust_then_keep_limit(self):
+        self._controller.maybe_adjust(0, _QUEUE_MAX_SIZE)
+        assert self._controller.limit == 4
+
+    def test_given_evaluation_interval_not_elapsed_when_maybe_adjust_then_keep_limit(self):
+        controller = AdaptiveConcurrencyController(1, 8, self._logger, initial_readers=4, rate_limit_counter=self._rate_limit_counter)
+        self._rate_limit_counter.increment()
+
+        controller.maybe_adjust(0, _QUEUE_MAX_SIZE)
+
+        assert controller.limit == 4
+
+    def test_given_limit_reached_when_try_acquire_reading_slot_then_refuse_until_slot_is_released(self):
+        controller = self._create_controller(initial_readers=1)
+        assert controller.try_acquire_reading_slot()
+
+        assert not controller.try_acquire_reading_slot()
+        controller.release_reading_slot()
+        assert controller.try_acquire_reading_slot()
+
+    def test_given_limit_increased_when_try_acquire_reading_slot_then_grant_slot(self):
+        controller = self._create_controller(initial_readers=1)
+        assert controller.try_acquire_reading_slot()
+
+        controller.maybe_adjust(0, _QUEUE_MAX_SIZE, waiting_readers=1)
+
+        assert controller.limit == 2
+        assert controller.try_acquire_reading_slot()
+
+def test_given_adaptive_concurrency_when_read_then_read_all_partitions():
+    partitions = []
+    for partition_index in range(10):
+        partition = Mock(spec=Partition)
+        partition.stream_name.return_value = "stream"
+        partition.read.return_value = [Record({"id": f"{partition_index}-{i}"}, partition) for i in range(5)]
+        partitions.append(partition)
+    stream = Mock(spec=AbstractStream)
+    stream.name = "stream"
+    stream.generate_partitions.return_value = iter(partitions)
+    stream.as_airbyte_stream.return_value = AirbyteStream(name="stream", json_schema={}, supported_sync_modes=[SyncMode.full_refresh])
+
+    source = ConcurrentSource.create(
+        4, 1, logging.getLogger("airbyte"), DebugSliceLogger(), InMemoryMessageRepository(), adaptive_concurrency=True
+    )
+    messages = list(source.read([stream]))
+
+    assert len([message for message in messages if message.type == MessageType.RECORD]) == 50
+    assert source._concurrency_controller._active_readers == 0
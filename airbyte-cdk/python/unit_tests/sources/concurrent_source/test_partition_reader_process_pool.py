@@ -0,0 +1,170 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+import datetime
+import logging
+import multiprocessing
+import os
+import threading
+from decimal import Decimal
+from typing import Any, Iterable, Mapping, Optional
+from unittest import TestCase
+from unittest.mock import Mock
+
+import pytest
+from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, AirbyteStream, Level, SyncMode
+from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources.concurrent_source.concurrent_source import ConcurrentSource
+from airbyte_cdk.sources.concurrent_source.partition_reader_process_pool import PartitionReaderProcessPool
+from airbyte_cdk.sources.message import InMemoryMessageRepository, MessageRepository
+from airbyte_cdk.sources.streams.concurrent.abstract_stream import AbstractStream
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.http.requests_native_auth import SingleUseRefreshTokenOauth2Authenticator
+from airbyte_cdk.sources.utils.slice_logger import DebugSliceLogger
+
+_STREAM_NAME = "stream"
+
+
+class _InMemoryPartition(Partition):
+    def __init__(self, number_of_records: int, exception: Optional[Exception] = None) -> None:
+        self._number_of_records = number_of_records
+        self._exception = exception
+
+    def read(self) -> Iterable[Record]:
+        for i in range(self._number_of_records):
+            yield Record({"id": i, "pid": os.getpid()}, self)
+        if self._exception:
+            raise self._exception
+
+    def to_slice(self) -> Optional[Mapping[str, Any]]:
+        return None
+
+    def stream_name(self) -> str:
+        return _STREAM_NAME
+
+    def close(self) -> None:
+        pass
+
+    def is_closed(self) -> bool:
+        return False
+
+    def __hash__(self) -> int:
+        return id(self)
+
+
+class _MessagePartition(_InMemoryPartition):
+    def __init__(self, message_repository: MessageRepository) -> None:
+        super().__init__(2)
+        self._message_repository = message_repository
+
+    def read(self) -> Iterable[Record]:
+        yield Record({"id": 0}, self)
+        self._message_repository.emit_message(
+            AirbyteMessage(type=MessageType.LOG, log=AirbyteLogMessage(level=Level.INFO, message="emitted in worker"))
+        )
+        self._message_repository.log_message(Level.INFO, lambda: {"message": "logged in worker"})
+        logging.getLogger("airbyte").warning("logged using the logger in worker")
+        yield Record({"id": 1}, self)
+
+
+class _ValuesPartition(_InMemoryPartition):
+    def read(self) -> Iterable[Record]:
+        yield Record({"decimal": Decimal("1.10"), "datetime": datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)}, self)
+
+
+class _SingleUseRefreshTokenPartition(_InMemoryPartition):
+    def __init__(self) -> None:
+        super().__init__(1)
+        self._authenticator = SingleUseRefreshTokenOauth2Authenticator(
+            {"credentials": {"client_id": "id", "client_secret": "secret", "refresh_token": "token"}}, "https://refresh.com"
+        )
+
+
+class _NonSerializablePartition(_InMemoryPartition):
+    def __init__(self, number_of_records: int) -> None:
+        super().__init__(number_of_records)
+        self._lock = threading.Lock()
+
+
+class PartitionReaderProcessPoolTest(TestCase):
+    def setUp(self) -> None:
+        self._logger = Mock()
+        self._process_pool = PartitionReaderProcessPool(1, self._logger, batch_size=3, mp_context=multiprocessing.get_context("fork"))
+
+    def tearDown(self) -> None:
+        self._process_pool.shutdown()
+
+    def test_given_invalid_number_of_processes_when_create_then_raise(self):
+        with pytest.raises(ValueError):
+            PartitionReaderProcessPool(0, self._logger)
+
+    def test_given_serializable_partition_when_read_then_records_are_read_in_worker_process(self):
+        partition = _InMemoryPartition(10)
+
+        records = list(self._process_pool.read(partition))
+
+        assert [record.data["id"] for record in records] == list(range(10))
+        assert all(record.partition is partition for record in records)
+        assert all(record.data["pid"] != os.getpid() for record in records)
+
+    def test_given_exception_in_worker_process_when_read_then_raise_after_records(self):
+        records = []
+        with pytest.raises(ValueError):
+            for record in self._process_pool.read(_InMemoryPartition(5, ValueError("error"))):
+                records.append(record)
+
+        assert [record.data["id"] for record in records] == [0, 1, 2]
+
+    def test_given_messages_emitted_in_worker_process_when_read_then_forward_messages_in_order(self):
+        message_repository = InMemoryMessageRepository()
+        partition = _MessagePartition(message_repository)
+        # The worker process is forked before the logs are captured as capturing the logs stops their propagation to the root logger
+        list(self._process_pool.read(_InMemoryPartition(1)))
+
+        with self.assertLogs("airbyte", level=logging.WARNING) as logs:
+            records = []
+            for record in self._process_pool.read(partition):
+                records.append(record)
+                if record.data["id"] == 0:
+                    assert list(message_repository.consume_queue()) == []
+
+        assert [message.log.message for message in message_repository.consume_queue()] == [
+            "emitted in worker",
+            '{"message": "logged in worker"}',
+        ]
+        assert [record.data["id"] for record in records] == [0, 1]
+        assert logs.output == ["WARNING:airbyte:logged using the logger in worker"]
+
+    def test_given_values_which_are_not_json_native_when_read_then_values_are_the_same_as_when_read_in_a_thread(self):
+        partition = _ValuesPartition(1)
+
+        records = list(self._process_pool.read(partition))
+
+        assert [record.data for record in records] == [record.data for record in partition.read()]
+
+    def test_given_single_use_refresh_token_authenticator_when_read_then_return_none(self):
+        assert self._process_pool.read(_SingleUseRefreshTokenPartition()) is None
+        self._logger.info.assert_called_once()
+
+    def test_given_non_serializable_partition_when_read_then_return_none(self):
+        assert self._process_pool.read(_NonSerializablePartition(1)) is None
+        assert self._process_pool.read(_NonSerializablePartition(1)) is None
+        self._logger.info.assert_called_once()
+
+
+def test_given_partition_reader_processes_when_read_then_read_all_partitions_in_worker_processes():
+    partitions = [_InMemoryPartition(5) for _ in range(4)]
+    stream = Mock(spec=AbstractStream)
+    stream.name = _STREAM_NAME
+    stream.generate_partitions.return_value = iter(partitions)
+    stream.as_airbyte_stream.return_value = AirbyteStream(name=_STREAM_NAME, json_schema={}, supported_sync_modes=[SyncMode.full_refresh])
+
+    source = ConcurrentSource.create(
+        2, 1, logging.getLogger("airbyte"), DebugSliceLogger(), InMemoryMessageRepository(), num_partition_reader_processes=2
+    )
+    records = [message.record for message in source.read([stream]) if message.type == MessageType.RECORD]
+
+    assert len(records) == 20
+    assert all(record.data["pid"] != os.getpid() for record in records)
+    assert stream.cursor.observe.call_count == 20
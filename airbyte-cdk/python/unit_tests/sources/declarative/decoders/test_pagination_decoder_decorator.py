@@ -3,7 +3,9 @@
 #
 import pytest
 import requests
+from airbyte_cdk.sources.declarative import decoders
 from airbyte_cdk.sources.declarative.decoders import JsonDecoder, PaginationDecoderDecorator
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamedArray
 
 
 class StreamingJsonDecoder(JsonDecoder):
@@ -24,3 +26,13 @@ def test_pagination_decoder_decorator(requests_mock, decoder_class, expected):
     requests_mock.register_uri("GET", "https://airbyte.io/", text=response_body)
     response = requests.get("https://airbyte.io/")
     assert next(decoder.decode(response)) == expected
+
+
+def test_given_streaming_json_decoder_when_decode_then_return_response_with_streamed_records(requests_mock):
+    streaming_json_decoder = decoders.StreamingJsonDecoder(field_path=["data"], parameters={})
+    decoder = PaginationDecoderDecorator(decoder=streaming_json_decoder)
+    requests_mock.register_uri("GET", "https://airbyte.io/", text='{"data": [{"id": 1}, {"id": 2}], "next_page": "page_2"}')
+    response = requests.get("https://airbyte.io/", stream=True)
+
+    assert list(streaming_json_decoder.decode(response)) == [{"id": 1}, {"id": 2}]
+    assert next(decoder.decode(response)) == {"data": StreamedArray(2, {"id": 1}, {"id": 2}), "next_page": "page_2"}
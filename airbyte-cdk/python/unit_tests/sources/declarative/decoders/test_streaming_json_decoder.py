@@ -0,0 +1,184 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+import io
+import json
+import tracemalloc
+from typing import Any, List, Optional
+
+import pytest
+import requests
+from airbyte_cdk.sources.declarative.decoders import JsonDecoder, PaginationDecoderDecorator, StreamingJsonDecoder
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamedArray
+from airbyte_cdk.sources.declarative.extractors import DpathExtractor
+from airbyte_cdk.sources.declarative.requesters.paginators import DefaultPaginator
+from airbyte_cdk.sources.declarative.requesters.paginators.strategies import CursorPaginationStrategy
+from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
+
+_RECORDS = [{"id": 1, "name": "é😀", "nested": {"list": [1.5, -2e10, None, True]}}, {"id": 2, "name": "with \"quotes\" and \\ escapes"}]
+_STREAMED_RECORDS = StreamedArray(len(_RECORDS), _RECORDS[0], _RECORDS[-1])
+
+
+def _response(body: str, encoding: Optional[str] = "utf-8") -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(body.encode("utf-8"))
+    response.encoding = encoding
+    return response
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64 * 1024])
+@pytest.mark.parametrize(
+    "body, field_path, expected_records, expected_remainder",
+    [
+        pytest.param(
+            {"data": _RECORDS, "next_page": "page_2", "count": 12345},
+            ["data"],
+            _RECORDS,
+            {"data": _STREAMED_RECORDS, "next_page": "page_2", "count": 12345},
+            id="test_records_under_a_field",
+        ),
+        pytest.param(
+            {"meta": {"next": 2}, "response": {"data": {"records": _RECORDS}}},
+            ["response", "data", "records"],
+            _RECORDS,
+            {"meta": {"next": 2}, "response": {"data": {"records": _STREAMED_RECORDS}}},
+            id="test_records_under_nested_fields",
+        ),
+        pytest.param(_RECORDS, [], _RECORDS, _STREAMED_RECORDS, id="test_top_level_array"),
+        pytest.param({"data": _RECORDS[0]}, ["data"], [_RECORDS[0]], {"data": _RECORDS[0]}, id="test_object_at_field_path"),
+        pytest.param({"data": []}, ["data"], [], {"data": []}, id="test_empty_array"),
+        pytest.param({"other": _RECORDS}, ["data"], [], {"other": _RECORDS}, id="test_missing_field_path"),
+        pytest.param({"data": "not an object"}, ["data", "records"], [], {"data": "not an object"}, id="test_field_path_on_scalar"),
+        pytest.param(
+            {"data": [{"records": []}, {"records": _RECORDS}]},
+            ["data", "1", "records"],
+            _RECORDS,
+            {"data": [{"records": []}, {"records": _STREAMED_RECORDS}]},
+            id="test_index_in_field_path",
+        ),
+    ],
+)
+def test_streaming_json_decoder(body: Any, field_path: List[str], expected_records, expected_remainder, chunk_size: int):
+    decoder = StreamingJsonDecoder(field_path=field_path, chunk_size=chunk_size, parameters={})
+    response = _response(json.dumps(body, ensure_ascii=False, indent=2))
+
+    assert list(decoder.decode(response)) == expected_records
+    assert decoder.decode_remainder(response) == expected_remainder
+
+
+def test_given_extractor_and_paginator_when_read_page_then_records_are_streamed_and_token_is_read_from_remainder():
+    decoder = StreamingJsonDecoder(field_path=["data"], parameters={})
+    extractor = DpathExtractor(field_path=[], config={}, decoder=decoder, parameters={})
+    pagination_strategy = CursorPaginationStrategy(
+        cursor_value="{{ response['next_page'] }}", config={}, decoder=PaginationDecoderDecorator(decoder), parameters={}
+    )
+    response = _response(json.dumps({"data": _RECORDS, "next_page": "page_2"}))
+
+    records = list(extractor.extract_records(response))
+
+    assert records == _RECORDS
+    assert pagination_strategy.next_page_token(response, len(records), records[-1]) == "page_2"
+
+
+def test_given_response_not_decoded_when_decode_remainder_then_consume_response():
+    decoder = StreamingJsonDecoder(field_path=["data"], parameters={})
+    response = _response(json.dumps({"data": _RECORDS, "next_page": "page_2"}))
+    assert decoder.decode_remainder(response) == {"data": _STREAMED_RECORDS, "next_page": "page_2"}
+
+
+@pytest.mark.parametrize(
+    "stop_condition, body, expected_next_page_token",
+    [
+        pytest.param("{{ not response.data }}", {"data": _RECORDS}, {"next_page_token": 2}, id="test_not_empty"),
+        pytest.param("{{ not response.data }}", {"data": []}, None, id="test_empty"),
+        pytest.param("{{ response.data | length < 2 }}", {"data": _RECORDS}, {"next_page_token": 2}, id="test_full_page"),
+        pytest.param("{{ response.data | length < 3 }}", {"data": _RECORDS}, None, id="test_partial_page"),
+    ],
+)
+def test_given_stop_condition_on_streamed_records_when_next_page_token_then_evaluate_on_streamed_array(
+    stop_condition, body, expected_next_page_token
+):
+    decoder = StreamingJsonDecoder(field_path=["data"], parameters={})
+    paginator = DefaultPaginator(
+        pagination_strategy=CursorPaginationStrategy(
+            cursor_value="{{ response.data[-1].id }}",
+            stop_condition=stop_condition,
+            config={},
+            decoder=PaginationDecoderDecorator(decoder),
+            parameters={},
+        ),
+        page_token_option=RequestOption(inject_into=RequestOptionType.request_parameter, field_name="since_id", parameters={}),
+        url_base="https://api.example.com",
+        config={},
+        parameters={},
+    )
+    response = _response(json.dumps(body))
+    records = list(decoder.decode(response))
+
+    assert paginator.next_page_token(response, len(records), records[-1] if records else None) == expected_next_page_token
+
+
+def test_given_streamed_array_when_access_item_which_is_not_kept_then_raise():
+    streamed_array = StreamedArray(3, {"id": 1}, {"id": 3})
+
+    assert len(streamed_array) == 3
+    assert streamed_array[0] == streamed_array[-3] == {"id": 1}
+    assert streamed_array[2] == streamed_array[-1] == {"id": 3}
+    with pytest.raises(ValueError):
+        streamed_array[1]
+    with pytest.raises(ValueError):
+        list(streamed_array)
+    with pytest.raises(IndexError):
+        streamed_array[3]
+
+
+def test_given_no_encoding_when_decode_then_decode_as_utf8():
+    decoder = StreamingJsonDecoder(field_path=["data"], chunk_size=1, parameters={})
+    assert list(decoder.decode(_response(json.dumps({"data": _RECORDS}, ensure_ascii=False), encoding=None))) == _RECORDS
+
+
+@pytest.mark.parametrize("body", ["", "not json", '{"data": "unterminated'])
+def test_given_invalid_body_before_records_when_decode_then_return_no_records(body):
+    decoder = StreamingJsonDecoder(field_path=["data"], parameters={})
+    response = _response(body)
+
+    assert list(decoder.decode(response)) == []
+    assert decoder.decode_remainder(response) == {}
+
+
+@pytest.mark.parametrize("body", ['{"data": [{"id": 1}, {"id": 2', '{"data": [{"id": 1}, {"id": 2}]} trailing data'])
+def test_given_invalid_body_after_records_when_decode_then_raise(body):
+    decoder = StreamingJsonDecoder(field_path=["data"], parameters={})
+    with pytest.raises(ValueError):
+        list(decoder.decode(_response(body)))
+
+
+@pytest.mark.slow
+def test_streaming_json_decoder_memory_usage():
+    body = json.dumps({"data": [{"id": i, "name": f"name {i}", "tags": ["a", "b"]} for i in range(300_000)], "next_page": "page_2"})
+
+    # The responses are created before tracing the memory as they hold the whole body
+    json_decoder_response = _response(body)
+    streaming_json_decoder_response = _response(body)
+    decoder = StreamingJsonDecoder(field_path=["data"], parameters={})
+
+    tracemalloc.start()
+    number_of_records = sum(1 for _ in JsonDecoder(parameters={}).decode(json_decoder_response))
+    # JsonDecoder keeps the content of the response in memory so it is not accounted for in the StreamingJsonDecoder peak
+    memory_before_streaming, json_decoder_peak = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    streamed_number_of_records = sum(1 for _ in decoder.decode(streaming_json_decoder_response))
+    _, streaming_json_decoder_peak = tracemalloc.get_traced_memory()
+    streaming_json_decoder_peak -= memory_before_streaming
+    tracemalloc.stop()
+
+    assert number_of_records == 1
+    assert streamed_number_of_records == 300_000
+    assert decoder.decode_remainder(streaming_json_decoder_response) == {
+        "data": StreamedArray(
+            300_000, {"id": 0, "name": "name 0", "tags": ["a", "b"]}, {"id": 299_999, "name": "name 299999", "tags": ["a", "b"]}
+        ),
+        "next_page": "page_2",
+    }
+    assert streaming_json_decoder_peak < json_decoder_peak / 10
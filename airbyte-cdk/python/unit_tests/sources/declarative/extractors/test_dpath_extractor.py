@@ -3,8 +3,11 @@
 #
 import io
 import json
-from typing import Dict, List, Union
+import timeit
+from typing import Any, Dict, List, Union
+from unittest.mock import Mock
 
+import dpath
 import pytest
 import requests
 from airbyte_cdk import Decoder
@@ -94,3 +97,99 @@ def test_dpath_extractor(field_path: List, decoder: Decoder, body, expected_reco
     actual_records = list(extractor.extract_records(response))
 
     assert actual_records == expected_records
+
+
+def _extract_records_using_dpath(body: Any, path: List[Any]) -> List[Any]:
+    if "*" in path:
+        extracted = dpath.values(body, path)
+    else:
+        extracted = dpath.get(body, path, default=[])
+    if isinstance(extracted, list):
+        return extracted
+    return [extracted] if extracted else []
+
+
+def _create_decoder(body: Any) -> Decoder:
+    decoder = Mock(spec=Decoder)
+    decoder.decode.side_effect = lambda response: iter([body])
+    return decoder
+
+
+_BODY = {
+    "data": [{"id": 1, "items": [{"id": "1-1"}]}, {"id": 2, "items": [{"id": "2-1"}, {"id": "2-2"}]}],
+    "object": {"b": {"id": "b", "items": [{"id": "b-1"}]}, "a": {"id": "a"}},
+    "0": {"id": "key 0"},
+    "": {"id": "empty key"},
+    "string": "a string",
+    "empty": {},
+    "null": None,
+}
+
+
+@pytest.mark.parametrize(
+    "field_path",
+    [
+        pytest.param(["data"], id="test_array"),
+        pytest.param(["data", "1"], id="test_index"),
+        pytest.param(["data", "-1"], id="test_negative_index"),
+        pytest.param(["data", "2"], id="test_index_out_of_range"),
+        pytest.param(["data", "first"], id="test_key_on_array"),
+        pytest.param(["0"], id="test_numeric_key"),
+        pytest.param(["{{ 0 }}"], id="test_integer_segment_on_object"),
+        pytest.param(["data", "{{ 0 }}"], id="test_integer_segment_on_array"),
+        pytest.param([""], id="test_empty_key"),
+        pytest.param(["string", "0"], id="test_index_on_string"),
+        pytest.param(["empty"], id="test_empty_object"),
+        pytest.param(["null"], id="test_null"),
+        pytest.param(["missing", "path"], id="test_missing_path"),
+        pytest.param(["data", "*", "items"], id="test_wildcard_on_array"),
+        pytest.param(["data", "*", "items", "*"], id="test_multiple_wildcards"),
+        pytest.param(["object", "*"], id="test_wildcard_on_object"),
+        pytest.param(["object", "*", "items", "0"], id="test_wildcard_with_missing_children"),
+        pytest.param(["string", "*"], id="test_wildcard_on_string"),
+        pytest.param(["*"], id="test_wildcard_on_root"),
+        pytest.param(["dat?"], id="test_glob_pattern_falls_back_on_dpath"),
+        pytest.param(["data", "*", "item[s]"], id="test_glob_pattern_with_wildcard_falls_back_on_dpath"),
+        pytest.param(["**", "items", "1", "id"], id="test_double_star_falls_back_on_dpath"),
+    ],
+)
+def test_given_field_path_when_extract_records_then_records_are_the_same_as_dpath(field_path: List[str]):
+    extractor = DpathExtractor(field_path=field_path, config=config, decoder=_create_decoder(_BODY), parameters=parameters)
+    evaluated_path = [path.eval(config) for path in extractor._field_path]
+
+    assert list(extractor.extract_records(requests.Response())) == _extract_records_using_dpath(_BODY, evaluated_path)
+
+
+def test_given_interpolated_field_path_when_extract_records_multiple_times_then_path_is_evaluated_once():
+    extractor = DpathExtractor(field_path=["{{ config['field'] }}"], config=config, decoder=decoder_json, parameters=parameters)
+    interpolated_path = Mock(wraps=extractor._field_path[0])
+    extractor._field_path = [interpolated_path]
+
+    for _ in range(3):
+        assert list(extractor.extract_records(create_response({"record_array": [{"id": 1}]}))) == [{"id": 1}]
+
+    interpolated_path.eval.assert_called_once_with(config)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "field_path, body",
+    [
+        pytest.param(["data", "records"], {"data": {"records": [{"id": i, "nested": {"key": "value"}} for i in range(20_000)]}}, id="path"),
+        pytest.param(
+            ["data", "*", "records"], {"data": [{"records": {"id": i, "nested": {"key": "value"}}} for i in range(20_000)]}, id="wildcard"
+        ),
+    ],
+)
+def test_dpath_extractor_benchmark(field_path: List[str], body: Any):
+    """
+    Compares extracting the records from an already decoded body using dpath with the compiled path. The best of a few runs is compared
+    and the compiled path, measured more than 15 times faster, only has to be 5 times faster so that noise does not fail the test.
+    """
+    extractor = DpathExtractor(field_path=field_path, config=config, decoder=_create_decoder(body), parameters=parameters)
+
+    dpath_duration = min(timeit.repeat(lambda: _extract_records_using_dpath(body, field_path), number=1, repeat=3))
+    compiled_path_duration = min(timeit.repeat(lambda: list(extractor.extract_records(requests.Response())), number=1, repeat=3))
+
+    assert list(extractor.extract_records(requests.Response())) == _extract_records_using_dpath(body, field_path)
+    assert compiled_path_duration < dpath_duration / 5
@@ -3,7 +3,7 @@
 #
 
 from collections import OrderedDict
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from airbyte_cdk.sources.declarative.incremental.declarative_cursor import DeclarativeCursor
@@ -551,3 +551,146 @@ def test_per_partition_state_when_set_initial_global_state(mocked_cursor_factory
         },
     ]
     assert cursor.get_stream_state()["states"] == expected_state
+
+
+def _cursor_with_partition_states(mocked_cursor_factory, mocked_partition_router, cursor_states, **kwargs) -> PerPartitionCursor:
+    mocked_partition_router.stream_slices.return_value = [
+        StreamSlice(partition={"partition_field": index}, cursor_slice={}) for index in range(len(cursor_states))
+    ]
+    mocked_partition_router.get_stream_state.return_value = {}
+    mocked_cursor_factory.create.side_effect = [
+        MockedCursorBuilder().with_stream_slices([{"slice": index}]).with_stream_state(cursor_state).build()
+        for index, cursor_state in enumerate(cursor_states)
+    ]
+    cursor = PerPartitionCursor(mocked_cursor_factory, mocked_partition_router, **kwargs)
+    list(cursor.stream_slices())
+    return cursor
+
+
+def test_given_compact_state_when_get_stream_state_then_list_partitions_having_global_state_without_cursor(
+    mocked_cursor_factory, mocked_partition_router
+):
+    cursor = _cursor_with_partition_states(
+        mocked_cursor_factory,
+        mocked_partition_router,
+        [{"updated_at": 1}, {"updated_at": 2}, {"updated_at": 2}, {}],
+        use_compact_state=True,
+    )
+
+    assert cursor.get_stream_state() == {
+        "state": {"updated_at": 2},
+        "states": [
+            {"partition": {"partition_field": 0}, "cursor": {"updated_at": 1}},
+            {"partition": {"partition_field": 1}},
+            {"partition": {"partition_field": 2}},
+        ],
+    }
+
+
+def test_given_compact_state_when_set_initial_state_then_only_partitions_listed_without_cursor_start_from_global_state(
+    mocked_cursor_factory, mocked_partition_router
+):
+    mocked_partition_router.stream_slices.return_value = [
+        StreamSlice(partition={"partition_field": 0}, cursor_slice={}),
+        StreamSlice(partition={"partition_field": 1}, cursor_slice={}),
+        StreamSlice(partition={"partition_field": 2}, cursor_slice={}),
+    ]
+    cursor = PerPartitionCursor(mocked_cursor_factory, mocked_partition_router)
+
+    cursor.set_initial_state(
+        {
+            "state": {"updated_at": 2},
+            "states": [{"partition": {"partition_field": 0}, "cursor": {"updated_at": 1}}, {"partition": {"partition_field": 1}}],
+        }
+    )
+    list(cursor.stream_slices())
+
+    assert [call.args[0] for call in mocked_cursor_factory.create.return_value.set_initial_state.call_args_list] == [
+        {"updated_at": 1},
+        {"updated_at": 2},
+        {},
+    ]
+
+
+def test_given_compact_state_emitted_before_partition_is_read_when_resume_then_partition_starts_from_the_beginning(
+    mocked_cursor_factory, mocked_partition_router
+):
+    # Partitions 0 and 1 are read but the sync fails before partition 2 is read
+    cursor = _cursor_with_partition_states(
+        mocked_cursor_factory,
+        mocked_partition_router,
+        [{"updated_at": "2024-10-01"}, {"updated_at": "2024-10-01"}, {}],
+        use_compact_state=True,
+    )
+    checkpoint = cursor.get_stream_state()
+
+    mocked_cursor_factory.create.side_effect = None
+    resumed_cursor = PerPartitionCursor(mocked_cursor_factory, mocked_partition_router, use_compact_state=True)
+    resumed_cursor.set_initial_state(checkpoint)
+    list(resumed_cursor.stream_slices())
+
+    assert [call.args[0] for call in mocked_cursor_factory.create.return_value.set_initial_state.call_args_list] == [
+        {"updated_at": "2024-10-01"},
+        {"updated_at": "2024-10-01"},
+        {},
+    ]
+
+
+def test_when_get_stream_state_then_modifying_the_state_does_not_modify_the_cached_state(mocked_cursor_factory, mocked_partition_router):
+    cursor = _cursor_with_partition_states(mocked_cursor_factory, mocked_partition_router, [{"updated_at": 1}])
+
+    state = cursor.get_stream_state()
+    state["states"].append({"partition": {"partition_field": 1}, "cursor": {"updated_at": 2}})
+    state["states"][0]["cursor"]["updated_at"] = 3
+
+    assert cursor.get_stream_state() == {"states": [{"partition": {"partition_field": 0}, "cursor": {"updated_at": 1}}]}
+
+
+def test_given_no_slice_closed_when_get_stream_state_then_reuse_partitions_state(mocked_cursor_factory, mocked_partition_router):
+    cursor = _cursor_with_partition_states(mocked_cursor_factory, mocked_partition_router, [{"updated_at": 1}])
+    partition_cursor = cursor._cursor_per_partition['{"partition_field":0}']
+
+    cursor.get_stream_state()
+    cursor.observe(StreamSlice(partition={"partition_field": 0}, cursor_slice={"slice": 0}), Mock())
+    cursor.get_stream_state()
+    assert partition_cursor.get_stream_state.call_count == 1
+
+    cursor.close_slice(StreamSlice(partition={"partition_field": 0}, cursor_slice={"slice": 0}))
+    partition_cursor.get_stream_state.return_value = {"updated_at": 2}
+
+    assert cursor.get_stream_state()["states"] == [{"partition": {"partition_field": 0}, "cursor": {"updated_at": 2}}]
+
+
+def test_given_checkpoint_every_n_slices_when_close_slice_then_checkpoint_is_due_every_n_slices(
+    mocked_cursor_factory, mocked_partition_router
+):
+    cursor = _cursor_with_partition_states(
+        mocked_cursor_factory, mocked_partition_router, [{"updated_at": 1}] * 5, checkpoint_every_n_slices=2
+    )
+
+    checkpoints_due = []
+    for index in range(5):
+        cursor.close_slice(StreamSlice(partition={"partition_field": index}, cursor_slice={"slice": index}))
+        checkpoints_due.append(cursor.is_checkpoint_due())
+
+    assert checkpoints_due == [False, True, False, True, False]
+
+
+def test_given_checkpoint_interval_seconds_when_close_slice_then_checkpoint_is_due_once_interval_elapsed(
+    mocked_cursor_factory, mocked_partition_router
+):
+    cursor = _cursor_with_partition_states(
+        mocked_cursor_factory, mocked_partition_router, [{"updated_at": 1}] * 3, checkpoint_interval_seconds=60
+    )
+
+    with patch("airbyte_cdk.sources.declarative.incremental.per_partition_cursor.time.monotonic") as monotonic:
+        monotonic.return_value = cursor._last_checkpoint_time + 30
+        cursor.close_slice(StreamSlice(partition={"partition_field": 0}, cursor_slice={"slice": 0}))
+        assert not cursor.is_checkpoint_due()
+
+        monotonic.return_value = cursor._last_checkpoint_time + 61
+        cursor.close_slice(StreamSlice(partition={"partition_field": 1}, cursor_slice={"slice": 1}))
+        assert cursor.is_checkpoint_due()
+
+        cursor.close_slice(StreamSlice(partition={"partition_field": 2}, cursor_slice={"slice": 2}))
+        assert not cursor.is_checkpoint_due()
@@ -3,6 +3,8 @@
 #
 
 import datetime
+from collections import defaultdict
+from typing import Any, Mapping
 
 import pytest
 from airbyte_cdk import StreamSlice
@@ -289,3 +291,116 @@ def test_interpolation_private_partition_attribute():
     actual_output = JinjaInterpolation().eval(template, {}, **{"stream_slice": stream_slice})
 
     assert actual_output == expected_output
+
+
+class _JinjaInterpolationWithoutFastPath(JinjaInterpolation):
+    def compile_fast_path(self, s):
+        return None
+
+
+_FAST_PATH_PARITY_CONTEXT: Mapping[str, Any] = {
+    "record": {
+        "id": 1,
+        "name": "airbyte",
+        "none": None,
+        "float": 1.5,
+        "list": [1, 2],
+        "nested": {"key": "value", "items": "an item"},
+        "quoted": "'quoted'",
+        "empty": "",
+        "keys": "a key shadowed by dict.keys",
+        "literals": ["None", "True", "False", "rb'bytes'", "u'unicode'", "f'{x}'", "nan", "_x", " \t1", "-1", "[1]", "(1,)", "1 + 2j", "ü"],
+    },
+    "stream_slice": StreamSlice(partition={"parent_id": "123"}, cursor_slice={"start_time": "2021-01-01"}),
+    "next_page_token": {"next_page_token": "https://api.com/next?cursor=abc"},
+    "headers": defaultdict(str),
+}
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "a constant",
+        "1234",
+        "['a', 'b']",
+        "a constant with a trailing newline\n",
+        "{{ config['key'] }}",
+        "{{ config.key }}",
+        "{{ config['missing'] }}",
+        "{{ config.missing }}",
+        "{{ config['nested']['key'] }}",
+        "{{ config['nested']['missing']['key'] }}",
+        "{{ record['id'] }}",
+        "{{ record.id }}",
+        "{{ record['none'] }}",
+        "{{ record['float'] }}",
+        "{{ record['list'] }}",
+        "{{ record['list'][0] }}",
+        "{{ record['list'][5] }}",
+        "{{ record['nested'] }}",
+        "{{ record.nested.items }}",
+        "{{ record['nested']['items'] }}",
+        "{{ record.keys }}",
+        "{{ record['quoted'] }}",
+        "{{ record['empty'] }}",
+        *[f"{{{{ record['literals'][{index}] }}}}" for index in range(14)],
+        "{{ stream_slice['parent_id'] }}",
+        "{{ stream_slice.start_time }}",
+        "{{ stream_partition['parent_id'] }}",
+        "{{ stream_interval['start_time'] }}",
+        "{{ stream_slice.partition }}",
+        "{{ next_page_token['next_page_token'] }}",
+        "{{ headers['missing'] }}",
+        "https://api.com/items/{{ record['id'] }}/details?name={{ record.name }}",
+        "{{ record['id'] }}{{ record['id'] }}",
+        "{{ record['id'] + 1 }}",
+        "{{ record['name'] | upper }}",
+        "{{ now_utc().year > 2000 }}",
+        "{% if record['id'] %}{{ record['id'] }}{% endif %}",
+    ],
+)
+def test_given_template_when_eval_then_fast_path_result_matches_jinja_result(template):
+    config = {"key": "value", "nested": {"key": 1}}
+    valid_types_to_test = [None, (str,), (int,)]
+
+    for valid_types in valid_types_to_test:
+        expected = _JinjaInterpolationWithoutFastPath().eval(template, config, "default", valid_types, **_FAST_PATH_PARITY_CONTEXT)
+        actual = JinjaInterpolation().eval(template, config, "default", valid_types, **_FAST_PATH_PARITY_CONTEXT)
+        assert actual == expected
+        assert type(actual) is type(expected)
+
+
+@pytest.mark.parametrize(
+    "template, is_compiled",
+    [
+        pytest.param("a constant", True, id="test_constant"),
+        pytest.param("{{ config['x'] }}", True, id="test_config_lookup"),
+        pytest.param("{{ record.id }}", True, id="test_attribute_lookup"),
+        pytest.param("{{ config['base_url'] }}/{{ record['id'] }}", True, id="test_lookups_and_text"),
+        pytest.param("{{ record['id'] + 1 }}", False, id="test_expression"),
+        pytest.param("{{ config['x'] | string }}", False, id="test_filter"),
+        pytest.param("{{ now_utc() }}", False, id="test_macro"),
+        pytest.param("{% if config['x'] %}x{% endif %}", False, id="test_statement"),
+        pytest.param("{{ config['x'] ", False, id="test_syntax_error"),
+    ],
+)
+def test_compile_fast_path(template, is_compiled):
+    assert (JinjaInterpolation().compile_fast_path(template) is not None) == is_compiled
+
+
+def test_given_undeclared_variable_when_eval_then_raise_even_if_template_is_a_simple_lookup():
+    with pytest.raises(ValueError):
+        JinjaInterpolation().eval("{{ record['id'] }}", {})
+
+
+@pytest.mark.slow
+def test_jinja_fast_path_benchmark():
+    templates = ["{{ config['api_key'] }}", "https://api.com/{{ record['id'] }}", "{{ next_page_token['cursor'] }}", "a constant"]
+    config = {"api_key": "secret"}
+    contexts = [{"record": {"id": i}, "next_page_token": {"cursor": f"cursor_{i}"}} for i in range(20_000)]
+
+    results = {}
+    for name, interpolation_to_benchmark in [("jinja", _JinjaInterpolationWithoutFastPath()), ("fast path", JinjaInterpolation())]:
+        results[name] = [interpolation_to_benchmark.eval(template, config, **context) for context in contexts for template in templates]
+
+    assert results["fast path"] == results["jinja"]
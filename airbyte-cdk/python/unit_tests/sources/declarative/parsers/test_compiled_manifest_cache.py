@@ -0,0 +1,74 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from airbyte_cdk.sources.declarative.parsers.compiled_manifest_cache import CompiledManifestCache
+
+_A_MANIFEST = {"version": "0.29.0", "streams": [{"name": "a_stream", "$parameters": {"name": "a_stream"}}]}
+_ANOTHER_MANIFEST = {"version": "0.29.0", "streams": [{"name": "another_stream"}]}
+
+
+def test_given_manifest_set_when_get_from_another_instance_then_return_persisted_manifest(tmp_path: Path) -> None:
+    CompiledManifestCache(tmp_path).set("key", _A_MANIFEST)
+
+    assert CompiledManifestCache(tmp_path).get("key") == _A_MANIFEST
+
+
+def test_given_unknown_key_when_get_then_return_none(tmp_path: Path) -> None:
+    assert CompiledManifestCache(tmp_path).get("unknown_key") is None
+
+
+def test_given_manifest_set_twice_when_get_then_return_latest_manifest_and_leave_no_temporary_file(tmp_path: Path) -> None:
+    cache = CompiledManifestCache(tmp_path)
+    cache.set("key", _A_MANIFEST)
+    cache.set("key", _ANOTHER_MANIFEST)
+
+    assert cache.get("key") == _ANOTHER_MANIFEST
+    assert [path.name for path in tmp_path.iterdir()] == ["key.json"]
+
+
+def test_given_corrupted_artifact_when_get_then_return_none(tmp_path: Path) -> None:
+    (tmp_path / "key.json").write_bytes(b'{"version": "0.29')
+
+    assert CompiledManifestCache(tmp_path).get("key") is None
+
+
+def test_given_directory_does_not_exist_when_create_then_create_directory(tmp_path: Path) -> None:
+    CompiledManifestCache(tmp_path / "compiled" / "manifests").set("key", _A_MANIFEST)
+
+    assert (tmp_path / "compiled" / "manifests" / "key.json").exists()
+
+
+def test_given_write_fails_when_set_then_do_not_raise(tmp_path: Path) -> None:
+    cache = CompiledManifestCache(tmp_path)
+
+    with patch("os.replace", side_effect=OSError("read-only file system")):
+        cache.set("key", _A_MANIFEST)
+
+    assert cache.get("key") is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_given_same_manifest_with_different_key_order_when_get_key_then_key_is_the_same() -> None:
+    assert CompiledManifestCache.get_key({"streams": [], "version": "0.29.0"}) == CompiledManifestCache.get_key(
+        {"version": "0.29.0", "streams": []}
+    )
+
+
+def test_given_manifest_changed_when_get_key_then_key_is_different() -> None:
+    assert CompiledManifestCache.get_key(_A_MANIFEST) != CompiledManifestCache.get_key(_ANOTHER_MANIFEST)
+
+
+def test_given_cdk_version_changed_when_get_key_then_key_is_different() -> None:
+    key = CompiledManifestCache.get_key(_A_MANIFEST)
+
+    with patch("airbyte_cdk.sources.declarative.parsers.compiled_manifest_cache.metadata.version", return_value="999.0.0"):
+        assert CompiledManifestCache.get_key(_A_MANIFEST) != key
+
+
+def test_given_manifest_with_dates_when_get_key_then_return_none() -> None:
+    assert CompiledManifestCache.get_key({**_A_MANIFEST, "start_date": datetime.date(2024, 1, 1)}) is None
@@ -22,7 +22,7 @@ from airbyte_cdk.sources.declarative.checks import CheckStream
 from airbyte_cdk.sources.declarative.concurrency_level import ConcurrencyLevel
 from airbyte_cdk.sources.declarative.datetime import MinMaxDatetime
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
-from airbyte_cdk.sources.declarative.decoders import JsonDecoder, PaginationDecoderDecorator
+from airbyte_cdk.sources.declarative.decoders import JsonDecoder, PaginationDecoderDecorator, StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors import DpathExtractor, RecordFilter, RecordSelector
 from airbyte_cdk.sources.declarative.extractors.record_filter import ClientSideIncrementalRecordFilterDecorator
 from airbyte_cdk.sources.declarative.incremental import CursorFactory, DatetimeBasedCursor, PerPartitionCursor, ResumableFullRefreshCursor
@@ -43,6 +43,7 @@ from airbyte_cdk.sources.declarative.models import OAuthAuthenticator as OAuthAu
 from airbyte_cdk.sources.declarative.models import RecordSelector as RecordSelectorModel
 from airbyte_cdk.sources.declarative.models import SimpleRetriever as SimpleRetrieverModel
 from airbyte_cdk.sources.declarative.models import Spec as SpecModel
+from airbyte_cdk.sources.declarative.models import StreamingJsonDecoder as StreamingJsonDecoderModel
 from airbyte_cdk.sources.declarative.models import SubstreamPartitionRouter as SubstreamPartitionRouterModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import OffsetIncrement as OffsetIncrementModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import PageIncrement as PageIncrementModel
@@ -517,6 +518,7 @@ def test_create_substream_partition_router():
         - stream: "#/stream_B"
           parent_key: someid
           partition_field: word_id
+      max_prefetched_partitions: 10
     """
     parsed_manifest = YamlDeclarativeSource._parse(content)
     resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
@@ -527,6 +529,7 @@ def test_create_substream_partition_router():
     )
 
     assert isinstance(partition_router, SubstreamPartitionRouter)
+    assert partition_router.max_prefetched_partitions == 10
     parent_stream_configs = partition_router.parent_stream_configs
     assert len(parent_stream_configs) == 2
     assert isinstance(parent_stream_configs[0].stream, DeclarativeStream)
@@ -541,6 +544,21 @@ def test_create_substream_partition_router():
     assert partition_router.parent_stream_configs[1].partition_field.eval({}) == "word_id"
     assert partition_router.parent_stream_configs[1].request_option is None
 
+    # Parents are identified by their definition so that routers created by the same factory share the partitions of the same parents
+    assert partition_router.parent_record_cache is factory._parent_record_cache
+    other_partition_router = factory.create_component(
+        model_type=SubstreamPartitionRouterModel, component_definition=partition_router_manifest, config=input_config
+    )
+    assert [parent_stream_config.record_cache_key for parent_stream_config in other_partition_router.parent_stream_configs] == [
+        parent_stream_config.record_cache_key for parent_stream_config in parent_stream_configs
+    ]
+    assert parent_stream_configs[0].record_cache_key != parent_stream_configs[1].record_cache_key
+
+    partition_router_without_cache = ModelToComponentFactory(disable_cache=True).create_component(
+        model_type=SubstreamPartitionRouterModel, component_definition=partition_router_manifest, config=input_config
+    )
+    assert partition_router_without_cache.parent_record_cache is None
+
 
 def test_datetime_based_cursor():
     content = """
@@ -1529,6 +1547,32 @@ def test_create_default_paginator():
     assert isinstance(paginator.page_token_option, RequestPath)
 
 
+def test_create_default_paginator_with_streaming_json_decoder():
+    decoder = factory.create_component(
+        model_type=StreamingJsonDecoderModel,
+        component_definition={"type": "StreamingJsonDecoder", "field_path": ["data"]},
+        config=input_config,
+    )
+    paginator_manifest = {
+        "type": "DefaultPaginator",
+        "pagination_strategy": {"type": "CursorPagination", "cursor_value": "{{ response._metadata.next }}"},
+    }
+
+    paginator = factory.create_component(
+        model_type=DefaultPaginatorModel,
+        component_definition=paginator_manifest,
+        config=input_config,
+        url_base="https://airbyte.io",
+        decoder=decoder,
+    )
+
+    assert isinstance(decoder, StreamingJsonDecoder)
+    assert decoder.field_path == ["data"]
+    assert decoder.is_stream_response()
+    assert isinstance(paginator.pagination_strategy.decoder, PaginationDecoderDecorator)
+    assert paginator.pagination_strategy.decoder.decoder is decoder
+
+
 @pytest.mark.parametrize(
     "manifest, field_name, expected_value, expected_error",
     [
@@ -2130,6 +2174,48 @@ def test_merge_incremental_and_partition_router(incremental, partition_router, e
         assert len(stream.retriever.stream_slicer.stream_slicerS) == len(partition_router)
 
 
+@pytest.mark.parametrize(
+    "checkpoint_options, expected_use_compact_state, expected_checkpoint_every_n_slices, expected_checkpoint_interval_seconds",
+    [
+        pytest.param(
+            {"use_compact_state": True, "checkpoint_every_n_slices": 100, "checkpoint_interval_seconds": 60.5},
+            True,
+            100,
+            60.5,
+            id="test_checkpoint_options_are_set",
+        ),
+        pytest.param({}, False, None, None, id="test_checkpoint_options_default_to_emitting_the_full_state_after_each_slice"),
+    ],
+)
+def test_given_checkpoint_options_on_incremental_sync_when_create_stream_with_partition_router_then_per_partition_cursor_uses_them(
+    checkpoint_options, expected_use_compact_state, expected_checkpoint_every_n_slices, expected_checkpoint_interval_seconds
+):
+    stream_model = {
+        "type": "DeclarativeStream",
+        "incremental_sync": {
+            "type": "DatetimeBasedCursor",
+            "datetime_format": "%Y-%m-%dT%H:%M:%S.%f%z",
+            "start_datetime": "{{ config['start_time'] }}",
+            "cursor_field": "created",
+            **checkpoint_options,
+        },
+        "retriever": {
+            "type": "SimpleRetriever",
+            "record_selector": {"type": "RecordSelector", "extractor": {"type": "DpathExtractor", "field_path": []}},
+            "requester": {"type": "HttpRequester", "name": "list", "url_base": "orange.com", "path": "/v1/api"},
+            "partition_router": {"type": "ListPartitionRouter", "values": "{{config['repos']}}", "cursor_field": "a_key"},
+        },
+    }
+
+    stream = factory.create_component(model_type=DeclarativeStreamModel, component_definition=stream_model, config=input_config)
+
+    cursor = stream.retriever.stream_slicer
+    assert isinstance(cursor, PerPartitionCursor)
+    assert cursor._use_compact_state is expected_use_compact_state
+    assert cursor._checkpoint_every_n_slices == expected_checkpoint_every_n_slices
+    assert cursor._checkpoint_interval_seconds == expected_checkpoint_interval_seconds
+
+
 def test_simple_retriever_emit_log_messages():
     simple_retriever_model = {
         "type": "SimpleRetriever",
@@ -0,0 +1,114 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import datetime
+
+import pytest
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import ParentRecordCache
+
+
+def _write(cache: ParentRecordCache, key: str, partitions) -> None:
+    writer = cache.writer(key)
+    for partition_value, parent_partition in partitions:
+        writer.append(partition_value, parent_partition)
+    writer.commit()
+
+
+def test_given_partitions_committed_when_get_then_return_partitions() -> None:
+    cache = ParentRecordCache()
+    _write(cache, "key", [(1, {"slice": "first"}), ("é😀", {}), ({"nested": [1, 2]}, {"slice": "second"})])
+
+    assert list(cache.get("key")) == [(1, {"slice": "first"}), ("é😀", {}), ({"nested": [1, 2]}, {"slice": "second"})]
+
+
+def test_given_partitions_not_committed_when_get_then_return_none() -> None:
+    cache = ParentRecordCache()
+    cache.writer("key").append(1, {})
+
+    assert cache.get("key") is None
+
+
+def test_given_no_partitions_committed_when_get_then_return_empty_iterator() -> None:
+    cache = ParentRecordCache()
+    _write(cache, "key", [])
+
+    assert list(cache.get("key")) == []
+
+
+def test_given_many_keys_written_concurrently_when_get_then_return_partitions_of_each_key() -> None:
+    cache = ParentRecordCache()
+    writers = {key: cache.writer(key) for key in ["first", "second"]}
+    for i in range(50_000):
+        for key, writer in writers.items():
+            writer.append(f"{key}_{i}", {"index": i})
+    for writer in writers.values():
+        writer.commit()
+
+    for key in ["first", "second"]:
+        assert list(cache.get(key)) == [(f"{key}_{i}", {"index": i}) for i in range(50_000)]
+
+
+def test_given_cache_is_full_when_commit_then_discard_partitions() -> None:
+    cache = ParentRecordCache(max_size_bytes=100)
+    _write(cache, "small", [(1, {})])
+    _write(cache, "large", [(i, {"slice": "a slice"}) for i in range(100)])
+
+    assert list(cache.get("small")) == [(1, {})]
+    assert cache.get("large") is None
+
+
+def test_given_partition_that_is_not_json_when_commit_then_discard_partitions() -> None:
+    cache = ParentRecordCache()
+    _write(cache, "key", [(1, {}), (2, {"start": datetime.datetime(2024, 1, 1)}), (3, {})])
+
+    assert cache.get("key") is None
+
+
+def test_given_cache_closed_when_get_then_return_none() -> None:
+    cache = ParentRecordCache()
+    _write(cache, "key", [(1, {})])
+
+    cache.close()
+
+    assert cache.get("key") is None
+
+
+def test_given_cache_closed_while_reading_when_get_then_return_remaining_partitions() -> None:
+    cache = ParentRecordCache()
+    writer = cache.writer("key")
+    for i in range(50_000):
+        writer.append(i, {"index": i})
+    writer.commit()
+    partitions = cache.get("key")
+
+    first_partition = next(partitions)
+    cache.close()
+
+    assert [first_partition] + list(partitions) == [(i, {"index": i}) for i in range(50_000)]
+
+
+def test_given_cache_closed_while_writing_when_commit_then_discard_partitions() -> None:
+    cache = ParentRecordCache()
+    writer = cache.writer("key")
+    writer.append(1, {})
+
+    cache.close()
+    writer.append(2, {})
+    writer.commit()
+    _write(cache, "other_key", [(3, {})])
+
+    assert cache.get("key") is None
+    assert list(cache.get("other_key")) == [(3, {})]
+
+
+def test_given_invalid_max_size_when_create_then_raise() -> None:
+    with pytest.raises(ValueError):
+        ParentRecordCache(max_size_bytes=0)
+
+
+def test_given_directory_does_not_exist_when_commit_then_discard_partitions(tmp_path) -> None:
+    cache = ParentRecordCache(directory=str(tmp_path / "deleted"))
+    _write(cache, "key", [(1, {})])
+
+    assert cache.get("key") is None
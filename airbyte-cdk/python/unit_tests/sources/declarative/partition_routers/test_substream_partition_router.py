@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import threading
 from functools import partial
 from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
 
@@ -11,6 +12,7 @@ from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
 from airbyte_cdk.sources.declarative.incremental import ChildPartitionResumableFullRefreshCursor, ResumableFullRefreshCursor
 from airbyte_cdk.sources.declarative.incremental.per_partition_cursor import CursorFactory, PerPartitionCursor, StreamSlice
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import ParentRecordCache
 from airbyte_cdk.sources.declarative.partition_routers.substream_partition_router import ParentStreamConfig, SubstreamPartitionRouter
 from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
 from airbyte_cdk.sources.streams.checkpoint import Cursor
@@ -295,14 +297,17 @@ class MockResumableFullRefreshStream(MockStream):
         "test_dpath_extraction",
     ],
 )
-def test_substream_partition_router(parent_stream_configs, expected_slices):
+@pytest.mark.parametrize("max_prefetched_partitions", [pytest.param(0, id="sequential"), pytest.param(2, id="pipelined")])
+def test_substream_partition_router(parent_stream_configs, expected_slices, max_prefetched_partitions):
     if expected_slices is None:
         try:
             SubstreamPartitionRouter(parent_stream_configs=parent_stream_configs, parameters={}, config={})
             assert False
         except ValueError:
             return
-    partition_router = SubstreamPartitionRouter(parent_stream_configs=parent_stream_configs, parameters={}, config={})
+    partition_router = SubstreamPartitionRouter(
+        parent_stream_configs=parent_stream_configs, parameters={}, config={}, max_prefetched_partitions=max_prefetched_partitions
+    )
     slices = [s for s in partition_router.stream_slices()]
     assert slices == expected_slices
 
@@ -833,3 +838,181 @@ def test_substream_using_resumable_full_refresh_parent_stream_slices(use_increme
         assert final_state["states"] == expected_substream_state["states"], "State for substreams is not valid!"
     else:
         assert final_state == expected_substream_state, "State for substreams with incremental dependency is not valid!"
+
+
+def _incremental_parent_stream_config(records: List[Record], slices: List[StreamSlice]) -> ParentStreamConfig:
+    return ParentStreamConfig(
+        stream=MockIncrementalStream(slices=slices, records=records, name="first_stream"),
+        incremental_dependency=True,
+        parent_key="id",
+        partition_field="partition_field",
+        parameters={},
+        config={},
+    )
+
+
+def test_given_max_prefetched_partitions_when_stream_slices_then_parent_state_is_only_updated_once_parent_slice_is_yielded():
+    mock_slices = [
+        StreamSlice(cursor_slice={"start_time": "2024-04-27", "end_time": "2024-05-27"}, partition={}),
+        StreamSlice(cursor_slice={"start_time": "2024-05-27", "end_time": "2024-06-27"}, partition={}),
+    ]
+    partition_router = SubstreamPartitionRouter(
+        parent_stream_configs=[
+            _incremental_parent_stream_config(
+                [
+                    Record({"id": "may_record_0", "updated_at": "2024-05-15"}, mock_slices[0]),
+                    Record({"id": "may_record_1", "updated_at": "2024-05-16"}, mock_slices[0]),
+                    Record({"id": "jun_record_0", "updated_at": "2024-06-15"}, mock_slices[1]),
+                    Record({"id": "jun_record_1", "updated_at": "2024-06-16"}, mock_slices[1]),
+                ],
+                mock_slices,
+            )
+        ],
+        parameters={},
+        config={},
+        max_prefetched_partitions=10,
+    )
+
+    parent_states = []
+    slices = []
+    for actual_slice in partition_router.stream_slices():
+        slices.append(actual_slice["partition_field"])
+        parent_states.append(partition_router.get_stream_state().get("first_stream"))
+
+    assert slices == ["may_record_0", "may_record_1", "jun_record_0", "jun_record_1"]
+    assert parent_states == [None, None, mock_slices[0], mock_slices[0]]
+    assert partition_router.get_stream_state() == {"first_stream": mock_slices[1]}
+
+
+class _FailingStream(MockStream):
+    def read_records(self, sync_mode, cursor_field=None, stream_slice=None, stream_state=None):
+        yield {"id": 1}
+        raise ValueError("parent stream failed")
+
+
+def test_given_parent_stream_fails_when_stream_slices_with_max_prefetched_partitions_then_raise_error():
+    partition_router = SubstreamPartitionRouter(
+        parent_stream_configs=[
+            ParentStreamConfig(
+                stream=_FailingStream([{}], [], "first_stream"), parent_key="id", partition_field="first_stream_id", parameters={}, config={}
+            )
+        ],
+        parameters={},
+        config={},
+        max_prefetched_partitions=2,
+    )
+    slices = partition_router.stream_slices()
+
+    assert next(slices) == {"first_stream_id": 1, "parent_slice": {}}
+    with pytest.raises(ValueError, match="parent stream failed"):
+        next(slices)
+
+
+def test_given_consumer_stops_when_stream_slices_with_max_prefetched_partitions_then_stop_reading_parent():
+    partition_router = SubstreamPartitionRouter(
+        parent_stream_configs=[
+            ParentStreamConfig(
+                stream=MockStream([{}], [{"id": i} for i in range(1000)], "first_stream"),
+                parent_key="id",
+                partition_field="first_stream_id",
+                parameters={},
+                config={},
+            )
+        ],
+        parameters={},
+        config={},
+        max_prefetched_partitions=1,
+    )
+    slices = partition_router.stream_slices()
+    next(slices)
+    prefetch_threads = [thread for thread in threading.enumerate() if thread.name == "substream-parent-prefetch"]
+
+    slices.close()
+
+    for thread in prefetch_threads:
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+
+
+def test_given_negative_max_prefetched_partitions_when_create_then_raise():
+    with pytest.raises(ValueError):
+        SubstreamPartitionRouter(
+            parent_stream_configs=[_incremental_parent_stream_config([], [])], parameters={}, config={}, max_prefetched_partitions=-1
+        )
+
+
+class _CountingStream(MockStream):
+    def __init__(self, slices, records, name):
+        super().__init__(slices, records, name)
+        self.read_count = 0
+
+    def read_records(self, sync_mode, cursor_field=None, stream_slice=None, stream_state=None):
+        self.read_count += 1
+        yield from super().read_records(sync_mode, cursor_field, stream_slice, stream_state)
+
+
+def _cached_partition_router(
+    parent_stream: MockStream, cache: ParentRecordCache, incremental_dependency: bool = False, max_prefetched_partitions: int = 0
+) -> SubstreamPartitionRouter:
+    return SubstreamPartitionRouter(
+        parent_stream_configs=[
+            ParentStreamConfig(
+                stream=parent_stream,
+                parent_key="id",
+                partition_field="first_stream_id",
+                incremental_dependency=incremental_dependency,
+                record_cache_key="first_stream",
+                parameters={},
+                config={},
+            )
+        ],
+        parameters={},
+        config={},
+        max_prefetched_partitions=max_prefetched_partitions,
+        parent_record_cache=cache,
+    )
+
+
+@pytest.mark.parametrize("max_prefetched_partitions", [0, 2])
+def test_given_parent_record_cache_when_stream_slices_of_many_routers_then_parent_is_read_once(max_prefetched_partitions):
+    cache = ParentRecordCache()
+    parent_stream = _CountingStream(parent_slices, all_parent_data, "first_stream")
+    expected_slices = [
+        {"first_stream_id": 0, "parent_slice": {"slice": "first"}},
+        {"first_stream_id": 1, "parent_slice": {"slice": "first"}},
+        {"first_stream_id": 2, "parent_slice": {"slice": "second"}},
+    ]
+
+    first_slices = list(_cached_partition_router(parent_stream, cache).stream_slices())
+    other_slices = list(_cached_partition_router(parent_stream, cache, max_prefetched_partitions=max_prefetched_partitions).stream_slices())
+
+    assert first_slices == expected_slices
+    assert other_slices == expected_slices
+    assert parent_stream.read_count == len(parent_slices)
+
+
+def test_given_incremental_dependency_when_stream_slices_then_parent_record_cache_is_not_used():
+    cache = ParentRecordCache()
+    parent_stream = _CountingStream(parent_slices, all_parent_data, "first_stream")
+
+    list(_cached_partition_router(parent_stream, cache, incremental_dependency=True).stream_slices())
+    list(_cached_partition_router(parent_stream, cache, incremental_dependency=True).stream_slices())
+
+    assert parent_stream.read_count == 2 * len(parent_slices)
+    assert len(cache) == 0
+
+
+def test_given_consumer_stops_before_parent_is_read_when_stream_slices_then_parent_records_are_not_cached():
+    cache = ParentRecordCache()
+    parent_stream = _CountingStream([{}], [{"id": i} for i in range(1000)], "first_stream")
+
+    slices = _cached_partition_router(parent_stream, cache, max_prefetched_partitions=1).stream_slices()
+    next(slices)
+    prefetch_threads = [thread for thread in threading.enumerate() if thread.name == "substream-parent-prefetch"]
+    slices.close()
+    for thread in prefetch_threads:
+        thread.join(timeout=5)
+
+    assert cache.get("first_stream") is None
+    assert len(list(_cached_partition_router(parent_stream, cache).stream_slices())) == 1000
+    assert len(list(cache.get("first_stream"))) == 1000
@@ -27,6 +27,9 @@ from airbyte_cdk.models import (
 )
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
 from airbyte_cdk.sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import DeclarativeStream as DeclarativeStreamModel
+from airbyte_cdk.sources.declarative.parsers.compiled_manifest_cache import CompiledManifestCache
+from airbyte_cdk.sources.declarative.parsers.manifest_reference_resolver import ManifestReferenceResolver
 from airbyte_cdk.sources.declarative.retrievers.simple_retriever import SimpleRetriever
 from jsonschema.exceptions import ValidationError
 
@@ -1141,7 +1144,10 @@ def test_read_manifest_declarative_source(test_name, manifest, pages, expected_r
         mock_retriever.assert_has_calls(expected_calls)
 
 
-def test_only_parent_streams_use_cache():
+@pytest.mark.parametrize(
+    "incremental_dependency", [pytest.param(True, id="test_incremental_dependency"), pytest.param(False, id="test_full_refresh_parent")]
+)
+def test_only_parent_streams_use_cache(incremental_dependency):
     applications_stream = {
         "type": "DeclarativeStream",
         "$parameters": {"name": "applications", "primary_key": "id", "url_base": "https://harvest.greenhouse.io/v1/"},
@@ -1202,7 +1208,12 @@ def test_only_parent_streams_use_cache():
                     "record_selector": {"extractor": {"type": "DpathExtractor", "field_path": []}},
                     "partition_router": {
                         "parent_stream_configs": [
-                            {"parent_key": "id", "partition_field": "parent_id", "stream": deepcopy(applications_stream)}
+                            {
+                                "parent_key": "id",
+                                "partition_field": "parent_id",
+                                "stream": deepcopy(applications_stream),
+                                "incremental_dependency": incremental_dependency,
+                            }
                         ],
                         "type": "SubstreamPartitionRouter",
                     },
@@ -1260,6 +1271,211 @@ def test_only_parent_streams_use_cache():
     assert not streams[2].retriever.requester.use_cache
 
 
+@pytest.mark.parametrize(
+    "incremental_dependency", [pytest.param(True, id="test_incremental_dependency"), pytest.param(False, id="test_full_refresh_parent")]
+)
+def test_given_parent_not_selected_when_initialize_cache_then_only_incremental_parent_uses_cache(incremental_dependency):
+    parent_stream = {"name": "applications", "retriever": {"requester": {"path": "applications"}}}
+    substream = {
+        "name": "applications_interviews",
+        "retriever": {
+            "requester": {"path": "applications_interviews"},
+            "partition_router": {
+                "type": "SubstreamPartitionRouter",
+                "parent_stream_configs": [
+                    {
+                        "parent_key": "id",
+                        "partition_field": "parent_id",
+                        "stream": parent_stream,
+                        "incremental_dependency": incremental_dependency,
+                    }
+                ],
+            },
+        },
+    }
+
+    [stream_config] = ManifestDeclarativeSource._initialize_cache_for_parent_streams([substream])
+
+    # Parents that are not read incrementally rely on the ParentRecordCache of the partition router instead of the HTTP cache
+    parent_requester = stream_config["retriever"]["partition_router"]["parent_stream_configs"][0]["stream"]["retriever"]["requester"]
+    assert parent_requester.get("use_cache", False) == incremental_dependency
+    assert "use_cache" not in stream_config["retriever"]["requester"]
+
+
+def _rates_manifest(stream_names: List[str]) -> Mapping[str, Any]:
+    return {
+        "version": "0.34.2",
+        "definitions": {
+            "requester": {
+                "type": "HttpRequester",
+                "url_base": "https://api.apilayer.com",
+                "path": "/exchangerates_data/latest",
+                "http_method": "GET",
+                "authenticator": {"type": "ApiKeyAuthenticator", "header": "apikey", "api_token": "{{ config['api_key'] }}"},
+            },
+        },
+        "check": {"type": "CheckStream", "stream_names": [stream_names[0]]},
+        "streams": [
+            {
+                "type": "DeclarativeStream",
+                "name": stream_name,
+                "primary_key": [],
+                "schema_loader": {"type": "InlineSchemaLoader", "schema": {"type": "object", "properties": {"ABC": {"type": "number"}}}},
+                "retriever": {
+                    "type": "SimpleRetriever",
+                    "requester": {"$ref": "#/definitions/requester"},
+                    "record_selector": {"type": "RecordSelector", "extractor": {"type": "DpathExtractor", "field_path": ["rates"]}},
+                    "paginator": {"type": "NoPagination"},
+                },
+            }
+            for stream_name in stream_names
+        ],
+    }
+
+
+def test_given_compiled_manifest_cache_when_create_source_again_then_skip_resolution_and_validation(tmp_path: Path):
+    manifest = _rates_manifest(["Rates"])
+    first_source = ManifestDeclarativeSource(source_config=manifest, compiled_manifest_cache=CompiledManifestCache(tmp_path))
+
+    with patch.object(ManifestReferenceResolver, "preprocess_manifest") as preprocess_manifest, patch.object(
+        ManifestDeclarativeSource, "_validate_source"
+    ) as validate_source:
+        source = ManifestDeclarativeSource(source_config=manifest, compiled_manifest_cache=CompiledManifestCache(tmp_path))
+
+    preprocess_manifest.assert_not_called()
+    validate_source.assert_not_called()
+    assert source.resolved_manifest == first_source.resolved_manifest
+    assert [stream.name for stream in source.streams({})] == ["Rates"]
+
+
+def test_given_manifest_changed_when_create_source_then_compile_manifest_again(tmp_path: Path):
+    ManifestDeclarativeSource(source_config=_rates_manifest(["Rates"]), compiled_manifest_cache=CompiledManifestCache(tmp_path))
+
+    source = ManifestDeclarativeSource(
+        source_config=_rates_manifest(["Rates", "Other"]), compiled_manifest_cache=CompiledManifestCache(tmp_path)
+    )
+
+    assert [stream.name for stream in source.streams({})] == ["Rates", "Other"]
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_given_invalid_manifest_when_create_source_then_do_not_cache_manifest(tmp_path: Path):
+    manifest = {**_rates_manifest(["Rates"]), "version": None}
+
+    with pytest.raises(ValidationError):
+        ManifestDeclarativeSource(source_config=manifest, compiled_manifest_cache=CompiledManifestCache(tmp_path))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_given_cache_path_environment_variable_when_create_source_then_use_compiled_manifest_cache(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("COMPILED_MANIFEST_CACHE_PATH", str(tmp_path / "compiled_manifests"))
+
+    ManifestDeclarativeSource(source_config=_rates_manifest(["Rates"]))
+
+    assert len(list((tmp_path / "compiled_manifests").iterdir())) == 1
+
+
+def test_given_catalog_when_read_then_only_create_configured_streams():
+    source = ManifestDeclarativeSource(source_config=_rates_manifest(["Rates", "Other", "Unused"]))
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(name="Other", json_schema={}, supported_sync_modes=[SyncMode.full_refresh]),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.append,
+            )
+        ]
+    )
+
+    with patch.object(SimpleRetriever, "_fetch_next_page", return_value=_create_page({"rates": [{"ABC": 1}]})), patch.object(
+        source._constructor, "create_component", wraps=source._constructor.create_component
+    ) as create_component:
+        records = [message.record for message in source.read(logger, {}, catalog, {}) if message.record]
+
+    assert [record.stream for record in records] == ["Other"]
+    created_stream_names = [
+        component_call.args[1]["name"]
+        for component_call in create_component.call_args_list
+        if component_call.args[0] == DeclarativeStreamModel
+    ]
+    assert created_stream_names == ["Other"]
+    assert [stream.name for stream in source.streams({})] == ["Rates", "Other", "Unused"]
+
+
+def test_given_parent_records_changed_when_read_twice_then_second_read_uses_new_parent_records(requests_mock):
+    def _stream(name: str, path: str, partition_router: Mapping[str, Any] = None) -> Mapping[str, Any]:
+        retriever = {
+            "type": "SimpleRetriever",
+            "requester": {"type": "HttpRequester", "url_base": "https://api.test.com", "path": path, "http_method": "GET"},
+            "record_selector": {"type": "RecordSelector", "extractor": {"type": "DpathExtractor", "field_path": ["items"]}},
+            "paginator": {"type": "NoPagination"},
+        }
+        if partition_router:
+            retriever["partition_router"] = partition_router
+        return {
+            "type": "DeclarativeStream",
+            "name": name,
+            "primary_key": [],
+            "schema_loader": {"type": "InlineSchemaLoader", "schema": {"type": "object"}},
+            "retriever": retriever,
+        }
+
+    parent_stream = _stream("parents", "/parents")
+    manifest = {
+        "version": "0.34.2",
+        "check": {"type": "CheckStream", "stream_names": ["parents"]},
+        "streams": [
+            parent_stream,
+            _stream(
+                "children",
+                "/parents/{{ stream_partition.parent_id }}/children",
+                {
+                    "type": "SubstreamPartitionRouter",
+                    "parent_stream_configs": [
+                        {"type": "ParentStreamConfig", "parent_key": "id", "partition_field": "parent_id", "stream": parent_stream}
+                    ],
+                },
+            ),
+        ],
+    }
+    source = ManifestDeclarativeSource(source_config=manifest)
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(name="children", json_schema={}, supported_sync_modes=[SyncMode.full_refresh]),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.append,
+            )
+        ]
+    )
+    for parent_id in [1, 2]:
+        requests_mock.get(f"https://api.test.com/parents/{parent_id}/children", json={"items": [{"parent": parent_id}]})
+
+    requests_mock.get("https://api.test.com/parents", json={"items": [{"id": 1}]})
+    first_read = [message.record.data for message in source.read(logger, {}, catalog, {}) if message.record]
+    requests_mock.get("https://api.test.com/parents", json={"items": [{"id": 1}, {"id": 2}]})
+    second_read = [message.record.data for message in source.read(logger, {}, catalog, {}) if message.record]
+
+    assert first_read == [{"parent": 1}]
+    assert second_read == [{"parent": 1}, {"parent": 2}]
+
+
+@pytest.mark.slow
+def test_compiled_manifest_cache_benchmark(tmp_path: Path):
+    """
+    Compares creating a source from a manifest with many streams with and without a compiled manifest artifact
+    """
+    manifest = _rates_manifest([f"stream_{i}" for i in range(200)])
+    ManifestDeclarativeSource(source_config=manifest, compiled_manifest_cache=CompiledManifestCache(tmp_path))
+
+    uncached_source = ManifestDeclarativeSource(source_config=manifest)
+    cached_source = ManifestDeclarativeSource(source_config=manifest, compiled_manifest_cache=CompiledManifestCache(tmp_path))
+
+    assert cached_source.resolved_manifest == uncached_source.resolved_manifest
+    assert [stream.name for stream in cached_source.streams({})] == [stream.name for stream in uncached_source.streams({})]
+
+
 def _run_read(manifest: Mapping[str, Any], stream_name: str) -> List[AirbyteMessage]:
     source = ManifestDeclarativeSource(source_config=manifest)
     catalog = ConfiguredAirbyteCatalog(
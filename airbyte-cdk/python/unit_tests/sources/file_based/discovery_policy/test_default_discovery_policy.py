@@ -5,6 +5,8 @@
 import unittest
 from unittest.mock import Mock
 
+import pytest
+
 from airbyte_cdk.sources.file_based.discovery_policy.default_discovery_policy import DefaultDiscoveryPolicy
 from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
 
@@ -29,3 +31,10 @@ class DefaultDiscoveryPolicyTest(unittest.TestCase):
         self._parser.parser_max_n_files_for_schema_inference = 1
 
         assert self._policy.get_max_n_files_for_schema_inference(self._parser) == 1
+
+    def test_schema_inference_processes_are_disabled_by_default(self) -> None:
+        assert self._policy.n_schema_inference_processes == 0
+
+    def test_given_negative_schema_inference_processes_when_create_then_raise(self) -> None:
+        with pytest.raises(ValueError):
+            DefaultDiscoveryPolicy(n_schema_inference_processes=-1)
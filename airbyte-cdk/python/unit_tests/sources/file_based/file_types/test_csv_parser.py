@@ -25,8 +25,15 @@ from airbyte_cdk.sources.file_based.config.csv_format import (
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.exceptions import RecordParseError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
-from airbyte_cdk.sources.file_based.file_types.csv_parser import CsvParser, _CsvReader
+from airbyte_cdk.sources.file_based.file_types.csv_parser import (
+    CsvParser,
+    _CsvReader,
+    _RowCaster,
+    _value_to_bool,
+    _value_to_python_type,
+)
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.schema_helpers import TYPE_PYTHON_MAPPING
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
 PROPERTY_TYPES = {
@@ -224,6 +231,20 @@ class SchemaInferenceTestCase(TestCase):
         # since the type is number, we know the string at the end was not considered
         assert inferred_schema == {self._HEADER_NAME: {"type": "number"}}
 
+    def test_given_max_records_when_infer_schema_then_stop_early(self) -> None:
+        self._parser = CsvParser(self._csv_reader, max_records_per_file_for_schema_inference=2)
+        self._config_format.inference_type = InferenceType.PRIMITIVE_TYPES_ONLY
+        self._csv_reader.read_data.return_value = ({self._HEADER_NAME: row} for row in ["1", "2", "this is a string"])
+        inferred_schema = self._infer_schema()
+        assert inferred_schema == {self._HEADER_NAME: {"type": "integer"}}
+
+    def test_given_max_bytes_when_infer_schema_then_stop_early(self) -> None:
+        self._parser = CsvParser(self._csv_reader, max_bytes_per_file_for_schema_inference=1)
+        self._config_format.inference_type = InferenceType.PRIMITIVE_TYPES_ONLY
+        self._csv_reader.read_data.return_value = ({self._HEADER_NAME: row} for row in ["23", "this is a string"])
+        inferred_schema = self._infer_schema()
+        assert inferred_schema == {self._HEADER_NAME: {"type": "integer"}}
+
     def test_given_empty_csv_file_when_infer_schema_then_raise_config_error(self) -> None:
         self._csv_reader.read_data.return_value = []
         with pytest.raises(AirbyteTracedException) as exception:
@@ -643,3 +664,159 @@ def test_encoding_is_passed_to_stream_reader() -> None:
             mock.call().__exit__(None, None, None),
         ]
     )
+
+
+_BATCH_SCHEMA = {
+    "properties": {
+        "integer": {"type": "integer"},
+        "number": {"type": "number"},
+        "boolean": {"type": "boolean"},
+        "string": {"type": "string"},
+        "object": {"type": "object"},
+        "array": {"type": "array"},
+    }
+}
+
+
+def _parse_records(
+    data: str, config_format: CsvFormat, read_in_batches: bool, schema: Dict[str, Any] = _BATCH_SCHEMA
+) -> List[Dict[str, Any]]:
+    config = FileBasedStreamConfig(name="test", validation_policy="Emit Record", file_type="csv", format=config_format)
+    stream_reader = Mock(spec=AbstractFileBasedStreamReader)
+    stream_reader.open_file.side_effect = lambda file, mode, encoding, logger: (
+        io.BytesIO(data.encode("utf-8")) if mode == FileReadMode.READ_BINARY else io.StringIO(data)
+    )
+    file = RemoteFile(uri="a uri", last_modified=datetime.now())
+    parser = CsvParser(read_in_batches=read_in_batches)
+    return list(parser.parse_records(config, file, stream_reader, Mock(spec=logging.Logger), schema))
+
+
+@pytest.mark.parametrize(
+    "data, config_format",
+    [
+        pytest.param(
+            'integer,number,boolean,string,object,array\n1,1.5,true,a string,"{""a"": 1}","[1, 2]"\n2,2.5,false,another,{},[]\n',
+            CsvFormat(),
+            id="test_all_types",
+        ),
+        pytest.param(
+            "integer,number,boolean,string,object,array\nnot an int,NaN-ish,maybe,a string,{invalid,[invalid\n",
+            CsvFormat(),
+            id="test_values_that_cannot_be_cast",
+        ),
+        pytest.param(
+            "integer,string,boolean\nNULL,NULL,NULL\n,,\n",
+            CsvFormat(null_values={"NULL", ""}),
+            id="test_null_values",
+        ),
+        pytest.param(
+            "integer,string,boolean\nNULL,NULL,NULL\n",
+            CsvFormat(null_values={"NULL"}, strings_can_be_null=False),
+            id="test_strings_cannot_be_null",
+        ),
+        pytest.param(
+            "integer,string,unknown_column\n1,a,b\n",
+            CsvFormat(),
+            id="test_columns_not_in_schema_are_dropped",
+        ),
+        pytest.param(
+            "to skip\ninteger;string\nskipped too\n1;'a;''quoted'' value'\n2;'multi\nline'\n",
+            CsvFormat(delimiter=";", quote_char="'", skip_rows_before_header=1, skip_rows_after_header=1),
+            id="test_format_options",
+        ),
+        pytest.param(
+            'integer,string\n1,"a \\"escaped\\" value"\n',
+            CsvFormat(escape_char="\\", double_quote=False),
+            id="test_escape_char",
+        ),
+        pytest.param(
+            "1,a\n2,b\n",
+            CsvFormat(header_definition=CsvHeaderUserProvided(column_names=["integer", "string"])),
+            id="test_user_provided_headers",
+        ),
+    ],
+)
+def test_given_read_in_batches_when_parse_records_then_records_are_the_same_as_when_reading_rows(data, config_format) -> None:
+    assert _parse_records(data, config_format, read_in_batches=True) == _parse_records(data, config_format, read_in_batches=False)
+
+
+def test_given_no_schema_when_parse_records_in_batches_then_values_are_not_cast() -> None:
+    data = "integer,string\n1,NULL\n"
+    config_format = CsvFormat(null_values={"NULL"})
+
+    records = _parse_records(data, config_format, read_in_batches=True, schema={})
+
+    assert records == [{"integer": "1", "string": None}]
+    assert records == _parse_records(data, config_format, read_in_batches=False, schema={})
+
+
+@pytest.mark.parametrize(
+    "data",
+    [pytest.param(_TOO_MANY_VALUES, id="test_too_many_values"), pytest.param(_TOO_FEW_VALUES, id="test_too_few_values")],
+)
+def test_given_mismatch_between_values_and_header_when_parse_records_in_batches_then_raise_record_parse_error(data) -> None:
+    with pytest.raises(RecordParseError) as exception:
+        _parse_records("\n".join(data), CsvFormat(), read_in_batches=True)
+    assert "lineno=2" in str(exception.value.__cause__)
+
+
+def test_given_ignore_errors_on_fields_mismatch_when_parse_records_in_batches_then_read_rows() -> None:
+    data = "\n".join(_TOO_FEW_VALUES)
+    config_format = CsvFormat(ignore_errors_on_fields_mismatch=True)
+    assert _parse_records(data, config_format, read_in_batches=True) == _parse_records(data, config_format, read_in_batches=False)
+
+
+def _cast_row_per_cell(row: Dict[str, str], property_types: Dict[str, str], config_format: CsvFormat) -> Dict[str, Any]:
+    """
+    Casts the values the way CsvParser did before the column casters were introduced: the type of every cell is looked up and the row is
+    copied again to replace the null values.
+    """
+    result = {}
+    for key, value in row.items():
+        prop_type = property_types.get(key)
+        cast_value: Any = value
+        if prop_type in TYPE_PYTHON_MAPPING and prop_type is not None:
+            _, python_type = TYPE_PYTHON_MAPPING[prop_type]
+            if python_type == bool:
+                try:
+                    cast_value = _value_to_bool(value, config_format.true_values, config_format.false_values)
+                except ValueError:
+                    pass
+            elif python_type:
+                try:
+                    cast_value = _value_to_python_type(value, python_type)
+                except ValueError:
+                    pass
+            result[key] = cast_value
+    return {
+        key: None
+        if value in config_format.null_values and (config_format.strings_can_be_null or property_types.get(key) != "string")
+        else value
+        for key, value in result.items()
+    }
+
+
+@pytest.mark.slow
+def test_csv_casting_benchmark() -> None:
+    """
+    Compares casting each cell by looking up its type with the column casters, reading rows using the csv module and reading batches using
+    pyarrow.
+    """
+    schema = {"properties": {f"col{i}": {"type": ["integer", "number", "boolean", "string"][i % 4]} for i in range(12)}}
+    property_types = {column: definition["type"] for column, definition in schema["properties"].items()}
+    headers = list(property_types.keys())
+    values = ["1", "1.5", "true", "a string"]
+    data = "\n".join([",".join(headers)] + [",".join(values[i % 4] for i in range(12)) for _ in range(100_000)]) + "\n"
+    config_format = CsvFormat(null_values={"NULL"})
+
+    rows = list(csv.DictReader(io.StringIO(data)))
+    per_cell_records = [_cast_row_per_cell(row, property_types, config_format) for row in rows]
+
+    row_caster = _RowCaster(property_types, config_format, Mock(), cast_values=True)
+    cast_records = [row_caster.cast_row(row) for row in rows]
+
+    row_records = _parse_records(data, config_format, read_in_batches=False, schema=schema)
+
+    batch_records = _parse_records(data, config_format, read_in_batches=True, schema=schema)
+
+    assert per_cell_records == cast_records == row_records == batch_records
@@ -96,6 +96,28 @@ def test_given_limit_hit_when_infer_then_stop_considering_records(stream_reader:
     assert schema == {"key": {"type": "number"}}
 
 
+def test_given_max_records_when_infer_then_stop_considering_records(stream_reader: MagicMock) -> None:
+    stream_reader.open_file.return_value.__enter__.return_value = io.BytesIO(b'{"key": 1}\n{"key": 2}\n{"key": "a string"}')
+    loop = asyncio.new_event_loop()
+
+    schema = loop.run_until_complete(
+        JsonlParser(max_records_per_file_for_schema_inference=2).infer_schema(Mock(), Mock(), stream_reader, Mock())
+    )
+
+    assert schema == {"key": {"type": "integer"}}
+
+
+def test_given_max_bytes_when_infer_then_stop_considering_records(stream_reader: MagicMock) -> None:
+    stream_reader.open_file.return_value.__enter__.return_value = io.BytesIO(b'{"key": 1}\n{"key": "a string"}')
+    loop = asyncio.new_event_loop()
+
+    schema = loop.run_until_complete(
+        JsonlParser(max_bytes_per_file_for_schema_inference=1).infer_schema(Mock(), Mock(), stream_reader, Mock())
+    )
+
+    assert schema == {"key": {"type": "integer"}}
+
+
 def test_given_multiline_json_objects_and_read_limit_hit_when_infer_then_return_parse_until_at_least_one_record(
     stream_reader: MagicMock,
 ) -> None:
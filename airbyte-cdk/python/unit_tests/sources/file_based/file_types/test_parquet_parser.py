@@ -4,11 +4,13 @@
 
 import asyncio
 import datetime
+import io
 import math
-from typing import Any, Mapping, Union
+from typing import Any, Dict, List, Mapping, Optional, Union
 from unittest.mock import Mock
 
 import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig, ValidationPolicy
@@ -273,3 +275,111 @@ def test_wrong_file_format(file_format: Union[CsvFormat, JsonlFormat]) -> None:
     logger = Mock()
     with pytest.raises(ValueError):
         asyncio.get_event_loop().run_until_complete(parser.infer_schema(config, file, stream_reader, logger))
+
+
+_TABLE = pa.table(
+    {
+        "int": pa.array([1, None, 3], type=pa.int64()),
+        "float": pa.array([1.5, 2.5, None], type=pa.float64()),
+        "string": pa.array(["a", None, "c"], type=pa.string()),
+        "bool": pa.array([True, False, None], type=pa.bool_()),
+        "timestamp": pa.array([datetime.datetime(2023, 7, 7, 10, 11, 12), None, datetime.datetime(2024, 1, 1)], type=pa.timestamp("ms")),
+        "timestamp_with_tz": pa.array(
+            [datetime.datetime(2020, 1, 1, 1, 1, 1, tzinfo=datetime.timezone.utc), None, None], type=pa.timestamp("s", "utc")
+        ),
+        "date": pa.array([datetime.date(2023, 7, 7), None, datetime.date(2023, 7, 8)], type=pa.date32()),
+        "time": pa.array([datetime.time(1, 2, 3), None, None], type=pa.time64("us")),
+        "duration": pa.array([12345, None, 1], type=pa.duration("ms")),
+        "binary": pa.array([b"binary", None, b"string"], type=pa.binary()),
+        "decimal": pa.array([12, None, 13], type=pa.decimal128(5, 3)),
+        "map": pa.array([{"hello": 1, "world": 2}, None, {}], type=pa.map_(pa.string(), pa.int32())),
+        "struct": pa.array([{"field": 1}, None, {"field": None}], type=pa.struct([pa.field("field", pa.int32())])),
+        "list": pa.array([[1, 2], None, []], type=pa.list_(pa.int32())),
+        "dictionary": pa.array(["apple", "banana", "apple"]).dictionary_encode(),
+        "null": pa.array([None, None, None], type=pa.null()),
+    }
+)
+
+
+def _to_parquet(table: pa.Table, row_group_size: Optional[int] = None) -> bytes:
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer, row_group_size=row_group_size)
+    return buffer.getvalue()
+
+
+def _parse_records(
+    parquet_file: bytes,
+    uri: str = "s3://mybucket/test.parquet",
+    parquet_format: ParquetFormat = _default_parquet_format,
+    schema: Optional[Mapping[str, Any]] = None,
+    validation_policy: ValidationPolicy = ValidationPolicy.emit_record,
+) -> List[Dict[str, Any]]:
+    config = FileBasedStreamConfig(name="test", format=parquet_format, file_type="parquet", validation_policy=validation_policy)
+    stream_reader = Mock()
+    stream_reader.open_file.side_effect = lambda *args, **kwargs: io.BytesIO(parquet_file)
+    file = RemoteFile(uri=uri, last_modified=datetime.datetime.now())
+    return list(ParquetParser().parse_records(config, file, stream_reader, Mock(), schema))
+
+
+def _parse_records_value_by_value(parquet_file: bytes, parquet_format: ParquetFormat) -> List[Dict[str, Any]]:
+    table = pq.read_table(io.BytesIO(parquet_file))
+    return [
+        {column: ParquetParser._to_output_value(table.column(column)[row], parquet_format) for column in table.column_names}
+        for row in range(table.num_rows)
+    ]
+
+
+@pytest.mark.parametrize(
+    "parquet_format", [pytest.param(_default_parquet_format, id="default"), pytest.param(_decimal_as_float_parquet_format, id="float")]
+)
+def test_parse_records_converts_values_the_same_way_as_to_output_value(parquet_format: ParquetFormat) -> None:
+    parquet_file = _to_parquet(_TABLE, row_group_size=2)
+    assert _parse_records(parquet_file, parquet_format=parquet_format) == _parse_records_value_by_value(parquet_file, parquet_format)
+
+
+def test_given_partitioned_file_when_parse_records_then_partition_columns_are_added() -> None:
+    parquet_file = _to_parquet(pa.table({"id": [1, 2], "year": [1, 2]}))
+    records = _parse_records(parquet_file, uri="s3://mybucket/year=2023/month=07/test.parquet")
+    assert records == [{"id": 1, "year": "2023", "month": "07"}, {"id": 2, "year": "2023", "month": "07"}]
+
+
+def test_given_schema_when_parse_records_then_only_read_columns_in_schema() -> None:
+    parquet_file = _to_parquet(_TABLE)
+    schema = {"type": "object", "properties": {"int": {"type": "integer"}, "string": {"type": "string"}, "missing": {"type": "string"}}}
+    expected_records = [{"int": 1, "string": "a"}, {"int": None, "string": None}, {"int": 3, "string": "c"}]
+    assert _parse_records(parquet_file, schema=schema) == expected_records
+
+
+def test_given_schema_without_file_columns_when_parse_records_then_yield_one_empty_record_per_row() -> None:
+    parquet_file = _to_parquet(_TABLE)
+    assert _parse_records(parquet_file, schema={"type": "object", "properties": {"missing": {"type": "string"}}}) == [{}, {}, {}]
+
+
+def test_given_validation_policy_other_than_emit_record_when_parse_records_then_read_all_columns() -> None:
+    parquet_file = _to_parquet(pa.table({"id": [1], "name": ["a"]}))
+    schema = {"type": "object", "properties": {"id": {"type": "integer"}}}
+    assert _parse_records(parquet_file, schema=schema, validation_policy=ValidationPolicy.skip_record) == [{"id": 1, "name": "a"}]
+
+
+@pytest.mark.slow
+def test_parse_records_benchmark() -> None:
+    """
+    Compares converting the values of a parquet file one by one with the columnar conversion
+    """
+    number_of_rows = 100_000
+    table = pa.table(
+        {
+            "id": pa.array(range(number_of_rows), type=pa.int64()),
+            "name": pa.array([f"name {i}" for i in range(number_of_rows)]),
+            "amount": pa.array([i * 1.5 for i in range(number_of_rows)]),
+            "created_at": pa.array([datetime.datetime(2024, 1, 1) + datetime.timedelta(seconds=i) for i in range(number_of_rows)]),
+            "price": pa.array(range(number_of_rows), type=pa.decimal128(12, 2)),
+        }
+    )
+    parquet_file = _to_parquet(table)
+
+    expected_records = _parse_records_value_by_value(parquet_file, _default_parquet_format)
+
+    records = _parse_records(parquet_file)
+
+    assert records == expected_records
@@ -1,7 +1,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, MutableMapping, Optional, Tuple
 from unittest.mock import MagicMock
 
@@ -11,6 +11,7 @@ from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.stream.concurrent.adapters import FileBasedStreamPartition
 from airbyte_cdk.sources.file_based.stream.concurrent.cursor import FileBasedConcurrentCursor
+from airbyte_cdk.sources.file_based.stream.concurrent.cursor.file_based_concurrent_cursor import _FileIndex
 from airbyte_cdk.sources.streams.concurrent.cursor import CursorField
 from freezegun import freeze_time
 
@@ -453,3 +454,64 @@ def test_compute_start_time(input_history, is_history_full, expected_start_time,
     cursor._file_to_datetime_history = input_history
     cursor._is_history_full = MagicMock(return_value=is_history_full)
     assert cursor._compute_start_time() == expected_start_time
+
+
+def test_file_index_returns_earliest_and_latest_up_to_date_files():
+    index = _FileIndex({"b.csv": datetime(2021, 1, 2), "a.csv": datetime(2021, 1, 2), "c.csv": datetime(2021, 1, 3)})
+    assert index.earliest() == (datetime(2021, 1, 2), "a.csv")
+    assert index.latest() == (datetime(2021, 1, 3), "c.csv")
+
+    index.add("c.csv", datetime(2021, 1, 1))
+    index.remove("a.csv")
+
+    assert len(index) == 2
+    assert index.get("c.csv") == datetime(2021, 1, 1)
+    assert index.get("a.csv") is None
+    assert index.earliest() == (datetime(2021, 1, 1), "c.csv")
+    assert index.latest() == (datetime(2021, 1, 2), "b.csv")
+
+
+def test_given_many_updates_when_add_to_file_index_then_outdated_entries_are_discarded():
+    index = _FileIndex({})
+    for i in range(10_000):
+        index.add("a.csv", datetime(2021, 1, 1) + timedelta(seconds=i))
+    assert len(index._earliest_heap) <= 1_000
+    assert index.earliest() == index.latest() == (datetime(2021, 1, 1) + timedelta(seconds=9_999), "a.csv")
+
+
+def test_given_pending_files_with_same_last_modified_when_get_state_then_cursor_is_the_file_with_the_lowest_uri():
+    cursor = _make_cursor({})
+    cursor._pending_files = {
+        uri: RemoteFile(uri=uri, last_modified=datetime.strptime("2021-01-01T00:00:00.000000Z", DATE_TIME_FORMAT))
+        for uri in ["c.csv", "a.csv", "b.csv"]
+    }
+    cursor._message_repository = MagicMock()
+
+    cursor.add_file(RemoteFile(uri="a.csv", last_modified=datetime.strptime("2021-01-01T00:00:00.000000Z", DATE_TIME_FORMAT)))
+
+    assert cursor.get_state()["_ab_source_file_last_modified"] == "2021-01-01T00:00:00.000000Z_b.csv"
+
+
+@pytest.mark.slow
+def test_add_file_benchmark():
+    """
+    Adds files to a cursor with a full history and checks that the history only keeps the most recent files
+    """
+    history_size = FileBasedConcurrentCursor.DEFAULT_MAX_HISTORY_SIZE
+    start = datetime(2021, 1, 1)
+    initial_history = {f"history_{i}.csv": (start + timedelta(seconds=i)).strftime(DATE_TIME_FORMAT) for i in range(history_size)}
+    cursor = _make_cursor({"history": dict(initial_history)})
+    cursor._message_repository = MagicMock()
+    files = [
+        RemoteFile(uri=f"new_{i}.csv", last_modified=start + timedelta(seconds=history_size // 2 + i * 7 % 20_000)) for i in range(20_000)
+    ]
+    cursor._pending_files = {file.uri: file for file in files}
+
+    for file in files:
+        cursor.add_file(file)
+
+    all_files = list(initial_history.items()) + [(file.uri, file.last_modified.strftime(DATE_TIME_FORMAT)) for file in files]
+    expected_history = dict(sorted(all_files, key=lambda f: (f[1], f[0]))[-history_size:])
+    assert cursor._file_to_datetime_history == expected_history
+    latest_uri, latest_last_modified = max(expected_history.items(), key=lambda f: (f[1], f[0]))
+    assert cursor.get_state()["_ab_source_file_last_modified"] == f"{latest_last_modified}_{latest_uri}"
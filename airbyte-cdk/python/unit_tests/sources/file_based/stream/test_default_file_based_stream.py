@@ -2,25 +2,34 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import logging
+import os
 import traceback
 import unittest
+import uuid
 from datetime import datetime, timezone
-from typing import Any, Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Mapping, Optional
 from unittest.mock import Mock
 
 import pytest
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level
 from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.sources.file_based.availability_strategy import AbstractFileBasedAvailabilityStrategy
-from airbyte_cdk.sources.file_based.discovery_policy import AbstractDiscoveryPolicy
+from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat, InferenceType
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
+from airbyte_cdk.sources.file_based.discovery_policy import AbstractDiscoveryPolicy, DefaultDiscoveryPolicy
 from airbyte_cdk.sources.file_based.exceptions import FileBasedErrorsCollector, FileBasedSourceError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader
+from airbyte_cdk.sources.file_based.file_types.csv_parser import CsvParser
 from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.schema_cache import FileSchemaCache
 from airbyte_cdk.sources.file_based.schema_validation_policies import AbstractSchemaValidationPolicy
 from airbyte_cdk.sources.file_based.stream.cursor import AbstractFileBasedCursor
 from airbyte_cdk.sources.file_based.stream.default_file_based_stream import DefaultFileBasedStream
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
+from unit_tests.sources.file_based.in_memory_files_source import InMemoryFilesStreamReader
 
 
 class MockFormat:
@@ -82,6 +91,8 @@ class DefaultFileBasedStreamTest(unittest.TestCase):
         self._stream_reader = Mock(spec=AbstractFileBasedStreamReader)
         self._availability_strategy = Mock(spec=AbstractFileBasedAvailabilityStrategy)
         self._discovery_policy = Mock(spec=AbstractDiscoveryPolicy)
+        self._discovery_policy.n_schema_inference_processes = 0
+        self._discovery_policy.schema_cache = None
         self._parser = Mock(spec=FileTypeParser)
         self._validation_policy = Mock(spec=AbstractSchemaValidationPolicy)
         self._validation_policy.name = "validation policy name"
@@ -209,6 +220,138 @@ class DefaultFileBasedStreamTest(unittest.TestCase):
             yield item
 
 
+class _ProcessIdCsvParser(CsvParser):
+    """
+    Adds the id of the process inferring the schema of the file to the schema
+    """
+
+    async def infer_schema(
+        self, config: FileBasedStreamConfig, file: RemoteFile, stream_reader: AbstractFileBasedStreamReader, logger: logging.Logger
+    ) -> Mapping[str, Any]:
+        schema = await super().infer_schema(config, file, stream_reader, logger)
+        return {**schema, f"process_{os.getpid()}": {"type": "string"}}
+
+
+class _DeserializationIdCsvParser(CsvParser):
+    """
+    Adds an id identifying each deserialization of the parser to the schema
+    """
+
+    def __setstate__(self, state: Mapping[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._deserialization_id = uuid.uuid4().hex
+
+    async def infer_schema(
+        self, config: FileBasedStreamConfig, file: RemoteFile, stream_reader: AbstractFileBasedStreamReader, logger: logging.Logger
+    ) -> Mapping[str, Any]:
+        schema = await super().infer_schema(config, file, stream_reader, logger)
+        return {**schema, f"deserialization_{getattr(self, '_deserialization_id', 'none')}": {"type": "string"}}
+
+
+class _RecordingCsvParser(CsvParser):
+    """
+    Records the uri of the files which schema is inferred
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.inferred_files: List[str] = []
+
+    async def infer_schema(
+        self, config: FileBasedStreamConfig, file: RemoteFile, stream_reader: AbstractFileBasedStreamReader, logger: logging.Logger
+    ) -> Mapping[str, Any]:
+        self.inferred_files.append(file.uri)
+        return await super().infer_schema(config, file, stream_reader, logger)
+
+
+def _create_stream_inferring_schema(
+    discovery_policy: AbstractDiscoveryPolicy, stream_reader: AbstractFileBasedStreamReader, parser: Optional[CsvParser] = None
+) -> DefaultFileBasedStream:
+    return DefaultFileBasedStream(
+        config=FileBasedStreamConfig(
+            name="a_stream",
+            file_type="csv",
+            validation_policy="Emit Record",
+            format=CsvFormat(inference_type=InferenceType.PRIMITIVE_TYPES_ONLY),
+        ),
+        catalog_schema=None,
+        stream_reader=stream_reader,
+        availability_strategy=Mock(spec=AbstractFileBasedAvailabilityStrategy),
+        discovery_policy=discovery_policy,
+        parsers={CsvFormat: parser or _ProcessIdCsvParser()},
+        validation_policy=Mock(spec=AbstractSchemaValidationPolicy),
+        cursor=Mock(spec=AbstractFileBasedCursor),
+        errors_collector=FileBasedErrorsCollector(),
+    )
+
+
+_CSV_FILES = {
+    f"file{i}.csv": {"contents": [("id", "name"), (str(i), f"name {i}")], "last_modified": "2024-01-01T00:00:00.000000Z"} for i in range(4)
+}
+
+
+def test_given_schema_inference_processes_when_infer_schema_then_infer_in_worker_processes() -> None:
+    stream = _create_stream_inferring_schema(
+        DefaultDiscoveryPolicy(n_schema_inference_processes=2), InMemoryFilesStreamReader(files=_CSV_FILES, file_type="csv")
+    )
+    files = list(stream.get_files())
+
+    schema = stream.infer_schema(files)
+
+    assert schema["id"] == {"type": ["null", "integer"]}
+    assert schema["name"] == {"type": ["null", "string"]}
+    process_columns = [column for column in schema if column.startswith("process_")]
+    assert process_columns
+    assert f"process_{os.getpid()}" not in process_columns
+
+
+def test_given_schema_inference_processes_when_infer_schema_then_send_inference_context_once_per_worker_process() -> None:
+    stream = _create_stream_inferring_schema(
+        DefaultDiscoveryPolicy(n_schema_inference_processes=2),
+        InMemoryFilesStreamReader(files=_CSV_FILES, file_type="csv"),
+        _DeserializationIdCsvParser(),
+    )
+    files = list(stream.get_files())
+
+    schema = stream.infer_schema(files)
+
+    deserialization_columns = [column for column in schema if column.startswith("deserialization_")]
+    assert 0 < len(deserialization_columns) <= 2 < len(files)
+
+
+def test_given_stream_reader_cannot_be_serialized_when_infer_schema_then_infer_in_main_process() -> None:
+    stream_reader = InMemoryFilesStreamReader(files=_CSV_FILES, file_type="csv")
+    stream_reader.not_serializable = lambda: None  # type: ignore[attr-defined]  # lambdas can't be pickled
+    stream = _create_stream_inferring_schema(DefaultDiscoveryPolicy(n_schema_inference_processes=2), stream_reader)
+    files = list(stream.get_files())
+
+    schema = stream.infer_schema(files)
+
+    assert schema["id"] == {"type": ["null", "integer"]}
+    assert [column for column in schema if column.startswith("process_")] == [f"process_{os.getpid()}"]
+
+
+def test_given_schema_cache_when_infer_schema_then_only_infer_schema_of_new_and_modified_files(tmp_path: Path) -> None:
+    files = dict(_CSV_FILES)
+    stream_reader = InMemoryFilesStreamReader(files=files, file_type="csv")
+    discovery_policy = DefaultDiscoveryPolicy(schema_cache=FileSchemaCache(tmp_path / "cache.sqlite"))
+    first_discover_schema = _create_stream_inferring_schema(discovery_policy, stream_reader, _RecordingCsvParser()).get_json_schema()
+
+    files["file0.csv"] = {"contents": [("id", "name"), ("a string", "name 0")], "last_modified": "2024-01-02T00:00:00.000000Z"}
+    files["file4.csv"] = {
+        "contents": [("id", "name", "new_column"), ("4", "name 4", "1.5")],
+        "last_modified": "2024-01-01T00:00:00.000000Z",
+    }
+    parser = _RecordingCsvParser()
+    stream = _create_stream_inferring_schema(discovery_policy, stream_reader, parser)
+    schema = stream.get_json_schema()
+
+    assert first_discover_schema["properties"]["id"] == {"type": ["null", "integer"]}
+    assert sorted(parser.inferred_files) == ["file0.csv", "file4.csv"]
+    assert schema["properties"]["id"] == {"type": ["null", "string"]}
+    assert schema["properties"]["new_column"] == {"type": ["null", "number"]}
+
+
 class TestFileBasedErrorCollector:
     test_error_collector: FileBasedErrorsCollector = FileBasedErrorsCollector()
 
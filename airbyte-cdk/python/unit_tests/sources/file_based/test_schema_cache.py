@@ -0,0 +1,88 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
+from airbyte_cdk.sources.file_based.config.jsonl_format import JsonlFormat
+from airbyte_cdk.sources.file_based.file_types.csv_parser import CsvParser
+from airbyte_cdk.sources.file_based.file_types.jsonl_parser import JsonlParser
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.schema_cache import FileSchemaCache
+
+_A_SCHEMA = {"id": {"type": "integer"}, "name": {"type": "string"}}
+_ANOTHER_SCHEMA = {"id": {"type": "string"}}
+_FILE = RemoteFile(uri="a_file.csv", last_modified=datetime(2024, 1, 1))
+
+
+def _config(**kwargs) -> FileBasedStreamConfig:
+    return FileBasedStreamConfig(
+        **{"name": "a_stream", "file_type": "csv", "validation_policy": "Emit Record", "globs": ["*.csv"], "format": CsvFormat(), **kwargs}
+    )
+
+
+def test_given_schemas_set_when_get_many_from_another_instance_then_return_persisted_schemas(tmp_path: Path) -> None:
+    FileSchemaCache(tmp_path / "cache.sqlite").set_many({"key": _A_SCHEMA, "another_key": _ANOTHER_SCHEMA})
+
+    schemas = FileSchemaCache(tmp_path / "cache.sqlite").get_many(["key", "another_key", "unknown_key"])
+
+    assert schemas == {"key": _A_SCHEMA, "another_key": _ANOTHER_SCHEMA}
+
+
+def test_given_schema_set_twice_when_get_many_then_return_latest_schema(tmp_path: Path) -> None:
+    cache = FileSchemaCache(tmp_path / "cache.sqlite")
+    cache.set_many({"key": _A_SCHEMA})
+    cache.set_many({"key": _ANOTHER_SCHEMA})
+
+    assert cache.get_many(["key"]) == {"key": _ANOTHER_SCHEMA}
+    assert len(cache) == 1
+
+
+def test_given_more_keys_than_query_parameters_limit_when_get_many_then_return_all_schemas(tmp_path: Path) -> None:
+    cache = FileSchemaCache(tmp_path / "cache.sqlite")
+    cache.set_many({f"key{i}": _A_SCHEMA for i in range(1200)})
+
+    assert len(cache.get_many([f"key{i}" for i in range(1200)])) == 1200
+
+
+def test_given_max_entries_exceeded_when_set_many_then_evict_least_recently_used_entries(tmp_path: Path) -> None:
+    cache = FileSchemaCache(tmp_path / "cache.sqlite", max_entries=2)
+    cache.set_many({"first": _A_SCHEMA})
+    cache.set_many({"second": _A_SCHEMA})
+    cache.get_many(["first"])
+
+    cache.set_many({"third": _A_SCHEMA})
+
+    assert cache.get_many(["first", "second", "third"]).keys() == {"first", "third"}
+    assert len(cache) == 2
+
+
+def test_given_invalid_max_entries_when_create_then_raise(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        FileSchemaCache(tmp_path / "cache.sqlite", max_entries=0)
+
+
+def test_given_same_parser_config_and_file_when_get_key_then_key_is_the_same() -> None:
+    assert FileSchemaCache.get_key(CsvParser(), _config(), _FILE) == FileSchemaCache.get_key(
+        CsvParser(), _config(), RemoteFile(uri="a_file.csv", last_modified=datetime(2024, 1, 1))
+    )
+
+
+@pytest.mark.parametrize(
+    "parser, config, file",
+    [
+        pytest.param(JsonlParser(), _config(), _FILE, id="test_parser_changed"),
+        pytest.param(CsvParser(), _config(format=CsvFormat(delimiter=";")), _FILE, id="test_format_changed"),
+        pytest.param(CsvParser(), _config(format=JsonlFormat()), _FILE, id="test_file_type_changed"),
+        pytest.param(CsvParser(), _config(globs=["**/*.csv"]), _FILE, id="test_globs_changed"),
+        pytest.param(CsvParser(), _config(name="another_stream"), _FILE, id="test_stream_changed"),
+        pytest.param(CsvParser(), _config(), RemoteFile(uri="a_file.csv", last_modified=datetime(2024, 1, 2)), id="test_file_modified"),
+        pytest.param(CsvParser(), _config(), RemoteFile(uri="another_file.csv", last_modified=datetime(2024, 1, 1)), id="test_other_file"),
+    ],
+)
+def test_given_parser_config_or_file_changed_when_get_key_then_key_is_different(parser, config, file) -> None:
+    assert FileSchemaCache.get_key(parser, config, file) != FileSchemaCache.get_key(CsvParser(), _config(), _FILE)
@@ -2,14 +2,29 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import threading
 from unittest.mock import Mock
 
 import pytest
-from airbyte_cdk.models import AirbyteControlConnectorConfigMessage, AirbyteControlMessage, AirbyteMessage, Level, OrchestratorType, Type
+from airbyte_cdk.models import (
+    AirbyteControlConnectorConfigMessage,
+    AirbyteControlMessage,
+    AirbyteMessage,
+    AirbyteStateBlob,
+    AirbyteStateMessage,
+    AirbyteStateType,
+    AirbyteStreamState,
+    Level,
+    OrchestratorType,
+    StreamDescriptor,
+    Type,
+)
 from airbyte_cdk.sources.message import (
+    ConcurrentMessageRepository,
     InMemoryMessageRepository,
     LogAppenderMessageRepositoryDecorator,
     MessageRepository,
+    MessageRepositoryMetrics,
     NoopMessageRepository,
 )
 
@@ -90,6 +105,123 @@ class TestInMemoryMessageRepository:
         assert list(repo.consume_queue())
 
 
+def _state_message() -> AirbyteMessage:
+    return AirbyteMessage(
+        type=Type.STATE,
+        state=AirbyteStateMessage(
+            type=AirbyteStateType.STREAM,
+            stream=AirbyteStreamState(stream_descriptor=StreamDescriptor(name="a stream"), stream_state=AirbyteStateBlob(cursor=1)),
+        ),
+    )
+
+
+class TestConcurrentMessageRepository:
+    def test_given_messages_when_consume_queue_then_return_messages_in_order(self):
+        repo = ConcurrentMessageRepository()
+        control_message = AirbyteMessage(type=Type.CONTROL, control=A_CONTROL)
+        state_message = _state_message()
+        repo.emit_message(control_message)
+        repo.log_message(Level.INFO, lambda: {"message": "this is a log message"})
+        repo.emit_message(state_message)
+
+        messages = list(repo.consume_queue())
+
+        assert [message.type for message in messages] == [Type.CONTROL, Type.LOG, Type.STATE]
+        assert messages[0] == control_message
+        assert messages[2] == state_message
+        assert repo.metrics == MessageRepositoryMetrics(queued=0, emitted=3, dropped=0)
+
+    def test_given_log_level_not_severe_enough_when_log_message_then_do_not_build_message(self):
+        repo = ConcurrentMessageRepository(Level.ERROR)
+        message_provider = Mock()
+
+        repo.log_message(Level.INFO, message_provider)
+
+        message_provider.assert_not_called()
+        assert not list(repo.consume_queue())
+
+    def test_given_queue_is_full_and_no_consumer_when_log_message_then_drop_message_without_building_it(self):
+        repo = ConcurrentMessageRepository(max_queue_size=1)
+        repo.log_message(Level.INFO, lambda: {"message": "first"})
+        message_provider = Mock()
+
+        repo.log_message(Level.INFO, message_provider)
+        repo.emit_message(AirbyteMessage(type=Type.LOG, log=Mock()))
+
+        message_provider.assert_not_called()
+        assert repo.metrics == MessageRepositoryMetrics(queued=1, emitted=0, dropped=2)
+
+    def test_given_queue_is_full_when_emit_state_or_control_message_then_queue_message(self):
+        repo = ConcurrentMessageRepository(max_queue_size=1)
+        repo.log_message(Level.INFO, lambda: {"message": "first"})
+
+        repo.emit_message(_state_message())
+        repo.emit_message(AirbyteMessage(type=Type.CONTROL, control=A_CONTROL))
+
+        assert repo.metrics.queued == 3
+
+    def test_given_dropped_messages_when_consume_queue_then_report_dropped_messages_once(self):
+        repo = ConcurrentMessageRepository(max_queue_size=1)
+        for _ in range(3):
+            repo.log_message(Level.INFO, lambda: {"message": "a log message"})
+
+        messages = list(repo.consume_queue())
+
+        assert len(messages) == 2
+        assert messages[1].log.level == Level.WARN
+        assert "2 log messages were dropped" in messages[1].log.message
+        assert not list(repo.consume_queue())
+        assert repo.metrics == MessageRepositoryMetrics(queued=0, emitted=2, dropped=2)
+
+    def test_given_queue_is_full_when_consumer_drains_queue_then_waiting_producer_queues_message(self):
+        repo = ConcurrentMessageRepository(max_queue_size=1, max_wait_seconds=10)
+        list(repo.consume_queue())  # the main thread is the consumer
+        repo.log_message(Level.INFO, lambda: {"message": "first"})
+        producer = threading.Thread(target=repo.log_message, args=(Level.INFO, lambda: {"message": "second"}))
+
+        producer.start()
+        messages = []
+        while producer.is_alive() or repo.metrics.queued:
+            messages.extend(repo.consume_queue())
+        producer.join()
+
+        assert [message.log.message for message in messages] == ['{"message": "first"}', '{"message": "second"}']
+        assert repo.metrics.dropped == 0
+
+    def test_given_queue_stays_full_when_producer_waits_then_drop_message_after_max_wait(self):
+        repo = ConcurrentMessageRepository(max_queue_size=1, max_wait_seconds=0.01)
+        list(repo.consume_queue())
+        repo.log_message(Level.INFO, lambda: {"message": "first"})
+
+        producer = threading.Thread(target=repo.log_message, args=(Level.INFO, lambda: {"message": "second"}))
+        producer.start()
+        producer.join()
+
+        assert repo.metrics == MessageRepositoryMetrics(queued=1, emitted=0, dropped=1)
+
+    def test_given_many_producers_when_consume_queue_then_every_message_is_consumed_once(self):
+        repo = ConcurrentMessageRepository(max_queue_size=10, max_wait_seconds=10)
+        list(repo.consume_queue())
+
+        def _produce(producer_id: int) -> None:
+            for i in range(200):
+                repo.log_message(Level.INFO, lambda: {"producer": producer_id, "index": i})
+
+        producers = [threading.Thread(target=_produce, args=(producer_id,)) for producer_id in range(4)]
+        for producer in producers:
+            producer.start()
+        messages = []
+        while any(producer.is_alive() for producer in producers) or repo.metrics.queued:
+            messages.extend(repo.consume_queue())
+
+        assert len({message.log.message for message in messages}) == 800
+        assert repo.metrics == MessageRepositoryMetrics(queued=0, emitted=800, dropped=0)
+
+    def test_given_invalid_max_queue_size_when_create_then_raise(self):
+        with pytest.raises(ValueError):
+            ConcurrentMessageRepository(max_queue_size=0)
+
+
 class TestNoopMessageRepository:
     def test_given_message_emitted_when_consume_queue_then_return_empty(self):
         repo = NoopMessageRepository()
@@ -348,3 +348,31 @@ def test_legacy_cursor_based_checkpoint_reader_resumable_full_refresh():
 
     # A finished checkpoint_reader should return None for the final checkpoint to avoid emitting duplicate state
     assert checkpoint_reader.get_checkpoint() is None
+
+
+def test_given_cursor_throttles_checkpoints_when_get_checkpoint_then_emit_pending_state_at_the_end_of_the_sync():
+    slices = [StreamSlice(cursor_slice={}, partition={"parent_id": parent_id}) for parent_id in range(3)]
+    stream_state = {"states": []}
+    cursor = Mock()
+    cursor.get_stream_state.return_value = stream_state
+    cursor.is_checkpoint_due.side_effect = [False, True, False]
+    checkpoint_reader = CursorBasedCheckpointReader(cursor=cursor, stream_slices=iter(slices))
+
+    checkpoints = []
+    while checkpoint_reader.next() is not None:
+        checkpoints.append(checkpoint_reader.get_checkpoint())
+    checkpoints.append(checkpoint_reader.get_checkpoint())
+
+    assert checkpoints == [None, stream_state, None, stream_state]
+
+
+def test_given_last_checkpoint_was_emitted_when_get_checkpoint_at_the_end_of_the_sync_then_return_none():
+    cursor = Mock()
+    cursor.get_stream_state.return_value = {"states": []}
+    cursor.is_checkpoint_due.return_value = True
+    checkpoint_reader = CursorBasedCheckpointReader(cursor=cursor, stream_slices=iter([StreamSlice(cursor_slice={}, partition={})]))
+
+    checkpoint_reader.next()
+    assert checkpoint_reader.get_checkpoint() == {"states": []}
+    assert checkpoint_reader.next() is None
+    assert checkpoint_reader.get_checkpoint() is None
@@ -19,6 +19,7 @@ from airbyte_cdk.models import (
 from airbyte_cdk.models import Level as LogLevel
 from airbyte_cdk.models import StreamDescriptor, SyncMode, TraceType
 from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources.concurrent_source.adaptive_concurrency import AdaptiveConcurrencyController
 from airbyte_cdk.sources.concurrent_source.concurrent_read_processor import ConcurrentReadProcessor
 from airbyte_cdk.sources.concurrent_source.partition_generation_completed_sentinel import PartitionGenerationCompletedSentinel
 from airbyte_cdk.sources.concurrent_source.stream_thread_exception import StreamThreadException
@@ -28,7 +29,7 @@ from airbyte_cdk.sources.streams.concurrent.abstract_stream import AbstractStrea
 from airbyte_cdk.sources.streams.concurrent.partition_enqueuer import PartitionEnqueuer
 from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
-from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record, RecordBatch
 from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel
 from airbyte_cdk.sources.utils.slice_logger import SliceLogger
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
@@ -465,6 +466,69 @@ class TestConcurrentReadProcessor(unittest.TestCase):
         ]
         assert messages == expected_messages
 
+    @freezegun.freeze_time("2020-01-01T00:00:00")
+    def test_given_record_batch_when_on_record_batch_then_emit_status_records_and_repository_messages(self):
+        repository_message = AirbyteMessage(
+            type=MessageType.LOG, log=AirbyteLogMessage(level=LogLevel.INFO, message="message emitted from the repository")
+        )
+        self._message_repository.consume_queue.return_value = [repository_message]
+        handler = ConcurrentReadProcessor(
+            [self._stream],
+            self._partition_enqueuer,
+            self._thread_pool_manager,
+            self._logger,
+            self._slice_logger,
+            self._message_repository,
+            self._partition_reader,
+        )
+        record_batch = RecordBatch([self._record, self._record], self._partition)
+
+        messages = list(handler.on_record_batch(record_batch))
+
+        record_message = AirbyteMessage(
+            type=MessageType.RECORD,
+            record=AirbyteRecordMessage(stream=_STREAM_NAME, data=self._record_data, emitted_at=1577836800000),
+        )
+        assert messages == [
+            AirbyteMessage(
+                type=MessageType.TRACE,
+                trace=AirbyteTraceMessage(
+                    type=TraceType.STREAM_STATUS,
+                    emitted_at=1577836800000.0,
+                    stream_status=AirbyteStreamStatusTraceMessage(
+                        stream_descriptor=StreamDescriptor(name=_STREAM_NAME), status=AirbyteStreamStatus(AirbyteStreamStatus.RUNNING)
+                    ),
+                ),
+            ),
+            record_message,
+            record_message,
+            repository_message,
+        ]
+        assert handler._record_counter[_STREAM_NAME] == 2
+        self._stream.cursor.observe_batch.assert_called_once_with(record_batch)
+        self._message_repository.consume_queue.assert_called_once()
+
+    def test_given_record_batch_with_non_record_messages_when_on_record_batch_then_only_observe_and_count_records(self):
+        handler = ConcurrentReadProcessor(
+            [self._stream],
+            self._partition_enqueuer,
+            self._thread_pool_manager,
+            self._logger,
+            self._slice_logger,
+            self._message_repository,
+            self._partition_reader,
+        )
+        log_record = Mock(spec=Record)
+        log_record.partition = self._partition
+        log_record.data = AirbyteLogMessage(level=LogLevel.INFO, message="log")
+
+        messages = list(handler.on_record_batch(RecordBatch([log_record, self._record], self._partition)))
+
+        assert [message.type for message in messages] == [MessageType.TRACE, MessageType.LOG, MessageType.RECORD]
+        assert handler._record_counter[_STREAM_NAME] == 1
+        observed_batch = self._stream.cursor.observe_batch.call_args.args[0]
+        assert observed_batch.records == [self._record]
+
     @freezegun.freeze_time("2020-01-01T00:00:00")
     def test_on_record_emits_status_message_on_first_record_with_repository_message(self):
         stream_instances_to_read_from = [self._stream]
@@ -754,3 +818,64 @@ class TestConcurrentReadProcessor(unittest.TestCase):
 
         assert _STREAM_NAME in handler._streams_currently_generating_partitions
         self._thread_pool_manager.submit.assert_called_with(self._partition_enqueuer.generate_partitions, self._stream)
+
+    def _a_partition_of_the_stream(self) -> Partition:
+        partition = Mock(spec=Partition)
+        partition.stream_name.return_value = _STREAM_NAME
+        return partition
+
+    def _handler_with_concurrency_controller(self, concurrency_controller: AdaptiveConcurrencyController) -> ConcurrentReadProcessor:
+        handler = ConcurrentReadProcessor(
+            [self._stream],
+            self._partition_enqueuer,
+            self._thread_pool_manager,
+            self._logger,
+            self._slice_logger,
+            self._message_repository,
+            self._partition_reader,
+            concurrency_controller,
+        )
+        handler.start_next_partition_generator()
+        self._thread_pool_manager.submit.reset_mock()
+        return handler
+
+    def test_given_concurrency_limit_reached_when_on_partition_then_hold_partition_back_instead_of_submitting_it(self):
+        handler = self._handler_with_concurrency_controller(AdaptiveConcurrencyController(1, 1, self._logger))
+        first_partition, second_partition = self._a_partition_of_the_stream(), self._a_partition_of_the_stream()
+
+        handler.on_partition(first_partition)
+        handler.on_partition(second_partition)
+
+        self._thread_pool_manager.submit.assert_called_once_with(self._partition_reader.process_partition, first_partition)
+        assert handler.waiting_partitions_count == 1
+        assert not handler.is_done()
+
+    def test_given_partition_waiting_for_reading_slot_when_on_partition_complete_sentinel_then_submit_waiting_partition(self):
+        handler = self._handler_with_concurrency_controller(AdaptiveConcurrencyController(1, 1, self._logger))
+        first_partition, second_partition = self._a_partition_of_the_stream(), self._a_partition_of_the_stream()
+        handler.on_partition(first_partition)
+        handler.on_partition(second_partition)
+
+        list(handler.on_partition_complete_sentinel(PartitionCompleteSentinel(first_partition, _IS_SUCCESSFUL)))
+
+        assert self._thread_pool_manager.submit.call_args_list == [
+            call(self._partition_reader.process_partition, first_partition),
+            call(self._partition_reader.process_partition, second_partition),
+        ]
+        assert handler.waiting_partitions_count == 0
+
+    def test_given_concurrency_limit_increased_when_submit_waiting_partitions_then_submit_partitions_up_to_the_new_limit(self):
+        concurrency_controller = AdaptiveConcurrencyController(1, 3, self._logger, initial_readers=1, evaluation_interval_in_seconds=0)
+        handler = self._handler_with_concurrency_controller(concurrency_controller)
+        partitions = [self._a_partition_of_the_stream() for _ in range(4)]
+        for partition in partitions:
+            handler.on_partition(partition)
+
+        concurrency_controller.maybe_adjust(0, 100, handler.waiting_partitions_count)
+        handler.submit_waiting_partitions()
+
+        assert self._thread_pool_manager.submit.call_args_list == [
+            call(self._partition_reader.process_partition, partitions[0]),
+            call(self._partition_reader.process_partition, partitions[1]),
+        ]
+        assert handler.waiting_partitions_count == 2
@@ -16,7 +16,7 @@ from airbyte_cdk.sources.declarative.incremental.datetime_based_cursor import Da
 from airbyte_cdk.sources.message import MessageRepository
 from airbyte_cdk.sources.streams.concurrent.cursor import ConcurrentCursor, CursorField, CursorValueType
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
-from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record, RecordBatch
 from airbyte_cdk.sources.streams.concurrent.state_converters.abstract_stream_state_converter import ConcurrencyCompatibleStateType
 from airbyte_cdk.sources.streams.concurrent.state_converters.datetime_stream_state_converter import (
     EpochValueConcurrentStreamStateConverter,
@@ -148,6 +148,19 @@ class ConcurrentCursorStateTest(TestCase):
             {"a_cursor_field_key": 10},
         )
 
+    def test_given_record_batch_observed_when_close_partition_then_emit_most_recent_cursor_value_of_batch(self) -> None:
+        cursor = self._cursor_without_slice_boundary_fields()
+        partition = _partition(_NO_SLICE)
+        cursor.observe_batch(RecordBatch([_record(cursor_value, partition=partition) for cursor_value in [10, 30, 20]], partition))
+        cursor.observe_batch(RecordBatch([_record(25, partition=partition)], partition))
+        cursor.close_partition(partition)
+
+        self._state_manager.update_state_for_stream.assert_called_once_with(
+            _A_STREAM_NAME,
+            _A_STREAM_NAMESPACE,
+            {"a_cursor_field_key": 30},
+        )
+
     def test_given_no_boundary_fields_when_close_multiple_partitions_then_raise_exception(self) -> None:
         cursor = self._cursor_without_slice_boundary_fields()
         partition = _partition(_NO_SLICE)
@@ -1,16 +1,18 @@
 #
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
+import asyncio
+import threading
 import unittest
 from queue import Queue
-from typing import Callable, Iterable, List
+from typing import AsyncIterator, Callable, Iterable, List, Optional
 from unittest.mock import Mock
 
 import pytest
 from airbyte_cdk.sources.concurrent_source.stream_thread_exception import StreamThreadException
 from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
-from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record, RecordBatch
 from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel, QueueItem
 
 _RECORDS = [
@@ -50,6 +52,97 @@ class PartitionReaderTest(unittest.TestCase):
 
         assert queue_content == _RECORDS + [StreamThreadException(exception, partition.stream_name()), PartitionCompleteSentinel(partition)]
 
+    def test_given_record_batch_size_when_process_partition_then_queue_record_batches_and_sentinel(self):
+        records = [Record({"id": i}, "stream") for i in range(5)]
+        partition = self._a_partition(records)
+
+        PartitionReader(self._queue, record_batch_size=2, record_batch_timeout_in_seconds=60).process_partition(partition)
+
+        assert self._consume_queue() == [
+            RecordBatch(records[0:2], partition),
+            RecordBatch(records[2:4], partition),
+            RecordBatch(records[4:5], partition),
+            PartitionCompleteSentinel(partition),
+        ]
+
+    def test_given_record_batch_timeout_reached_when_process_partition_then_queue_incomplete_batch(self):
+        partition = self._a_partition(_RECORDS)
+
+        PartitionReader(self._queue, record_batch_size=10, record_batch_timeout_in_seconds=0).process_partition(partition)
+
+        assert self._consume_queue() == [
+            RecordBatch(_RECORDS[0:1], partition),
+            RecordBatch(_RECORDS[1:2], partition),
+            PartitionCompleteSentinel(partition),
+        ]
+
+    def test_given_exception_and_record_batch_size_when_process_partition_then_queue_pending_batch_before_exception(self):
+        partition = Mock()
+        exception = ValueError()
+        partition.read.side_effect = self._read_with_exception(_RECORDS, exception)
+
+        PartitionReader(self._queue, record_batch_size=10, record_batch_timeout_in_seconds=60).process_partition(partition)
+
+        assert self._consume_queue() == [
+            RecordBatch(_RECORDS, partition),
+            StreamThreadException(exception, partition.stream_name()),
+            PartitionCompleteSentinel(partition),
+        ]
+
+    def test_given_async_http_engine_and_partition_read_async_when_process_partition_then_queue_records_read_on_event_loop(self):
+        partition = Mock(spec=Partition)
+        partition.read_async.return_value = self._async_records(_RECORDS)
+        engine = Mock()
+        engine.submit.side_effect = asyncio.run
+
+        PartitionReader(self._queue, async_http_engine=engine).process_partition(partition)
+
+        assert self._consume_queue() == _RECORDS + [PartitionCompleteSentinel(partition)]
+        partition.read.assert_not_called()
+
+    def test_given_async_http_engine_and_partition_not_read_async_when_process_partition_then_read_partition_in_worker_thread(self):
+        partition = self._a_partition(_RECORDS)
+        partition.read_async.return_value = None
+        engine = Mock()
+
+        PartitionReader(self._queue, async_http_engine=engine).process_partition(partition)
+
+        assert self._consume_queue() == _RECORDS + [PartitionCompleteSentinel(partition)]
+        engine.submit.assert_not_called()
+
+    def test_given_exception_when_process_partition_async_then_queue_records_and_exception_and_sentinel(self):
+        partition = Mock(spec=Partition)
+        exception = ValueError()
+        partition.read_async.return_value = self._async_records(_RECORDS, exception)
+        engine = Mock()
+        engine.submit.side_effect = asyncio.run
+
+        PartitionReader(self._queue, record_batch_size=10, async_http_engine=engine).process_partition(partition)
+
+        assert self._consume_queue() == [
+            RecordBatch(_RECORDS, partition),
+            StreamThreadException(exception, partition.stream_name()),
+            PartitionCompleteSentinel(partition, False),
+        ]
+
+    def test_given_full_queue_when_process_partition_async_then_wait_for_room_in_the_queue(self):
+        self._queue = Queue(maxsize=1)
+        partition = Mock(spec=Partition)
+        partition.read_async.return_value = self._async_records(_RECORDS)
+        engine = Mock()
+        engine.submit.side_effect = lambda coroutine: threading.Thread(target=asyncio.run, args=(coroutine,)).start()
+
+        PartitionReader(self._queue, async_http_engine=engine).process_partition(partition)
+
+        assert self._consume_queue() == _RECORDS + [PartitionCompleteSentinel(partition)]
+
+    @staticmethod
+    async def _async_records(records: List[Record], exception: Optional[Exception] = None) -> AsyncIterator[Record]:
+        for record in records:
+            yield record
+        if exception:
+            raise exception
+
     def _a_partition(self, records: List[Record]) -> Partition:
         partition = Mock(spec=Partition)
         partition.read.return_value = iter(records)
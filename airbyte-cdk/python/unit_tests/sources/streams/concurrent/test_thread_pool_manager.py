@@ -1,81 +1,182 @@
 #
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
+import time
+import timeit
 from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, List, Type
 from unittest import TestCase
 from unittest.mock import Mock
 
+import pytest
 from airbyte_cdk.sources.concurrent_source.thread_pool_manager import ThreadPoolManager
 
 
 class ThreadPoolManagerTest(TestCase):
     def setUp(self):
         self._threadpool = Mock(spec=ThreadPoolExecutor)
-        self._thread_pool_manager = ThreadPoolManager(self._threadpool, Mock(), max_concurrent_tasks=1)
+        self._logger = Mock()
+        self._thread_pool_manager = ThreadPoolManager(self._threadpool, self._logger, max_concurrent_tasks=1)
         self._fn = lambda x: x
         self._arg = "arg"
 
-    def test_submit_calls_underlying_thread_pool(self):
+    def _submit(self) -> Future:
+        future = Future()
+        self._threadpool.submit.return_value = future
         self._thread_pool_manager.submit(self._fn, self._arg)
+        return future
+
+    def test_submit_calls_underlying_thread_pool(self):
+        self._submit()
         self._threadpool.submit.assert_called_with(self._fn, self._arg)
 
-        assert len(self._thread_pool_manager._futures) == 1
+        assert self._thread_pool_manager.in_flight_count == 1
+
+    def test_given_future_completed_when_in_flight_count_then_future_is_not_counted(self):
+        future = self._submit()
+        self._submit()
+
+        future.set_result(None)
+
+        assert self._thread_pool_manager.in_flight_count == 1
+
+    def test_given_future_already_done_when_submit_then_future_is_not_counted(self):
+        future = Future()
+        future.set_result(None)
+        self._threadpool.submit.return_value = future
+
+        self._thread_pool_manager.submit(self._fn, self._arg)
+
+        assert self._thread_pool_manager.in_flight_count == 0
+
+    def test_given_limit_reached_when_prune_to_validate_has_reached_futures_limit_then_return_true(self):
+        self._submit()
+        assert self._thread_pool_manager.prune_to_validate_has_reached_futures_limit()
+
+    def test_given_futures_completed_when_prune_to_validate_has_reached_futures_limit_then_return_false(self):
+        self._submit().set_result(None)
+        assert not self._thread_pool_manager.prune_to_validate_has_reached_futures_limit()
 
-    def test_given_exception_during_pruning_when_check_for_errors_and_shutdown_then_shutdown_and_raise(self):
-        future = Mock(spec=Future)
-        future.exception.return_value = RuntimeError
-        future.done.side_effect = [True, True]
+    def test_given_in_flight_count_above_logging_threshold_when_prune_to_validate_has_reached_futures_limit_then_log_warning(self):
+        for _ in range(3):
+            self._submit()
 
-        self._thread_pool_manager._futures = [future]
         self._thread_pool_manager.prune_to_validate_has_reached_futures_limit()
 
+        self._logger.warning.assert_called_once()
+
+    def test_given_exception_in_future_when_check_for_errors_and_shutdown_then_shutdown_and_raise(self):
+        self._submit().set_exception(ValueError("error"))
+
         with self.assertRaises(RuntimeError):
             self._thread_pool_manager.check_for_errors_and_shutdown()
         self._threadpool.shutdown.assert_called_with(wait=False, cancel_futures=True)
 
-    def test_is_done_is_false_if_not_all_futures_are_done(self):
-        future = Mock(spec=Future)
-        future.done.return_value = False
+    def test_given_many_exceptions_when_check_for_errors_and_shutdown_then_raise_first_exception(self):
+        self._submit().set_exception(ValueError("first error"))
+        self._submit().set_exception(ValueError("second error"))
+
+        with self.assertRaisesRegex(RuntimeError, "first error"):
+            self._thread_pool_manager.check_for_errors_and_shutdown()
 
-        self._thread_pool_manager._futures = [future]
+    def test_given_cancelled_future_when_check_for_errors_and_shutdown_then_do_not_raise(self):
+        future = self._submit()
+        future.cancel()
+
+        self._thread_pool_manager.check_for_errors_and_shutdown()
+
+        assert self._thread_pool_manager.is_done()
+        self._threadpool.shutdown.assert_called_with(wait=False, cancel_futures=True)
+
+    def test_is_done_is_false_if_not_all_futures_are_done(self):
+        self._submit().set_result(None)
+        self._submit()
 
         assert not self._thread_pool_manager.is_done()
 
     def test_is_done_is_true_if_all_futures_are_done(self):
-        future = Mock(spec=Future)
-        future.done.return_value = True
-
-        self._thread_pool_manager._futures = [future]
+        self._submit().set_result(None)
+        self._submit().set_result(None)
 
         assert self._thread_pool_manager.is_done()
 
-    def test_threadpool_shutdown_if_errors(self):
-        future = Mock(spec=Future)
-        future.exception.return_value = RuntimeError
-
-        self._thread_pool_manager._futures = [future]
+    def test_check_for_errors_and_shutdown_raises_error_if_futures_are_not_done(self):
+        self._submit()
 
         with self.assertRaises(RuntimeError):
             self._thread_pool_manager.check_for_errors_and_shutdown()
         self._threadpool.shutdown.assert_called_with(wait=False, cancel_futures=True)
 
-    def test_check_for_errors_and_shutdown_raises_error_if_futures_are_not_done(self):
-        future = Mock(spec=Future)
-        future.exception.return_value = None
-        future.done.return_value = False
-
-        self._thread_pool_manager._futures = [future]
+    def test_given_future_done_but_callback_not_called_yet_when_check_for_errors_and_shutdown_then_do_not_raise(self):
+        future = self._submit()
+        future.done = Mock(return_value=True)
+        future.exception = Mock(return_value=None)
 
-        with self.assertRaises(RuntimeError):
-            self._thread_pool_manager.check_for_errors_and_shutdown()
+        self._thread_pool_manager.check_for_errors_and_shutdown()
         self._threadpool.shutdown.assert_called_with(wait=False, cancel_futures=True)
 
     def test_check_for_errors_and_shutdown_does_not_raise_error_if_futures_are_done(self):
-        future = Mock(spec=Future)
-        future.exception.return_value = None
-        future.done.return_value = True
-
-        self._thread_pool_manager._futures = [future]
+        self._submit().set_result(None)
 
         self._thread_pool_manager.check_for_errors_and_shutdown()
         self._threadpool.shutdown.assert_called_with(wait=False, cancel_futures=True)
+
+
+class _FutureListThreadPoolManager(ThreadPoolManager):
+    """
+    Tracks the futures in a list that is iterated over to prune the completed futures and to know if all the tasks are done, like the
+    ThreadPoolManager did before using done-callbacks
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._futures: List[Future[Any]] = []
+
+    def submit(self, function: Callable[..., Any], *args: Any) -> None:
+        self._futures.append(self._threadpool.submit(function, *args))
+
+    def prune_to_validate_has_reached_futures_limit(self) -> bool:
+        if len(self._futures) >= self._max_concurrent_tasks:
+            self._futures = [future for future in self._futures if not future.done()]
+        return len(self._futures) >= self._max_concurrent_tasks
+
+    def is_done(self) -> bool:
+        return all([future.done() for future in self._futures])
+
+
+def _submit_and_track_partitions(thread_pool_manager_class: Type[ThreadPoolManager], number_of_partitions: int) -> None:
+    """
+    Mimics the main loop of a concurrent read where, for each partition submitted, the partition enqueuer checks if the limit of futures
+    has been reached and the main thread checks if the tasks are done.
+    """
+    with ThreadPoolExecutor(max_workers=4) as threadpool:
+        thread_pool_manager = thread_pool_manager_class(threadpool, Mock())
+
+        for _ in range(number_of_partitions):
+            thread_pool_manager.submit(time.sleep, 0)
+            thread_pool_manager.prune_to_validate_has_reached_futures_limit()
+            thread_pool_manager.is_done()
+        while not thread_pool_manager.is_done():
+            time.sleep(0.001)
+
+    thread_pool_manager.check_for_errors_and_shutdown()
+    assert thread_pool_manager.in_flight_count == 0
+
+
+@pytest.mark.slow
+def test_thread_pool_manager_benchmark():
+    """
+    Compares tracking the futures with done-callbacks with iterating over a list of futures. The cost of the list grows with the number of
+    pending futures so the best of a few runs of the loop is compared on a number of partitions below the default limit of futures. The
+    done-callbacks were measured about 20 times faster and only have to be 5 times faster so that noise does not fail the test.
+    """
+    number_of_partitions = 1_000
+
+    future_list_duration = min(
+        timeit.repeat(lambda: _submit_and_track_partitions(_FutureListThreadPoolManager, number_of_partitions), number=1, repeat=3)
+    )
+    done_callbacks_duration = min(
+        timeit.repeat(lambda: _submit_and_track_partitions(ThreadPoolManager, number_of_partitions), number=1, repeat=3)
+    )
+
+    assert done_callbacks_duration < future_list_duration / 5
@@ -0,0 +1,349 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from queue import Queue
+from typing import Any, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Union
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from aiohttp import web
+from airbyte_cdk.models import FailureType, SyncMode
+from airbyte_cdk.sources.streams.call_rate import APIBudget, MovingWindowCallRatePolicy, Rate
+from airbyte_cdk.sources.streams.concurrent.adapters import StreamPartition
+from airbyte_cdk.sources.streams.concurrent.cursor import FinalStateCursor
+from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel, QueueItem
+from airbyte_cdk.sources.streams.http import HttpStream
+from airbyte_cdk.sources.streams.http.async_http_client import AsyncHttpClient, AsyncHttpEngine
+from airbyte_cdk.sources.streams.http.error_handlers import BackoffStrategy, ErrorResolution, ResponseAction
+from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException
+from airbyte_cdk.sources.streams.http.http_client import MessageRepresentationAirbyteTracedErrors
+from airbyte_cdk.sources.streams.http.requests_native_auth import TokenAuthenticator
+from pytest_httpserver import HTTPServer
+
+
+class _ConstantBackoffStrategy(BackoffStrategy):
+    def backoff_time(
+        self, response_or_exception: Optional[Union[requests.Response, requests.RequestException]], attempt_count: int
+    ) -> Optional[float]:
+        return 0.01
+
+
+class _PaginatedStream(HttpStream):
+    primary_key = "id"
+    cursor_field = "id"
+
+    def __init__(self, url_base: str, use_async_http_client: bool = True, use_cache: bool = False):
+        self._url_base = url_base
+        self._use_async_http_client = use_async_http_client
+        self._use_cache = use_cache
+        super().__init__()
+
+    @property
+    def url_base(self) -> str:
+        return self._url_base
+
+    @property
+    def use_async_http_client(self) -> bool:
+        return self._use_async_http_client
+
+    @property
+    def use_cache(self) -> bool:
+        return self._use_cache
+
+    def get_json_schema(self) -> Mapping[str, Any]:
+        return {}
+
+    def path(self, **kwargs: Any) -> str:
+        return "items"
+
+    def request_params(self, next_page_token: Optional[Mapping[str, Any]] = None, **kwargs: Any) -> MutableMapping[str, Any]:
+        return dict(next_page_token or {})
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        next_page = response.json().get("next_page")
+        return {"page": next_page} if next_page else None
+
+    def parse_response(self, response: requests.Response, **kwargs: Any) -> Iterable[Mapping[str, Any]]:
+        yield from response.json()["items"]
+
+
+def _expect_pages(httpserver: HTTPServer) -> None:
+    httpserver.expect_request("/items", query_string="").respond_with_json({"items": [{"id": 1}, {"id": 2}], "next_page": "2"})
+    httpserver.expect_request("/items", query_string="page=2").respond_with_json({"items": [{"id": 3}]})
+
+
+@pytest.fixture
+def engine() -> Iterator[AsyncHttpEngine]:
+    engine = AsyncHttpEngine()
+    yield engine
+    engine.close()
+
+
+def _client(engine: AsyncHttpEngine, **kwargs: Any) -> AsyncHttpClient:
+    return AsyncHttpClient(name="test", logger=MagicMock(), engine=engine, **kwargs)
+
+
+def _send(client: AsyncHttpClient, url: str, **kwargs: Any) -> requests.Response:
+    async def _send_and_close() -> requests.Response:
+        try:
+            _, response = await client.send_request_async("GET", url, request_kwargs={}, **kwargs)
+            return response
+        finally:
+            await client._engine.aclose()
+
+    return asyncio.run(_send_and_close())
+
+
+def test_given_successful_response_when_send_request_async_then_return_requests_response(
+    httpserver: HTTPServer, engine: AsyncHttpEngine
+) -> None:
+    httpserver.expect_request("/items", query_string="page=2", headers={"Authorization": "Bearer a_token"}).respond_with_json(
+        {"items": [1, 2]}, headers={"X-Custom": "value"}
+    )
+    client = _client(engine, authenticator=TokenAuthenticator("a_token"))
+
+    response = _send(client, httpserver.url_for("/items"), params={"page": "2"})
+
+    assert response.status_code == 200
+    assert response.json() == {"items": [1, 2]}
+    assert response.headers["x-custom"] == "value"
+    assert response.url == httpserver.url_for("/items") + "?page=2"
+    assert response.request.headers["Authorization"] == "Bearer a_token"
+
+
+def test_given_json_body_when_send_request_async_then_send_body(httpserver: HTTPServer, engine: AsyncHttpEngine) -> None:
+    httpserver.expect_request("/items", method="POST", json={"key": "value"}).respond_with_data("created", status=201)
+    client = _client(engine)
+
+    async def _post() -> requests.Response:
+        _, response = await client.send_request_async("POST", httpserver.url_for("/items"), request_kwargs={}, json={"key": "value"})
+        await engine.aclose()
+        return response
+
+    response = asyncio.run(_post())
+
+    assert response.status_code == 201
+    assert response.text == "created"
+
+
+def test_given_server_error_then_success_when_send_request_async_then_retry(httpserver: HTTPServer, engine: AsyncHttpEngine) -> None:
+    httpserver.expect_ordered_request("/items").respond_with_data("error", status=500)
+    httpserver.expect_ordered_request("/items").respond_with_json({"items": []})
+    client = _client(engine, backoff_strategy=_ConstantBackoffStrategy())
+
+    response = _send(client, httpserver.url_for("/items"))
+
+    assert response.json() == {"items": []}
+    assert len(httpserver.log) == 2
+
+
+def test_given_fail_response_action_when_send_request_async_then_raise_traced_exception(
+    httpserver: HTTPServer, engine: AsyncHttpEngine
+) -> None:
+    httpserver.expect_request("/items").respond_with_data("not found", status=404)
+    client = _client(engine)
+
+    with pytest.raises(MessageRepresentationAirbyteTracedErrors):
+        _send(client, httpserver.url_for("/items"))
+    assert len(httpserver.log) == 1
+
+
+def test_given_retries_disabled_when_send_request_async_then_raise_backoff_exception(
+    httpserver: HTTPServer, engine: AsyncHttpEngine
+) -> None:
+    httpserver.expect_request("/items").respond_with_data("error", status=500)
+    client = _client(engine, disable_retries=True)
+
+    with pytest.raises(DefaultBackoffException):
+        _send(client, httpserver.url_for("/items"))
+    assert len(httpserver.log) == 1
+
+
+def test_given_connection_refused_when_send_request_async_then_error_handler_interprets_requests_connection_error(
+    engine: AsyncHttpEngine,
+) -> None:
+    error_handler = MagicMock(max_retries=None, max_time=None)
+    error_handler.interpret_response.return_value = ErrorResolution(
+        response_action=ResponseAction.FAIL, failure_type=FailureType.system_error
+    )
+    client = _client(engine, error_handler=error_handler)
+
+    with pytest.raises(MessageRepresentationAirbyteTracedErrors):
+        _send(client, "http://localhost:1/items")
+    assert isinstance(error_handler.interpret_response.call_args.args[0], requests.ConnectionError)
+
+
+def test_given_log_formatter_when_send_request_async_then_log_response_with_message_repository(
+    httpserver: HTTPServer, engine: AsyncHttpEngine
+) -> None:
+    httpserver.expect_request("/items").respond_with_json({"items": []})
+    message_repository = MagicMock()
+    client = _client(engine, message_repository=message_repository)
+
+    _send(client, httpserver.url_for("/items"), log_formatter=lambda response: response.status_code)
+
+    message_repository.log_message.assert_called_once()
+
+
+def test_given_api_budget_when_send_requests_async_then_wait_without_blocking_the_event_loop(
+    httpserver: HTTPServer, engine: AsyncHttpEngine
+) -> None:
+    httpserver.expect_request("/items").respond_with_json({})
+    budget = APIBudget(policies=[MovingWindowCallRatePolicy(rates=[Rate(limit=2, interval=timedelta(seconds=1))], matchers=[])])
+    client = _client(engine, api_budget=budget)
+    ticks = []
+
+    async def _tick_until(event: asyncio.Event) -> None:
+        while not event.is_set():
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.05)
+
+    async def _send_requests() -> None:
+        done = asyncio.Event()
+        ticker = asyncio.create_task(_tick_until(done))
+        await asyncio.gather(*(client.send_request_async("GET", httpserver.url_for("/items"), request_kwargs={}) for _ in range(3)))
+        done.set()
+        await ticker
+        await engine.aclose()
+
+    start = time.monotonic()
+    asyncio.run(_send_requests())
+
+    assert len(httpserver.log) == 3
+    assert time.monotonic() - start >= 0.9
+    assert len(ticks) >= 10
+
+
+def test_given_requests_from_many_threads_when_send_request_then_share_one_loop_and_session(
+    httpserver: HTTPServer, engine: AsyncHttpEngine
+) -> None:
+    httpserver.expect_request("/items").respond_with_json({})
+    client = _client(engine)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        responses = list(executor.map(lambda _: client.send_request("GET", httpserver.url_for("/items"), request_kwargs={})[1], range(8)))
+
+    assert [response.status_code for response in responses] == [200] * 8
+    assert len(engine._sessions) == 1
+
+
+def test_given_submitted_from_engine_loop_when_run_then_raise(engine: AsyncHttpEngine) -> None:
+    async def _run_nested() -> None:
+        engine.run(asyncio.sleep(0))
+
+    with pytest.raises(RuntimeError):
+        engine.run(_run_nested())
+
+
+@pytest.mark.parametrize(
+    "number_of_requests, max_connections, expected_max_in_flight",
+    [
+        pytest.param(300, 300, 300, id="test_hundreds_of_requests_in_flight"),
+        pytest.param(20, 5, 5, id="test_in_flight_requests_bounded_by_connection_pool"),
+    ],
+)
+def test_given_requests_gathered_on_one_event_loop_then_requests_are_in_flight_concurrently(
+    number_of_requests: int, max_connections: int, expected_max_in_flight: int
+) -> None:
+    in_flight = 0
+    max_in_flight = 0
+    all_in_flight = asyncio.Event()
+
+    async def _handler(request: web.Request) -> web.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        if in_flight == expected_max_in_flight:
+            all_in_flight.set()
+        try:
+            # Requests are only answered once the expected number of requests are in flight
+            await asyncio.wait_for(all_in_flight.wait(), timeout=30)
+            await asyncio.sleep(0.01)
+        finally:
+            in_flight -= 1
+        return web.json_response({"id": request.query["id"]})
+
+    async def _send_requests() -> float:
+        app = web.Application()
+        app.router.add_get("/items", _handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "localhost", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+        engine = AsyncHttpEngine(max_connections=max_connections)
+        client = _client(engine)
+        try:
+            start = time.monotonic()
+            results = await asyncio.gather(
+                *(
+                    client.send_request_async("GET", f"http://localhost:{port}/items", request_kwargs={}, params={"id": str(i)})
+                    for i in range(number_of_requests)
+                )
+            )
+            duration = time.monotonic() - start
+            assert [response.json()["id"] for _, response in results] == [str(i) for i in range(number_of_requests)]
+            return duration
+        finally:
+            await engine.aclose()
+            await runner.cleanup()
+
+    duration = asyncio.run(_send_requests())
+
+    assert max_in_flight == expected_max_in_flight
+    assert duration < 30
+
+
+def test_given_use_async_http_client_when_read_records_async_then_read_all_pages(httpserver: HTTPServer) -> None:
+    _expect_pages(httpserver)
+    stream = _PaginatedStream(httpserver.url_for("/"))
+
+    async def _read() -> List[Mapping[str, Any]]:
+        try:
+            return [record async for record in stream.read_records_async(SyncMode.full_refresh)]  # type: ignore[misc]
+        finally:
+            await stream._http_client._engine.aclose()  # type: ignore[attr-defined]
+
+    assert stream.reads_records_async
+    assert asyncio.run(_read()) == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+
+@pytest.mark.parametrize(
+    "use_async_http_client, use_cache",
+    [pytest.param(False, False, id="test_async_client_not_requested"), pytest.param(True, True, id="test_responses_are_cached")],
+)
+def test_given_async_http_client_not_usable_when_create_stream_then_records_are_not_read_async(
+    use_async_http_client: bool, use_cache: bool
+) -> None:
+    stream = _PaginatedStream("https://example.com/", use_async_http_client=use_async_http_client, use_cache=use_cache)
+
+    assert not isinstance(stream._http_client, AsyncHttpClient)
+    assert not stream.reads_records_async
+    assert StreamPartition(stream, None, MagicMock(), SyncMode.full_refresh, None, None, MagicMock()).read_async() is None
+
+
+def test_given_async_http_engine_when_process_stream_partition_then_read_partition_on_the_event_loop_of_the_engine(
+    httpserver: HTTPServer, engine: AsyncHttpEngine
+) -> None:
+    _expect_pages(httpserver)
+    stream = _PaginatedStream(httpserver.url_for("/"))
+    partition = StreamPartition(
+        stream, None, MagicMock(), SyncMode.full_refresh, None, None, FinalStateCursor(stream.name, None, MagicMock())
+    )
+    queue: Queue[QueueItem] = Queue()
+
+    PartitionReader(queue, async_http_engine=engine).process_partition(partition)
+
+    items = []
+    while not isinstance(item := queue.get(timeout=5), PartitionCompleteSentinel):
+        items.append(item)
+    assert [record.data for record in items if isinstance(record, Record)] == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert len(items) == 3
@@ -1,11 +1,13 @@
 #
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
+import asyncio
 import os
 import tempfile
+import threading
 import time
 from datetime import datetime, timedelta
-from typing import Any, Iterable, Mapping, Optional
+from typing import Any, Iterable, List, Mapping, Optional
 
 import pytest
 import requests
@@ -14,6 +16,7 @@ from airbyte_cdk.sources.streams.call_rate import (
     APIBudget,
     CallRateLimitHit,
     FixedWindowCallRatePolicy,
+    HttpAPIBudget,
     HttpRequestMatcher,
     MovingWindowCallRatePolicy,
     Rate,
@@ -162,6 +165,9 @@ class TestUnlimitedCallRatePolicy:
         policy.update(available_calls=None, call_reset_ts=datetime.now())
         policy.update(available_calls=10, call_reset_ts=None)
 
+    def test_utilization(self):
+        assert UnlimitedCallRatePolicy(matchers=[]).utilization() is None
+
 
 class TestFixedWindowCallRatePolicy:
     def test_limit_rate(self, mocker):
@@ -194,6 +200,12 @@ class TestFixedWindowCallRatePolicy:
         with pytest.raises(CallRateLimitHit):
             policy.try_acquire(mocker.Mock(), weight=3)
 
+    def test_utilization(self, mocker):
+        policy = FixedWindowCallRatePolicy(matchers=[], next_reset_ts=datetime.now(), period=timedelta(hours=1), call_limit=4)
+        assert policy.utilization() == 0
+        policy.try_acquire(mocker.Mock(), weight=1)
+        assert policy.utilization() == 0.25
+
 
 class TestMovingWindowCallRatePolicy:
     def test_no_rates(self):
@@ -246,6 +258,173 @@ class TestMovingWindowCallRatePolicy:
         assert excinfo.value.time_to_wait.total_seconds() == pytest.approx(3600, 0.1)
         assert str(excinfo.value) == "Bucket for item=call with Rate limit=2/1.0h is already full"
 
+    def test_utilization_is_the_one_of_the_most_used_rate(self):
+        policy = MovingWindowCallRatePolicy(matchers=[], rates=[Rate(4, timedelta(minutes=1)), Rate(10, timedelta(hours=1))])
+        assert policy.utilization() == 0
+        policy.try_acquire("call", weight=2)
+        assert policy.utilization() == 0.5
+
+
+def _acquire_in_threads(api_budget: APIBudget, number_of_threads: int) -> List[int]:
+    """Start the threads one after the other once the previous thread is waiting and return the threads in their order of acquisition"""
+    acquired = []
+    threads = []
+    for i in range(number_of_threads):
+        thread = threading.Thread(target=lambda thread_index=i: (api_budget.acquire_call("call"), acquired.append(thread_index)))
+        thread.start()
+        threads.append(thread)
+        while api_budget.metrics.waiting_calls < i + 1 and len(acquired) < i + 1:
+            time.sleep(0.001)
+    for thread in threads:
+        thread.join()
+    return acquired
+
+
+def _acquire_alternating_threads_and_event_loop(api_budget: APIBudget, number_of_calls: int) -> List[int]:
+    """Send blocking calls from threads and awaited calls from an event loop, one after the other once the previous call is waiting, and
+    return the calls in their order of acquisition"""
+    loop = asyncio.new_event_loop()
+    loop_thread = threading.Thread(target=loop.run_forever, daemon=True)
+    loop_thread.start()
+    acquired = []
+    waits = []
+    try:
+        for i in range(number_of_calls):
+            if i % 2:
+
+                async def _acquire_async(call_index: int = i) -> None:
+                    await api_budget.acquire_call_async("call")
+                    acquired.append(call_index)
+
+                waits.append(asyncio.run_coroutine_threadsafe(_acquire_async(), loop).result)
+            else:
+                thread = threading.Thread(target=lambda call_index=i: (api_budget.acquire_call("call"), acquired.append(call_index)))
+                thread.start()
+                waits.append(thread.join)
+            while api_budget.metrics.waiting_calls < i + 1 and len(acquired) < i + 1:
+                time.sleep(0.001)
+        for wait in waits:
+            wait()
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        loop_thread.join()
+        loop.close()
+    return acquired
+
+
+class TestAPIBudget:
+    def test_given_credits_exhausted_when_acquire_call_then_calls_acquire_in_order_of_arrival(self):
+        api_budget = APIBudget(policies=[MovingWindowCallRatePolicy(rates=[Rate(1, timedelta(milliseconds=50))], matchers=[])])
+
+        assert _acquire_in_threads(api_budget, 6) == list(range(6))
+
+    def test_given_credits_exhausted_when_acquire_call_then_only_head_of_queue_tries_to_acquire(self, mocker):
+        policy = MovingWindowCallRatePolicy(rates=[Rate(1, timedelta(milliseconds=20))], matchers=[])
+        try_acquire = mocker.spy(policy, "try_acquire")
+        api_budget = APIBudget(policies=[policy])
+
+        _acquire_in_threads(api_budget, 10)
+
+        # Each call fails once when it reaches the head of the queue and possibly once more as the policies count time in milliseconds,
+        # instead of every waiting call retrying each time a credit is freed
+        assert try_acquire.call_count <= 3 * 10
+
+    def test_given_credit_expires_when_acquire_call_then_wake_up_when_credit_is_available(self):
+        api_budget = APIBudget(policies=[MovingWindowCallRatePolicy(rates=[Rate(1, timedelta(milliseconds=200))], matchers=[])])
+        api_budget.acquire_call("call")
+
+        start = time.monotonic()
+        api_budget.acquire_call("call")
+        duration = time.monotonic() - start
+
+        assert 0.15 <= duration < 0.4
+        metrics = api_budget.metrics
+        assert metrics.acquired_calls == 2
+        assert metrics.delayed_calls == 1
+        assert metrics.max_wait_time.total_seconds() == pytest.approx(duration, abs=0.05)
+        assert metrics.average_wait_time == metrics.total_wait_time / 2
+        assert metrics.utilization == [1.0]
+
+    def test_given_timeout_when_acquire_call_then_raise_call_rate_limit_hit_once_timeout_expires(self):
+        api_budget = APIBudget(policies=[MovingWindowCallRatePolicy(rates=[Rate(1, timedelta(minutes=1))], matchers=[])])
+        api_budget.acquire_call("call")
+
+        start = time.monotonic()
+        with pytest.raises(CallRateLimitHit) as exception:
+            api_budget.acquire_call("call", timeout=0.1)
+
+        assert 0.1 <= time.monotonic() - start < 1
+        assert exception.value.time_to_wait.total_seconds() == pytest.approx(60, abs=1)
+        metrics = api_budget.metrics
+        assert (metrics.acquired_calls, metrics.rejected_calls, metrics.waiting_calls) == (1, 1, 0)
+
+    def test_given_non_blocking_call_when_credits_exhausted_then_raise_immediately(self):
+        api_budget = APIBudget(policies=[MovingWindowCallRatePolicy(rates=[Rate(1, timedelta(minutes=1))], matchers=[])])
+        api_budget.acquire_call("call", block=False)
+
+        with pytest.raises(CallRateLimitHit):
+            api_budget.acquire_call("call", block=False)
+        assert api_budget.metrics.rejected_calls == 1
+
+    def test_given_waiting_call_when_update_from_response_resets_window_then_waiting_call_acquires(self):
+        policy = FixedWindowCallRatePolicy(
+            matchers=[], next_reset_ts=datetime.now() + timedelta(hours=1), period=timedelta(hours=1), call_limit=1
+        )
+        api_budget = HttpAPIBudget(policies=[policy])
+        request = Request("GET", url="http://domain/api/users").prepare()
+        api_budget.acquire_call(request)
+        thread = threading.Thread(target=api_budget.acquire_call, args=(request,))
+        thread.start()
+        while api_budget.metrics.waiting_calls == 0:
+            time.sleep(0.001)
+
+        response = requests.Response()
+        response.headers["ratelimit-reset"] = str(int(time.time()) - 1)
+        api_budget.update_from_response(request, response)
+
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        assert api_budget.metrics.acquired_calls == 2
+
+
+    def test_given_blocking_and_awaited_calls_when_credits_exhausted_then_calls_acquire_in_order_of_arrival(self):
+        api_budget = APIBudget(policies=[MovingWindowCallRatePolicy(rates=[Rate(1, timedelta(milliseconds=50))], matchers=[])])
+
+        assert _acquire_alternating_threads_and_event_loop(api_budget, 6) == list(range(6))
+
+    def test_given_credits_exhausted_when_acquire_call_async_then_event_loop_is_not_blocked(self):
+        api_budget = APIBudget(policies=[MovingWindowCallRatePolicy(rates=[Rate(1, timedelta(milliseconds=200))], matchers=[])])
+        ticks = []
+
+        async def _tick() -> None:
+            while True:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        async def _acquire_twice() -> None:
+            ticker = asyncio.create_task(_tick())
+            await api_budget.acquire_call_async("call")
+            await api_budget.acquire_call_async("call")
+            ticker.cancel()
+
+        asyncio.run(_acquire_twice())
+
+        assert len(ticks) >= 10
+        metrics = api_budget.metrics
+        assert (metrics.acquired_calls, metrics.delayed_calls, metrics.waiting_calls) == (2, 1, 0)
+
+    def test_given_timeout_when_acquire_call_async_then_raise_call_rate_limit_hit_once_timeout_expires(self):
+        api_budget = APIBudget(policies=[MovingWindowCallRatePolicy(rates=[Rate(1, timedelta(minutes=1))], matchers=[])])
+        api_budget.acquire_call("call")
+
+        start = time.monotonic()
+        with pytest.raises(CallRateLimitHit):
+            asyncio.run(api_budget.acquire_call_async("call", timeout=0.1))
+
+        assert 0.1 <= time.monotonic() - start < 1
+        metrics = api_budget.metrics
+        assert (metrics.acquired_calls, metrics.rejected_calls, metrics.waiting_calls) == (1, 1, 0)
+
 
 class TestHttpStreamIntegration:
     def test_without_cache(self, mocker, requests_mock):
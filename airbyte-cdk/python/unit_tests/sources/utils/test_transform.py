@@ -3,6 +3,8 @@
 #
 
 import json
+import logging
+from typing import List
 
 import pytest
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
@@ -205,8 +207,9 @@ VERY_NESTED_SCHEMA = {
         ),
     ],
 )
-def test_transform(schema, actual, expected, expected_warns, caplog):
-    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+@pytest.mark.parametrize("compile_schema", [False, True])
+def test_transform(schema, actual, expected, expected_warns, compile_schema, caplog):
+    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization, compile_schema=compile_schema)
     t.transform(actual, schema)
     assert json.dumps(actual) == json.dumps(expected)
     if expected_warns:
@@ -264,3 +267,102 @@ def test_custom_transform_with_default_normalization():
     obj = {"value": 12}
     s.transformer.transform(obj, SIMPLE_SCHEMA)
     assert obj == {"value": "transformed"}
+
+
+PARITY_SCHEMA = {
+    "type": ["null", "object"],
+    "properties": {
+        "id": {"type": "integer"},
+        "name": {"type": ["null", "string"]},
+        "amount": {"type": "number"},
+        "active": {"type": "boolean"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "scalar_or_array": {"type": "array", "items": {"type": ["null", "integer"]}},
+        "address": {"$ref": "#/definitions/address"},
+        "children": {"type": "array", "items": {"$ref": "#/definitions/child"}},
+        "ambiguous": {"type": ["string", "integer"]},
+    },
+    "definitions": {
+        "address": {"type": "object", "properties": {"zip": {"type": "string"}, "number": {"type": "integer"}}},
+        "child": {"type": "object", "properties": {"name": {"type": "string"}, "children": {"type": "array", "items": {"$ref": "#/definitions/child"}}}},
+    },
+}
+PARITY_RECORDS = [
+    {"id": "1", "name": None, "amount": "1.5", "active": "true", "tags": [1, None, "a"], "scalar_or_array": 2},
+    {"id": "not an int", "amount": None, "active": "not a bool", "tags": "single", "scalar_or_array": None, "ambiguous": 1.5},
+    {"address": {"zip": 12345, "number": "12"}, "children": [{"name": 1, "children": [{"name": None, "children": "not a list"}]}]},
+    {"address": "not an object", "children": [1, None, {"name": True}]},
+    {"id": True, "amount": [1], "active": 0, "tags": {"key": "value"}},
+]
+
+
+def _airbyte_warnings(caplog) -> List[str]:
+    # other libraries, like pyrate_limiter, may log from background threads while the test runs
+    return [log.message for log in caplog.records if log.name == "airbyte" and log.levelno >= logging.WARNING]
+
+
+@pytest.mark.parametrize("record", PARITY_RECORDS)
+def test_compiled_transform_is_equivalent_to_validator_transform(record, caplog):
+    validator_record = json.loads(json.dumps(record))
+    TypeTransformer(TransformConfig.DefaultSchemaNormalization).transform(validator_record, PARITY_SCHEMA)
+    validator_warnings = _airbyte_warnings(caplog)
+    caplog.clear()
+
+    compiled_record = json.loads(json.dumps(record))
+    TypeTransformer(TransformConfig.DefaultSchemaNormalization, compile_schema=True).transform(compiled_record, PARITY_SCHEMA)
+
+    assert compiled_record == validator_record
+    assert _airbyte_warnings(caplog) == validator_warnings
+
+
+def test_given_schema_with_unsupported_type_when_compiled_transform_then_fallback_to_validator():
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization, compile_schema=True)
+    schema = {"type": "object", "properties": {"value": {"type": "string"}, "other": {"type": "unknown_type"}}}
+
+    record = {"value": 12}
+    transformer.transform(record, schema)
+
+    assert record == {"value": "12"}
+    assert transformer._get_compiled_normalizer(schema) is None
+
+
+def test_given_same_schema_content_when_compiled_transform_then_compile_once():
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization, compile_schema=True)
+
+    transformer.transform({"value": 12}, json.loads(json.dumps(SIMPLE_SCHEMA)))
+    compiled_normalizer = transformer._get_compiled_normalizer(SIMPLE_SCHEMA)
+    transformer.transform({"value": 12}, json.loads(json.dumps(SIMPLE_SCHEMA)))
+
+    assert compiled_normalizer is not None
+    assert transformer._get_compiled_normalizer(json.loads(json.dumps(SIMPLE_SCHEMA))) is compiled_normalizer
+    assert len(transformer._compiled_schemas) == 1
+
+
+def test_custom_transform_with_compiled_schema():
+    transformer = TypeTransformer(TransformConfig.CustomSchemaNormalization | TransformConfig.DefaultSchemaNormalization, compile_schema=True)
+
+    @transformer.registerCustomTransform
+    def transform_cb(instance, schema):
+        assert instance == "12"
+        assert schema == SIMPLE_SCHEMA["properties"]["value"]
+        return "transformed"
+
+    obj = {"value": 12}
+    transformer.transform(obj, SIMPLE_SCHEMA)
+    assert obj == {"value": "transformed"}
+
+
+@pytest.mark.slow
+def test_compiled_transform_benchmark():
+    schema = {"type": "object", "properties": {f"column_{i}": {"type": ["null", "integer" if i % 2 else "string"]} for i in range(100)}}
+    records = [{f"column_{i}": str(i) if i % 2 else i for i in range(100)} for _ in range(2_000)]
+
+    transformed_records = {}
+    for compile_schema in (False, True):
+        transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization, compile_schema=compile_schema)
+        transformed_records[compile_schema] = [dict(record) for record in records]
+        for record in transformed_records[compile_schema]:
+            transformer.transform(record, schema)
+
+    assert transformed_records[True] == transformed_records[False]
+    assert transformed_records[True][0] == {f"column_{i}": i if i % 2 else str(i) for i in range(100)}
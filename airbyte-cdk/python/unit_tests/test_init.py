@@ -0,0 +1,60 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import importlib
+import subprocess
+import sys
+
+import airbyte_cdk
+import pytest
+
+# The import of the package used to take about 2 seconds as it imported the whole CDK
+_IMPORT_TIME_BUDGET_SECONDS = 0.5
+_MODULES_NOT_IMPORTED_BY_THE_PACKAGE = ["airbyte_cdk.sources.declarative", "airbyte_cdk.sources.file_based", "jsonschema", "requests_cache"]
+
+
+def _run_python(code: str) -> str:
+    return subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+
+
+@pytest.mark.parametrize("name", sorted(airbyte_cdk._LAZY_EXPORTS))
+def test_given_exported_name_when_get_attribute_then_return_object_from_its_module(name) -> None:
+    module_name, attribute_name = airbyte_cdk._LAZY_EXPORTS[name]
+    module = importlib.import_module(module_name, "airbyte_cdk")
+
+    expected = getattr(module, attribute_name, None) or importlib.import_module(f"{module_name}.{attribute_name}", "airbyte_cdk")
+    assert getattr(airbyte_cdk, name) is expected
+
+
+def test_given_unknown_name_when_get_attribute_then_raise_attribute_error() -> None:
+    with pytest.raises(AttributeError):
+        airbyte_cdk.UnknownName
+
+
+def test_given_submodule_when_get_attribute_then_return_submodule() -> None:
+    assert airbyte_cdk.models is importlib.import_module("airbyte_cdk.models")
+
+
+def test_when_dir_then_list_exported_names() -> None:
+    assert set(airbyte_cdk._LAZY_EXPORTS).issubset(dir(airbyte_cdk))
+
+
+def test_when_import_package_then_do_not_import_the_whole_cdk() -> None:
+    imported_modules = _run_python(
+        f"import sys; import airbyte_cdk; print(' '.join(m for m in {_MODULES_NOT_IMPORTED_BY_THE_PACKAGE!r} if m in sys.modules))"
+    )
+
+    assert imported_modules.strip() == ""
+
+
+def test_import_time_benchmark() -> None:
+    """
+    Measures the time it takes to import the package in a new interpreter. The best of a few runs is kept to limit the noise.
+    """
+    durations = [
+        float(_run_python("import time; start = time.perf_counter(); import airbyte_cdk; print(time.perf_counter() - start)"))
+        for _ in range(3)
+    ]
+
+    assert min(durations) < _IMPORT_TIME_BUDGET_SECONDS
@@ -0,0 +1,114 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+import io
+import threading
+import time
+
+from airbyte_cdk.utils.buffered_message_writer import BufferedMessageWriter
+
+
+class _CountingBinaryStream(io.BytesIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.number_of_writes = 0
+
+    def write(self, data) -> int:
+        self.number_of_writes += 1
+        return super().write(data)
+
+
+class _TextStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.buffer = _CountingBinaryStream()
+
+
+def test_given_messages_below_buffer_size_when_write_then_nothing_is_written_until_flush():
+    stream = _TextStream()
+    writer = BufferedMessageWriter(max_buffer_size=1024, flush_interval=60, stream=stream)
+
+    writer.write('{"type": "RECORD"}')
+    writer.write('{"type": "STATE"}')
+    assert stream.buffer.getvalue() == b""
+
+    writer.flush()
+    assert stream.buffer.getvalue() == b'{"type": "RECORD"}\n{"type": "STATE"}\n'
+    assert stream.buffer.number_of_writes == 1
+
+
+def test_given_buffer_size_reached_when_write_then_flush_whole_lines():
+    stream = _TextStream()
+    writer = BufferedMessageWriter(max_buffer_size=10, flush_interval=60, stream=stream)
+
+    writer.write("123456")
+    assert stream.buffer.getvalue() == b""
+    writer.write(b"789012")
+
+    assert stream.buffer.getvalue() == b"123456\n789012\n"
+
+
+def test_given_oldest_message_is_stale_when_write_then_flush():
+    stream = _TextStream()
+    writer = BufferedMessageWriter(max_buffer_size=1024, flush_interval=0.01, stream=stream)
+
+    writer.write("first")
+    time.sleep(0.02)
+    writer.write("second")
+
+    assert stream.buffer.getvalue() == b"first\nsecond\n"
+
+
+def test_given_context_manager_when_no_new_message_then_background_thread_flushes_stale_buffer():
+    stream = _TextStream()
+    with BufferedMessageWriter(max_buffer_size=1024, flush_interval=0.01, stream=stream) as writer:
+        writer.write("message")
+        deadline = time.monotonic() + 5
+        while not stream.buffer.getvalue() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert stream.buffer.getvalue() == b"message\n"
+
+
+def test_given_exception_when_exiting_context_manager_then_flush_buffer():
+    stream = _TextStream()
+    try:
+        with BufferedMessageWriter(max_buffer_size=1024, flush_interval=60, stream=stream) as writer:
+            writer.write("message")
+            raise ValueError("error")
+    except ValueError:
+        pass
+
+    assert stream.buffer.getvalue() == b"message\n"
+
+
+def test_given_stream_without_binary_buffer_when_flush_then_write_text():
+    stream = io.StringIO()
+    writer = BufferedMessageWriter(stream=stream)
+
+    writer.write("message")
+    writer.flush()
+
+    assert stream.getvalue() == "message\n"
+
+
+def test_given_concurrent_writers_when_write_then_lines_are_never_split():
+    stream = _TextStream()
+    number_of_threads = 8
+    messages_per_thread = 1000
+
+    def _write(writer: BufferedMessageWriter, thread_id: int) -> None:
+        for i in range(messages_per_thread):
+            writer.write(f"{thread_id}-{i}-" + "x" * 50)
+
+    with BufferedMessageWriter(max_buffer_size=512, flush_interval=0.001, stream=stream) as writer:
+        threads = [threading.Thread(target=_write, args=(writer, thread_id)) for thread_id in range(number_of_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    lines = stream.buffer.getvalue().decode().splitlines()
+    assert len(lines) == number_of_threads * messages_per_thread
+    assert all(line.endswith("x" * 50) for line in lines)
+    for thread_id in range(number_of_threads):
+        indexes = [int(line.split("-")[1]) for line in lines if line.startswith(f"{thread_id}-")]
+        assert indexes == list(range(messages_per_thread))
@@ -2,11 +2,14 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import List, Mapping
+import timeit
+from collections import OrderedDict
+from typing import Any, Iterable, List, Mapping
+from unittest.mock import patch
 
 import pytest
 from airbyte_cdk.models import AirbyteRecordMessage
-from airbyte_cdk.utils.schema_inferrer import SchemaInferrer, SchemaValidationException
+from airbyte_cdk.utils.schema_inferrer import NoRequiredSchemaBuilder, SchemaInferrer, SchemaValidationException
 
 NOW = 1234567
 
@@ -349,3 +352,118 @@ def test_given_composite_pk_but_only_one_path_valid_when_get_inferred_schemas_th
 
     assert len(exception.value.validation_errors) == 1
     assert "id 2" in exception.value.validation_errors[0]
+
+
+def _heterogeneous_records(number_of_records: int) -> Iterable[Mapping[str, Any]]:
+    for i in range(number_of_records):
+        record: dict = {"id": i, "name": f"name {i}", "amount": i * 1.5 if i % 3 else i}
+        if i % 5 == 0:
+            record["optional"] = None if i % 2 else "value"
+        if i % 7 == 0:
+            record["tags"] = ["a", i] if i % 2 else []
+        if i % 11 == 0:
+            record["nested"] = {"key": i % 2 == 0, "values": [{"x": 1.0}, {"y": "z"}]}
+        if i % 13 == 0:
+            record["id"] = str(i)
+        yield record
+
+
+def _infer_with_every_record(records: Iterable[Mapping[str, Any]]) -> Mapping[str, Any]:
+    builder = NoRequiredSchemaBuilder()
+    for record in records:
+        builder.add_object(AirbyteRecordMessage(stream=_STREAM_NAME, data=record, emitted_at=NOW).data)
+    inferrer = SchemaInferrer()
+    inferrer.stream_to_builder[_STREAM_NAME] = builder
+    return inferrer.get_stream_schema(_STREAM_NAME)
+
+
+def _accumulate(inferrer: SchemaInferrer, records: Iterable[Mapping[str, Any]]) -> None:
+    for record in records:
+        inferrer.accumulate(AirbyteRecordMessage(stream=_STREAM_NAME, data=record, emitted_at=NOW))
+
+
+def test_given_heterogeneous_records_when_get_stream_schema_then_schema_is_the_same_as_adding_every_record() -> None:
+    inferrer = SchemaInferrer()
+    _accumulate(inferrer, _heterogeneous_records(3000))
+
+    assert inferrer.get_stream_schema(_STREAM_NAME) == _infer_with_every_record(_heterogeneous_records(3000))
+
+
+def test_given_records_with_the_same_shape_when_accumulate_then_only_add_first_record_to_builder() -> None:
+    inferrer = SchemaInferrer()
+    with patch.object(NoRequiredSchemaBuilder, "add_object", side_effect=NoRequiredSchemaBuilder.add_object, autospec=True) as add_object:
+        _accumulate(inferrer, [{"id": 1, "tags": ["a", 1]}, {"id": 2, "tags": [2, "b", "c"]}, {"id": "3", "tags": []}, {"id": 4, "tags": []}])
+
+    assert add_object.call_count == 3
+    assert inferrer.get_stream_schema(_STREAM_NAME)["properties"] == {
+        "id": {"type": ["number", "string", "null"]},
+        "tags": {"type": ["array", "null"], "items": {"type": ["number", "string", "null"]}},
+    }
+
+
+def test_given_max_shapes_reached_when_accumulate_then_records_with_unknown_shapes_are_still_added() -> None:
+    inferrer = SchemaInferrer(max_shapes_per_stream=1)
+    _accumulate(inferrer, [{"id": 1}, {"id": "1"}, {"id": 1, "name": "a name"}])
+
+    assert inferrer.get_stream_schema(_STREAM_NAME)["properties"] == {
+        "id": {"type": ["number", "string", "null"]},
+        "name": {"type": ["string", "null"]},
+    }
+
+
+def test_given_mapping_subclass_when_accumulate_then_always_add_record_to_builder() -> None:
+    inferrer = SchemaInferrer()
+    _accumulate(inferrer, [{"nested": OrderedDict(key=1)}, {"nested": OrderedDict(key="a value")}])
+
+    assert inferrer.get_stream_schema(_STREAM_NAME)["properties"]["nested"]["properties"] == {"key": {"type": ["number", "string", "null"]}}
+
+
+def test_given_max_records_per_stream_when_get_stream_schema_then_infer_schema_from_sample() -> None:
+    inferrer = SchemaInferrer(max_records_per_stream=10)
+    _accumulate(inferrer, [{"id": i} for i in range(1000)] + [{"id": str(i)} for i in range(1000)])
+
+    schema = inferrer.get_stream_schema(_STREAM_NAME)
+
+    # the sample is uniform over all the records so records of both halves are expected to be sampled
+    assert schema["properties"] == {"id": {"type": ["number", "string", "null"]}}
+    assert len(inferrer._stream_to_sample[_STREAM_NAME]) == 10
+
+
+def test_given_fewer_records_than_max_records_per_stream_when_get_stream_schema_then_schema_is_the_same_as_adding_every_record() -> None:
+    inferrer = SchemaInferrer(max_records_per_stream=1000)
+    _accumulate(inferrer, _heterogeneous_records(500))
+
+    assert inferrer.get_stream_schema(_STREAM_NAME) == _infer_with_every_record(_heterogeneous_records(500))
+
+
+def test_given_invalid_max_records_per_stream_when_create_then_raise() -> None:
+    with pytest.raises(ValueError):
+        SchemaInferrer(max_records_per_stream=0)
+
+
+@pytest.mark.slow
+def test_schema_inferrer_benchmark() -> None:
+    """
+    Compares adding every one of 50,000 heterogeneous records to the genson schema builder, which is what the SchemaInferrer used to do,
+    with accumulating them in the SchemaInferrer. The messages are created beforehand so that only the inference is timed. The best of a
+    few runs is compared and the SchemaInferrer, measured almost 3 times faster, only has to be 1.5 times faster so that noise does not
+    fail the test.
+    """
+    messages = [AirbyteRecordMessage(stream=_STREAM_NAME, data=record, emitted_at=NOW) for record in _heterogeneous_records(50_000)]
+
+    def _add_every_record() -> None:
+        builder = NoRequiredSchemaBuilder()
+        for message in messages:
+            builder.add_object(message.data)
+
+    def _accumulate_and_get_schema() -> Mapping[str, Any]:
+        inferrer = SchemaInferrer()
+        for message in messages:
+            inferrer.accumulate(message)
+        return inferrer.get_stream_schema(_STREAM_NAME)
+
+    every_record_duration = min(timeit.repeat(_add_every_record, number=1, repeat=3))
+    inferrer_duration = min(timeit.repeat(_accumulate_and_get_schema, number=1, repeat=3))
+
+    assert _accumulate_and_get_schema() == _infer_with_every_record(message.data for message in messages)
+    assert inferrer_duration < every_record_duration / 1.5